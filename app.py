@@ -6,55 +6,47 @@ VRChat「MedalGameWorld」ワールドのカードゲームの最適解を提示
 """
 
 import streamlit as st
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple
 
 from src.models import Card
 from src.controllers import (
     GameState, 
-    MCTSStrategy,
-    HeuristicStrategy,
     ObservableGameState
 )
 from src.views import (
     initialize_session_state,
     reset_game,
+    record_state,
+    undo_state,
+    redo_state,
     get_suit_emoji,
     display_game_state,
     display_hand,
     display_field,
     display_deck_status,
+    display_search_statistics,
     show_exclude_card_dialog,
     show_hand_selection_dialog,
-    show_add_card_dialog
+    show_add_card_dialog,
+    run_heuristic_search,
+    run_mcts_search
 )
 
 
-def get_played_cards_from_history() -> List[Card]:
-    """履歴から既に場に出したカードのリストを生成"""
-    played_cards = []
-    if 'history' in st.session_state and st.session_state.history:
-        for record in st.session_state.history:
-            # 履歴からカードを復元
-            # record['card']は文字列（例: "A5"）
-            card_str = record['card']
-            suit = record.get('suit')  # スート情報がある場合
-            
-            if suit:
-                # スートと数値を分離
-                value_str = card_str[1:]  # 最初の1文字（スート）を除いた数値部分
-                try:
-                    value = int(value_str)
-                    played_cards.append(Card(suit, value))
-                except (ValueError, KeyError):
-                    pass  # パースエラーは無視
+def get_best_move_with_mcts(
+    state: GameState,
+    num_iterations: int,
+    instrument: bool = False
+) -> Optional[Tuple[Card, int]]:
+    """
+    MCTSを使って最適な手を取得（探索の統計情報はセッション状態に保存）
     
-    return played_cards
-
-
-def get_best_move_with_mcts(state: GameState, num_iterations: int) -> Optional[Tuple[Card, int]]:
-    """MCTSを使って最適な手を取得"""
-    strategy = MCTSStrategy(num_iterations=num_iterations, verbose=False)
-    return strategy.get_best_move(state)
+    探索はプロセス全体で共有するワーカープールで実行し、結果はこのセッションにだけ返る
+    （同じ局面・同じ探索回数なら推奨手キャッシュから即座に返る）
+    """
+    best_move, statistics = run_mcts_search(state, num_iterations, instrument)
+    st.session_state.search_statistics = statistics
+    return best_move
 
 
 def get_best_move_with_heuristic(state: GameState) -> Tuple[Optional[Tuple[Card, int]], str]:
@@ -64,18 +56,15 @@ def get_best_move_with_heuristic(state: GameState) -> Tuple[Optional[Tuple[Card,
     Returns:
         (最適な手, 説明文)
     """
-    # 既出カードを取得
-    played_cards = get_played_cards_from_history()
-    
-    # ObservableGameStateを構築
-    obs_state = ObservableGameState.from_game_state(state, played_cards)
-    
-    # ヒューリスティック戦略で手を選択
-    strategy = HeuristicStrategy(verbose=False)
-    best_move = strategy.get_best_move(obs_state)
-    explanation = strategy.explain()
+    # ObservableGameStateを構築（既出カードはゲーム状態の記録を共有、O(1)）
+    # 除外カードはWebUIで入力・表示済みなので、分かっているものとして渡す
+    obs_state = ObservableGameState.from_game_state(
+        state,
+        known_excluded_cards=state.get_deck().get_excluded_cards()
+    )
     
-    return best_move, explanation
+    # ヒューリスティック戦略で手を選択（同じ局面なら推奨手キャッシュから返る）
+    return run_heuristic_search(obs_state)
 
 
 def main():
@@ -118,8 +107,14 @@ def main():
                 step=50,
                 help="探索回数を増やすと精度が上がりますが、時間がかかります"
             )
+            show_instrumentation = st.checkbox(
+                "探索の計測を表示",
+                value=False,
+                help="フェーズごとの所要時間や探索速度を計測して表示します（次の計算から有効）"
+            )
         else:
             num_iterations = 500  # デフォルト値
+            show_instrumentation = False
         
         # 戦略変更を検出して自動再計算
         strategy_changed = False
@@ -143,6 +138,18 @@ def main():
         st.caption(f"シード値: {st.session_state.seed}")
         st.caption(f"ターン: {st.session_state.turn}")
         
+        # 元に戻す/やり直し
+        state_history = st.session_state.state_history
+        col_undo, col_redo = st.columns(2)
+        with col_undo:
+            if st.button("↩️ 元に戻す", use_container_width=True, disabled=not state_history.can_undo()):
+                undo_state()
+                st.rerun()
+        with col_redo:
+            if st.button("↪️ やり直し", use_container_width=True, disabled=not state_history.can_redo()):
+                redo_state()
+                st.rerun()
+        
         st.markdown("---")
         
         # リセットボタン
@@ -267,7 +274,7 @@ def main():
             else:
                 # MCTS戦略
                 with st.spinner(f"MCTS探索中... ({num_iterations}回反復)"):
-                    best_move = get_best_move_with_mcts(state, num_iterations)
+                    best_move = get_best_move_with_mcts(state, num_iterations, show_instrumentation)
                 
                 if best_move is None:
                     st.error(" 出せるカードがありません。ゲーム終了です。")
@@ -291,6 +298,10 @@ def main():
                 with st.expander(" 戦略の説明", expanded=True):
                     st.text(st.session_state.strategy_explanation)
             
+            # MCTS探索の計測結果を表示
+            if show_instrumentation:
+                display_search_statistics(st.session_state.get('search_statistics'))
+            
             col_exec1, col_exec2 = st.columns([1, 1])
             
             with col_exec1:
@@ -309,7 +320,7 @@ def main():
                             # カードを場に出す
                             state.field.place_card(slot, card)
                             
-                            # 場に出したカードを記録
+                            # 場に出したカードを記録（出した順のログとビットマスクを同時に更新）
                             state.played_cards.append(card)
                             
                             # ポイントを更新
@@ -318,9 +329,9 @@ def main():
                             # ターン数をインクリメント
                             state.turn_count += 1
                             
-                            st.session_state.turn += 1
-                            st.session_state.history.append({
-                                'turn': st.session_state.turn,
+                            # 状態履歴に記録（表示用の履歴とターン数もここから導出）
+                            record_state({
+                                'turn': st.session_state.turn + 1,
                                 'card': str(card),
                                 'suit': card.suit,  # スート情報も保存
                                 'slot': slot
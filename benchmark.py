@@ -0,0 +1,464 @@
+"""
+統合ベンチマーク
+戦略レジストリ・シード範囲・探索予算を指定して、プロセスプールで並列にゲームを実行する
+
+1手ごとの思考時間を perf_counter_ns で記録し、結果を JSONL / CSV に出力、
+平均・中央値・p95・95%信頼区間を表示する。
+
+実行方法:
+    # ランダム vs ヒューリスティック（100ゲーム）
+    uv run python benchmark.py --strategies random heuristic --num-games 100
+    
+    # UCB1 vs PUCT（WebUIの探索回数100/250/500回）
+    uv run python benchmark.py --strategies mcts mcts-puct ismcts ismcts-puct --iterations 100 250 500
+    
+    # 時間予算（1手50ms）で4プロセス並列、結果をJSONLに保存
+    uv run python benchmark.py --strategies ismcts --time-limits 50 --workers 4 --output results.jsonl
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from src.models.card import Card
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.heuristic_strategy import HeuristicStrategy
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers.ismcts_strategy import ISMCTSStrategy
+from src.controllers.flat_monte_carlo_engine import FlatMonteCarloEngine
+from src.controllers.random_streams import RandomStreams
+from src.controllers.early_stopping import EarlyStopping
+from src.controllers.decision_triage import DecisionTriage
+
+
+# 時間予算のみを指定した場合の探索回数の上限
+TIME_BUDGET_MAX_ITERATIONS = 1_000_000
+
+# 95%信頼区間の係数（正規近似）
+CONFIDENCE_Z = 1.96
+
+Player = Callable[[GameState], Optional[Tuple[Card, int]]]
+
+# プレイヤーの乱数ストリームのキー（ゲームのシードから派生する）
+PLAYER_STREAM_KEY = 1
+
+
+def _random_player(
+    num_iterations: Optional[int],
+    time_limit: Optional[float],
+    rng: random.Random
+) -> Player:
+    """合法手から一様ランダムに選ぶプレイヤー"""
+    def decide(state: GameState) -> Optional[Tuple[Card, int]]:
+        valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+        return rng.choice(valid_moves) if valid_moves else None
+    return decide
+
+
+def _observable_player(strategy) -> Player:
+    """ObservableGameStateを受け取る戦略をプレイヤーに変換"""
+    def decide(state: GameState) -> Optional[Tuple[Card, int]]:
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        return strategy.get_best_move(obs_state)
+    return decide
+
+
+def _heuristic_player(
+    num_iterations: Optional[int],
+    time_limit: Optional[float],
+    rng: random.Random
+) -> Player:
+    """ヒューリスティック戦略のプレイヤー"""
+    return _observable_player(HeuristicStrategy())
+
+
+def _mcts_player(
+    num_iterations: Optional[int],
+    time_limit: Optional[float],
+    rng: random.Random,
+    selection: str = 'ucb1',
+    root_selection: str = 'ucb',
+    early_stopping: bool = False,
+    triage: bool = False
+) -> Player:
+    """完全情報MCTS戦略のプレイヤー"""
+    strategy = MCTSStrategy(
+        num_iterations=num_iterations,
+        selection=selection,
+        time_limit=time_limit,
+        rng=rng,
+        root_selection=root_selection,
+        early_stopping=EarlyStopping() if early_stopping else None,
+        triage=DecisionTriage() if triage else None
+    )
+    return strategy.get_best_move
+
+
+def _ismcts_player(
+    num_iterations: Optional[int],
+    time_limit: Optional[float],
+    rng: random.Random,
+    selection: str = 'ucb1',
+    root_selection: str = 'ucb',
+    early_stopping: bool = False,
+    triage: bool = False
+) -> Player:
+    """IS-MCTS戦略のプレイヤー"""
+    strategy = ISMCTSStrategy(
+        num_iterations=num_iterations,
+        selection=selection,
+        time_limit=time_limit,
+        rng=rng,
+        root_selection=root_selection,
+        early_stopping=EarlyStopping() if early_stopping else None,
+        triage=DecisionTriage() if triage else None
+    )
+    return _observable_player(strategy)
+
+
+def _flat_mc_player(
+    num_iterations: Optional[int],
+    time_limit: Optional[float],
+    rng: random.Random
+) -> Player:
+    """共通乱数による平坦モンテカルロ評価のプレイヤー"""
+    engine = FlatMonteCarloEngine(rng=rng)
+    def decide(state: GameState) -> Optional[Tuple[Card, int]]:
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        best_move, _ = engine.search(obs_state, num_iterations=num_iterations, time_limit=time_limit)
+        return best_move
+    return decide
+
+
+# 戦略名 -> (プレイヤーの生成関数, 探索予算を使うか)
+STRATEGIES: Dict[str, Tuple[Callable[[Optional[int], Optional[float], random.Random], Player], bool]] = {
+    'random': (_random_player, False),
+    'heuristic': (_heuristic_player, False),
+    'mcts': (partial(_mcts_player, selection='ucb1'), True),
+    'mcts-puct': (partial(_mcts_player, selection='puct'), True),
+    'ismcts': (partial(_ismcts_player, selection='ucb1'), True),
+    'ismcts-puct': (partial(_ismcts_player, selection='puct'), True),
+    'mcts-sh': (partial(_mcts_player, root_selection='sequential_halving'), True),
+    'mcts-hybrid': (partial(_mcts_player, root_selection='hybrid'), True),
+    'ismcts-sh': (partial(_ismcts_player, root_selection='sequential_halving'), True),
+    'ismcts-hybrid': (partial(_ismcts_player, root_selection='hybrid'), True),
+    'mcts-es': (partial(_mcts_player, early_stopping=True), True),
+    'ismcts-es': (partial(_ismcts_player, early_stopping=True), True),
+    'mcts-triage': (partial(_mcts_player, triage=True), True),
+    'ismcts-triage': (partial(_ismcts_player, triage=True), True),
+    'flat-mc': (_flat_mc_player, True),
+}
+
+
+def build_jobs(
+    strategies: Sequence[str],
+    seeds: Sequence[int],
+    iterations: Sequence[int],
+    time_limits_ms: Sequence[float]
+) -> List[Dict]:
+    """
+    (戦略, 探索予算, シード) の全組み合わせのジョブを作成
+    
+    探索予算を使わない戦略は、シードごとに1ジョブだけ作成する。
+    
+    Args:
+        strategies: 戦略名のリスト
+        seeds: 初期状態の乱数シード
+        iterations: 探索回数の予算
+        time_limits_ms: 1手あたりの時間予算（ミリ秒）
+    
+    Returns:
+        ジョブ（辞書）のリスト
+    """
+    jobs = []
+    for name in strategies:
+        if name not in STRATEGIES:
+            raise ValueError(f"未知の戦略です: {name}（選択肢: {', '.join(STRATEGIES)}）")
+        
+        _, uses_budget = STRATEGIES[name]
+        if uses_budget:
+            budgets = [(num_iterations, None) for num_iterations in iterations]
+            budgets += [(TIME_BUDGET_MAX_ITERATIONS, limit) for limit in time_limits_ms]
+        else:
+            budgets = [(None, None)]
+        
+        for num_iterations, time_limit_ms in budgets:
+            for seed in seeds:
+                jobs.append({
+                    'strategy': name,
+                    'seed': seed,
+                    'num_iterations': num_iterations,
+                    'time_limit_ms': time_limit_ms
+                })
+    return jobs
+
+
+def play_game(job: Dict) -> Dict:
+    """
+    ジョブを1つ実行（1ゲームをプレイ）
+    
+    プロセスプールから呼ばれるため、引数・戻り値ともにpickle可能な辞書。
+    山札はシード、プレイヤーの乱数はシードから派生したストリームで決まる（グローバル乱数は使わない）ので、
+    どのワーカーで実行しても探索回数予算の結果は再現可能。
+    
+    Args:
+        job: build_jobs() が作成したジョブ
+    
+    Returns:
+        ゲーム結果の辞書（1手ごとの思考時間 decision_ns を含む）
+    """
+    factory, _ = STRATEGIES[job['strategy']]
+    time_limit_ms = job['time_limit_ms']
+    time_limit = time_limit_ms / 1000 if time_limit_ms is not None else None
+    
+    game_state = GameState(seed=job['seed'])
+    rng = RandomStreams(job['seed']).child(PLAYER_STREAM_KEY).python_random()
+    decide = factory(job['num_iterations'], time_limit, rng)
+    
+    decision_ns = []
+    game_start = time.perf_counter_ns()
+    while MoveValidator.has_valid_move(game_state.get_hand(), game_state.get_field()):
+        start = time.perf_counter_ns()
+        best_move = decide(game_state)
+        decision_ns.append(time.perf_counter_ns() - start)
+        
+        if best_move is None:
+            break
+        
+        card, slot = best_move
+        game_state.play_card(card, slot)
+    
+    return {
+        **job,
+        'cards_played': game_state.get_cards_played_count(),
+        'total_points': game_state.get_total_points(),
+        'turns': game_state.turn_count,
+        'game_ns': time.perf_counter_ns() - game_start,
+        'decision_ns': decision_ns
+    }
+
+
+def run_jobs(jobs: List[Dict], workers: int = 1) -> List[Dict]:
+    """
+    ジョブを実行（workers > 1 ならプロセスプールで並列実行）
+    
+    Args:
+        jobs: ジョブのリスト
+        workers: ワーカープロセス数
+    
+    Returns:
+        ジョブと同じ順序のゲーム結果のリスト
+    """
+    if workers <= 1:
+        return [play_game(job) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play_game, jobs))
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    最近傍順位法によるパーセンタイル
+    
+    Args:
+        values: 値のリスト（空でない）
+        q: パーセンタイル（0〜100）
+    
+    Returns:
+        パーセンタイル値
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def describe(values: Sequence[float]) -> Dict[str, float]:
+    """
+    平均・中央値・p95・95%信頼区間を計算
+    
+    Args:
+        values: 値のリスト
+    
+    Returns:
+        統計量の辞書（ci95 は平均の95%信頼区間の半幅）
+    """
+    if len(values) == 0:
+        return {'n': 0, 'mean': 0.0, 'median': 0.0, 'p95': 0.0, 'ci95': 0.0}
+    
+    ci95 = 0.0
+    if len(values) >= 2:
+        ci95 = CONFIDENCE_Z * statistics.stdev(values) / math.sqrt(len(values))
+    
+    return {
+        'n': len(values),
+        'mean': statistics.fmean(values),
+        'median': statistics.median(values),
+        'p95': percentile(values, 95),
+        'ci95': ci95
+    }
+
+
+def summarize(records: List[Dict]) -> Dict[Tuple[str, Optional[int], Optional[float]], Dict]:
+    """
+    (戦略, 探索回数, 時間予算) ごとに結果を集計
+    
+    Args:
+        records: ゲーム結果のリスト
+    
+    Returns:
+        (戦略, 探索回数, 時間予算ms) -> 集計結果 の辞書
+    """
+    groups: Dict[Tuple[str, Optional[int], Optional[float]], List[Dict]] = {}
+    for record in records:
+        key = (record['strategy'], record['num_iterations'], record['time_limit_ms'])
+        groups.setdefault(key, []).append(record)
+    
+    summaries = {}
+    for key, group in groups.items():
+        decision_ms = [ns / 1e6 for record in group for ns in record['decision_ns']]
+        summaries[key] = {
+            'games': len(group),
+            'cards': describe([record['cards_played'] for record in group]),
+            'points': describe([record['total_points'] for record in group]),
+            'decision_ms': describe(decision_ms)
+        }
+    return summaries
+
+
+def write_results(records: List[Dict], path: str, output_format: Optional[str] = None):
+    """
+    ゲーム結果をファイルに出力
+    
+    Args:
+        records: ゲーム結果のリスト
+        path: 出力先のパス
+        output_format: 'jsonl' または 'csv'（Noneの場合は拡張子から判定）
+    """
+    if output_format is None:
+        output_format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    
+    if output_format == 'jsonl':
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    elif output_format == 'csv':
+        fieldnames = [
+            'strategy', 'seed', 'num_iterations', 'time_limit_ms',
+            'cards_played', 'total_points', 'turns', 'game_ns', 'decision_ns'
+        ]
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for record in records:
+                row = {name: record[name] for name in fieldnames}
+                # 1手ごとの思考時間は空白区切りで1列にまとめる
+                row['decision_ns'] = ' '.join(str(ns) for ns in record['decision_ns'])
+                writer.writerow(row)
+    else:
+        raise ValueError(f"出力形式は'jsonl'または'csv'である必要があります: {output_format}")
+
+
+def _budget_label(num_iterations: Optional[int], time_limit_ms: Optional[float]) -> str:
+    """探索予算の表示用ラベル"""
+    if time_limit_ms is not None:
+        return f"{time_limit_ms:g}ms"
+    if num_iterations is not None:
+        return f"{num_iterations}回"
+    return "-"
+
+
+def print_summary(summaries: Dict[Tuple[str, Optional[int], Optional[float]], Dict]):
+    """集計結果を表で表示"""
+    print(f"\n{'='*100}")
+    print("比較サマリー（平均 ± 95%信頼区間 / 中央値 / p95）")
+    print(f"{'='*100}")
+    print(
+        f"{'戦略':<12} {'予算':<8} {'ゲーム':>6}  "
+        f"{'カード数':<26} {'ポイント':<26} {'1手(ms)':<24}"
+    )
+    print(f"{'-'*100}")
+    for (name, num_iterations, time_limit_ms), summary in summaries.items():
+        cards = summary['cards']
+        points = summary['points']
+        decision = summary['decision_ms']
+        print(
+            f"{name:<12} {_budget_label(num_iterations, time_limit_ms):<8} {summary['games']:>6}  "
+            f"{cards['mean']:>6.2f} ±{cards['ci95']:<5.2f} / {cards['median']:<4g} / {cards['p95']:<4g}  "
+            f"{points['mean']:>6.2f} ±{points['ci95']:<5.2f} / {points['median']:<4g} / {points['p95']:<4g}  "
+            f"{decision['mean']:>8.2f} / {decision['median']:.2f} / {decision['p95']:.2f}"
+        )
+    print(f"{'='*100}\n")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="戦略の統合ベンチマーク")
+    parser.add_argument(
+        '--strategies', nargs='+', default=['random', 'heuristic'], choices=list(STRATEGIES),
+        help="実行する戦略（デフォルト: random heuristic）"
+    )
+    parser.add_argument('--seed-start', type=int, default=100, help="最初のシード（デフォルト: 100）")
+    parser.add_argument('--num-games', type=int, default=10, help="戦略・予算ごとのゲーム数（デフォルト: 10）")
+    parser.add_argument(
+        '--iterations', nargs='*', type=int, default=[100],
+        help="探索回数の予算（複数指定可、デフォルト: 100）"
+    )
+    parser.add_argument(
+        '--time-limits', nargs='*', type=float, default=[],
+        help="1手あたりの時間予算（ミリ秒、複数指定可）"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=os.cpu_count() or 1,
+        help="ワーカープロセス数（デフォルト: CPU数）"
+    )
+    parser.add_argument('--output', help="結果の出力先（.jsonl または .csv）")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], help="出力形式（省略時は拡張子から判定）")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict:
+    """
+    ベンチマークを実行
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    
+    Returns:
+        (戦略, 探索回数, 時間予算ms) -> 集計結果 の辞書
+    """
+    args = parse_args(argv)
+    seeds = list(range(args.seed_start, args.seed_start + args.num_games))
+    jobs = build_jobs(args.strategies, seeds, args.iterations, args.time_limits)
+    
+    print(f"\n{'#'*60}")
+    print("# 統合ベンチマーク")
+    print(f"# 戦略: {', '.join(args.strategies)}")
+    print(f"# シード: {seeds[0]}〜{seeds[-1]}（{len(seeds)}ゲーム）" if seeds else "# シード: なし")
+    print(f"# 探索回数: {args.iterations} / 時間予算(ms): {args.time_limits}")
+    print(f"# ジョブ数: {len(jobs)} / ワーカー数: {args.workers}")
+    print(f"{'#'*60}")
+    
+    start = time.perf_counter()
+    records = run_jobs(jobs, args.workers)
+    print(f"実行時間: {time.perf_counter() - start:.1f}秒")
+    
+    if args.output:
+        write_results(records, args.output, args.format)
+        print(f"結果を保存しました: {args.output}")
+    
+    summaries = summarize(records)
+    print_summary(summaries)
+    return summaries
+
+
+if __name__ == '__main__':
+    main()
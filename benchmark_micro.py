@@ -0,0 +1,413 @@
+"""
+マイクロベンチマーク
+探索時間の大半を占める処理（ホットパス）の1回あたりの実行時間を計測する
+
+計測対象:
+- MoveValidator.get_valid_moves
+- GameState.play_card
+- copy.deepcopy(GameState)
+- PointCalculator.calculate_points
+- InformationSet.__hash__
+- Determinizer.create_determinization
+- MCTSEngine._simulate（ロールアウト1回）
+
+固定シードのヒューリスティック戦略のゲームから実際の局面をサンプリングし、
+timeitと同様に「繰り返しのうち最速の1回あたり時間」を記録する。
+ベースラインJSONと比較し、閾値を超えて遅くなった処理があれば終了コード1で失敗する。
+マシン全体の速度変動を打ち消すため、比較は純Pythonの基準ループとの相対時間で行う。
+
+実行方法:
+    # ベースラインと比較（遅くなっていれば失敗）
+    uv run python benchmark_micro.py
+    
+    # ベースラインを更新（計測環境を変えた時や、意図的に性能が変わった時）
+    # 繰り返し回数を増やすと、負荷変動の影響が小さい最速値を記録できる
+    uv run python benchmark_micro.py --update-baseline --repeat 15
+"""
+
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+from src.models.point_calculator import PointCalculator
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.heuristic_strategy import HeuristicStrategy
+from src.controllers.information_set import InformationSet
+from src.controllers.determinizer import Determinizer
+from src.controllers.mcts_engine import MCTSEngine
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_micro_baseline.json')
+BASELINE_VERSION = 1
+
+# 局面をサンプリングするゲームのシード
+SAMPLE_SEEDS = list(range(10))
+
+# 計測時の乱数シード（決定化・ロールアウト用）
+TIMING_SEED = 12345
+
+# 許容する遅延の割合（0.5 = ベースラインより50%遅くなったら失敗）
+# 基準ループで正規化しても、共有マシンでは±30%程度ばらつく
+DEFAULT_THRESHOLD = 0.5
+
+
+def collect_samples(seeds: Sequence[int] = SAMPLE_SEEDS) -> Dict[str, List]:
+    """
+    固定シードのゲームをヒューリスティック戦略でプレイし、各手番の局面を集める
+    
+    Args:
+        seeds: ゲームのシード
+    
+    Returns:
+        局面の種類 -> リスト の辞書
+        - states: 手番開始時のGameState（合法手あり）
+        - moves: その局面で実際に指した手
+        - observables: 対応するObservableGameState
+        - info_sets: 対応するInformationSet
+        - hands: 対応する手札のカードリスト
+    """
+    samples = {'states': [], 'moves': [], 'observables': [], 'info_sets': [], 'hands': []}
+    strategy = HeuristicStrategy()
+    
+    for seed in seeds:
+        game_state = GameState(seed=seed)
+        while MoveValidator.has_valid_move(game_state.get_hand(), game_state.get_field()):
+            obs_state = ObservableGameState.from_game_state(game_state, game_state.get_played_cards())
+            best_move = strategy.get_best_move(obs_state)
+            if best_move is None:
+                break
+            
+            samples['states'].append(copy.deepcopy(game_state))
+            samples['moves'].append(best_move)
+            samples['observables'].append(obs_state)
+            samples['info_sets'].append(InformationSet(
+                hand=game_state.get_hand(),
+                field=game_state.get_field(),
+                cards_played_count=len(game_state.get_played_cards())
+            ))
+            samples['hands'].append(game_state.get_hand().get_cards())
+            
+            card, slot = best_move
+            game_state.play_card(card, slot)
+    
+    return samples
+
+
+def _cycle(items: List, number: int) -> List:
+    """リストを繰り返して number 個にする"""
+    return [items[i % len(items)] for i in range(number)]
+
+
+def bench_get_valid_moves(samples: Dict[str, List], number: int) -> int:
+    """MoveValidator.get_valid_moves"""
+    states = _cycle(samples['states'], number)
+    start = time.perf_counter_ns()
+    for state in states:
+        MoveValidator.get_valid_moves(state.hand, state.field)
+    return time.perf_counter_ns() - start
+
+
+def bench_play_card(samples: Dict[str, List], number: int) -> int:
+    """GameState.play_card（状態のコピーは計測外）"""
+    pairs = _cycle(list(zip(samples['states'], samples['moves'])), number)
+    states = [copy.deepcopy(state) for state, _ in pairs]
+    moves = [move for _, move in pairs]
+    start = time.perf_counter_ns()
+    for state, (card, slot) in zip(states, moves):
+        state.play_card(card, slot)
+    return time.perf_counter_ns() - start
+
+
+def bench_deepcopy_game_state(samples: Dict[str, List], number: int) -> int:
+    """copy.deepcopy(GameState)"""
+    states = _cycle(samples['states'], number)
+    start = time.perf_counter_ns()
+    for state in states:
+        copy.deepcopy(state)
+    return time.perf_counter_ns() - start
+
+
+def bench_calculate_points(samples: Dict[str, List], number: int) -> int:
+    """PointCalculator.calculate_points"""
+    hands = _cycle(samples['hands'], number)
+    start = time.perf_counter_ns()
+    for hand_cards in hands:
+        PointCalculator.calculate_points(hand_cards)
+    return time.perf_counter_ns() - start
+
+
+def bench_information_set_hash(samples: Dict[str, List], number: int) -> int:
+    """InformationSet.__hash__"""
+    info_sets = _cycle(samples['info_sets'], number)
+    start = time.perf_counter_ns()
+    for info_set in info_sets:
+        hash(info_set)
+    return time.perf_counter_ns() - start
+
+
+def bench_create_determinization(samples: Dict[str, List], number: int) -> int:
+    """Determinizer.create_determinization"""
+    observables = _cycle(samples['observables'], number)
+    start = time.perf_counter_ns()
+    for obs_state in observables:
+        Determinizer.create_determinization(obs_state)
+    return time.perf_counter_ns() - start
+
+
+def bench_simulate(samples: Dict[str, List], number: int) -> int:
+    """MCTSEngine._simulate（一様ランダムロールアウト1回、状態コピー込み）"""
+    engine = MCTSEngine()
+    states = _cycle(samples['states'], number)
+    start = time.perf_counter_ns()
+    for state in states:
+        engine._simulate(state)
+    return time.perf_counter_ns() - start
+
+
+def bench_calibration(samples: Dict[str, List], number: int) -> int:
+    """
+    基準ループ（ゲームのコードに依存しない純Pythonの処理）
+    
+    マシン全体の速度変動を打ち消すため、各計測はこの基準との比で比較する。
+    """
+    cards = samples['hands'][0]
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        total = 0
+        for card in cards:
+            total += card.value
+    return time.perf_counter_ns() - start
+
+
+# 基準ループの計測名
+CALIBRATION = 'calibration'
+
+# 計測名 -> (計測関数, 1回の計測での呼び出し回数)
+BENCHMARKS: Dict[str, tuple] = {
+    'get_valid_moves': (bench_get_valid_moves, 5000),
+    'play_card': (bench_play_card, 2000),
+    'deepcopy_game_state': (bench_deepcopy_game_state, 1000),
+    'calculate_points': (bench_calculate_points, 5000),
+    'information_set_hash': (bench_information_set_hash, 10000),
+    'create_determinization': (bench_create_determinization, 500),
+    'simulate': (bench_simulate, 200),
+    CALIBRATION: (bench_calibration, 20000),
+}
+
+
+def run_suite(
+    samples: Dict[str, List],
+    names: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    scale: float = 1.0
+) -> Dict[str, float]:
+    """
+    マイクロベンチマークを実行
+    
+    Args:
+        samples: collect_samples() で集めた局面
+        names: 実行する計測名（Noneの場合は全て）。基準ループは常に含まれる
+        repeat: 繰り返し回数（最速の1回を採用）
+        scale: 呼び出し回数の倍率（テスト用に小さくできる）
+    
+    Returns:
+        計測名 -> 1回あたりの実行時間（ナノ秒）
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+    elif CALIBRATION not in names:
+        names = list(names) + [CALIBRATION]
+    
+    # 計測を交互に繰り返し、一時的な負荷変動が特定の計測だけに偏らないようにする
+    best: Dict[str, float] = {}
+    for _ in range(repeat):
+        for name in names:
+            bench, number = BENCHMARKS[name]
+            number = max(1, int(number * scale))
+            random.seed(TIMING_SEED)
+            # timeitと同様に、計測中はガベージコレクションを止める
+            gc.collect()
+            gc.disable()
+            try:
+                per_call = bench(samples, number) / number
+            finally:
+                gc.enable()
+            best[name] = min(per_call, best.get(name, per_call))
+    return {name: best[name] for name in names}
+
+
+def relative_ratio(
+    name: str,
+    results: Dict[str, float],
+    baseline: Dict[str, float]
+) -> Optional[float]:
+    """
+    ベースラインに対する実行時間の比（基準ループで正規化）
+    
+    両方に基準ループの計測があれば (今回/今回の基準) / (ベースライン/ベースラインの基準)、
+    無ければ単純な 今回/ベースライン を返す。
+    
+    Args:
+        name: 計測名
+        results: 今回の計測結果（計測名 -> ns）
+        baseline: ベースライン（計測名 -> ns）
+    
+    Returns:
+        比（1.0より大きいほど遅い）。ベースラインに無い計測はNone
+    """
+    baseline_ns = baseline.get(name)
+    if baseline_ns is None or baseline_ns <= 0:
+        return None
+    
+    ratio = results[name] / baseline_ns
+    if name != CALIBRATION and baseline.get(CALIBRATION) and results.get(CALIBRATION):
+        ratio /= results[CALIBRATION] / baseline[CALIBRATION]
+    return ratio
+
+
+def compare_with_baseline(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict]:
+    """
+    ベースラインより閾値を超えて遅くなった計測を検出
+    
+    Args:
+        results: 今回の計測結果（計測名 -> ns）
+        baseline: ベースライン（計測名 -> ns）
+        threshold: 許容する遅延の割合
+    
+    Returns:
+        退行した計測のリスト（name, baseline_ns, current_ns, ratio）
+    """
+    regressions = []
+    for name, current_ns in results.items():
+        if name == CALIBRATION:
+            continue
+        ratio = relative_ratio(name, results, baseline)
+        if ratio is not None and ratio > 1.0 + threshold:
+            regressions.append({
+                'name': name,
+                'baseline_ns': baseline[name],
+                'current_ns': current_ns,
+                'ratio': ratio
+            })
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict[str, float]]:
+    """
+    ベースラインJSONを読み込む
+    
+    Args:
+        path: ベースラインのパス
+    
+    Returns:
+        計測名 -> ns（ファイルが無い場合はNone）
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"ベースラインのバージョンが一致しません: {data.get('version')}")
+    return data['results']
+
+
+def save_baseline(results: Dict[str, float], path: str = BASELINE_PATH):
+    """
+    ベースラインJSONを保存
+    
+    Args:
+        results: 計測名 -> ns
+        path: 保存先のパス
+    """
+    data = {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sample_seeds': SAMPLE_SEEDS,
+        'results': {name: round(ns, 1) for name, ns in results.items()}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def print_results(results: Dict[str, float], baseline: Optional[Dict[str, float]]):
+    """計測結果をベースラインとの比較付きで表示（比率は基準ループで正規化済み）"""
+    print(f"\n{'='*64}")
+    print(f"{'計測':<26} {'今回(µs)':>10} {'基準(µs)':>10} {'比率':>8}")
+    print(f"{'-'*64}")
+    for name, current_ns in results.items():
+        ratio = relative_ratio(name, results, baseline) if baseline else None
+        if ratio is not None:
+            print(f"{name:<26} {current_ns / 1000:>10.2f} {baseline[name] / 1000:>10.2f} {ratio:>7.2f}x")
+        else:
+            print(f"{name:<26} {current_ns / 1000:>10.2f} {'-':>10} {'-':>8}")
+    print(f"{'='*64}\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    マイクロベンチマークを実行してベースラインと比較
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    
+    Returns:
+        終了コード（退行があれば1）
+    """
+    parser = argparse.ArgumentParser(description="ホットパスのマイクロベンチマーク")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="実行する計測")
+    parser.add_argument('--repeat', type=int, default=5, help="繰り返し回数（デフォルト: 5）")
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help=f"許容する遅延の割合（デフォルト: {DEFAULT_THRESHOLD}）"
+    )
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="ベースラインJSONのパス")
+    parser.add_argument('--update-baseline', action='store_true', help="今回の結果でベースラインを更新")
+    args = parser.parse_args(argv)
+    
+    samples = collect_samples()
+    print(f"サンプル局面数: {len(samples['states'])}（シード: {SAMPLE_SEEDS[0]}〜{SAMPLE_SEEDS[-1]}）")
+    
+    results = run_suite(samples, names=args.only, repeat=args.repeat)
+    
+    if args.update_baseline:
+        print_results(results, None)
+        save_baseline(results, args.baseline)
+        print(f"ベースラインを更新しました: {args.baseline}")
+        return 0
+    
+    baseline = load_baseline(args.baseline)
+    print_results(results, baseline)
+    if baseline is None:
+        print(f"ベースラインがありません。--update-baseline で作成してください: {args.baseline}")
+        return 0
+    
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"❌ 性能退行を検出しました（許容: +{args.threshold:.0%}）")
+        for regression in regressions:
+            print(
+                f"  {regression['name']}: {regression['baseline_ns'] / 1000:.2f}µs → "
+                f"{regression['current_ns'] / 1000:.2f}µs ({regression['ratio']:.2f}x)"
+            )
+        return 1
+    
+    print(f"✅ 全ての計測がベースラインの +{args.threshold:.0%} 以内です")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
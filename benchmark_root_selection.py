@@ -0,0 +1,178 @@
+"""
+ルートの手の選び方のベンチマーク
+同じ探索回数で、UCB1・逐次半減・ハイブリッドが最良の手をどれだけ正しく選べるかを比較する
+
+固定シードのゲームの途中局面ごとに、共通乱数の平坦モンテカルロ評価（FlatMonteCarloEngine）を
+十分な数の世界で実行して、手ごとの価値の参照値を作る。各方式で乱数ストリームだけを変えて
+探索を繰り返し、以下を計測する:
+- 正解率: 選んだ手が参照値で最良の手と一致した割合
+- regret: 参照値での「最良の手の価値 − 選んだ手の価値」の平均（0に近いほど良い）
+- ms/手: 1回の探索の平均時間
+- 正解率/ms: 1msあたりの正解率（同じ時間でどれだけ正しく選べるか）
+
+MCTSEngine は完全情報の探索なので、局面の決定化を1つサンプリングして、その上で探索する。
+
+実行方法:
+    uv run python benchmark_root_selection.py
+    uv run python benchmark_root_selection.py --engine mcts --iterations 50 200 --repeats 8
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.models.card import Card
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.determinizer import Determinizer
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.flat_monte_carlo_engine import FlatMonteCarloEngine
+from src.controllers.random_streams import RandomStreams
+from benchmark_sampling import BENCHMARK_SEED, collect_positions
+
+
+def reference_values(
+    positions: Sequence[ObservableGameState],
+    num_worlds: int
+) -> List[Dict[Tuple[Card, int], float]]:
+    """
+    局面ごとの手の価値の参照値を、共通乱数の平坦モンテカルロ評価で計算
+    
+    Args:
+        positions: 局面
+        num_worlds: 1局面あたりの世界（決定化）の数
+    
+    Returns:
+        局面ごとの 手 -> 平均報酬 の辞書
+    """
+    streams = RandomStreams(BENCHMARK_SEED).child(0)
+    values = []
+    for position_index, observable_state in enumerate(positions):
+        engine = FlatMonteCarloEngine(rng=streams.child(position_index).python_random())
+        stats = engine.evaluate(observable_state, num_worlds)
+        values.append({move_stats['move']: move_stats['mean_reward'] for move_stats in stats['moves']})
+    return values
+
+
+def measure_accuracy(
+    positions: Sequence[ObservableGameState],
+    references: Sequence[Dict[Tuple[Card, int], float]],
+    engine_name: str,
+    root_selection: str,
+    num_iterations: int,
+    repeats: int
+) -> Dict[str, float]:
+    """
+    ルートの手の選び方ごとの正解率・regret・時間
+    
+    Args:
+        positions: 局面
+        references: 局面ごとの手の価値の参照値
+        engine_name: 'ismcts' または 'mcts'
+        root_selection: ルートの手の選び方
+        num_iterations: 1回の探索の探索回数
+        repeats: 局面ごとの探索の繰り返し回数
+    
+    Returns:
+        'accuracy'、'regret'、'ms_per_move'、'accuracy_per_ms'
+    """
+    streams = RandomStreams(BENCHMARK_SEED).child(1)
+    hits = 0
+    regrets = []
+    elapsed = 0.0
+    for position_index, (observable_state, reference) in enumerate(zip(positions, references)):
+        best_value = max(reference.values())
+        for repeat in range(repeats):
+            # 方式によらず同じ乱数ストリームを使い、方式の違いだけを比べる
+            rng = streams.child(position_index, repeat).python_random()
+            if engine_name == 'mcts':
+                state = Determinizer.create_determinization(observable_state, rng=rng)
+                engine = MCTSEngine(rng=rng, root_selection=root_selection)
+                start = time.perf_counter()
+                best_move, _ = engine.search(state, num_iterations=num_iterations)
+            else:
+                engine = ISMCTSEngine(rng=rng, root_selection=root_selection)
+                start = time.perf_counter()
+                best_move, _ = engine.search(observable_state, num_iterations=num_iterations)
+            elapsed += time.perf_counter() - start
+            
+            # 参照値は代表手で計算しているので、参照値に無い手は最低の価値として扱う
+            value = reference.get(best_move, min(reference.values()))
+            hits += value >= best_value
+            regrets.append(best_value - value)
+    
+    count = len(positions) * repeats
+    ms_per_move = elapsed / count * 1000
+    accuracy = hits / count
+    return {
+        'accuracy': accuracy,
+        'regret': statistics.mean(regrets),
+        'ms_per_move': ms_per_move,
+        'accuracy_per_ms': accuracy / ms_per_move if ms_per_move > 0 else float('nan')
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="ルートの手の選び方ごとの最良の手の正解率")
+    parser.add_argument(
+        '--engine', choices=['ismcts', 'mcts'], default='ismcts',
+        help="探索エンジン（デフォルト: ismcts）"
+    )
+    parser.add_argument(
+        '--iterations', type=int, nargs='+', default=[50, 100, 200, 500],
+        help="1回の探索の探索回数（デフォルト: 50 100 200 500）"
+    )
+    parser.add_argument('--repeats', type=int, default=8, help="局面ごとの繰り返し回数（デフォルト: 8）")
+    parser.add_argument('--positions', type=int, default=8, help="局面数（デフォルト: 8）")
+    parser.add_argument(
+        '--reference-worlds', type=int, default=400,
+        help="参照値の計算に使う1局面あたりの世界の数（デフォルト: 400）"
+    )
+    parser.add_argument(
+        '--modes', nargs='+', default=list(ISMCTSEngine.ROOT_SELECTION_MODES),
+        choices=ISMCTSEngine.ROOT_SELECTION_MODES,
+        help="比較するルートの手の選び方（デフォルト: 全て）"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """
+    ベンチマークを実行
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    
+    Returns:
+        探索回数 -> ルートの手の選び方 -> 計測結果 の辞書
+    """
+    args = parse_args(argv)
+    positions = collect_positions(args.positions)
+    references = reference_values(positions, args.reference_worlds)
+    
+    print(f"\n{'#'*60}")
+    print(f"# ルートの手の選び方のベンチマーク（{args.engine}）")
+    print(f"# 局面数: {args.positions} / 繰り返し: {args.repeats} / 参照値の世界数: {args.reference_worlds}")
+    print(f"{'#'*60}")
+    print(
+        f"{'探索回数':>8} {'方式':<20} {'正解率':>8} {'regret':>8} {'ms/手':>8} {'正解率/ms':>10}"
+    )
+    
+    results = {}
+    for num_iterations in args.iterations:
+        results[num_iterations] = {}
+        for root_selection in args.modes:
+            result = measure_accuracy(
+                positions, references, args.engine, root_selection, num_iterations, args.repeats
+            )
+            results[num_iterations][root_selection] = result
+            print(
+                f"{num_iterations:>8} {root_selection:<20} {result['accuracy']:>8.1%} "
+                f"{result['regret']:>8.3f} {result['ms_per_move']:>8.1f} {result['accuracy_per_ms']:>10.5f}"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+決定化のサンプリング方式のベンチマーク
+同じ探索回数で、IS-MCTSのルートの価値の推定がどれだけばらつくかを比較する
+
+固定シードのゲームの途中局面ごとに、乱数ストリームだけを変えて同じ探索回数の探索を繰り返し、
+以下の2つのルートの価値の推定の分散を計測する:
+- IS-MCTS: ルートの平均報酬（stats['root_reward']、木の方策による偏りを含む）
+- flat: 決定化ごとに1回ずつルートからロールアウトした報酬の平均（サンプリングの効果だけを見る）
+分散は局面ごとに計算して平均し、'iid'（独立な一様サンプリング）に対する比で比較する。
+比が1より小さいほど、同じ探索回数で推定が安定している（少ない探索回数で済む）。
+
+実行方法:
+    uv run python benchmark_sampling.py
+    uv run python benchmark_sampling.py --iterations 100 500 --repeats 32 --positions 8
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List, Optional, Sequence
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.determinizer import Determinizer
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.random_streams import RandomStreams
+from src.controllers.rollout_policy import RolloutPolicy
+
+
+# 探索の乱数ストリームのシード（局面・繰り返しごとに子ストリームを派生する）
+BENCHMARK_SEED = 2026
+
+
+def collect_positions(num_positions: int) -> List[ObservableGameState]:
+    """
+    ゲームの途中局面を集める
+    
+    Args:
+        num_positions: 局面数
+    
+    Returns:
+        シードごとに先頭の合法手で数手進めた局面の観測可能状態のリスト
+    """
+    positions = []
+    seed = 0
+    while len(positions) < num_positions:
+        state = GameState(seed=seed)
+        for _ in range(seed % 4 + 1):
+            valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+            if not valid_moves:
+                break
+            state.play_card(*valid_moves[0])
+        if MoveValidator.has_valid_move(state.get_hand(), state.get_field()):
+            positions.append(ObservableGameState.from_game_state(state))
+        seed += 1
+    return positions
+
+
+def measure_variance(
+    positions: Sequence[ObservableGameState],
+    sampling: str,
+    num_iterations: int,
+    repeats: int
+) -> Dict[str, float]:
+    """
+    ルートの価値の推定の分散（局面ごとの分散の平均）
+    
+    Args:
+        positions: 探索する局面
+        sampling: 決定化のサンプリング方式
+        num_iterations: 1回の探索の探索回数
+        repeats: 局面ごとの探索の繰り返し回数
+    
+    Returns:
+        'variance'（IS-MCTSの分散の平均）、'flat_variance'（flatの分散の平均）、
+        'ms_per_search'（1回のIS-MCTS探索の平均時間）
+    """
+    streams = RandomStreams(BENCHMARK_SEED)
+    variances = []
+    flat_variances = []
+    elapsed = 0.0
+    for position_index, observable_state in enumerate(positions):
+        values = []
+        flat_values = []
+        for repeat in range(repeats):
+            # 方式によらず同じ乱数ストリームを使い、方式の違いだけを比べる
+            stream = streams.child(position_index, repeat)
+            engine = ISMCTSEngine(
+                rng=stream.python_random(),
+                determinization_sampling=sampling,
+                determinization_batch_size=num_iterations
+            )
+            start = time.perf_counter()
+            _, stats = engine.search(observable_state, num_iterations=num_iterations)
+            elapsed += time.perf_counter() - start
+            values.append(stats['root_reward'])
+            
+            batch = Determinizer.create_batch(
+                observable_state, num_iterations, stream.numpy_generator(), sampling=sampling
+            )
+            rollout_policy = RolloutPolicy(stream.child(1).python_random())
+            flat_values.append(statistics.mean(
+                rollout_policy.rollout(batch.create_state(index)) for index in range(len(batch))
+            ))
+        variances.append(statistics.variance(values))
+        flat_variances.append(statistics.variance(flat_values))
+    return {
+        'variance': statistics.mean(variances),
+        'flat_variance': statistics.mean(flat_variances),
+        'ms_per_search': elapsed / (len(positions) * repeats) * 1000
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="決定化のサンプリング方式ごとのルートの価値の分散")
+    parser.add_argument(
+        '--iterations', type=int, nargs='+', default=[100, 300],
+        help="1回の探索の探索回数（デフォルト: 100 300）"
+    )
+    parser.add_argument('--repeats', type=int, default=16, help="局面ごとの繰り返し回数（デフォルト: 16）")
+    parser.add_argument('--positions', type=int, default=4, help="局面数（デフォルト: 4）")
+    parser.add_argument(
+        '--modes', nargs='+', default=list(Determinizer.SAMPLING_MODES),
+        choices=Determinizer.SAMPLING_MODES,
+        help="比較するサンプリング方式（デフォルト: 全て）"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """
+    ベンチマークを実行
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    
+    Returns:
+        探索回数 -> サンプリング方式 -> 計測結果 の辞書
+    """
+    args = parse_args(argv)
+    positions = collect_positions(args.positions)
+    
+    print(f"\n{'#'*60}")
+    print(f"# 決定化のサンプリング方式のベンチマーク")
+    print(f"# 局面数: {args.positions} / 繰り返し: {args.repeats}")
+    print(f"{'#'*60}")
+    print(
+        f"{'探索回数':>8} {'方式':<12} {'IS-MCTS分散':>12} {'iid比':>8} "
+        f"{'flat分散':>10} {'iid比':>8} {'ms/探索':>9}"
+    )
+    
+    results = {}
+    for num_iterations in args.iterations:
+        results[num_iterations] = {}
+        for sampling in args.modes:
+            results[num_iterations][sampling] = measure_variance(
+                positions, sampling, num_iterations, args.repeats
+            )
+        baseline = results[num_iterations].get('iid')
+        for sampling, result in results[num_iterations].items():
+            ratios = [
+                result[key] / baseline[key] if baseline and baseline[key] > 0 else float('nan')
+                for key in ('variance', 'flat_variance')
+            ]
+            print(
+                f"{num_iterations:>8} {sampling:<12} {result['variance']:>12.4f} {ratios[0]:>8.2f} "
+                f"{result['flat_variance']:>10.4f} {ratios[1]:>8.2f} {result['ms_per_search']:>9.1f}"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+ワーカープールのベンチマーク
+SearchWorkerPool の起動時間と、1ジョブあたりのオーバーヘッドを計測する
+
+ジョブごとのオーバーヘッドは、探索そのものがほぼ0になるよう先頭の合法手を返すだけの戦略で計測し、
+以下の2つを比較する:
+- pickle: 従来の方式（ジョブごとに戦略とGameStateのオブジェクトグラフをpickleして送る）
+- bytes: SearchWorkerPool（戦略は起動時に1回だけ共有し、ジョブは状態のバイト列のみ）
+
+実行方法:
+    uv run python benchmark_worker_pool.py
+    uv run python benchmark_worker_pool.py --workers 4 --jobs 500 --start-methods spawn
+"""
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+from src.controllers.game_state import GameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.search_worker_pool import SearchWorkerPool
+
+
+class FirstMoveStrategy:
+    """計測用の戦略（先頭の合法手を返すだけなので、オーバーヘッドだけが残る）"""
+    
+    def get_best_move(self, state: GameState):
+        valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+        return valid_moves[0] if valid_moves else None
+
+
+def collect_states(num_states: int) -> List[GameState]:
+    """
+    ゲームの途中局面を集める
+    
+    Args:
+        num_states: 局面数
+    
+    Returns:
+        シードごとに先頭の合法手で数手進めた局面のリスト
+    """
+    states = []
+    for seed in range(num_states):
+        state = GameState(seed=seed)
+        for _ in range(seed % 10):
+            valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+            if not valid_moves:
+                break
+            state.play_card(*valid_moves[0])
+        states.append(state)
+    return states
+
+
+def _search_pickled(strategy: FirstMoveStrategy, state: GameState):
+    """従来の方式のジョブ（戦略と状態をジョブごとに受け取る）"""
+    return strategy.get_best_move(state)
+
+
+def measure_startup(start_method: str, workers: int) -> float:
+    """
+    プールの作成から全ワーカーの初期化完了までの時間
+    
+    Args:
+        start_method: 起動方式
+        workers: ワーカー数
+    
+    Returns:
+        所要時間（ミリ秒）
+    """
+    start = time.perf_counter()
+    with SearchWorkerPool({'first': FirstMoveStrategy()}, workers, start_method) as pool:
+        pool.warm_up(delay=0.0)
+        elapsed = time.perf_counter() - start
+    return elapsed * 1000
+
+
+def measure_job_latency(
+    start_method: str,
+    workers: int,
+    states: Sequence[GameState]
+) -> Dict[str, float]:
+    """
+    1ジョブずつ投入して結果を待つまでの時間（中央値）
+    
+    Args:
+        start_method: 起動方式
+        workers: ワーカー数
+        states: 探索する局面
+    
+    Returns:
+        方式 -> 1ジョブあたりの時間（マイクロ秒）
+    """
+    strategy = FirstMoveStrategy()
+    context = multiprocessing.get_context(start_method)
+    results = {}
+    
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        executor.submit(_search_pickled, strategy, states[0]).result()
+        samples = []
+        for state in states:
+            start = time.perf_counter_ns()
+            executor.submit(_search_pickled, strategy, state).result()
+            samples.append(time.perf_counter_ns() - start)
+        results['pickle'] = statistics.median(samples) / 1000
+    
+    with SearchWorkerPool({'first': strategy}, workers, start_method) as pool:
+        pool.warm_up(delay=0.0)
+        samples = []
+        for state in states:
+            start = time.perf_counter_ns()
+            pool.submit('first', state).result()
+            samples.append(time.perf_counter_ns() - start)
+        results['bytes'] = statistics.median(samples) / 1000
+    
+    return results
+
+
+def payload_sizes(states: Sequence[GameState]) -> Dict[str, float]:
+    """
+    1ジョブあたりの送信バイト数（平均）
+    
+    Args:
+        states: 探索する局面
+    
+    Returns:
+        方式 -> バイト数
+    """
+    strategy = FirstMoveStrategy()
+    pickled = [len(pickle.dumps((strategy, state))) for state in states]
+    encoded = [len(pickle.dumps(SearchWorkerPool.encode_job('first', state))) for state in states]
+    return {
+        'pickle': statistics.mean(pickled),
+        'bytes': statistics.mean(encoded)
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="ワーカープールの起動時間・ジョブのオーバーヘッド")
+    parser.add_argument('--workers', type=int, default=1, help="ワーカープロセス数（デフォルト: 1）")
+    parser.add_argument('--jobs', type=int, default=200, help="レイテンシを計測するジョブ数（デフォルト: 200）")
+    parser.add_argument(
+        '--start-methods', nargs='+', default=multiprocessing.get_all_start_methods(),
+        choices=multiprocessing.get_all_start_methods(),
+        help="計測する起動方式（デフォルト: このOSで使える全て）"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Dict]:
+    """
+    ベンチマークを実行
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    
+    Returns:
+        起動方式 -> 計測結果 の辞書
+    """
+    args = parse_args(argv)
+    states = collect_states(args.jobs)
+    sizes = payload_sizes(states)
+    
+    print(f"\n{'#'*60}")
+    print(f"# ワーカープールのベンチマーク")
+    print(f"# ワーカー数: {args.workers} / ジョブ数: {args.jobs} / CPU数: {os.cpu_count()}")
+    print(f"# 1ジョブの送信サイズ: pickle {sizes['pickle']:.0f}B / bytes {sizes['bytes']:.0f}B")
+    print(f"{'#'*60}")
+    print(f"{'起動方式':<12} {'起動(ms)':>10} {'pickle(µs/job)':>16} {'bytes(µs/job)':>15}")
+    
+    results = {}
+    for start_method in args.start_methods:
+        startup_ms = measure_startup(start_method, args.workers)
+        latency = measure_job_latency(start_method, args.workers, states)
+        results[start_method] = {'startup_ms': startup_ms, 'latency_us': latency}
+        print(
+            f"{start_method:<12} {startup_ms:>10.1f} "
+            f"{latency['pickle']:>16.0f} {latency['bytes']:>15.0f}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
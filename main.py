@@ -3,6 +3,7 @@ vrchat-twin-cool-emulator メインエントリーポイント
 VRChat「MedalGameWorld」ワールドのカードゲームエミュレータ
 """
 
+import random
 from src.models import Suit, Card, Deck, Hand, FieldSlot, Field, PointCalculator
 from src.controllers import Game, MoveValidator, GameState, MCTSStrategy
 
@@ -99,7 +100,7 @@ def run_mcts_demo(seed: int = 42, num_iterations: int = 500):
     print()
     
     # 戦略を作成
-    strategy = MCTSStrategy(num_iterations=num_iterations, verbose=False)
+    strategy = MCTSStrategy(num_iterations=num_iterations, verbose=False, rng=random.Random(seed))
     
     # 初期状態を作成
     state = GameState(seed=seed)
@@ -0,0 +1,175 @@
+"""
+探索プロファイルCLI
+1手分の探索（MCTS / IS-MCTS）をプロファイルし、入力状態のスナップショットと一緒に保存する
+
+「この手札でMCTSに8秒かかった」といった遅いケースを、スナップショットから
+同じ乱数状態で再実行してオフラインでプロファイルできる。
+
+実行方法:
+    # シード42の局面をヒューリスティックで5手進めてから、IS-MCTS 1000回をプロファイル
+    uv run python profile_search.py capture --strategy ismcts --seed 42 --turns 5 --iterations 1000
+    
+    # 保存したスナップショットを再実行してプロファイル（pyinstrumentを使う場合は --pyinstrument）
+    uv run python profile_search.py replay profiles/ismcts_20261019-120000_1234_1.snapshot.pkl
+    
+    # 保存済みのcProfile結果を表示
+    uv run python profile_search.py show profiles/ismcts_20261019-120000_1234_1.prof --top 30
+"""
+
+import argparse
+import os
+import pstats
+import time
+from typing import Optional, Sequence
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.heuristic_strategy import HeuristicStrategy
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers.ismcts_strategy import ISMCTSStrategy
+from src.controllers.search_profiler import SearchProfiler
+
+
+def build_state(seed: int, turns: int) -> GameState:
+    """
+    シードの初期局面からヒューリスティック戦略で指定手数だけ進めた局面を作成
+    
+    Args:
+        seed: ゲームのシード
+        turns: 進める手数（途中でゲームが終わった場合はその局面）
+    
+    Returns:
+        ゲーム状態
+    """
+    state = GameState(seed=seed)
+    heuristic = HeuristicStrategy()
+    for _ in range(turns):
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        move = heuristic.get_best_move(obs_state)
+        if move is None:
+            break
+        card, slot = move
+        state.play_card(card, slot)
+    return state
+
+
+def print_profile(prefix: str, top: int):
+    """
+    プロファイル結果の上位を表示
+    
+    Args:
+        prefix: 出力ファイルの共通プレフィックス
+        top: 表示する関数の数
+    """
+    if os.path.exists(prefix + '.prof'):
+        pstats.Stats(prefix + '.prof').sort_stats('cumulative').print_stats(top)
+    print(f"スナップショット: {prefix}.snapshot.pkl")
+    for extension in ('.prof', '.pyinstrument.html'):
+        if os.path.exists(prefix + extension):
+            print(f"プロファイル: {prefix}{extension}")
+
+
+def capture(args: argparse.Namespace) -> str:
+    """
+    局面を作成して1手分の探索をプロファイル
+    
+    Args:
+        args: コマンドライン引数
+    
+    Returns:
+        出力ファイルの共通プレフィックス
+    """
+    profiler = SearchProfiler(args.output_dir, use_pyinstrument=args.pyinstrument)
+    time_limit = args.time_limit / 1000 if args.time_limit is not None else None
+    state = build_state(args.seed, args.turns)
+    
+    if args.strategy == 'mcts':
+        strategy = MCTSStrategy(
+            num_iterations=args.iterations,
+            selection=args.selection,
+            time_limit=time_limit,
+            profiler=profiler
+        )
+        search_state = state
+    else:
+        strategy = ISMCTSStrategy(
+            num_iterations=args.iterations,
+            selection=args.selection,
+            time_limit=time_limit,
+            profiler=profiler
+        )
+        search_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+    
+    start = time.perf_counter()
+    best_move = strategy.get_best_move(search_state, profile=True)
+    print(f"最良の手: {best_move}（{time.perf_counter() - start:.2f}秒）")
+    return strategy.last_profile_path
+
+
+def replay(args: argparse.Namespace) -> str:
+    """
+    スナップショットから探索を再実行してプロファイル
+    
+    Args:
+        args: コマンドライン引数
+    
+    Returns:
+        出力ファイルの共通プレフィックス
+    """
+    profiler = SearchProfiler(args.output_dir, use_pyinstrument=args.pyinstrument)
+    start = time.perf_counter()
+    best_move, prefix = profiler.replay(args.snapshot)
+    print(f"最良の手: {best_move}（{time.perf_counter() - start:.2f}秒）")
+    return prefix
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="1手分の探索のプロファイル")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    capture_parser = subparsers.add_parser('capture', help="局面を作成して探索をプロファイル")
+    capture_parser.add_argument('--strategy', choices=['mcts', 'ismcts'], default='ismcts', help="戦略（デフォルト: ismcts）")
+    capture_parser.add_argument('--selection', choices=['ucb1', 'puct'], default='ucb1', help="選択方式（デフォルト: ucb1）")
+    capture_parser.add_argument('--seed', type=int, default=42, help="ゲームのシード（デフォルト: 42）")
+    capture_parser.add_argument('--turns', type=int, default=0, help="探索前にヒューリスティックで進める手数（デフォルト: 0）")
+    capture_parser.add_argument('--iterations', type=int, default=1000, help="探索回数（デフォルト: 1000）")
+    capture_parser.add_argument('--time-limit', type=float, help="探索時間の上限（ミリ秒）")
+    
+    replay_parser = subparsers.add_parser('replay', help="スナップショットから探索を再実行してプロファイル")
+    replay_parser.add_argument('snapshot', help="スナップショットのパス（*.snapshot.pkl）")
+    
+    for subparser in (capture_parser, replay_parser):
+        subparser.add_argument('--output-dir', default='profiles', help="出力先ディレクトリ（デフォルト: profiles）")
+        subparser.add_argument('--pyinstrument', action='store_true', help="cProfileの代わりにpyinstrumentを使う")
+        subparser.add_argument('--top', type=int, default=25, help="表示する関数の数（デフォルト: 25）")
+    
+    show_parser = subparsers.add_parser('show', help="保存済みのcProfile結果を表示")
+    show_parser.add_argument('profile', help="プロファイルのパス（*.prof）")
+    show_parser.add_argument('--sort', default='cumulative', help="並べ替えのキー（デフォルト: cumulative）")
+    show_parser.add_argument('--top', type=int, default=25, help="表示する関数の数（デフォルト: 25）")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    プロファイルを実行
+    
+    Args:
+        argv: コマンドライン引数（Noneの場合はsys.argv）
+    
+    Returns:
+        出力ファイルの共通プレフィックス（show の場合はNone）
+    """
+    args = parse_args(argv)
+    
+    if args.command == 'show':
+        pstats.Stats(args.profile).sort_stats(args.sort).print_stats(args.top)
+        return None
+    
+    prefix = capture(args) if args.command == 'capture' else replay(args)
+    print_profile(prefix, args.top)
+    return prefix
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,28 @@ from .mcts_strategy import MCTSStrategy
 from .observable_game_state import ObservableGameState
 from .flexibility_calculator import FlexibilityCalculator
 from .heuristic_strategy import HeuristicStrategy
+from .expansion_policy import ExpansionPolicy
+from .prior_provider import PriorProvider
+from .heuristic_prior_provider import HeuristicPriorProvider
+from .puct_selector import PUCTSelector
+from .unknown_card_counter import UnknownCardCounter
+from .rollout_policy import RolloutPolicy
+from .epsilon_greedy_rollout_policy import EpsilonGreedyRolloutPolicy
+from .softmax_rollout_policy import SoftmaxRolloutPolicy
+from .rollout_cache import RolloutCache
+from .search_instrumentation import SearchInstrumentation
+from .search_profiler import SearchProfiler
+from .state_codec import StateCodec
+from .search_worker_pool import SearchWorkerPool
+from .search_job_scheduler import SearchJobScheduler
+from .recommendation_cache import RecommendationCache
+from .state_history import StateHistory
+from .random_streams import RandomStreams
+from .determinization_batch import DeterminizationBatch
+from .flat_monte_carlo_engine import FlatMonteCarloEngine
+from .sequential_halving import SequentialHalving
+from .early_stopping import EarlyStopping
+from .decision_triage import DecisionTriage
 
 __all__ = [
     'MoveValidator',
@@ -25,4 +47,26 @@ __all__ = [
     'ObservableGameState',
     'FlexibilityCalculator',
     'HeuristicStrategy',
+    'ExpansionPolicy',
+    'PriorProvider',
+    'HeuristicPriorProvider',
+    'PUCTSelector',
+    'UnknownCardCounter',
+    'RolloutPolicy',
+    'EpsilonGreedyRolloutPolicy',
+    'SoftmaxRolloutPolicy',
+    'RolloutCache',
+    'SearchInstrumentation',
+    'SearchProfiler',
+    'StateCodec',
+    'SearchWorkerPool',
+    'SearchJobScheduler',
+    'RecommendationCache',
+    'StateHistory',
+    'RandomStreams',
+    'DeterminizationBatch',
+    'FlatMonteCarloEngine',
+    'SequentialHalving',
+    'EarlyStopping',
+    'DecisionTriage',
 ]
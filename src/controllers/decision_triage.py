@@ -0,0 +1,223 @@
+"""
+手の事前判定 (Decision Triage)
+探索しなくても答えが決まる局面を、探索の前にマイクロ秒で解決する
+"""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..models.card import Card
+from ..models.suit import Suit
+from ..models.hand import Hand
+from ..models.field import Field
+from .move_validator import MoveValidator
+
+
+class DecisionTriage:
+    """
+    MCTS / IS-MCTS の探索の前に、自明な局面を判定するクラス
+    
+    以下の規則を順に試し、手が1つに決まった時点でその手を返す:
+    - 'no_move': 合法手が無い（Noneを返す）
+    - 'single_move': 合法手が1つしかない
+    - 'symmetric': 合法手が全てスロットの入れ替えで同値（代表手が1つ）
+    - 'dominated': 支配される手を除くと代表手が1つになる
+    どの規則でも決まらない局面だけを探索する（'searched' として数える）。
+    
+    支配される手:
+    同じカードを両方のスロットに出せるとき、片方のスロットのトップカードが「死んでいる」
+    （残りの手札にも未知のカードにも、そのトップとスートか数値が一致するカードが無く、
+    二度とその上にカードを出せない）なら、生きているトップの上に出す手は、
+    死んでいるトップの上に出す手に支配される。手札は同じで、死んでいるトップは
+    以降の展開に影響しないため、死んでいるトップを覆う方が選べる手が減ることはない。
+    （両方のトップが死んでいる場合はどちらも同じなので、スロット1に出す手を残す）
+    
+    counters に規則ごとに決まった回数を数える（複数の戦略で共有できる）。
+    
+    未知のカードは「全80枚 − 手札 − known_cards（出したカード・分かっている除外カード）」の
+    スート別・数値別の枚数だけを数える（未知のカードのリストは作らない）。
+    
+    Usage:
+        triage = DecisionTriage()
+        strategy = ISMCTSStrategy(num_iterations=1000, triage=triage)
+        ...
+        print(triage.get_statistics())
+    """
+    
+    RULES = ('no_move', 'single_move', 'symmetric', 'dominated')
+    VALUES_PER_SUIT = 10
+    
+    def __init__(self):
+        """事前判定の初期化"""
+        self.reset()
+    
+    def reset(self):
+        """規則ごとの回数をクリア"""
+        self.counters: Dict[str, int] = {rule: 0 for rule in self.RULES + ('searched',)}
+        # 直近の判定で決まった規則（探索が必要だった場合はNone）
+        self.last_rule: Optional[str] = None
+    
+    def resolve(
+        self,
+        hand: Hand,
+        field: Field,
+        known_cards: Iterable[Card]
+    ) -> Tuple[bool, Optional[Tuple[Card, int]]]:
+        """
+        局面を判定
+        
+        Args:
+            hand: 手札
+            field: 場
+            known_cards: 手札以外で、今後手札に来ないと分かっているカード
+                         （出したカードと、分かっている除外カード）
+        
+        Returns:
+            (手が決まったか, 決まった手)。合法手が無い場合は (True, None)、
+            探索が必要な場合は (False, None)
+        """
+        valid_moves = MoveValidator.get_valid_moves(hand, field)
+        if len(valid_moves) == 0:
+            return self._resolved('no_move', None)
+        if len(valid_moves) == 1:
+            return self._resolved('single_move', valid_moves[0])
+        
+        canonical_moves = MoveValidator.deduplicate_moves(valid_moves, field)
+        if len(canonical_moves) == 1:
+            return self._resolved('symmetric', canonical_moves[0])
+        
+        undominated_moves = self.remove_dominated_moves(
+            canonical_moves, hand, field, known_cards
+        )
+        if len(undominated_moves) == 1:
+            return self._resolved('dominated', undominated_moves[0])
+        
+        self.counters['searched'] += 1
+        self.last_rule = None
+        return False, None
+    
+    @staticmethod
+    def remove_dominated_moves(
+        moves: List[Tuple[Card, int]],
+        hand: Hand,
+        field: Field,
+        known_cards: Iterable[Card]
+    ) -> List[Tuple[Card, int]]:
+        """
+        支配される手（死んでいないトップを覆う手）を除く
+        
+        Args:
+            moves: 手のリスト
+            hand: 手札
+            field: 場
+            known_cards: 手札以外で、今後手札に来ないと分かっているカード
+        
+        Returns:
+            支配される手を除いた手のリスト（元の順序を保持）
+        """
+        slots_by_card: Dict[Card, List[int]] = {}
+        for card, slot_number in moves:
+            slots_by_card.setdefault(card, []).append(slot_number)
+        both_slot_cards = [card for card, slots in slots_by_card.items() if len(slots) == 2]
+        if not both_slot_cards:
+            return moves
+        
+        hand_cards = hand.get_cards()
+        unknown_suits, unknown_values = DecisionTriage._count_unknown(hand_cards, known_cards)
+        top_cards = {1: field.get_top_card(1), 2: field.get_top_card(2)}
+        dominated = set()
+        for card in both_slot_cards:
+            remaining_cards = [other for other in hand_cards if other != card]
+            live = {
+                slot_number: DecisionTriage._is_live(
+                    top_card, remaining_cards, unknown_suits, unknown_values
+                )
+                for slot_number, top_card in top_cards.items()
+            }
+            if not live[1]:
+                # スロット1のトップが死んでいるなら、スロット1に出す
+                dominated.add((card, 2))
+            elif not live[2]:
+                dominated.add((card, 1))
+        return [move for move in moves if move not in dominated]
+    
+    @staticmethod
+    def _count_unknown(
+        hand_cards: Iterable[Card],
+        known_cards: Iterable[Card]
+    ) -> Tuple[Dict[Suit, int], Dict[int, int]]:
+        """
+        未知のカードのスート別・数値別の枚数
+        
+        Args:
+            hand_cards: 手札のカード
+            known_cards: 手札以外で、今後手札に来ないと分かっているカード
+        
+        Returns:
+            (スート -> 枚数, 数値 -> 枚数)
+        """
+        known_suits: Counter = Counter()
+        known_values: Counter = Counter()
+        for cards in (hand_cards, known_cards):
+            for card in cards:
+                known_suits[card.suit] += 1
+                known_values[card.value] += 1
+        unknown_suits = {suit: DecisionTriage.VALUES_PER_SUIT - known_suits[suit] for suit in Suit}
+        unknown_values = {
+            value: len(Suit) - known_values[value]
+            for value in range(1, DecisionTriage.VALUES_PER_SUIT + 1)
+        }
+        return unknown_suits, unknown_values
+    
+    @staticmethod
+    def _is_live(
+        top_card: Optional[Card],
+        remaining_cards: Iterable[Card],
+        unknown_suits: Dict[Suit, int],
+        unknown_values: Dict[int, int]
+    ) -> bool:
+        """
+        トップカードの上に、今後カードを出せる可能性があるか
+        
+        Args:
+            top_card: トップカード（Noneの場合は空のスロットで、常に出せる）
+            remaining_cards: 手を打った後の手札
+            unknown_suits: 未知のカードのスート別の枚数
+            unknown_values: 未知のカードの数値別の枚数
+        
+        Returns:
+            残りの手札か未知のカードに、スートか数値が一致するカードがあればTrue
+        """
+        if top_card is None:
+            return True
+        if unknown_suits[top_card.suit] > 0 or unknown_values[top_card.value] > 0:
+            return True
+        return any(MoveValidator.can_play_card(card, top_card) for card in remaining_cards)
+    
+    def _resolved(
+        self,
+        rule: str,
+        move: Optional[Tuple[Card, int]]
+    ) -> Tuple[bool, Optional[Tuple[Card, int]]]:
+        """規則で決まった手を記録して返す"""
+        self.counters[rule] += 1
+        self.last_rule = rule
+        return True, move
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        規則ごとの回数
+        
+        Returns:
+            規則ごとの回数（'searched' は探索が必要だった回数）、'total'、
+            'resolved_rate'（探索せずに決まった割合）
+        """
+        total = sum(self.counters.values())
+        resolved = total - self.counters['searched']
+        return {
+            **self.counters,
+            'total': total,
+            'resolved_rate': resolved / total if total > 0 else 0.0
+        }
+    
+    def __repr__(self) -> str:
+        return f"DecisionTriage(counters={self.counters})"
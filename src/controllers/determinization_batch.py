@@ -0,0 +1,104 @@
+"""
+決定化の一括生成結果 (Determinization Batch)
+K個の決定化を、カード番号の行列として保持する
+"""
+
+from typing import List, Sequence
+import numpy as np
+from ..models.card import Card
+from ..models.indexed_deck import IndexedDeck
+from .game_state import GameState
+from .observable_game_state import ObservableGameState
+
+
+class DeterminizationBatch:
+    """
+    Determinizer.create_batch() が生成するK個の決定化
+    
+    - orders: K×N の int8 行列。各行が1つの決定化の山札（列0が最初に引くカード）
+    - excluded: K×H の int8 行列。各行の分かっていない除外カード
+      （未出現カードのうち、その行の山札に入らなかったカード）
+    
+    カード番号は 0〜79（スート番号 × 10 + 数値 - 1）。どちらの行列も読み取り専用。
+    create_state() は行をそのまま山札（IndexedDeck）として使うので、
+    Cardのリストを作らずに O(1) で GameState を構築できる。
+    """
+    
+    def __init__(
+        self,
+        observable_state: ObservableGameState,
+        orders: np.ndarray,
+        excluded: np.ndarray,
+        known_excluded_cards: Sequence[Card],
+        cards: Sequence[Card]
+    ):
+        """
+        一括生成結果の初期化
+        
+        Args:
+            observable_state: 決定化の元になった観測可能なゲーム状態
+            orders: 山札のカード番号の行列（K×N、int8）
+            excluded: 分かっていない除外カードのカード番号の行列（K×H、int8）
+            known_excluded_cards: 分かっている除外カード（全ての行で共通）
+            cards: カード番号 -> カード の対応表
+        """
+        if orders.shape[0] != excluded.shape[0]:
+            raise ValueError(
+                f"山札と除外カードの行数が一致しません: {orders.shape[0]} != {excluded.shape[0]}"
+            )
+        self.observable_state = observable_state
+        self.orders = orders
+        self.excluded = excluded
+        self.known_excluded_cards = tuple(known_excluded_cards)
+        self.cards = cards
+    
+    @property
+    def deck_size(self) -> int:
+        """各決定化の山札の枚数（N）"""
+        return self.orders.shape[1]
+    
+    def deck_cards(self, index: int) -> List[Card]:
+        """
+        index番目の決定化の山札を取得
+        
+        Args:
+            index: 行番号
+        
+        Returns:
+            山札のカード（先頭が最初に引くカード）
+        """
+        cards = self.cards
+        return [cards[card_index] for card_index in self.orders[index]]
+    
+    def excluded_cards(self, index: int) -> List[Card]:
+        """
+        index番目の決定化の除外カードを取得
+        
+        Args:
+            index: 行番号
+        
+        Returns:
+            分かっている除外カード + その行の分かっていない除外カード
+        """
+        cards = self.cards
+        return list(self.known_excluded_cards) + [cards[card_index] for card_index in self.excluded[index]]
+    
+    def create_state(self, index: int) -> GameState:
+        """
+        index番目の決定化をGameStateとして構築（山札は行をそのまま使う IndexedDeck）
+        
+        Args:
+            index: 行番号
+        
+        Returns:
+            完全なGameState
+        """
+        deck = IndexedDeck(self.orders[index], self.cards, self.excluded[index], self.known_excluded_cards)
+        return GameState.from_observable_with_deck(self.observable_state, deck)
+    
+    def __len__(self) -> int:
+        """決定化の数（K）"""
+        return self.orders.shape[0]
+    
+    def __repr__(self) -> str:
+        return f"DeterminizationBatch(count={len(self)}, deck_size={self.deck_size})"
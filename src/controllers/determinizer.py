@@ -3,12 +3,16 @@
 観測可能状態から完全なゲーム状態をサンプリングする
 """
 
+import math
 import random
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from ..models.card import Card
 from ..models.suit import Suit
+from ..models.lazy_deck import LazyDeck
 from .observable_game_state import ObservableGameState
 from .game_state import GameState
+from .determinization_batch import DeterminizationBatch
 
 
 class Determinizer:
@@ -19,14 +23,30 @@ class Determinizer:
     完全なゲーム状態（決定化）をサンプリングする。
     
     決定化の手順:
-    1. 未出現カード（全80枚 - 手札 - 既出カード）を取得
-    2. ランダムに10枚を除外カードとして選択
+    1. 未出現カード（全80枚 - 手札 - 既出カード - 分かっている除外カード）を取得
+    2. 分かっていない除外カードの枚数（10枚 - 分かっている枚数）をランダムに選択
     3. 残りを山札としてシャッフル
-    4. GameStateを構築
+    4. GameStateを構築（除外カード = 分かっている除外カード + 2で選んだカード）
+    
+    分かっている除外カードは山札にも除外カードの候補にも入らないので、
+    観測と矛盾する決定化は生成しない。
+    
+    遅延決定化（create_lazy_determinization）では2〜3を行わず、
+    山札から引くたびに未出現カードから1枚ずつサンプリングする。
+    一括決定化（create_batch）では2〜3をK個分まとめてNumPyで行う。
+    一括決定化では、分散を減らすサンプリング方式（層別・対称）も選べる。
     """
     
+    # 一括決定化のサンプリング方式
+    # - iid: 独立な一様ランダム順列
+    # - stratified: 潜在的な特徴量（除外カードのうち手札・場と関係するカードの枚数、次に引くカードの種類）で層別
+    # - antithetic: 乱数キー u と 1 - u の組（2行ずつ、互いに逆順の山札）
+    SAMPLING_MODES = ('iid', 'stratified', 'antithetic')
+    
     # カードプールをクラス変数としてキャッシュ（最適化）
     _all_cards_cache: Optional[List[Card]] = None
+    # カード -> カード番号（全80枚のリストでの位置 = スート番号 × 10 + 数値 - 1）
+    _card_index_cache: Optional[Dict[Card, int]] = None
     
     @classmethod
     def _get_all_cards(cls) -> List[Card]:
@@ -46,33 +66,37 @@ class Determinizer:
     @staticmethod
     def create_determinization(
         observable_state: ObservableGameState,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None
     ) -> GameState:
         """
         決定化を1つ生成
         
         Args:
             observable_state: 観測可能なゲーム状態
-            seed: 乱数シード（テスト用）
+            seed: 乱数シード（テスト用、rng省略時にこの決定化専用の乱数を生成する）
+            rng: 乱数生成器（省略時はseedから生成、
+                 seedも省略した場合はrandomモジュールのグローバル乱数）
         
         Returns:
             完全なGameState
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
         
         # 未出現カードを取得
         unplayed_cards = Determinizer._get_unplayed_cards(observable_state)
         
-        # ランダムに10枚を除外
+        # 分かっていない除外カードをランダムに選ぶ
         shuffled = unplayed_cards.copy()
-        random.shuffle(shuffled)
+        rng.shuffle(shuffled)
         
-        excluded_cards = shuffled[:10]
-        deck_cards = shuffled[10:]
+        hidden_count = Determinizer._get_hidden_excluded_count(observable_state)
+        excluded_cards = Determinizer._get_known_excluded_cards(observable_state) + shuffled[:hidden_count]
+        deck_cards = shuffled[hidden_count:]
         
         # 山札をさらにシャッフル
-        random.shuffle(deck_cards)
+        rng.shuffle(deck_cards)
         
         # 完全なGameStateを構築
         game_state = GameState.from_observable_determinization(
@@ -87,10 +111,258 @@ class Determinizer:
         
         return game_state
     
+    @classmethod
+    def _get_card_index(cls) -> Dict[Card, int]:
+        """
+        カード -> カード番号 の対応表を取得（キャッシュ付き）
+        
+        Returns:
+            対応表
+        """
+        if cls._card_index_cache is None:
+            cls._card_index_cache = {card: index for index, card in enumerate(cls._get_all_cards())}
+        return cls._card_index_cache
+    
+    @staticmethod
+    def create_batch(
+        observable_state: ObservableGameState,
+        k: int,
+        rng: Optional[np.random.Generator] = None,
+        unknown_pool: Optional[Sequence[Card]] = None,
+        sampling: str = 'iid'
+    ) -> DeterminizationBatch:
+        """
+        K個の決定化を一括生成
+        
+        未出現カード（U枚）ごとにK×Uの一様乱数のキーを作り、行ごとの argsort で
+        K個の一様ランダム順列を1回のベクトル演算で得る。各行の先頭H枚
+        （H = 分かっていない除外カードの枚数）を除外カード、残りN枚を山札とする。
+        
+        sampling で行どうしの関係を選べる（どの方式でも、各行の分布は一様ランダム順列のまま）:
+        - 'iid': 各行が独立
+        - 'stratified': 層別サンプリング（_stratified_permutations を参照）
+        - 'antithetic': 対称サンプリング。2行目ごとに直前の行と逆順の順列を使う
+          （一方で早く引くカードが、もう一方では除外カード・山札の底になる）
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            k: 生成する決定化の数
+            rng: NumPyの乱数生成器（省略時は新しく生成）
+            unknown_pool: get_unknown_pool() の結果（省略時はここで計算）
+            sampling: サンプリング方式（SAMPLING_MODES のいずれか）
+        
+        Returns:
+            K×N の山札の行列と K×H の除外カードの行列を持つ DeterminizationBatch
+        """
+        if k < 1:
+            raise ValueError(f"決定化の数は1以上である必要があります: {k}")
+        if sampling not in Determinizer.SAMPLING_MODES:
+            raise ValueError(
+                f"samplingは{Determinizer.SAMPLING_MODES}のいずれかである必要があります: {sampling}"
+            )
+        if rng is None:
+            rng = np.random.default_rng()
+        if unknown_pool is None:
+            unknown_pool = Determinizer.get_unknown_pool(observable_state)
+        
+        card_index = Determinizer._get_card_index()
+        pool_indices = np.fromiter(
+            (card_index[card] for card in unknown_pool),
+            dtype=np.int8,
+            count=len(unknown_pool)
+        )
+        hidden_count = min(Determinizer._get_hidden_excluded_count(observable_state), len(unknown_pool))
+        
+        # 行ごとの一様ランダム順列（乱数キーの argsort）
+        if sampling == 'stratified':
+            permutations = Determinizer._stratified_permutations(
+                observable_state, unknown_pool, hidden_count, k, rng
+            )
+        elif sampling == 'antithetic':
+            base_keys = rng.random(((k + 1) // 2, len(unknown_pool)))
+            keys = np.empty((2 * len(base_keys), len(unknown_pool)))
+            keys[0::2] = base_keys
+            keys[1::2] = 1.0 - base_keys
+            permutations = np.argsort(keys[:k], axis=1)
+        else:
+            permutations = np.argsort(rng.random((k, len(unknown_pool))), axis=1)
+        shuffled = pool_indices[permutations]
+        shuffled.flags.writeable = False
+        
+        return DeterminizationBatch(
+            observable_state,
+            orders=shuffled[:, hidden_count:],
+            excluded=shuffled[:, :hidden_count],
+            known_excluded_cards=Determinizer._get_known_excluded_cards(observable_state),
+            cards=Determinizer._get_all_cards()
+        )
+    
+    @staticmethod
+    def _stratified_permutations(
+        observable_state: ObservableGameState,
+        unknown_pool: Sequence[Card],
+        hidden_count: int,
+        k: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        層別サンプリングで K 個の順列を生成
+        
+        未出現カードを、次の手番での役割で3つのグループに分ける:
+        - 0: 場のトップカード（空でないスロット）とスートまたは数値が一致する（すぐ出せる）
+        - 1: 0以外で、手札のいずれかのカードとスートまたは数値が一致する
+        - 2: それ以外
+        
+        ルートの価値を左右する2つの潜在的な特徴量で層を作る:
+        - X: 分かっていない除外カードのうち、グループ0・1（関係するカード）の枚数（超幾何分布）
+        - Y: 次に引くカードのグループ（X の条件付きの分布）
+        
+        (X, Y) の同時分布の累積分布を K 等分した区間から1点ずつ取って各行の層を決め
+        （各層の行数は K × 確率 と1未満しか違わない）、層の中では一様にサンプリングする。
+        各行の周辺分布は一様ランダム順列のままなので、推定は不偏で分散だけが減る。
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            unknown_pool: 未出現カード（U枚）
+            hidden_count: 分かっていない除外カードの枚数（H）
+            k: 生成する順列の数
+            rng: NumPyの乱数生成器
+        
+        Returns:
+            K×U の順列（先頭H列が除外カード、列Hが次に引くカード）
+        """
+        pool_size = len(unknown_pool)
+        deck_size = pool_size - hidden_count
+        hand_cards = observable_state.hand.get_cards()
+        hand_suits = {card.suit for card in hand_cards}
+        hand_values = {card.value for card in hand_cards}
+        field = observable_state.field
+        top_cards = [top for top in (field.get_top_card(1), field.get_top_card(2)) if top is not None]
+        groups = np.fromiter(
+            (
+                0 if any(card.suit == top.suit or card.value == top.value for top in top_cards)
+                else 1 if card.suit in hand_suits or card.value in hand_values
+                else 2
+                for card in unknown_pool
+            ),
+            dtype=np.int64,
+            count=pool_size
+        )
+        group_sizes = np.bincount(groups, minlength=3)
+        related = groups < 2
+        related_count = int(group_sizes[0] + group_sizes[1])
+        other_count = int(group_sizes[2])
+        
+        # (X, Y) の同時分布（山札が空の場合は Y = -1）
+        # 除外カードの関係するカードは一様に選ばれるので、残りの関係するカードに占める
+        # グループ0・1の割合は元の枚数の比と同じになる
+        strata_x = []
+        strata_y = []
+        probabilities = []
+        total = math.comb(pool_size, hidden_count)
+        for x in range(max(0, hidden_count - other_count), min(hidden_count, related_count) + 1):
+            p_x = math.comb(related_count, x) * math.comb(other_count, hidden_count - x) / total
+            if deck_size == 0:
+                next_probabilities = [(-1, 1.0)]
+            else:
+                p_related = (related_count - x) / deck_size
+                next_probabilities = [
+                    (0, p_related * group_sizes[0] / related_count if related_count else 0.0),
+                    (1, p_related * group_sizes[1] / related_count if related_count else 0.0),
+                    (2, (other_count - (hidden_count - x)) / deck_size)
+                ]
+            for y, p_y in next_probabilities:
+                if p_x * p_y > 0.0:
+                    strata_x.append(x)
+                    strata_y.append(y)
+                    probabilities.append(p_x * p_y)
+        cumulative = np.cumsum(probabilities)
+        cumulative[-1] = 1.0
+        
+        # 累積分布の K 等分した区間から1点ずつ（行の並びは層と無関係にする）
+        points = (rng.permutation(k) + rng.random(k)) / k
+        strata = np.minimum(np.searchsorted(cumulative, points, side='right'), len(cumulative) - 1)
+        x = np.asarray(strata_x)[strata][:, None]
+        y = np.asarray(strata_y)[strata][:, None]
+        
+        def group_ranks(keys: np.ndarray, group_ids: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+            # 乱数キー（0以上2未満）の、グループの中での順位
+            order = np.argsort(keys + 2.0 * group_ids, axis=1)
+            ranks = np.empty_like(order)
+            np.put_along_axis(ranks, order, np.arange(pool_size), axis=1)
+            offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            return ranks - offsets[group_ids]
+        
+        # 1. 次に引くカード: グループ Y の中で乱数キーが最小のカード
+        next_card = (groups == y) & (group_ranks(rng.random((k, pool_size)), groups, group_sizes) == 0)
+        
+        # 2. 除外カード: 次に引くカードを除き、関係するカードから X 枚、それ以外から H - X 枚
+        #    （次に引くカードのキーを1以上にして、グループの中で最後に回す）
+        related_ids = (~related).astype(np.int64)
+        ranks = group_ranks(
+            rng.random((k, pool_size)) + next_card,
+            related_ids,
+            np.array([related_count, other_count])
+        )
+        excluded = ranks < np.where(related, x, hidden_count - x)
+        
+        # 3. 除外カード・次に引くカード・残り（新しい乱数キーで一様な順）の順に並べる
+        bucket = np.where(excluded, 0.0, np.where(next_card, 1.0, 2.0))
+        return np.argsort(bucket + rng.random((k, pool_size)), axis=1)
+    
+    @staticmethod
+    def get_unknown_pool(observable_state: ObservableGameState) -> Tuple[Card, ...]:
+        """
+        遅延決定化で共有する未出現カードの列を取得
+        
+        同じ観測可能状態からの遅延決定化では、この列を1回だけ計算して使い回せる。
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+        
+        Returns:
+            未出現カードのタプル（不変）
+        """
+        return tuple(Determinizer._get_unplayed_cards(observable_state))
+    
+    @staticmethod
+    def create_lazy_determinization(
+        observable_state: ObservableGameState,
+        unknown_pool: Optional[Sequence[Card]] = None,
+        rng: Optional[random.Random] = None
+    ) -> GameState:
+        """
+        遅延決定化を1つ生成
+        
+        山札の順序と除外カードを決めずに、山札（LazyDeck）から引くたびに
+        未出現カードから1枚ずつサンプリングする。最後まで引かれなかったカードが
+        分かっていない除外カードになるため、分布は create_determinization と同じで、
+        コストは実際に引いた枚数に比例する。
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            unknown_pool: get_unknown_pool() の結果（省略時はここで計算）
+            rng: 山札から引くときの乱数生成器（省略時はrandomモジュールのグローバル乱数）
+        
+        Returns:
+            山札が LazyDeck の GameState
+        """
+        if unknown_pool is None:
+            unknown_pool = Determinizer.get_unknown_pool(observable_state)
+        deck_size = min(observable_state.remaining_deck_size, len(unknown_pool))
+        
+        deck = LazyDeck(
+            unknown_pool,
+            deck_size,
+            rng,
+            excluded_cards=Determinizer._get_known_excluded_cards(observable_state)
+        )
+        return GameState.from_observable_with_deck(observable_state, deck)
+    
     @staticmethod
     def _get_unplayed_cards(observable_state: ObservableGameState) -> List[Card]:
         """
-        未出現カード（山札候補 + 除外10枚候補）を取得
+        未出現カード（山札候補 + 分かっていない除外カードの候補）を取得
         
         Args:
             observable_state: 観測可能なゲーム状態
@@ -100,21 +372,54 @@ class Determinizer:
         """
         all_cards = Determinizer._get_all_cards()
         
-        # 既知のカード（手札 + 既出カード）
-        hand_cards = observable_state.hand.get_cards()
+        # 既知のカード（手札 + 分かっている除外カード + 既出カード、既出カードはビットマスクで判定）
+        known_cards = set(observable_state.hand.get_cards())
+        known_cards.update(observable_state.known_excluded_cards)
         played_cards = observable_state.played_cards
-        known_cards = set(hand_cards + played_cards)
         
         # 未出現カード = 全カード - 既知カード
-        unplayed_cards = [card for card in all_cards if card not in known_cards]
+        unplayed_cards = [
+            card for card in all_cards
+            if card not in known_cards and card not in played_cards
+        ]
         
         return unplayed_cards
     
+    @staticmethod
+    def _get_known_excluded_cards(observable_state: ObservableGameState) -> List[Card]:
+        """
+        分かっている除外カードを全カードの順に並べて取得（乱数の消費順を実行ごとに固定するため）
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+        
+        Returns:
+            除外カードのリスト
+        """
+        known_excluded_cards = observable_state.known_excluded_cards
+        if not known_excluded_cards:
+            return []
+        return [card for card in Determinizer._get_all_cards() if card in known_excluded_cards]
+    
+    @staticmethod
+    def _get_hidden_excluded_count(observable_state: ObservableGameState) -> int:
+        """
+        分かっていない除外カードの枚数
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+        
+        Returns:
+            除外枚数 - 分かっている除外カードの枚数
+        """
+        return max(observable_state.excluded_cards_count - len(observable_state.known_excluded_cards), 0)
+    
     @staticmethod
     def create_multiple_determinizations(
         observable_state: ObservableGameState,
         count: int,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None
     ) -> List[GameState]:
         """
         複数の決定化を生成
@@ -122,17 +427,19 @@ class Determinizer:
         Args:
             observable_state: 観測可能なゲーム状態
             count: 生成する決定化の数
-            seed: 乱数シード（テスト用）
+            seed: 乱数シード（テスト用、rng省略時に専用の乱数を生成する）
+            rng: 乱数生成器（省略時はseedから生成、
+                 seedも省略した場合はrandomモジュールのグローバル乱数）
         
         Returns:
             GameStateのリスト
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
         
         determinizations = []
         for _ in range(count):
-            det = Determinizer.create_determinization(observable_state)
+            det = Determinizer.create_determinization(observable_state, rng=rng)
             determinizations.append(det)
         
         return determinizations
@@ -0,0 +1,167 @@
+"""
+探索の早期終了 (Early Stopping)
+ルートの最良の手が確定したら、探索回数の途中でも探索を打ち切る
+"""
+
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+class EarlyStopping:
+    """
+    ルートの子の統計から、探索を続けても最良の手が変わらないと判断したら探索を打ち切る
+    
+    エンジンに early_stopping を指定した場合のみ使われる（探索ごとに reset() される）。
+    以下のいずれかが成り立った時点で打ち切る:
+    - 'single_move': ルートの手が1つしかない（1回探索した時点で打ち切る）
+    - 'visit_bound': 訪問回数が最多の手と2番目の手の差が残りの探索回数より大きい
+      （残りを全て2番目の手に使っても追いつけないので、訪問回数で選ぶ手は変わらない）
+    - 'confidence': 訪問回数が最多の手の平均報酬の信頼区間の下限が、
+      他の全ての手の信頼区間の上限より大きい
+      （報酬の標準偏差は手ごとではなく、ルートの全ての報酬から推定する）
+    
+    min_iterations 回までと、check_interval 回ごと以外は判定しないので、
+    判定のコストは探索1回あたりでは無視できる。
+    
+    Usage:
+        engine = ISMCTSEngine(early_stopping=EarlyStopping())
+        best_move, stats = engine.search(observable_state, num_iterations=1000)
+        print(stats['early_stopping']['iterations_saved'])
+    """
+    
+    STOP_REASONS = ('single_move', 'visit_bound', 'confidence')
+    
+    def __init__(
+        self,
+        min_iterations: int = 100,
+        check_interval: int = 10,
+        confidence_z: float = 2.58
+    ):
+        """
+        早期終了の初期化
+        
+        Args:
+            min_iterations: 'visit_bound' / 'confidence' を判定し始める探索回数
+            check_interval: 判定する間隔（探索回数）
+            confidence_z: 信頼区間の幅（標準誤差の何倍か、デフォルト: 99%）
+        """
+        if min_iterations < 1:
+            raise ValueError(f"min_iterationsは1以上である必要があります: {min_iterations}")
+        if check_interval < 1:
+            raise ValueError(f"check_intervalは1以上である必要があります: {check_interval}")
+        if confidence_z <= 0:
+            raise ValueError(f"confidence_zは正である必要があります: {confidence_z}")
+        
+        self.min_iterations = min_iterations
+        self.check_interval = check_interval
+        self.confidence_z = confidence_z
+        self.reset(0)
+    
+    def reset(self, num_iterations: int):
+        """
+        探索1回分の状態をクリア
+        
+        Args:
+            num_iterations: この探索の探索回数の上限
+        """
+        self.num_iterations = num_iterations
+        self.iterations = 0
+        self.stop_reason: Optional[str] = None
+        self._reward_sum = 0.0
+        self._reward_square_sum = 0.0
+    
+    def record(self, reward: float):
+        """
+        探索1回分の報酬を記録
+        
+        Args:
+            reward: 報酬値
+        """
+        self.iterations += 1
+        self._reward_sum += reward
+        self._reward_square_sum += reward * reward
+    
+    def should_check(self) -> bool:
+        """
+        この探索回数で判定するか
+        
+        Returns:
+            1回目（'single_move' の判定）、または min_iterations 回以降の check_interval 回ごとならTrue
+        """
+        iterations = self.iterations
+        return iterations == 1 or (
+            iterations >= self.min_iterations and iterations % self.check_interval == 0
+        )
+    
+    def should_stop(self, children: Sequence[Tuple[int, float]], num_moves: int) -> bool:
+        """
+        探索を打ち切るかを判定（打ち切る場合は stop_reason を設定する）
+        
+        Args:
+            children: ルートの子ごとの (訪問回数, 累積報酬)
+            num_moves: ルートの手の数（まだ展開していない手を含む）
+        
+        Returns:
+            打ち切る場合True
+        """
+        if num_moves <= 1 and self.iterations >= 1:
+            self.stop_reason = 'single_move'
+            return True
+        if self.iterations < self.min_iterations or len(children) == 0:
+            return False
+        
+        ranked = sorted(children, key=lambda child: child[0], reverse=True)
+        best_visits, best_total = ranked[0]
+        # 展開していない手は訪問回数0として扱う
+        runner_up_visits = ranked[1][0] if len(ranked) > 1 else 0
+        if best_visits - runner_up_visits > self.num_iterations - self.iterations:
+            self.stop_reason = 'visit_bound'
+            return True
+        
+        # 信頼区間は全ての手を1回以上試してから判定する
+        if len(children) < num_moves or any(visits == 0 for visits, _ in children):
+            return False
+        std = self._reward_std()
+        lower = best_total / best_visits - self.confidence_z * std / math.sqrt(best_visits)
+        if all(
+            total / visits + self.confidence_z * std / math.sqrt(visits) < lower
+            for visits, total in ranked[1:]
+        ):
+            self.stop_reason = 'confidence'
+            return True
+        return False
+    
+    @property
+    def iterations_saved(self) -> int:
+        """打ち切りで省略した探索回数（打ち切らなかった場合は0）"""
+        if self.stop_reason is None:
+            return 0
+        return max(self.num_iterations - self.iterations, 0)
+    
+    def _reward_std(self) -> float:
+        """記録した全ての報酬の標準偏差（不偏）"""
+        n = self.iterations
+        if n < 2:
+            return math.inf
+        mean = self._reward_sum / n
+        variance = (self._reward_square_sum - n * mean * mean) / (n - 1)
+        return math.sqrt(max(variance, 0.0))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        統計情報の辞書に変換
+        
+        Returns:
+            'iterations'（実行した探索回数）、'iterations_saved'、'stop_reason'（打ち切らなかった場合はNone）
+        """
+        return {
+            'iterations': self.iterations,
+            'iterations_saved': self.iterations_saved,
+            'stop_reason': self.stop_reason
+        }
+    
+    def __repr__(self) -> str:
+        return (
+            f"EarlyStopping(min_iterations={self.min_iterations}, "
+            f"check_interval={self.check_interval}, confidence_z={self.confidence_z})"
+        )
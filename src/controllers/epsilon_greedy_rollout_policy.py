@@ -0,0 +1,77 @@
+"""
+ε-greedy ヒューリスティックロールアウト方策
+"""
+
+import random
+from typing import List, Optional, Tuple
+from ..models.card import Card
+from .game_state import GameState
+from .rollout_policy import RolloutPolicy
+from .unknown_card_counter import UnknownCardCounter
+
+
+class EpsilonGreedyRolloutPolicy(RolloutPolicy):
+    """
+    ε-greedy ヒューリスティックロールアウト
+    
+    確率 ε で一様ランダムに、それ以外はヒューリスティック戦略と同じく
+    柔軟性が最も低いカードを出す手（= 残った手札の柔軟性が最大になる手）を選ぶ。
+    同点の場合はヒューリスティック戦略と同じく先に列挙された手を選ぶ
+    （空きスロットを温存するため、ランダムに選ぶより多くのカードを出せる）。
+    柔軟性は UnknownCardCounter で差分更新するため、1手あたり O(合法手数)。
+    """
+    
+    def __init__(self, epsilon: float = 0.1, rng: Optional[random.Random] = None):
+        """
+        ε-greedy ロールアウト方策の初期化
+        
+        Args:
+            epsilon: ランダムに手を選ぶ確率（0〜1）
+            rng: 乱数生成器（省略時はrandomモジュールのグローバル乱数）
+        """
+        if not 0.0 <= epsilon <= 1.0:
+            raise ValueError(f"epsilonは0〜1である必要があります: {epsilon}")
+        super().__init__(rng)
+        self.epsilon = epsilon
+        self.counter = UnknownCardCounter()
+    
+    def begin(self, state: GameState):
+        """未知カードのカウンタを初期化"""
+        self.counter = UnknownCardCounter(state.get_unknown_cards())
+    
+    def select_move(
+        self,
+        state: GameState,
+        valid_moves: List[Tuple[Card, int]]
+    ) -> Tuple[Card, int]:
+        """
+        ε-greedyで1手を選択
+        
+        Args:
+            state: 現在の状態
+            valid_moves: 合法手のリスト（空でない）
+        
+        Returns:
+            選択した手
+        """
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(valid_moves)
+        
+        suit_counts = self.counter.suit_counts
+        value_counts = self.counter.value_counts
+        best_move = valid_moves[0]
+        best_flexibility = suit_counts[best_move[0].suit] + value_counts[best_move[0].value]
+        for move in valid_moves:
+            card = move[0]
+            flexibility = suit_counts[card.suit] + value_counts[card.value]
+            if flexibility < best_flexibility:
+                best_flexibility = flexibility
+                best_move = move
+        return best_move
+    
+    def on_card_drawn(self, card: Card):
+        """引いたカードを未知カードから取り除く"""
+        self.counter.remove(card)
+    
+    def __repr__(self) -> str:
+        return f"EpsilonGreedyRolloutPolicy(epsilon={self.epsilon})"
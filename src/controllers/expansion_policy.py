@@ -0,0 +1,116 @@
+"""
+展開方策 (Expansion Policy)
+柔軟性ヒューリスティックで展開順序を決め、Progressive Wideningで展開数を制限する
+"""
+
+import math
+from typing import List, Tuple
+from ..models.card import Card
+from ..models.hand import Hand
+from .flexibility_calculator import FlexibilityCalculator
+
+
+class ExpansionPolicy:
+    """
+    ヒューリスティック順序付き Progressive Widening
+    
+    - 未試行の手を FlexibilityCalculator の評価で並べ、有望な手から展開する
+    - ノードが持てる子の数を訪問回数に応じて増やす
+      最大子ノード数 = max(1, ceil(C * visits^α))
+    
+    有望度の低い手は、ノードが十分に訪問されるまで展開されないため、
+    同じ探索回数でも有望な手順をより深く探索できる。
+    
+    Usage:
+        policy = ExpansionPolicy(widening_constant=1.0, widening_exponent=0.5)
+        engine = MCTSEngine(expansion_policy=policy)
+    """
+    
+    def __init__(
+        self,
+        widening_constant: float = 1.0,
+        widening_exponent: float = 0.5
+    ):
+        """
+        展開方策の初期化
+        
+        Args:
+            widening_constant: Progressive Wideningの係数C
+            widening_exponent: Progressive Wideningの指数α（0〜1）
+        """
+        if widening_constant <= 0:
+            raise ValueError(f"widening_constantは正の値である必要があります: {widening_constant}")
+        if not 0.0 <= widening_exponent <= 1.0:
+            raise ValueError(f"widening_exponentは0〜1である必要があります: {widening_exponent}")
+        
+        self.widening_constant = widening_constant
+        self.widening_exponent = widening_exponent
+    
+    def order_moves(
+        self,
+        moves: List[Tuple[Card, int]],
+        hand: Hand,
+        unknown_cards: List[Card]
+    ) -> List[Tuple[Card, int]]:
+        """
+        手を有望度の低い順に並べる
+        
+        ノードは untried_moves の末尾から pop() で展開するため、
+        末尾が最も有望な手になるように並べる。
+        
+        有望度はヒューリスティック戦略と同じ基準:
+        1. 残った手札の柔軟性が高いほど良い
+        2. 同点なら出すカード自身の柔軟性が低いほど良い
+        
+        Args:
+            moves: 並べ替える手のリスト
+            hand: 現在の手札
+            unknown_cards: 未知のカード
+        
+        Returns:
+            並べ替えた手のリスト（新しいリスト）
+        """
+        evaluations = FlexibilityCalculator.evaluate_moves_flexibility(
+            moves, hand, unknown_cards
+        )
+        
+        def priority(move: Tuple[Card, int]) -> Tuple[int, int]:
+            remaining_flex, card_flex = evaluations[move]
+            return remaining_flex, -card_flex
+        
+        # 同点の場合は元の順序で先にある手から展開されるよう、逆順にしてから安定ソート
+        return sorted(reversed(moves), key=priority)
+    
+    def max_children(self, visits: int) -> int:
+        """
+        訪問回数に対して展開を許可する子ノード数の上限
+        
+        Args:
+            visits: ノードの訪問回数
+        
+        Returns:
+            子ノード数の上限（最低1）
+        """
+        if visits <= 0:
+            return 1
+        return max(1, math.ceil(self.widening_constant * visits ** self.widening_exponent))
+    
+    def can_expand(self, num_children: int, visits: int) -> bool:
+        """
+        ノードをさらに展開してよいか判定
+        
+        Args:
+            num_children: 現在の子ノード数
+            visits: ノードの訪問回数
+        
+        Returns:
+            展開してよい場合True
+        """
+        return num_children < self.max_children(visits)
+    
+    def __repr__(self) -> str:
+        return (
+            f"ExpansionPolicy("
+            f"C={self.widening_constant}, "
+            f"alpha={self.widening_exponent})"
+        )
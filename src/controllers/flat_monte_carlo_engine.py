@@ -0,0 +1,262 @@
+"""
+共通乱数による平坦モンテカルロ評価 (Flat Monte Carlo Engine)
+ルートの合法手だけを、同じ決定化・同じロールアウトの乱数列の上で比較する
+"""
+
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from ..models.card import Card
+from .observable_game_state import ObservableGameState
+from .determinizer import Determinizer
+from .move_validator import MoveValidator
+from .rollout_policy import RolloutPolicy
+
+
+class FlatMonteCarloEngine:
+    """
+    共通乱数（CRN）による平坦モンテカルロのルート評価エンジン
+    
+    M個の決定化（世界）を1回だけ生成し、ルートの全ての合法手を同じM個の世界で評価する。
+    世界ごとにロールアウトの乱数列も1つ決めて、全ての手で同じ乱数列を使う。
+    手の差は「同じ世界・同じ乱数での報酬の差」（対応のある差）として推定するため、
+    世界ごとの当たり外れが打ち消され、独立にサンプリングするUCB1の訪問よりも
+    少ないサンプル数で手を区別できる。
+    
+    世界どうしは独立なので、世界単位で分割して並列化・ベクトル化できる。
+    時間制限では世界の途中で打ち切らず、全ての手を評価し終えた世界だけを使う。
+    時間制限がある場合は、世界を TIME_LIMIT_BATCH_SIZE 個ずつ生成する
+    （時間制限だけで評価する場合は世界の数が非常に大きいため）。
+    
+    Usage:
+        engine = FlatMonteCarloEngine(rng=random.Random(42))
+        best_move, stats = engine.search(observable_state, num_iterations=1000)
+        for move_stats in stats['moves']:
+            print(move_stats['move'], move_stats['diff_to_best'], move_stats['diff_std_error'])
+    """
+    
+    # 時間制限を指定した場合に、一度に生成する世界の数の上限
+    TIME_LIMIT_BATCH_SIZE = 256
+    
+    def __init__(
+        self,
+        rollout_policy: Optional[RolloutPolicy] = None,
+        deduplicate_moves: bool = True,
+        determinization_sampling: str = 'iid',
+        rng: Optional[random.Random] = None,
+        verbose: bool = False
+    ):
+        """
+        平坦モンテカルロ評価エンジンの初期化
+        
+        Args:
+            rollout_policy: ロールアウト方策（Noneの場合は一様ランダム）。
+                            評価中は世界ごとに方策の乱数を差し替え、終了後に元に戻す
+            deduplicate_moves: 同値な手をまとめて評価する手の数を減らすか
+            determinization_sampling: 決定化のサンプリング方式（Determinizer.SAMPLING_MODES）
+            rng: 決定化と世界ごとの乱数列の生成に使う乱数生成器
+                 （省略時はrandomモジュールのグローバル乱数）
+            verbose: 詳細ログを出力するか
+        """
+        if determinization_sampling not in Determinizer.SAMPLING_MODES:
+            raise ValueError(
+                f"determinization_samplingは{Determinizer.SAMPLING_MODES}のいずれかである必要があります: "
+                f"{determinization_sampling}"
+            )
+        
+        self.rollout_policy = rollout_policy if rollout_policy is not None else RolloutPolicy()
+        self.deduplicate_moves = deduplicate_moves
+        self.determinization_sampling = determinization_sampling
+        # Noneの場合はグローバル乱数（pickleできるよう、randomモジュール自体は保持しない）
+        self.rng: Optional[random.Random] = rng
+        self.verbose = verbose
+    
+    def set_rng(self, rng: Optional[random.Random]):
+        """
+        評価で使う乱数生成器を差し替える（ワーカーでジョブごとにシードを設定する場合など）
+        
+        Args:
+            rng: 乱数生成器（Noneの場合はrandomモジュールのグローバル乱数）
+        """
+        self.rng = rng
+    
+    def search(
+        self,
+        observable_state: ObservableGameState,
+        num_iterations: int = 1000,
+        time_limit: Optional[float] = None
+    ) -> Tuple[Optional[Tuple[Card, int]], Dict]:
+        """
+        ロールアウトの回数を予算として評価し、最良の手を返す
+        
+        MCTSEngine / ISMCTSEngine と同じく、num_iterations はロールアウトの回数。
+        世界の数は num_iterations / 合法手の数（1以上）になる。
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            num_iterations: ロールアウトの回数の予算
+            time_limit: 評価時間の上限（秒）。Noneの場合は予算のみで終了
+        
+        Returns:
+            (最良の手, 統計情報)
+        """
+        moves = self._get_moves(observable_state)
+        num_worlds = max(num_iterations // max(len(moves), 1), 1)
+        stats = self._evaluate_moves(observable_state, moves, num_worlds, time_limit)
+        return stats['best_move'], stats
+    
+    def evaluate(
+        self,
+        observable_state: ObservableGameState,
+        num_worlds: int,
+        time_limit: Optional[float] = None
+    ) -> Dict:
+        """
+        全ての合法手をM個の共通の世界で評価
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            num_worlds: 世界（決定化）の数 M
+            time_limit: 評価時間の上限（秒）。Noneの場合はM個全てを評価
+        
+        Returns:
+            統計情報（_evaluate_moves を参照）
+        """
+        if num_worlds < 1:
+            raise ValueError(f"世界の数は1以上である必要があります: {num_worlds}")
+        moves = self._get_moves(observable_state)
+        return self._evaluate_moves(observable_state, moves, num_worlds, time_limit)
+    
+    def _get_moves(self, observable_state: ObservableGameState) -> List[Tuple[Card, int]]:
+        """
+        評価する合法手を取得
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+        
+        Returns:
+            合法手のリスト（deduplicate_movesが有効なら代表手のみ）
+        """
+        if self.deduplicate_moves:
+            return MoveValidator.get_canonical_moves(observable_state.hand, observable_state.field)
+        return MoveValidator.get_valid_moves(observable_state.hand, observable_state.field)
+    
+    def _evaluate_moves(
+        self,
+        observable_state: ObservableGameState,
+        moves: List[Tuple[Card, int]],
+        num_worlds: int,
+        time_limit: Optional[float]
+    ) -> Dict:
+        """
+        手ごとの報酬を世界ごとに計算し、対応のある差の統計をまとめる
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            moves: 評価する手
+            num_worlds: 世界の数
+            time_limit: 評価時間の上限（秒）
+        
+        Returns:
+            統計情報の辞書
+            - best_move: 平均報酬が最大の手（手が無ければNone）
+            - best_move_reward: その平均報酬
+            - num_worlds: 評価し終えた世界の数
+            - total_rollouts: ロールアウトの回数
+            - moves: 手ごとの統計（平均報酬の降順）
+              - move / mean_reward / std_error（平均報酬の標準誤差）
+              - diff_to_best（最良の手との報酬の差の平均、0以下）
+              - diff_std_error（その差の標準誤差。同じ世界どうしの差から計算する）
+        """
+        if not moves:
+            return {
+                'best_move': None,
+                'best_move_reward': 0.0,
+                'num_worlds': 0,
+                'total_rollouts': 0,
+                'moves': []
+            }
+        
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        batch_size = num_worlds if time_limit is None else min(num_worlds, self.TIME_LIMIT_BATCH_SIZE)
+        rng = self.rng if self.rng is not None else random
+        generator = np.random.default_rng(rng.getrandbits(64))
+        
+        # 世界ごとの報酬の列（手の数の長さ）
+        world_rewards: List[np.ndarray] = []
+        policy_rng = self.rollout_policy.rng
+        try:
+            while len(world_rewards) < num_worlds:
+                batch = Determinizer.create_batch(
+                    observable_state,
+                    min(batch_size, num_worlds - len(world_rewards)),
+                    generator,
+                    sampling=self.determinization_sampling
+                )
+                # 世界ごとのロールアウトの乱数列（全ての手で共通）
+                rollout_seeds = [rng.getrandbits(64) for _ in range(len(batch))]
+                for index in range(len(batch)):
+                    column = np.zeros(len(moves))
+                    for move_index, (card, slot) in enumerate(moves):
+                        state = batch.create_state(index)
+                        state.play_card(card, slot)
+                        self.rollout_policy.rng = random.Random(rollout_seeds[index])
+                        column[move_index] = self.rollout_policy.rollout(state)
+                    world_rewards.append(column)
+                    
+                    world = len(world_rewards) - 1
+                    if self.verbose and world % 100 == 0:
+                        print(f"Flat MC World {world}/{num_worlds}")
+                    
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        finally:
+            self.rollout_policy.rng = policy_rng
+        
+        return self._get_statistics(moves, np.column_stack(world_rewards))
+    
+    @staticmethod
+    def _get_statistics(moves: List[Tuple[Card, int]], rewards: np.ndarray) -> Dict:
+        """
+        手ごとの報酬の行列から統計情報を作成
+        
+        Args:
+            moves: 評価した手
+            rewards: 手 × 世界 の報酬の行列
+        
+        Returns:
+            統計情報の辞書（_evaluate_moves を参照）
+        """
+        num_worlds = rewards.shape[1]
+        means = rewards.mean(axis=1)
+        best_index = int(np.argmax(means))
+        differences = rewards - rewards[best_index]
+        if num_worlds > 1:
+            std_errors = rewards.std(axis=1, ddof=1) / math.sqrt(num_worlds)
+            diff_std_errors = differences.std(axis=1, ddof=1) / math.sqrt(num_worlds)
+        else:
+            std_errors = np.full(len(moves), math.inf)
+            diff_std_errors = np.full(len(moves), math.inf)
+            diff_std_errors[best_index] = 0.0
+        
+        move_stats = [
+            {
+                'move': moves[index],
+                'mean_reward': float(means[index]),
+                'std_error': float(std_errors[index]),
+                'diff_to_best': float(means[index] - means[best_index]),
+                'diff_std_error': float(diff_std_errors[index])
+            }
+            for index in np.argsort(-means, kind='stable')
+        ]
+        return {
+            'best_move': moves[best_index],
+            'best_move_reward': float(means[best_index]),
+            'num_worlds': num_worlds,
+            'total_rollouts': num_worlds * len(moves),
+            'moves': move_stats
+        }
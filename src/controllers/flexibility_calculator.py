@@ -139,6 +139,46 @@ class FlexibilityCalculator:
         
         return remaining_flexibility, card_flexibility
     
+    @staticmethod
+    def evaluate_moves_flexibility(
+        moves: List[Tuple[Card, int]],
+        hand: Hand,
+        unknown_cards: List[Card]
+    ) -> Dict[Tuple[Card, int], Tuple[int, int]]:
+        """
+        複数の手の柔軟性をまとめて評価（最適化版）
+        
+        evaluate_move_flexibility() と同じ値を返すが、
+        手札全体のスコアを1回だけ計算して使い回すため O(n+m) で済む。
+        
+        Args:
+            moves: 評価する手のリスト
+            hand: 現在の手札
+            unknown_cards: 未知のカード
+        
+        Returns:
+            手 -> (残った手札の合計柔軟性, 出すカードの柔軟性) のマップ
+        """
+        scores = FlexibilityCalculator.calculate_all_flexibility_scores(
+            hand, unknown_cards
+        )
+        total_flexibility = sum(scores.values())
+        
+        evaluations = {}
+        for card, slot in moves:
+            card_flexibility = scores.get(card)
+            if card_flexibility is None:
+                # 手札に無いカード（通常は発生しない）
+                card_flexibility = FlexibilityCalculator.calculate_flexibility_score(
+                    card, unknown_cards
+                )
+                remaining_flexibility = total_flexibility
+            else:
+                remaining_flexibility = total_flexibility - card_flexibility
+            evaluations[(card, slot)] = (remaining_flexibility, card_flexibility)
+        
+        return evaluations
+    
     @staticmethod
     def get_card_compatibility_details(
         card: Card,
@@ -18,18 +18,20 @@ class Game:
         is_finished: ゲームが終了したかどうか
     """
     
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, rng: Optional[random.Random] = None):
         """
         ゲームの初期化
         
         Args:
-            seed: 乱数シード（テスト用、省略可）
+            seed: 乱数シード（テスト用、省略可。同じシードの GameState と同じ山札になる）
+            rng: 山札のシャッフルとランダムプレイに使う乱数生成器
+                 （省略時はseedから生成、seedも省略した場合はrandomモジュールのグローバル乱数）
         """
-        self.state = GameState(seed=seed)
+        self.state = GameState(seed=seed, rng=rng)
         self.is_finished = False
-        
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+        self.rng = rng
     
     def play_turn(self, card_index: int, slot_number: int) -> bool:
         """
@@ -38,7 +40,7 @@ class Game:
         Args:
             card_index: 手札のカードのインデックス（0始まり）
             slot_number: 出すスロット番号（1 or 2）
-            
+        
         Returns:
             成功した場合True、失敗した場合False
         """
@@ -89,7 +91,7 @@ class Game:
             return False
         
         # ランダムに1つの合法手を選択
-        card, slot_number = random.choice(valid_moves)
+        card, slot_number = self.rng.choice(valid_moves)
         
         # カードを出す
         success = self.state.play_card(card, slot_number)
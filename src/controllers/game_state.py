@@ -3,12 +3,13 @@
 現在のゲーム状態（手札、場、山札、ポイント）を管理する
 """
 
-import copy
-from typing import List, Optional
+import random
+from typing import Iterable, List, Optional
 from ..models.deck import Deck
 from ..models.hand import Hand
 from ..models.field import Field
 from ..models.card import Card
+from ..models.played_card_log import PlayedCardLog
 from ..models.point_calculator import PointCalculator
 
 
@@ -22,11 +23,11 @@ class GameState:
         field: 場
         total_points: 累積ポイント
         turn_count: ターン数
-        played_cards: 場に出したカード（IS-MCTS用）
+        played_cards: 場に出したカード（出した順のログ + ビットマスク、IS-MCTS用）
     """
     
     def __init__(self, seed: Optional[int] = None, excluded_cards: Optional[List[Card]] = None, 
-                 initial_hand: Optional[List[Card]] = None):
+                 initial_hand: Optional[List[Card]] = None, rng: Optional[random.Random] = None):
         """
         ゲーム状態の初期化
         
@@ -34,13 +35,14 @@ class GameState:
             seed: 乱数シード（テスト用、省略可）
             excluded_cards: 除外するカードのリスト（10枚）。Noneの場合はランダムに10枚除外
             initial_hand: 初期手札のリスト（5枚）。Noneの場合は山札からランダムに5枚配布
+            rng: 山札のシャッフルに使う乱数生成器（省略時はseedから生成）
         """
-        self.deck = Deck(seed=seed, excluded_cards=excluded_cards)
+        self.deck = Deck(seed=seed, excluded_cards=excluded_cards, rng=rng)
         self.hand = Hand()
         self.field = Field()
         self.total_points = 0
         self.turn_count = 0
-        self.played_cards: List[Card] = []  # 場に出したカードの履歴
+        self._played_cards = PlayedCardLog()  # 場に出したカードの履歴
         
         # 初期手札を配布（5枚）
         self._deal_initial_hand(initial_hand)
@@ -101,7 +103,7 @@ class GameState:
         Args:
             card: 出すカード
             slot_number: 出すスロット番号（1 or 2）
-            
+        
         Returns:
             成功した場合True、失敗した場合False
         """
@@ -117,7 +119,7 @@ class GameState:
         self.field.place_card(slot_number, card)
         
         # 場に出したカードを記録
-        self.played_cards.append(card)
+        self._played_cards.append(card)
         
         # 山札から1枚引く
         drawn_card = self.deck.draw()
@@ -139,7 +141,7 @@ class GameState:
         
         Args:
             card: 手札に追加するカード
-            
+        
         Returns:
             成功した場合True、失敗した場合False
         """
@@ -187,7 +189,7 @@ class GameState:
         Note:
             ゲーム終了判定は外部（MoveValidator）で行うため、
             このメソッドは補助的な役割
-            
+        
         Returns:
             手札が空の場合True（通常は発生しない）
         """
@@ -205,9 +207,31 @@ class GameState:
         """山札を取得"""
         return self.deck
     
+    @property
+    def played_cards(self) -> PlayedCardLog:
+        """場に出したカードの記録（出した順のログ + ビットマスク）"""
+        return self._played_cards
+    
+    @played_cards.setter
+    def played_cards(self, cards: Iterable[Card]):
+        """場に出したカードの記録を設定（リストも受け付ける）"""
+        if isinstance(cards, PlayedCardLog):
+            self._played_cards = cards.view()
+        else:
+            self._played_cards = PlayedCardLog(cards)
+    
     def get_played_cards(self) -> List[Card]:
         """場に出したカードのリストを取得"""
-        return self.played_cards.copy()
+        return self._played_cards.to_list()
+    
+    def get_unknown_cards(self) -> List[Card]:
+        """
+        プレイヤーから見て未知のカード（山札 + 除外10枚）を取得
+        
+        Returns:
+            全80枚 - (手札 + 場に出したカード) に相当するカードのリスト
+        """
+        return self.deck.get_remaining_cards() + self.deck.get_excluded_cards()
     
     @staticmethod
     def from_observable_determinization(
@@ -238,19 +262,73 @@ class GameState:
         # 新しいインスタンスを作成（__init__を呼ばない）
         state = GameState.__new__(GameState)
         
-        # Deckを構築
-        state.deck = Deck(excluded_cards=excluded_cards)
-        state.deck._cards = deck_cards.copy()  # 順序を保持
+        # Deckを構築（順序を保持、80枚の生成とシャッフルは行わない）
+        state.deck = Deck.from_order(deck_cards, excluded_cards)
         
-        # その他の属性をディープコピー
-        state.hand = copy.deepcopy(hand)
-        state.field = copy.deepcopy(field)
+        # カードは不変なので、手札と場はリストだけをコピー
+        state.hand = Hand()
+        state.hand._cards = hand._cards.copy()
+        state.field = Field()
+        for slot_number in (1, 2):
+            state.field.get_slot(slot_number)._cards = field.get_slot(slot_number)._cards.copy()
         state.total_points = total_points
         state.turn_count = turn_count
-        state.played_cards = played_cards.copy() if played_cards else []
+        state.played_cards = played_cards if played_cards is not None else []
+        
+        return state
+    
+    @staticmethod
+    def from_observable_with_deck(observable_state, deck: Deck) -> 'GameState':
+        """
+        観測可能状態と山札からGameStateを構築（遅延決定化・一括決定化用）
+        
+        カードは不変なので、手札と場はリストだけをコピーし、出したカードの記録は共有する（O(1)）。
         
+        Args:
+            observable_state: 観測可能なゲーム状態
+            deck: 山札（LazyDeck / IndexedDeck など）
+        
+        Returns:
+            完全なGameState
+        """
+        # 新しいインスタンスを作成（__init__を呼ばない）
+        state = GameState.__new__(GameState)
+        state.deck = deck
+        state.hand = Hand()
+        state.hand._cards = observable_state.hand._cards.copy()
+        state.field = Field()
+        observable_field = observable_state.field
+        for slot_number in (1, 2):
+            state.field.get_slot(slot_number)._cards = observable_field.get_slot(slot_number)._cards.copy()
+        state.total_points = observable_state.total_points
+        state.turn_count = observable_state.turn_count
+        state.played_cards = observable_state.played_cards
         return state
     
+    def to_bytes(self) -> bytes:
+        """
+        コンパクトなバイト列に変換（StateCodec形式、約100バイト）
+        
+        Returns:
+            バイト列
+        """
+        from .state_codec import StateCodec
+        return StateCodec.encode_game_state(self)
+    
+    @staticmethod
+    def from_bytes(data: bytes) -> 'GameState':
+        """
+        to_bytes() で作成したバイト列から復元
+        
+        Args:
+            data: バイト列
+        
+        Returns:
+            GameState
+        """
+        from .state_codec import StateCodec
+        return StateCodec.decode_game_state(data)
+    
     def __str__(self) -> str:
         return (
             f"GameState(\n"
@@ -0,0 +1,67 @@
+"""
+ヒューリスティック事前確率プロバイダ
+柔軟性スコアを正規化して事前確率とする
+"""
+
+import math
+from typing import Dict, List, Tuple
+from ..models.card import Card
+from ..models.hand import Hand
+from .flexibility_calculator import FlexibilityCalculator
+from .prior_provider import PriorProvider
+
+
+class HeuristicPriorProvider(PriorProvider):
+    """
+    柔軟性ヒューリスティックに基づく事前確率
+    
+    各手の「残った手札の柔軟性」をソフトマックスで正規化する。
+    ヒューリスティック戦略が選ぶ手（柔軟性が低いカードを出す手）ほど
+    高い事前確率を持つ。
+        
+        P(手) ∝ exp((残った手札の柔軟性 - 最大値) / temperature)
+    """
+    
+    def __init__(self, temperature: float = 2.0):
+        """
+        ヒューリスティック事前確率プロバイダの初期化
+        
+        Args:
+            temperature: ソフトマックスの温度（小さいほど最良手に集中）
+        """
+        if temperature <= 0:
+            raise ValueError(f"temperatureは正の値である必要があります: {temperature}")
+        self.temperature = temperature
+    
+    def get_priors(
+        self,
+        moves: List[Tuple[Card, int]],
+        hand: Hand,
+        unknown_cards: List[Card]
+    ) -> Dict[Tuple[Card, int], float]:
+        """
+        各手の事前確率を取得
+        
+        Args:
+            moves: 候補の手のリスト
+            hand: 現在の手札
+            unknown_cards: 未知のカード
+        
+        Returns:
+            手 -> 事前確率 のマップ（合計1.0）
+        """
+        if not moves:
+            return {}
+        
+        evaluations = FlexibilityCalculator.evaluate_moves_flexibility(
+            moves, hand, unknown_cards
+        )
+        max_remaining = max(remaining for remaining, _ in evaluations.values())
+        
+        weights = {
+            move: math.exp((evaluations[move][0] - max_remaining) / self.temperature)
+            for move in moves
+        }
+        total_weight = sum(weights.values())
+        
+        return {move: weight / total_weight for move, weight in weights.items()}
@@ -5,7 +5,9 @@ IS-MCTS探索エンジン
 
 import copy
 import random
-from typing import Dict, Optional, Tuple
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 from ..models.card import Card
 from .game_state import GameState
 from .observable_game_state import ObservableGameState
@@ -13,7 +15,13 @@ from .information_set import InformationSet
 from .ismcts_node import ISMCTSNode
 from .determinizer import Determinizer
 from .move_validator import MoveValidator
-from .evaluator import Evaluator
+from .expansion_policy import ExpansionPolicy
+from .prior_provider import PriorProvider
+from .puct_selector import PUCTSelector
+from .rollout_policy import RolloutPolicy
+from .search_instrumentation import SearchInstrumentation
+from .sequential_halving import SequentialHalving
+from .early_stopping import EarlyStopping
 
 
 class ISMCTSEngine:
@@ -25,12 +33,39 @@ class ISMCTSEngine:
     2. Expansion（展開）- 未試行の手を試す
     3. Simulation（シミュレーション）- ランダムプレイアウト
     4. Backpropagation（逆伝播）- 情報セット単位で統計更新
+    
+    root_selection でルートの手への探索回数の配分方法を選べる（MCTSEngine と同じ）:
+    - 'ucb': ルートも他のノードと同じく selection の方式（UCB1 / PUCT）で選ぶ
+    - 'sequential_halving': ルートの手を逐次半減（SequentialHalving）で選び、
+      決定化でその手を指した状態から直接ロールアウトする（木は伸ばさない）
+    - 'hybrid': ルートの手は逐次半減で選び、その子から下は selection の方式で木を伸ばす
+    
+    early_stopping を指定すると、最良の手が確定した時点で探索回数の途中でも打ち切る
+    （省略した探索回数は統計情報の 'early_stopping' に入る）。
     """
     
+    ROOT_SELECTION_MODES = ('ucb', 'sequential_halving', 'hybrid')
+    # 時間制限を指定した場合に、一括決定化で一度に生成する数の上限
+    # （時間制限だけで探索する場合は探索回数が非常に大きいため）
+    TIME_LIMIT_BATCH_SIZE = 256
+    
     def __init__(
         self,
         exploration_weight: float = 1.41,
-        verbose: bool = False
+        verbose: bool = False,
+        deduplicate_moves: bool = True,
+        expansion_policy: Optional[ExpansionPolicy] = None,
+        selection: str = 'ucb1',
+        puct_constant: float = 1.25,
+        prior_provider: Optional[PriorProvider] = None,
+        rollout_policy: Optional[RolloutPolicy] = None,
+        instrument: bool = False,
+        lazy_determinization: bool = False,
+        rng: Optional[random.Random] = None,
+        determinization_batch_size: Optional[int] = None,
+        determinization_sampling: str = 'iid',
+        root_selection: str = 'ucb',
+        early_stopping: Optional[EarlyStopping] = None
     ):
         """
         IS-MCTS探索エンジンの初期化
@@ -38,17 +73,97 @@ class ISMCTSEngine:
         Args:
             exploration_weight: UCB1の探索重み（デフォルト: sqrt(2)）
             verbose: 詳細ログを出力するか
+            deduplicate_moves: 同値な手をまとめて分岐数を減らすか
+            expansion_policy: 展開方策（Noneの場合は全ての手を順に展開）
+            selection: 子ノードの選択方式（'ucb1' または 'puct'）
+            puct_constant: PUCTの探索係数
+            prior_provider: PUCTの事前確率プロバイダ（Noneの場合はヒューリスティック）
+            rollout_policy: ロールアウト方策（Noneの場合は一様ランダム）
+            instrument: フェーズごとの所要時間などを計測するか（デフォルト: 無効）
+            lazy_determinization: 遅延決定化を使うか（山札から引くたびに未出現カードを
+                                  サンプリングし、コストを引いた枚数に比例させる）
+            rng: 決定化と探索で使う乱数生成器（省略時はrandomモジュールのグローバル乱数）。
+                 グローバル乱数を使うロールアウト方策にも、この乱数を使わせる
+            determinization_batch_size: 指定した場合、決定化をこの個数ずつNumPyで一括生成する
+                                        （Determinizer.create_batch、遅延決定化とは併用不可）
+            determinization_sampling: 一括決定化のサンプリング方式
+                                      （'iid' / 'stratified' / 'antithetic'、Determinizer.SAMPLING_MODES）。
+                                      'iid' 以外で determinization_batch_size を省略した場合は、
+                                      探索回数分を1回で生成する（層別は一度に生成する数が多いほど効く）
+            root_selection: ルートの手の選び方（'ucb' / 'sequential_halving' / 'hybrid'）。
+                            逐次半減は探索回数を予算として配分するので、時間制限だけで
+                            探索する（探索回数を大きくする）場合は 'ucb' の方が向いている
+            early_stopping: 探索の早期終了（Noneの場合は探索回数・時間制限まで探索する）。
+                            訪問回数で最良の手を選ぶ root_selection='ucb' とだけ併用できる
         """
+        if selection not in ('ucb1', 'puct'):
+            raise ValueError(f"selectionは'ucb1'または'puct'である必要があります: {selection}")
+        if determinization_batch_size is not None:
+            if determinization_batch_size < 1:
+                raise ValueError(
+                    f"determinization_batch_sizeは1以上である必要があります: {determinization_batch_size}"
+                )
+            if lazy_determinization:
+                raise ValueError("遅延決定化と一括決定化は同時に指定できません")
+        if determinization_sampling not in Determinizer.SAMPLING_MODES:
+            raise ValueError(
+                f"determinization_samplingは{Determinizer.SAMPLING_MODES}のいずれかである必要があります: "
+                f"{determinization_sampling}"
+            )
+        if determinization_sampling != 'iid' and lazy_determinization:
+            raise ValueError("遅延決定化ではdeterminization_samplingを指定できません")
+        if root_selection not in self.ROOT_SELECTION_MODES:
+            raise ValueError(
+                f"root_selectionは{self.ROOT_SELECTION_MODES}のいずれかである必要があります: {root_selection}"
+            )
+        if early_stopping is not None and root_selection != 'ucb':
+            raise ValueError("early_stoppingはroot_selection='ucb'とだけ併用できます")
+        
         self.exploration_weight = exploration_weight
         self.verbose = verbose
+        self.deduplicate_moves = deduplicate_moves
+        self.expansion_policy = expansion_policy
+        self.selection = selection
+        self.root_selection = root_selection
+        self.early_stopping = early_stopping
+        # Noneの場合はグローバル乱数（pickleできるよう、randomモジュール自体は保持しない）
+        self.rng: Optional[random.Random] = None
+        self.rollout_policy = rollout_policy if rollout_policy is not None else RolloutPolicy()
+        self.set_rng(rng)
+        self.lazy_determinization = lazy_determinization
+        self.determinization_batch_size = determinization_batch_size
+        self.determinization_sampling = determinization_sampling
+        self.instrumentation: Optional[SearchInstrumentation] = (
+            SearchInstrumentation() if instrument else None
+        )
+        self.puct_selector: Optional[PUCTSelector] = None
+        if selection == 'puct':
+            self.puct_selector = PUCTSelector(
+                puct_constant=puct_constant,
+                prior_provider=prior_provider
+            )
         
         # 情報セット -> ノード のマッピング（木の共有）
         self.info_set_tree: Dict[InformationSet, ISMCTSNode] = {}
     
+    def set_rng(self, rng: Optional[random.Random]):
+        """
+        探索で使う乱数生成器を差し替える（ワーカーでジョブごとにシードを設定する場合など）
+        
+        ロールアウト方策がグローバル乱数またはエンジンの乱数を使っている場合は、方策の乱数も差し替える。
+        
+        Args:
+            rng: 乱数生成器（Noneの場合はrandomモジュールのグローバル乱数）
+        """
+        if self.rollout_policy.rng is random or self.rollout_policy.rng is self.rng:
+            self.rollout_policy.rng = rng if rng is not None else random
+        self.rng = rng
+    
     def search(
         self,
         observable_state: ObservableGameState,
-        num_iterations: int = 1000
+        num_iterations: int = 1000,
+        time_limit: Optional[float] = None
     ) -> Tuple[Optional[Tuple[Card, int]], Dict]:
         """
         IS-MCTS探索を実行
@@ -60,7 +175,8 @@ class ISMCTSEngine:
         
         Args:
             observable_state: 観測可能なゲーム状態
-            num_iterations: 探索回数
+            num_iterations: 探索回数（time_limit指定時は上限）
+            time_limit: 探索時間の上限（秒）。Noneの場合は探索回数のみで終了
         
         Returns:
             (最良の手, 統計情報)
@@ -68,47 +184,238 @@ class ISMCTSEngine:
         # ルート情報セットを取得
         root_info_set = self._get_information_set_from_observable(observable_state)
         root_node = self._get_or_create_node(root_info_set)
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        if self.instrumentation is not None:
+            self.instrumentation.reset()
+        determinizations = self._determinizations(observable_state, num_iterations, time_limit)
+        
+        halving: Optional[SequentialHalving] = None
+        grow_tree = self.root_selection != 'sequential_halving'
+        if self.root_selection != 'ucb':
+            root_moves = self._get_root_moves(observable_state)
+            if root_moves:
+                halving = SequentialHalving(root_moves, num_iterations)
+        root_move: Optional[Tuple[Card, int]] = None
+        early_stopping = self.early_stopping
+        if early_stopping is not None:
+            early_stopping.reset(num_iterations)
+            num_root_moves = len(self._get_root_moves(observable_state))
         
         for iteration in range(num_iterations):
-            # 1. 決定化を生成
-            determinized_state = Determinizer.create_determinization(observable_state)
+            if halving is not None:
+                root_move = halving.next_move()
+            
+            if self.instrumentation is not None:
+                reward = self._run_instrumented_iteration(
+                    root_node, determinizations, root_move, grow_tree
+                )
+            else:
+                # 1. 決定化を生成
+                determinized_state = next(determinizations)
+                
+                # 2. この決定化でMCTS 1イテレーション
+                reward = self._run_one_iteration(root_node, determinized_state, root_move, grow_tree)
             
-            # 2. この決定化でMCTS 1イテレーション
-            self._run_one_iteration(root_node, determinized_state)
+            if halving is not None:
+                halving.record(root_move, reward)
+            
+            if early_stopping is not None:
+                early_stopping.record(reward)
+                if early_stopping.should_check() and early_stopping.should_stop(
+                    [(child.visits, child.total_reward) for child in root_node.children.values()],
+                    num_root_moves
+                ):
+                    break
             
             if self.verbose and iteration % 100 == 0:
                 print(f"IS-MCTS Iteration {iteration}/{num_iterations}")
+            
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        
+        if self.instrumentation is not None:
+            self.instrumentation.stop()
         
-        # 最良の手を返す
-        best_move = root_node.get_best_move()
-        stats = self._get_statistics(root_node)
+        # 最良の手を返す（逐次半減では最後まで残った手のうち平均報酬が最大の手）
+        best_move = halving.best_move() if halving is not None else root_node.get_best_move()
+        stats = self._get_statistics(root_node, best_move)
         
         return best_move, stats
     
+    def _determinizations(
+        self,
+        observable_state: ObservableGameState,
+        num_iterations: int,
+        time_limit: Optional[float] = None
+    ) -> Iterator[GameState]:
+        """
+        設定に応じた決定化を順に生成
+        
+        - 遅延決定化: 未出現カードの列を探索ごとに1回だけ計算して共有する
+        - 一括決定化: determinization_batch_size 個ずつNumPyで生成し、行をそのまま山札として使う
+          （determinization_sampling が 'iid' 以外の場合も一括決定化。
+          determinization_batch_size を省略した場合は探索回数分、時間制限があれば
+          TIME_LIMIT_BATCH_SIZE 個ずつ生成する）
+        - それ以外: 1つずつ生成する
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+            num_iterations: 探索回数（一括決定化で余分に生成しないための上限）
+            time_limit: 探索時間の上限（秒）
+        
+        Yields:
+            決定化されたゲーム状態
+        """
+        if self.lazy_determinization:
+            unknown_pool = Determinizer.get_unknown_pool(observable_state)
+            while True:
+                yield Determinizer.create_lazy_determinization(
+                    observable_state, unknown_pool, rng=self.rng
+                )
+        elif self.determinization_batch_size is not None or self.determinization_sampling != 'iid':
+            batch_size = self.determinization_batch_size
+            if batch_size is None:
+                batch_size = num_iterations
+                if time_limit is not None:
+                    batch_size = min(batch_size, self.TIME_LIMIT_BATCH_SIZE)
+            unknown_pool = Determinizer.get_unknown_pool(observable_state)
+            # エンジンの乱数列からNumPyの乱数生成器を派生する（同じ乱数列なら同じ決定化）
+            rng = self.rng if self.rng is not None else random
+            generator = np.random.default_rng(rng.getrandbits(64))
+            remaining = num_iterations
+            while True:
+                batch = Determinizer.create_batch(
+                    observable_state,
+                    max(min(batch_size, remaining), 1),
+                    generator,
+                    unknown_pool,
+                    sampling=self.determinization_sampling
+                )
+                remaining -= len(batch)
+                for index in range(len(batch)):
+                    yield batch.create_state(index)
+        else:
+            while True:
+                yield Determinizer.create_determinization(observable_state, rng=self.rng)
+    
     def _run_one_iteration(
         self,
         root_node: ISMCTSNode,
-        determinized_state: GameState
-    ):
+        determinized_state: GameState,
+        root_move: Optional[Tuple[Card, int]] = None,
+        grow_tree: bool = True
+    ) -> float:
         """
         決定化1つでMCTSイテレーション1回実行
         
         Args:
             root_node: ルートノード
             determinized_state: 決定化されたゲーム状態
+            root_move: 指定した場合、ルートではこの手を指し、その子から選択を始める（逐次半減）
+            grow_tree: Falseの場合は選択・展開をせず、root_move を指した状態から直接ロールアウトする
+        
+        Returns:
+            報酬値
         """
-        # Selection
-        node, state = self._select(root_node, determinized_state)
+        node, state = root_node, determinized_state
+        if root_move is not None:
+            node, state = self._descend_root(root_node, determinized_state, root_move)
         
-        # Expansion
-        if not self._is_terminal(state) and not node.is_fully_expanded():
-            node, state = self._expand(node, state)
+        if grow_tree:
+            # Selection
+            node, state = self._select(node, state)
+            
+            # Expansion
+            if not self._is_terminal(state) and not node.is_fully_expanded():
+                node, state = self._expand(node, state)
         
         # Simulation
         reward = self._simulate(state)
         
         # Backpropagation
         self._backpropagate(node, reward)
+        return reward
+    
+    def _run_instrumented_iteration(
+        self,
+        root_node: ISMCTSNode,
+        determinizations: Iterator[GameState],
+        root_move: Optional[Tuple[Card, int]] = None,
+        grow_tree: bool = True
+    ) -> float:
+        """
+        各フェーズの所要時間を計測しながら決定化とイテレーションを1回実行
+        
+        Args:
+            root_node: ルートノード
+            determinizations: _determinizations() の生成器
+            root_move: 指定した場合、ルートではこの手を指し、その子から選択を始める（逐次半減）
+            grow_tree: Falseの場合は選択・展開をせず、root_move を指した状態から直接ロールアウトする
+        
+        Returns:
+            報酬値
+        """
+        instrumentation = self.instrumentation
+        
+        start = time.perf_counter_ns()
+        determinized_state = next(determinizations)
+        determinized = time.perf_counter_ns()
+        instrumentation.add_phase('determinize', determinized - start)
+        
+        num_nodes = len(self.info_set_tree)
+        node, state = root_node, determinized_state
+        if root_move is not None:
+            node, state = self._descend_root(root_node, determinized_state, root_move)
+        if grow_tree:
+            node, state = self._select(node, state)
+        selected = time.perf_counter_ns()
+        instrumentation.add_phase('select', selected - determinized)
+        
+        if grow_tree and not self._is_terminal(state) and not node.is_fully_expanded():
+            node, state = self._expand(node, state)
+        instrumentation.nodes_allocated += len(self.info_set_tree) - num_nodes
+        expanded = time.perf_counter_ns()
+        instrumentation.add_phase('expand', expanded - selected)
+        
+        reward = self._simulate(state)
+        simulated = time.perf_counter_ns()
+        instrumentation.add_phase('simulate', simulated - expanded)
+        
+        self._backpropagate(node, reward)
+        instrumentation.add_phase('backprop', time.perf_counter_ns() - simulated)
+        
+        # 情報セットの深さ = ルートから出したカードの枚数
+        depth = node.info_set.cards_played_count - root_node.info_set.cards_played_count
+        instrumentation.record_iteration(depth)
+        return reward
+    
+    def _descend_root(
+        self,
+        root_node: ISMCTSNode,
+        state: GameState,
+        move: Tuple[Card, int]
+    ) -> Tuple[ISMCTSNode, GameState]:
+        """
+        ルートで指定の手を指し、ルートの子ノードへ進む（逐次半減でルートの手を選んだ場合）
+        
+        ルートの手は観測可能な手札と場から作るので、どの決定化でも指せる。
+        子ノードがまだ無ければ、この決定化で指した後の情報セットで作成する。
+        
+        Args:
+            root_node: ルートノード
+            state: 決定化されたゲーム状態（この呼び出しで変更する）
+            move: ルートの手
+        
+        Returns:
+            (ルートの子ノード, 手を指した後の状態)
+        """
+        card, slot = move
+        state.play_card(card, slot)
+        child = root_node.children.get(move)
+        if child is None:
+            child = self._get_or_create_node(self._get_information_set(state), parent=root_node, move=move)
+            root_node.children[move] = child
+        return child, state
     
     def _select(
         self,
@@ -129,27 +436,54 @@ class ISMCTSEngine:
         current_node = node
         
         while not self._is_terminal(current_state):
-            # 有効手を取得
-            valid_moves = MoveValidator.get_valid_moves(
-                current_state.get_hand(),
-                current_state.get_field()
-            )
-            
             # 未試行の手を初期化
             if not current_node._initialized_moves:
+                valid_moves = self._get_valid_moves(current_state)
+                if self.expansion_policy is not None:
+                    # 有望な手が末尾（先に展開される）に来るよう並べ替える
+                    valid_moves = self.expansion_policy.order_moves(
+                        valid_moves,
+                        current_state.get_hand(),
+                        current_state.get_unknown_cards()
+                    )
                 current_node.initialize_untried_moves(valid_moves)
             
+            if self.puct_selector is not None:
+                # PUCT: 子ノードと未試行の手をまとめて比較
+                self._ensure_priors(current_node, current_state)
+                untried_moves = [] if current_node.is_fully_expanded() else current_node.untried_moves
+                move, child = self.puct_selector.select(
+                    current_node.visits,
+                    current_node.children.items(),
+                    untried_moves,
+                    current_node.priors
+                )
+                if child is None:
+                    # 未試行の手を展開すべき
+                    return current_node, current_state
+                card, slot = move
+                if not current_state.play_card(card, slot):
+                    # この決定化では指せない手（途中で引いたカードが別の決定化と異なる）
+                    return current_node, current_state
+                current_node = child
+                continue
+            
             # まだ展開できる手がある場合は、このノードを返す
             if not current_node.is_fully_expanded():
                 return current_node, current_state
             
             # 完全に展開済み → UCB1で最良の子を選択
-            current_node = current_node.select_best_child(self.exploration_weight)
+            child = current_node.select_best_child(self.exploration_weight)
             
             # 状態を進める
-            if current_node.move is not None:
-                card, slot = current_node.move
-                current_state.play_card(card, slot)
+            if child.move is not None:
+                card, slot = child.move
+                if not current_state.play_card(card, slot):
+                    # 子ノードは別の決定化で引いたカードの手。状態が進まないまま
+                    # 子ノードへ進むと、以降の展開で祖先と同じ情報セットを子に登録して
+                    # 木が循環するため、ここで打ち切る
+                    return current_node, current_state
+            current_node = child
         
         return current_node, current_state
     
@@ -169,12 +503,21 @@ class ISMCTSEngine:
             (新しく作成された子ノード, 対応する状態)
         """
         # 未試行の手を1つ選択
-        move = node.untried_moves.pop()
+        if self.puct_selector is not None:
+            # 事前確率が最も高い未試行の手を展開
+            self._ensure_priors(node, state)
+            move = PUCTSelector.best_untried_move(node.untried_moves, node.priors)
+            node.untried_moves.remove(move)
+        else:
+            move = node.untried_moves.pop()
         card, slot = move
         
         # 状態を進める
         new_state = copy.deepcopy(state)
-        new_state.play_card(card, slot)
+        if not new_state.play_card(card, slot):
+            # この決定化では指せない手（別の決定化で初期化した未試行の手）は、後で試す
+            node.untried_moves.insert(0, move)
+            return node, state
         
         # 新しい情報セットとノードを作成
         new_info_set = self._get_information_set(new_state)
@@ -185,9 +528,26 @@ class ISMCTSEngine:
         
         return new_node, new_state
     
+    def _ensure_priors(self, node: ISMCTSNode, state: GameState):
+        """
+        ノード（情報セット）の事前確率を計算してキャッシュ
+        
+        Args:
+            node: 対象ノード
+            state: ノードに対応する決定化状態
+        """
+        if node.priors is None:
+            moves = list(node.children.keys()) + node.untried_moves
+            self.puct_selector.ensure_priors(
+                node,
+                moves,
+                state.get_hand(),
+                state.get_unknown_cards()
+            )
+    
     def _simulate(self, state: GameState) -> float:
         """
-        Simulation フェーズ: ゲーム終了までランダムプレイ
+        Simulation: ゲーム終了までロールアウト方策でプレイ
         
         Args:
             state: シミュレーション開始時の状態
@@ -195,32 +555,12 @@ class ISMCTSEngine:
         Returns:
             報酬値（評価スコア）
         """
+        # 状態をコピーして破壊的に変更
         sim_state = copy.deepcopy(state)
-        
-        # ゲーム終了までランダムにプレイ
-        while MoveValidator.has_valid_move(
-            sim_state.get_hand(),
-            sim_state.get_field()
-        ):
-            valid_moves = MoveValidator.get_valid_moves(
-                sim_state.get_hand(),
-                sim_state.get_field()
-            )
-            
-            if len(valid_moves) == 0:
-                break
-            
-            # ランダムに手を選択
-            card, slot = random.choice(valid_moves)
-            sim_state.play_card(card, slot)
-        
-        # 結果を評価
-        result = {
-            'cards_played': sim_state.get_cards_played_count(),
-            'total_points': sim_state.get_total_points()
-        }
-        
-        return Evaluator.evaluate(result)
+        reward = self.rollout_policy.rollout(sim_state)
+        if self.instrumentation is not None:
+            self.instrumentation.record_rollout(sim_state.turn_count - state.turn_count)
+        return reward
     
     def _backpropagate(self, node: Optional[ISMCTSNode], reward: float):
         """
@@ -258,7 +598,8 @@ class ISMCTSEngine:
             self.info_set_tree[info_set] = ISMCTSNode(
                 info_set,
                 parent=parent,
-                move=move
+                move=move,
+                expansion_policy=self.expansion_policy
             )
         return self.info_set_tree[info_set]
     
@@ -297,6 +638,40 @@ class ISMCTSEngine:
             cards_played_count=len(obs_state.played_cards)
         )
     
+    def _get_valid_moves(self, state: GameState) -> List[Tuple[Card, int]]:
+        """
+        ノード展開用の有効手を取得
+        
+        Args:
+            state: ゲーム状態
+        
+        Returns:
+            有効手のリスト（deduplicate_movesが有効なら代表手のみ）
+        """
+        if self.deduplicate_moves:
+            return MoveValidator.get_canonical_moves(
+                state.get_hand(),
+                state.get_field()
+            )
+        return MoveValidator.get_valid_moves(
+            state.get_hand(),
+            state.get_field()
+        )
+    
+    def _get_root_moves(self, observable_state: ObservableGameState) -> List[Tuple[Card, int]]:
+        """
+        ルートの有効手を観測可能な状態から取得（全ての決定化で共通）
+        
+        Args:
+            observable_state: 観測可能なゲーム状態
+        
+        Returns:
+            有効手のリスト（deduplicate_movesが有効なら代表手のみ）
+        """
+        if self.deduplicate_moves:
+            return MoveValidator.get_canonical_moves(observable_state.hand, observable_state.field)
+        return MoveValidator.get_valid_moves(observable_state.hand, observable_state.field)
+    
     def _is_terminal(self, state: GameState) -> bool:
         """
         終端状態（ゲーム終了）判定
@@ -312,17 +687,23 @@ class ISMCTSEngine:
             state.get_field()
         )
     
-    def _get_statistics(self, root: ISMCTSNode) -> dict:
+    def _get_statistics(
+        self,
+        root: ISMCTSNode,
+        best_move: Optional[Tuple[Card, int]] = None
+    ) -> dict:
         """
         探索の統計情報を取得
         
         Args:
             root: ルートノード
+            best_move: 最良の手（省略時は訪問回数が最大の手）
         
         Returns:
             統計情報の辞書
         """
-        best_move = root.get_best_move()
+        if best_move is None:
+            best_move = root.get_best_move()
         
         if best_move and best_move in root.children:
             best_child = root.children[best_move]
@@ -332,14 +713,20 @@ class ISMCTSEngine:
             best_move_visits = 0
             best_move_reward = 0.0
         
-        return {
+        stats = {
             'total_visits': root.visits,
             'num_children': len(root.children),
             'best_move': best_move,
             'best_move_visits': best_move_visits,
             'best_move_reward': best_move_reward,
+            'root_reward': root.get_average_reward(),
             'info_set_cache_size': len(self.info_set_tree)
         }
+        if self.instrumentation is not None:
+            stats['instrumentation'] = self.instrumentation.to_dict()
+        if self.early_stopping is not None:
+            stats['early_stopping'] = self.early_stopping.to_dict()
+        return stats
     
     def clear_cache(self):
         """
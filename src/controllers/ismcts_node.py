@@ -7,6 +7,7 @@ import math
 from typing import Dict, List, Optional, Tuple
 from ..models.card import Card
 from .information_set import InformationSet
+from .expansion_policy import ExpansionPolicy
 
 
 class ISMCTSNode:
@@ -23,7 +24,8 @@ class ISMCTSNode:
         self,
         info_set: InformationSet,
         parent: Optional['ISMCTSNode'] = None,
-        move: Optional[Tuple[Card, int]] = None
+        move: Optional[Tuple[Card, int]] = None,
+        expansion_policy: Optional[ExpansionPolicy] = None
     ):
         """
         IS-MCTSノードの初期化
@@ -32,6 +34,7 @@ class ISMCTSNode:
             info_set: このノードが表す情報セット
             parent: 親ノード
             move: 親から このノードへの手
+            expansion_policy: 展開方策（Progressive Widening）
         """
         self.info_set = info_set
         self.parent = parent
@@ -47,6 +50,10 @@ class ISMCTSNode:
         # 未試行の手
         self.untried_moves: List[Tuple[Card, int]] = []
         self._initialized_moves = False
+        self.expansion_policy = expansion_policy
+        
+        # PUCT用の事前確率（情報セットごとに1回だけ計算）
+        self.priors: Optional[Dict[Tuple[Card, int], float]] = None
     
     def initialize_untried_moves(self, valid_moves: List[Tuple[Card, int]]):
         """
@@ -65,10 +72,18 @@ class ISMCTSNode:
         """
         全ての手が試されたか判定
         
+        Note:
+            展開方策が設定されている場合、訪問回数に対して子ノード数が
+            上限に達していれば展開済みとみなす
+        
         Returns:
             全て試されていればTrue
         """
-        return len(self.untried_moves) == 0
+        if len(self.untried_moves) == 0:
+            return True
+        if self.expansion_policy is not None:
+            return not self.expansion_policy.can_expand(len(self.children), self.visits)
+        return False
     
     def is_terminal(self) -> bool:
         """
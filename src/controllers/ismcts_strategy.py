@@ -3,10 +3,17 @@ IS-MCTS戦略
 WebUIから利用できる戦略インターフェース
 """
 
-from typing import Optional, Tuple
+import random
+from typing import Optional, Tuple, Dict, Any
 from ..models.card import Card
 from .observable_game_state import ObservableGameState
 from .ismcts_engine import ISMCTSEngine
+from .expansion_policy import ExpansionPolicy
+from .prior_provider import PriorProvider
+from .rollout_policy import RolloutPolicy
+from .search_profiler import SearchProfiler
+from .early_stopping import EarlyStopping
+from .decision_triage import DecisionTriage
 
 
 class ISMCTSStrategy:
@@ -25,7 +32,21 @@ class ISMCTSStrategy:
         self,
         num_iterations: int = 1000,
         exploration_weight: float = 1.41,
-        verbose: bool = False
+        verbose: bool = False,
+        expansion_policy: Optional[ExpansionPolicy] = None,
+        selection: str = 'ucb1',
+        prior_provider: Optional[PriorProvider] = None,
+        rollout_policy: Optional[RolloutPolicy] = None,
+        time_limit: Optional[float] = None,
+        instrument: bool = False,
+        profiler: Optional[SearchProfiler] = None,
+        lazy_determinization: bool = False,
+        rng: Optional[random.Random] = None,
+        determinization_batch_size: Optional[int] = None,
+        determinization_sampling: str = 'iid',
+        root_selection: str = 'ucb',
+        early_stopping: Optional[EarlyStopping] = None,
+        triage: Optional[DecisionTriage] = None
     ):
         """
         IS-MCTS戦略の初期化
@@ -34,35 +55,102 @@ class ISMCTSStrategy:
             num_iterations: 探索回数（デフォルト: 1000）
             exploration_weight: UCB1の探索重み（デフォルト: sqrt(2)）
             verbose: 詳細ログを出力するか
+            expansion_policy: 展開方策（Progressive Widening、省略可）
+            selection: 子ノードの選択方式（'ucb1' または 'puct'）
+            prior_provider: PUCTの事前確率プロバイダ（Noneの場合はヒューリスティック）
+            rollout_policy: ロールアウト方策（Noneの場合は一様ランダム）
+            time_limit: 1手あたりの探索時間の上限（秒、Noneの場合は探索回数のみ）
+            instrument: 探索のフェーズごとの所要時間などを計測するか
+            profiler: profile=True 時に使うプロファイラ（Noneの場合は ./profiles に出力）
+            lazy_determinization: 遅延決定化を使うか（山札から引くたびに未出現カードをサンプリング）
+            rng: 決定化と探索で使う乱数生成器（省略時はrandomモジュールのグローバル乱数）
+            determinization_batch_size: 指定した場合、決定化をこの個数ずつNumPyで一括生成する
+            determinization_sampling: 一括決定化のサンプリング方式（'iid' / 'stratified' / 'antithetic'）
+            root_selection: ルートの手の選び方（'ucb' / 'sequential_halving' / 'hybrid'）
+            early_stopping: 探索の早期終了（最良の手が確定したら探索回数の途中でも打ち切る）
+            triage: 探索前の事前判定（自明な局面は探索せずに手を返す、Noneの場合は常に探索する）
         """
         self.num_iterations = num_iterations
         self.exploration_weight = exploration_weight
         self.verbose = verbose
+        self.time_limit = time_limit
+        # 直近の探索の統計情報（get_best_move呼び出し後に設定される）
+        self.last_statistics: Optional[Dict[str, Any]] = None
+        self.profiler = profiler
+        # 直近のプロファイル出力の共通プレフィックス（profile=True 時に設定される）
+        self.last_profile_path: Optional[str] = None
+        self.triage = triage
         
         # エンジンを初期化
         self.engine = ISMCTSEngine(
             exploration_weight=exploration_weight,
-            verbose=verbose
+            verbose=verbose,
+            expansion_policy=expansion_policy,
+            selection=selection,
+            prior_provider=prior_provider,
+            rollout_policy=rollout_policy,
+            instrument=instrument,
+            lazy_determinization=lazy_determinization,
+            rng=rng,
+            determinization_batch_size=determinization_batch_size,
+            determinization_sampling=determinization_sampling,
+            root_selection=root_selection,
+            early_stopping=early_stopping
         )
     
+    def set_rng(self, rng: Optional[random.Random]):
+        """
+        決定化と探索で使う乱数生成器を差し替える
+        
+        Args:
+            rng: 乱数生成器（Noneの場合はrandomモジュールのグローバル乱数）
+        """
+        self.engine.set_rng(rng)
+    
     def get_best_move(
         self,
-        observable_state: ObservableGameState
+        observable_state: ObservableGameState,
+        profile: bool = False
     ) -> Optional[Tuple[Card, int]]:
         """
         最適な手を取得
         
         Args:
             observable_state: 観測可能なゲーム状態
+            profile: 探索をプロファイルし、入力状態のスナップショットと一緒に保存するか
+                     （出力先は last_profile_path に設定される）
         
         Returns:
             最良の手（カード、スロット番号）、手が無ければNone
         """
+        if profile:
+            profiler = self.profiler if self.profiler is not None else SearchProfiler()
+            best_move, self.last_profile_path = profiler.profile(
+                'ismcts',
+                self,
+                observable_state,
+                lambda: self.get_best_move(observable_state)
+            )
+            return best_move
+        
+        if self.triage is not None:
+            # 自明な局面は探索しない
+            resolved, move = self.triage.resolve(
+                observable_state.hand,
+                observable_state.field,
+                observable_state.get_played_cards() + list(observable_state.known_excluded_cards)
+            )
+            if resolved:
+                self.last_statistics = {'best_move': move, 'triage': self.triage.last_rule}
+                return move
+        
         # IS-MCTS探索を実行
         best_move, stats = self.engine.search(
             observable_state,
-            num_iterations=self.num_iterations
+            num_iterations=self.num_iterations,
+            time_limit=self.time_limit
         )
+        self.last_statistics = stats
         
         if self.verbose:
             self._print_statistics(stats)
@@ -88,6 +176,8 @@ class ISMCTSStrategy:
         print(f"Best move: {stats['best_move']}")
         print(f"Best move visits: {stats['best_move_visits']}")
         print(f"Best move avg reward: {stats['best_move_reward']:.2f}")
+        if 'early_stopping' in stats:
+            print(f"Iterations saved: {stats['early_stopping']['iterations_saved']}")
         print("=" * 50 + "\n")
     
     def set_num_iterations(self, num_iterations: int):
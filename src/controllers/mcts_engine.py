@@ -5,13 +5,20 @@ MCTS探索エンジン
 
 import random
 import copy
-from typing import Optional, Tuple
+import time
+from typing import Dict, Optional, Tuple
 from ..models.card import Card
 from .game_state import GameState
 from .mcts_node import MCTSNode
-from .move_validator import MoveValidator
-from .evaluator import Evaluator
 from .game import Game
+from .expansion_policy import ExpansionPolicy
+from .prior_provider import PriorProvider
+from .puct_selector import PUCTSelector
+from .rollout_policy import RolloutPolicy
+from .rollout_cache import RolloutCache
+from .search_instrumentation import SearchInstrumentation
+from .sequential_halving import SequentialHalving
+from .early_stopping import EarlyStopping
 
 
 class MCTSEngine:
@@ -23,60 +30,250 @@ class MCTSEngine:
     2. Expansion（展開）
     3. Simulation（シミュレーション）
     4. Backpropagation（逆伝播）
+    
+    root_selection でルートの手への探索回数の配分方法を選べる:
+    - 'ucb': ルートも他のノードと同じく selection の方式（UCB1 / PUCT）で選ぶ
+    - 'sequential_halving': ルートの手を逐次半減（SequentialHalving）で選び、
+      その子から直接ロールアウトする（木は伸ばさない）
+    - 'hybrid': ルートの手は逐次半減で選び、その子から下は selection の方式で木を伸ばす
+    逐次半減を使う場合、最良の手は訪問回数ではなく、最後まで残った手の平均報酬で決める。
+    
+    early_stopping を指定すると、最良の手が確定した時点で探索回数の途中でも打ち切る
+    （省略した探索回数は get_statistics() の 'early_stopping' に入る）。
     """
     
+    ROOT_SELECTION_MODES = ('ucb', 'sequential_halving', 'hybrid')
+    
     def __init__(
         self,
         exploration_weight: float = 1.41,
-        simulation_seed: Optional[int] = None
+        simulation_seed: Optional[int] = None,
+        deduplicate_moves: bool = True,
+        expansion_policy: Optional[ExpansionPolicy] = None,
+        selection: str = 'ucb1',
+        puct_constant: float = 1.25,
+        prior_provider: Optional[PriorProvider] = None,
+        rollout_policy: Optional[RolloutPolicy] = None,
+        rollout_cache: Optional[RolloutCache] = None,
+        instrument: bool = False,
+        rng: Optional[random.Random] = None,
+        root_selection: str = 'ucb',
+        early_stopping: Optional[EarlyStopping] = None
     ):
         """
         MCTS探索エンジンの初期化
         
         Args:
             exploration_weight: UCB1の探索重み（デフォルト: sqrt(2)）
-            simulation_seed: シミュレーションの乱数シード（デバッグ用）
+            simulation_seed: シミュレーションの乱数シード（デバッグ用、rng省略時にエンジン専用の乱数を生成する）
+            deduplicate_moves: 同値な手をまとめて分岐数を減らすか
+            expansion_policy: 展開方策（Noneの場合は全ての手を順に展開）
+            selection: 子ノードの選択方式（'ucb1' または 'puct'）
+            puct_constant: PUCTの探索係数
+            prior_provider: PUCTの事前確率プロバイダ（Noneの場合はヒューリスティック）
+            rollout_policy: ロールアウト方策（Noneの場合は一様ランダム）
+            rollout_cache: ロールアウト結果のキャッシュ（Noneの場合はキャッシュしない）
+            instrument: フェーズごとの所要時間などを計測するか（デフォルト: 無効）
+            rng: 探索で使う乱数生成器（省略時はsimulation_seedから生成、
+                 どちらも省略した場合はrandomモジュールのグローバル乱数）。
+                 グローバル乱数を使うロールアウト方策にも、この乱数を使わせる
+            root_selection: ルートの手の選び方（'ucb' / 'sequential_halving' / 'hybrid'）。
+                            逐次半減は探索回数を予算として配分するので、時間制限だけで
+                            探索する（探索回数を大きくする）場合は 'ucb' の方が向いている
+            early_stopping: 探索の早期終了（Noneの場合は探索回数・時間制限まで探索する）。
+                            訪問回数で最良の手を選ぶ root_selection='ucb' とだけ併用できる
         """
+        if selection not in ('ucb1', 'puct'):
+            raise ValueError(f"selectionは'ucb1'または'puct'である必要があります: {selection}")
+        if root_selection not in self.ROOT_SELECTION_MODES:
+            raise ValueError(
+                f"root_selectionは{self.ROOT_SELECTION_MODES}のいずれかである必要があります: {root_selection}"
+            )
+        if early_stopping is not None and root_selection != 'ucb':
+            raise ValueError("early_stoppingはroot_selection='ucb'とだけ併用できます")
+        
         self.exploration_weight = exploration_weight
         self.simulation_seed = simulation_seed
-        if simulation_seed is not None:
-            random.seed(simulation_seed)
+        self.deduplicate_moves = deduplicate_moves
+        self.expansion_policy = expansion_policy
+        self.selection = selection
+        self.root_selection = root_selection
+        self.early_stopping = early_stopping
+        # 直近の探索のルートと逐次半減のスケジュール（get_statistics で最良の手を決めるのに使う）
+        self._last_halving: Optional[Tuple[MCTSNode, SequentialHalving]] = None
+        if rng is None and simulation_seed is not None:
+            rng = random.Random(simulation_seed)
+        # Noneの場合はグローバル乱数（pickleできるよう、randomモジュール自体は保持しない）
+        self.rng: Optional[random.Random] = None
+        self.rollout_policy = rollout_policy if rollout_policy is not None else RolloutPolicy()
+        self.set_rng(rng)
+        self.rollout_cache = rollout_cache
+        self.instrumentation: Optional[SearchInstrumentation] = (
+            SearchInstrumentation() if instrument else None
+        )
+        self.puct_selector: Optional[PUCTSelector] = None
+        if selection == 'puct':
+            self.puct_selector = PUCTSelector(
+                puct_constant=puct_constant,
+                prior_provider=prior_provider
+            )
+    
+    def set_rng(self, rng: Optional[random.Random]):
+        """
+        探索で使う乱数生成器を差し替える（ワーカーでジョブごとにシードを設定する場合など）
+        
+        ロールアウト方策がグローバル乱数またはエンジンの乱数を使っている場合は、方策の乱数も差し替える。
+        
+        Args:
+            rng: 乱数生成器（Noneの場合はrandomモジュールのグローバル乱数）
+        """
+        if self.rollout_policy.rng is random or self.rollout_policy.rng is self.rng:
+            self.rollout_policy.rng = rng if rng is not None else random
+        self.rng = rng
     
     def search(
         self,
         root_state: GameState,
-        num_iterations: int = 1000
+        num_iterations: int = 1000,
+        time_limit: Optional[float] = None
     ) -> Tuple[Optional[Tuple[Card, int]], MCTSNode]:
         """
         MCTS探索を実行し、最良の手を返す
         
         Args:
             root_state: 探索開始時のゲーム状態
-            num_iterations: 探索回数
+            num_iterations: 探索回数（time_limit指定時は上限）
+            time_limit: 探索時間の上限（秒）。Noneの場合は探索回数のみで終了
         
         Returns:
             (最良の手, ルートノード)
         """
-        root = MCTSNode(root_state)
+        root = MCTSNode(
+            root_state,
+            deduplicate_moves=self.deduplicate_moves,
+            expansion_policy=self.expansion_policy
+        )
+        
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        if self.instrumentation is not None:
+            self.instrumentation.reset()
+        early_stopping = self.early_stopping
+        if early_stopping is not None:
+            early_stopping.reset(num_iterations)
+        
+        halving: Optional[SequentialHalving] = None
+        root_children: Dict[Tuple[Card, int], MCTSNode] = {}
+        grow_tree = self.root_selection != 'sequential_halving'
+        if self.root_selection != 'ucb' and not root.is_terminal():
+            # ルートの手を全て展開し、逐次半減で探索回数を配分する
+            while root.untried_moves:
+                root.expand()
+            root_children = {child.move: child for child in root.children}
+            halving = SequentialHalving(list(root_children), num_iterations)
+        self._last_halving = (root, halving) if halving is not None else None
         
         for _ in range(num_iterations):
-            # 1. Selection: UCB1で最良のノードを選択
-            node = self._select(root)
+            start = root
+            if halving is not None:
+                move = halving.next_move()
+                start = root_children[move]
             
-            # 2. Expansion: 子ノードを追加
-            if not node.is_terminal() and not node.is_fully_expanded():
-                node = self._expand(node)
+            if self.instrumentation is not None:
+                reward = self._run_instrumented_iteration(start, grow_tree)
+            else:
+                reward = self._run_iteration(start, grow_tree)
             
-            # 3. Simulation: ランダムプレイアウト
-            reward = self._simulate(node.state)
+            if halving is not None:
+                halving.record(move, reward)
             
-            # 4. Backpropagation: 報酬を親ノードに伝播
-            self._backpropagate(node, reward)
+            if early_stopping is not None:
+                early_stopping.record(reward)
+                if early_stopping.should_check() and early_stopping.should_stop(
+                    [(child.visits, child.total_reward) for child in root.children],
+                    len(root.children) + len(root.untried_moves)
+                ):
+                    break
+            
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        
+        if self.instrumentation is not None:
+            self.instrumentation.stop()
+        
+        if halving is not None:
+            # 逐次半減で最後まで残った手のうち、平均報酬が最大の手を返す
+            return halving.best_move(), root
         
         # 最も訪問回数が多い手を返す
         best_move = root.get_best_move()
         return best_move, root
     
+    def _run_iteration(self, start: MCTSNode, grow_tree: bool = True) -> float:
+        """
+        イテレーションを1回実行
+        
+        Args:
+            start: 選択を始めるノード（通常はルート、逐次半減ではルートの子）
+            grow_tree: Falseの場合は選択・展開をせず、startから直接ロールアウトする
+        
+        Returns:
+            報酬値
+        """
+        node = start
+        if grow_tree:
+            # 1. Selection: UCB1で最良のノードを選択
+            node = self._select(start)
+            
+            # 2. Expansion: 子ノードを追加
+            if not node.is_terminal() and not node.is_fully_expanded():
+                node = self._expand(node)
+        
+        # 3. Simulation: ランダムプレイアウト
+        reward = self._simulate(node.state)
+        
+        # 4. Backpropagation: 報酬を親ノードに伝播
+        self._backpropagate(node, reward)
+        return reward
+    
+    def _run_instrumented_iteration(self, start: MCTSNode, grow_tree: bool = True) -> float:
+        """
+        各フェーズの所要時間を計測しながらイテレーションを1回実行
+        
+        Args:
+            start: 選択を始めるノード（通常はルート、逐次半減ではルートの子）
+            grow_tree: Falseの場合は選択・展開をせず、startから直接ロールアウトする
+        
+        Returns:
+            報酬値
+        """
+        instrumentation = self.instrumentation
+        
+        start_time = time.perf_counter_ns()
+        node = self._select(start) if grow_tree else start
+        selected = time.perf_counter_ns()
+        instrumentation.add_phase('select', selected - start_time)
+        
+        if grow_tree and not node.is_terminal() and not node.is_fully_expanded():
+            node = self._expand(node)
+            instrumentation.nodes_allocated += 1
+        expanded = time.perf_counter_ns()
+        instrumentation.add_phase('expand', expanded - selected)
+        
+        reward = self._simulate(node.state)
+        simulated = time.perf_counter_ns()
+        instrumentation.add_phase('simulate', simulated - expanded)
+        
+        self._backpropagate(node, reward)
+        instrumentation.add_phase('backprop', time.perf_counter_ns() - simulated)
+        
+        depth = 0
+        parent = node.parent
+        while parent is not None:
+            depth += 1
+            parent = parent.parent
+        instrumentation.record_iteration(depth)
+        return reward
+    
     def _select(self, node: MCTSNode) -> MCTSNode:
         """
         Selection: UCB1で最も有望なノードを選択
@@ -88,7 +285,14 @@ class MCTSEngine:
             選択されたノード
         """
         while not node.is_terminal():
-            if not node.is_fully_expanded():
+            if self.puct_selector is not None:
+                # PUCT: 子ノードと未試行の手をまとめて比較
+                child = self._select_puct_child(node)
+                if child is None:
+                    # 未試行の手を展開すべき
+                    return node
+                node = child
+            elif not node.is_fully_expanded():
                 # まだ展開できる手がある
                 return node
             else:
@@ -97,6 +301,40 @@ class MCTSEngine:
         
         return node
     
+    def _select_puct_child(self, node: MCTSNode) -> Optional[MCTSNode]:
+        """
+        PUCTで子ノードを選択
+        
+        Args:
+            node: 現在のノード
+        
+        Returns:
+            選択された子ノード。未試行の手を展開すべき場合はNone
+        """
+        self._ensure_priors(node)
+        untried_moves = [] if node.is_fully_expanded() else node.untried_moves
+        children = [(child.move, child) for child in node.children]
+        _, child = self.puct_selector.select(
+            node.visits, children, untried_moves, node.priors
+        )
+        return child
+    
+    def _ensure_priors(self, node: MCTSNode):
+        """
+        ノードの事前確率を計算してキャッシュ
+        
+        Args:
+            node: 対象ノード
+        """
+        if node.priors is None:
+            moves = [child.move for child in node.children] + node.untried_moves
+            self.puct_selector.ensure_priors(
+                node,
+                moves,
+                node.state.get_hand(),
+                node.state.get_unknown_cards()
+            )
+    
     def _expand(self, node: MCTSNode) -> MCTSNode:
         """
         Expansion: 未試行の手を1つ選んで子ノードを作成
@@ -107,11 +345,16 @@ class MCTSEngine:
         Returns:
             新しく作成された子ノード
         """
+        if self.puct_selector is not None:
+            # 事前確率が最も高い未試行の手を展開
+            self._ensure_priors(node)
+            move = PUCTSelector.best_untried_move(node.untried_moves, node.priors)
+            return node.expand(move)
         return node.expand()
     
     def _simulate(self, state: GameState) -> float:
         """
-        Simulation: ゲーム終了までランダムプレイ
+        Simulation: ゲーム終了までロールアウト方策でプレイ
         
         Args:
             state: シミュレーション開始時の状態
@@ -119,30 +362,43 @@ class MCTSEngine:
         Returns:
             報酬値（評価スコア）
         """
-        # 状態をコピーして破壊的に変更
-        sim_state = copy.deepcopy(state)
+        if self.rollout_cache is None:
+            return self._rollout(state)
         
-        # ゲーム終了までランダムにプレイ
-        while MoveValidator.has_valid_move(sim_state.get_hand(), sim_state.get_field()):
-            valid_moves = MoveValidator.get_valid_moves(
-                sim_state.get_hand(),
-                sim_state.get_field()
-            )
-            
-            if len(valid_moves) == 0:
-                break
-            
-            # ランダムに手を選択
-            card, slot_number = random.choice(valid_moves)
-            sim_state.play_card(card, slot_number)
+        # ストリームを選び、同じ状態・方策・ストリームのロールアウト済みなら報酬を再利用
+        cache = self.rollout_cache
+        stream = self.rollout_policy.rng.randrange(cache.num_streams)
+        key = cache.make_key(state, type(self.rollout_policy), stream)
+        reward = cache.get(key)
+        if reward is None:
+            reward = self._rollout(state, rng=cache.stream_rng(stream))
+            cache.put(key, reward)
+        return reward
+    
+    def _rollout(self, state: GameState, rng: Optional[random.Random] = None) -> float:
+        """
+        状態をコピーしてロールアウトを1回実行
         
-        # 結果を評価
-        result = {
-            'cards_played': sim_state.get_cards_played_count(),
-            'total_points': sim_state.get_total_points()
-        }
+        Args:
+            state: シミュレーション開始時の状態
+            rng: このロールアウトだけで方策に使わせる乱数生成器（Noneの場合は方策の乱数）
         
-        reward = Evaluator.evaluate(result)
+        Returns:
+            報酬値（評価スコア）
+        """
+        # 状態をコピーして破壊的に変更
+        sim_state = copy.deepcopy(state)
+        if rng is None:
+            reward = self.rollout_policy.rollout(sim_state)
+        else:
+            policy_rng = self.rollout_policy.rng
+            self.rollout_policy.rng = rng
+            try:
+                reward = self.rollout_policy.rollout(sim_state)
+            finally:
+                self.rollout_policy.rng = policy_rng
+        if self.instrumentation is not None:
+            self.instrumentation.record_rollout(sim_state.turn_count - state.turn_count)
         return reward
     
     def _backpropagate(self, node: Optional[MCTSNode], reward: float):
@@ -168,20 +424,32 @@ class MCTSEngine:
             統計情報の辞書
         """
         if len(root.children) == 0:
-            return {
+            stats = {
                 'total_visits': root.visits,
                 'num_children': 0,
                 'best_move': None,
                 'best_move_visits': 0,
                 'best_move_reward': 0.0
             }
+        else:
+            best_child = max(root.children, key=lambda c: c.visits)
+            if self._last_halving is not None and self._last_halving[0] is root:
+                # 逐次半減では、最後まで残った手のうち平均報酬が最大の手
+                best_move = self._last_halving[1].best_move()
+                best_child = next(child for child in root.children if child.move == best_move)
+            stats = {
+                'total_visits': root.visits,
+                'num_children': len(root.children),
+                'best_move': best_child.move,
+                'best_move_visits': best_child.visits,
+                'best_move_reward': best_child.total_reward / best_child.visits if best_child.visits > 0 else 0.0
+            }
         
-        best_child = max(root.children, key=lambda c: c.visits)
+        if self.rollout_cache is not None:
+            stats.update(self.rollout_cache.get_statistics())
+        if self.instrumentation is not None:
+            stats['instrumentation'] = self.instrumentation.to_dict()
+        if self.early_stopping is not None:
+            stats['early_stopping'] = self.early_stopping.to_dict()
         
-        return {
-            'total_visits': root.visits,
-            'num_children': len(root.children),
-            'best_move': best_child.move,
-            'best_move_visits': best_child.visits,
-            'best_move_reward': best_child.total_reward / best_child.visits if best_child.visits > 0 else 0.0
-        }
+        return stats
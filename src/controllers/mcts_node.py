@@ -4,10 +4,11 @@ MCTSノードクラス
 """
 
 import math
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from ..models.card import Card
 from .game_state import GameState
 from .move_validator import MoveValidator
+from .expansion_policy import ExpansionPolicy
 
 
 class MCTSNode:
@@ -22,13 +23,17 @@ class MCTSNode:
         visits: 訪問回数
         total_reward: 累積報酬
         untried_moves: まだ試していない手のリスト
+        deduplicate_moves: 同値な手をまとめて分岐数を減らすか
+        expansion_policy: 展開方策（Noneの場合はリスト順に全ての手を展開）
     """
     
     def __init__(
         self,
         state: GameState,
         parent: Optional['MCTSNode'] = None,
-        move: Optional[Tuple[Card, int]] = None
+        move: Optional[Tuple[Card, int]] = None,
+        deduplicate_moves: bool = True,
+        expansion_policy: Optional[ExpansionPolicy] = None
     ):
         """
         MCTSノードの初期化
@@ -37,6 +42,8 @@ class MCTSNode:
             state: ゲーム状態
             parent: 親ノード
             move: このノードに至った手
+            deduplicate_moves: 同値な手（スロット入れ替えで同じ結果になる手）をまとめるか
+            expansion_policy: 展開方策（展開順序とProgressive Widening）
         """
         self.state = state
         self.parent = parent
@@ -44,21 +51,39 @@ class MCTSNode:
         self.children: List[MCTSNode] = []
         self.visits = 0
         self.total_reward = 0.0
+        self.deduplicate_moves = deduplicate_moves
+        self.expansion_policy = expansion_policy
+        self._moves_ordered = False
+        self.priors: Optional[Dict[Tuple[Card, int], float]] = None  # PUCT用の事前確率
         
         # まだ試していない手を取得
-        self.untried_moves = MoveValidator.get_valid_moves(
-            state.get_hand(),
-            state.get_field()
-        )
+        if deduplicate_moves:
+            self.untried_moves = MoveValidator.get_canonical_moves(
+                state.get_hand(),
+                state.get_field()
+            )
+        else:
+            self.untried_moves = MoveValidator.get_valid_moves(
+                state.get_hand(),
+                state.get_field()
+            )
     
     def is_fully_expanded(self) -> bool:
         """
         ノードが完全に展開されているか（全ての子ノードが作成済みか）
         
+        Note:
+            展開方策が設定されている場合、訪問回数に対して子ノード数が
+            上限に達していれば（未試行の手が残っていても）展開済みとみなす
+        
         Returns:
             完全に展開されている場合True
         """
-        return len(self.untried_moves) == 0
+        if len(self.untried_moves) == 0:
+            return True
+        if self.expansion_policy is not None:
+            return not self.expansion_policy.can_expand(len(self.children), self.visits)
+        return False
     
     def is_terminal(self) -> bool:
         """
@@ -108,18 +133,34 @@ class MCTSNode:
         """
         return max(self.children, key=lambda child: child.ucb1_score(exploration_weight))
     
-    def expand(self) -> 'MCTSNode':
+    def expand(self, move: Optional[Tuple[Card, int]] = None) -> 'MCTSNode':
         """
         未試行の手を1つ選んで子ノードを作成
         
+        Args:
+            move: 展開する手（省略時は未試行の手の末尾から選ぶ）
+        
         Returns:
             新しく作成された子ノード
         """
         if len(self.untried_moves) == 0:
             raise ValueError("展開できる手がありません")
         
-        # 未試行の手を1つ選ぶ
-        move = self.untried_moves.pop()
+        if move is not None:
+            # 指定された手を展開
+            self.untried_moves.remove(move)
+        else:
+            # 展開方策がある場合、最初の展開時に有望な手が末尾に来るよう並べ替える
+            if self.expansion_policy is not None and not self._moves_ordered:
+                self.untried_moves = self.expansion_policy.order_moves(
+                    self.untried_moves,
+                    self.state.get_hand(),
+                    self.state.get_unknown_cards()
+                )
+                self._moves_ordered = True
+            
+            # 未試行の手を1つ選ぶ
+            move = self.untried_moves.pop()
         card, slot_number = move
         
         # 新しい状態を作成（状態をコピーして手を適用）
@@ -128,7 +169,13 @@ class MCTSNode:
         new_state.play_card(card, slot_number)
         
         # 子ノードを作成
-        child_node = MCTSNode(new_state, parent=self, move=move)
+        child_node = MCTSNode(
+            new_state,
+            parent=self,
+            move=move,
+            deduplicate_moves=self.deduplicate_moves,
+            expansion_policy=self.expansion_policy
+        )
         self.children.append(child_node)
         
         return child_node
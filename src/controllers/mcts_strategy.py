@@ -3,12 +3,20 @@
 MCTSを使用して最適な手を提案
 """
 
+import random
 from typing import Optional, Tuple, Dict, Any
 from ..models.card import Card
 from .game_state import GameState
 from .mcts_engine import MCTSEngine
 from .game import Game
 from .evaluator import Evaluator
+from .expansion_policy import ExpansionPolicy
+from .prior_provider import PriorProvider
+from .rollout_policy import RolloutPolicy
+from .search_profiler import SearchProfiler
+from .early_stopping import EarlyStopping
+from .decision_triage import DecisionTriage
+from .rollout_cache import RolloutCache
 import copy
 
 
@@ -21,7 +29,19 @@ class MCTSStrategy:
         self,
         num_iterations: int = 1000,
         exploration_weight: float = 1.41,
-        verbose: bool = False
+        verbose: bool = False,
+        expansion_policy: Optional[ExpansionPolicy] = None,
+        selection: str = 'ucb1',
+        prior_provider: Optional[PriorProvider] = None,
+        rollout_policy: Optional[RolloutPolicy] = None,
+        rollout_cache: Optional[RolloutCache] = None,
+        time_limit: Optional[float] = None,
+        instrument: bool = False,
+        profiler: Optional[SearchProfiler] = None,
+        rng: Optional[random.Random] = None,
+        root_selection: str = 'ucb',
+        early_stopping: Optional[EarlyStopping] = None,
+        triage: Optional[DecisionTriage] = None
     ):
         """
         MCTS戦略の初期化
@@ -30,30 +50,93 @@ class MCTSStrategy:
             num_iterations: MCTS探索回数（デフォルト: 1000）
             exploration_weight: UCB1の探索重み
             verbose: 詳細ログを出力するか
+            expansion_policy: 展開方策（Progressive Widening、省略可）
+            selection: 子ノードの選択方式（'ucb1' または 'puct'）
+            prior_provider: PUCTの事前確率プロバイダ（Noneの場合はヒューリスティック）
+            rollout_policy: ロールアウト方策（Noneの場合は一様ランダム）
+            rollout_cache: ロールアウト結果のキャッシュ（手番をまたいで再利用される）
+            time_limit: 1手あたりの探索時間の上限（秒、Noneの場合は探索回数のみ）
+            instrument: 探索のフェーズごとの所要時間などを計測するか
+            profiler: profile=True 時に使うプロファイラ（Noneの場合は ./profiles に出力）
+            rng: 探索で使う乱数生成器（省略時はrandomモジュールのグローバル乱数）
+            root_selection: ルートの手の選び方（'ucb' / 'sequential_halving' / 'hybrid'）
+            early_stopping: 探索の早期終了（最良の手が確定したら探索回数の途中でも打ち切る）
+            triage: 探索前の事前判定（自明な局面は探索せずに手を返す、Noneの場合は常に探索する）
         """
         self.num_iterations = num_iterations
         self.exploration_weight = exploration_weight
         self.verbose = verbose
-        self.engine = MCTSEngine(exploration_weight=exploration_weight)
+        self.time_limit = time_limit
+        # 直近の探索の統計情報（get_best_move呼び出し後に設定される）
+        self.last_statistics: Optional[Dict[str, Any]] = None
+        self.profiler = profiler
+        # 直近のプロファイル出力の共通プレフィックス（profile=True 時に設定される）
+        self.last_profile_path: Optional[str] = None
+        self.triage = triage
+        self.engine = MCTSEngine(
+            exploration_weight=exploration_weight,
+            expansion_policy=expansion_policy,
+            selection=selection,
+            prior_provider=prior_provider,
+            rollout_policy=rollout_policy,
+            rollout_cache=rollout_cache,
+            instrument=instrument,
+            rng=rng,
+            root_selection=root_selection,
+            early_stopping=early_stopping
+        )
     
-    def get_best_move(self, state: GameState) -> Optional[Tuple[Card, int]]:
+    def set_rng(self, rng: Optional[random.Random]):
+        """
+        探索で使う乱数生成器を差し替える
+        
+        Args:
+            rng: 乱数生成器（Noneの場合はrandomモジュールのグローバル乱数）
+        """
+        self.engine.set_rng(rng)
+    
+    def get_best_move(self, state: GameState, profile: bool = False) -> Optional[Tuple[Card, int]]:
         """
         現在の状態から最適な手を取得
         
         Args:
             state: 現在のゲーム状態
+            profile: 探索をプロファイルし、入力状態のスナップショットと一緒に保存するか
+                     （出力先は last_profile_path に設定される）
         
         Returns:
             最適な手（カード、スロット番号）、または None
         """
-        best_move, root = self.engine.search(state, self.num_iterations)
+        if profile:
+            profiler = self.profiler if self.profiler is not None else SearchProfiler()
+            best_move, self.last_profile_path = profiler.profile(
+                'mcts',
+                self,
+                state,
+                lambda: self.get_best_move(state)
+            )
+            return best_move
+        
+        if self.triage is not None:
+            # 自明な局面は探索しない
+            resolved, move = self.triage.resolve(
+                state.get_hand(), state.get_field(), state.get_played_cards()
+            )
+            if resolved:
+                self.last_statistics = {'best_move': move, 'triage': self.triage.last_rule}
+                return move
+        
+        best_move, root = self.engine.search(state, self.num_iterations, self.time_limit)
+        stats = self.engine.get_statistics(root)
+        self.last_statistics = stats
         
         if self.verbose and best_move is not None:
-            stats = self.engine.get_statistics(root)
             card, slot = best_move
             print(f"[MCTS] Best move: {card} → Slot {slot}")
             print(f"[MCTS] Visits: {stats['best_move_visits']}/{stats['total_visits']}")
             print(f"[MCTS] Avg reward: {stats['best_move_reward']:.2f}")
+            if 'early_stopping' in stats:
+                print(f"[MCTS] Iterations saved: {stats['early_stopping']['iterations_saved']}")
         
         return best_move
     
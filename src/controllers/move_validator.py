@@ -72,6 +72,89 @@ class MoveValidator:
         
         return valid_moves
     
+    @staticmethod
+    def get_canonical_moves(hand: Hand, field: Field) -> List[Tuple[Card, int]]:
+        """
+        同値な手をまとめた合法手（代表手）のリストを取得
+        
+        探索木の分岐数を減らすために使用する。
+        結果として得られる2つのトップカードの組がスロットの入れ替えを除いて
+        同じになる手は、以降のゲーム展開が区別できないため1つにまとめる。
+        （例: 両スロットが空の場合の (カード, 1) と (カード, 2)）
+        
+        カードは全て異なるので、まとめられるのは両スロットが空の局面（最初の1手）だけで、
+        それ以降の局面では合法手と同じリストを返す。
+        
+        Args:
+            hand: 手札
+            field: 場
+            
+        Returns:
+            代表手 (カード, スロット番号) のリスト
+        """
+        valid_moves = MoveValidator.get_valid_moves(hand, field)
+        return MoveValidator.deduplicate_moves(valid_moves, field)
+    
+    @staticmethod
+    def deduplicate_moves(
+        moves: List[Tuple[Card, int]],
+        field: Field
+    ) -> List[Tuple[Card, int]]:
+        """
+        手のリストから同値な手を除き、最初に現れた手を代表として残す
+        
+        Args:
+            moves: (カード, スロット番号)のタプルのリスト
+            field: 場
+            
+        Returns:
+            重複を除いた手のリスト（元の順序を保持）
+        """
+        top_card_1 = field.get_top_card(1)
+        top_card_2 = field.get_top_card(2)
+        
+        canonical_moves = []
+        seen_keys = set()
+        for card, slot_number in moves:
+            key = MoveValidator._equivalence_key(card, slot_number, top_card_1, top_card_2)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            canonical_moves.append((card, slot_number))
+        
+        return canonical_moves
+    
+    @staticmethod
+    def _equivalence_key(
+        card: Card,
+        slot_number: int,
+        top_card_1: Optional[Card],
+        top_card_2: Optional[Card]
+    ) -> Tuple[Card, frozenset]:
+        """
+        手の同値判定用のキーを生成
+        
+        キー = (出すカード, 手を打った後のトップカードの組（順序無視）)
+        出すカードが同じなら手を打った後の手札も同じになる。
+        残る側のトップは2つのスロットで異なるカードなので、キーが一致するのは
+        両スロットが空の場合だけ。
+        
+        Args:
+            card: 出すカード
+            slot_number: 出すスロット番号
+            top_card_1: スロット1のトップカード
+            top_card_2: スロット2のトップカード
+            
+        Returns:
+            同値判定用のキー
+        """
+        if slot_number == 1:
+            resulting_tops = (card, top_card_2)
+        else:
+            resulting_tops = (top_card_1, card)
+        # 出したカードは必ずトップに来るため、2枚が同一になることはない
+        return card, frozenset(resulting_tops)
+    
     @staticmethod
     def has_valid_move(hand: Hand, field: Field) -> bool:
         """
@@ -4,10 +4,11 @@
 """
 
 import copy
-from typing import List
+from typing import FrozenSet, Iterable, List, Optional
 from ..models.card import Card
 from ..models.hand import Hand
 from ..models.field import Field
+from ..models.played_card_log import PlayedCardLog
 from ..models.suit import Suit
 
 
@@ -21,42 +22,56 @@ class ObservableGameState:
     - これまでに場に出したカード
     - 累積ポイント
     - ターン数
-    - 山札の残り枚数
+    - 山札の残り枚数（手札・出したカード・除外枚数から導出）
+    - 除外カードのうち分かっているもの（WebUIで入力した場合など、一部だけでもよい）
     
     知らない情報:
     - 山札の具体的な順番
-    - 除外された10枚のカード
+    - 除外された10枚のカード（known_excluded_cards 以外）
     """
     
+    TOTAL_CARDS = 80
+    
     def __init__(self):
         """観測可能状態の初期化"""
         self.hand: Hand = Hand()
         self.field: Field = Field()
-        self.played_cards: List[Card] = []  # 場に出したカード
+        self._played_cards = PlayedCardLog()  # 場に出したカード
         self.total_points: int = 0
         self.turn_count: int = 0
-        self.remaining_deck_size: int = 65  # 70枚 - 初期手札5枚
         self.excluded_cards_count: int = 10  # ゲーム開始時に除外（固定）
+        self._known_excluded_cards: FrozenSet[Card] = frozenset()
     
     @staticmethod
-    def from_game_state(game_state, played_cards: List[Card]) -> 'ObservableGameState':
+    def from_game_state(
+        game_state,
+        played_cards: Optional[Iterable[Card]] = None,
+        known_excluded_cards: Optional[Iterable[Card]] = None
+    ) -> 'ObservableGameState':
         """
         既存のGameStateから観測可能状態を構築
         
+        出したカードの記録は GameState の記録のスナップショットを共有するので、
+        履歴の長さによらず O(1)。手札と場はリストの浅いコピー（カードは不変）。
+        
         Args:
             game_state: 完全情報のGameState
-            played_cards: これまでに場に出したカード
+            played_cards: これまでに場に出したカード（Noneの場合はGameStateの記録を使う）
+            known_excluded_cards: 分かっている除外カード（Noneの場合は分からないものとする）
         
         Returns:
             ObservableGameState
         """
         obs = ObservableGameState()
-        obs.hand = copy.deepcopy(game_state.get_hand())
-        obs.field = copy.deepcopy(game_state.get_field())
-        obs.played_cards = played_cards.copy()
+        obs.hand._cards = game_state.hand._cards.copy()
+        field = game_state.field
+        obs.field.get_slot(1)._cards = field.get_slot(1)._cards.copy()
+        obs.field.get_slot(2)._cards = field.get_slot(2)._cards.copy()
+        obs.played_cards = played_cards if played_cards is not None else game_state.played_cards
         obs.total_points = game_state.get_total_points()
         obs.turn_count = game_state.turn_count
-        obs.remaining_deck_size = game_state.get_deck().remaining_count()
+        if known_excluded_cards is not None:
+            obs.known_excluded_cards = known_excluded_cards
         return obs
     
     def get_hand(self) -> Hand:
@@ -67,9 +82,60 @@ class ObservableGameState:
         """場を取得"""
         return self.field
     
+    @property
+    def played_cards(self) -> PlayedCardLog:
+        """場に出したカードの記録（出した順のログ + ビットマスク）"""
+        return self._played_cards
+    
+    @played_cards.setter
+    def played_cards(self, cards: Iterable[Card]):
+        """場に出したカードの記録を設定（リストも受け付ける）"""
+        if isinstance(cards, PlayedCardLog):
+            self._played_cards = cards.view()
+        else:
+            self._played_cards = PlayedCardLog(cards)
+    
     def get_played_cards(self) -> List[Card]:
         """場に出したカードのリストを取得"""
-        return self.played_cards.copy()
+        return self._played_cards.to_list()
+    
+    @property
+    def known_excluded_cards(self) -> FrozenSet[Card]:
+        """分かっている除外カード（除外枚数以下、一部だけでもよい）"""
+        return self._known_excluded_cards
+    
+    @known_excluded_cards.setter
+    def known_excluded_cards(self, cards: Iterable[Card]):
+        """
+        分かっている除外カードを設定
+        
+        Args:
+            cards: 除外カード（手札・出したカードと重なってはいけない）
+        """
+        cards = frozenset(cards)
+        if len(cards) > self.excluded_cards_count:
+            raise ValueError(
+                f"分かっている除外カードは{self.excluded_cards_count}枚以下である必要があります: "
+                f"{len(cards)}枚"
+            )
+        hand_cards = set(self.hand.get_cards())
+        for card in cards:
+            if card in hand_cards or card in self._played_cards:
+                raise ValueError(f"除外カードが手札または出したカードに含まれています: {card}")
+        self._known_excluded_cards = cards
+    
+    @property
+    def remaining_deck_size(self) -> int:
+        """
+        山札の残り枚数（全80枚 - 除外枚数 - 手札 - 出したカード）
+        
+        場のカードは出したカードに含まれる。
+        """
+        return max(
+            self.TOTAL_CARDS - self.excluded_cards_count
+            - len(self.hand.get_cards()) - len(self._played_cards),
+            0
+        )
     
     def get_total_points(self) -> int:
         """累積ポイントを取得"""
@@ -77,23 +143,24 @@ class ObservableGameState:
     
     def get_unknown_cards(self) -> List[Card]:
         """
-        未出現カード（山札 + 除外10枚）を取得
+        未出現カード（山札 + 分かっていない除外カード）を取得
         
         Returns:
-            全80枚 - (手札 + 場に出したカード)
+            全80枚 - (手札 + 場に出したカード + 分かっている除外カード)
         """
         all_cards = self._get_all_80_cards()
         
-        # 手札と既出カードを除外
-        hand_cards = self.hand.get_cards()
-        known_cards = hand_cards + self.played_cards
+        # 手札・分かっている除外カードと既出カードを除外（既出カードはビットマスクで判定）
+        known_cards = set(self.hand.get_cards())
+        known_cards.update(self._known_excluded_cards)
+        played_cards = self._played_cards
         
-        unknown_cards = [c for c in all_cards if c not in known_cards]
+        unknown_cards = [c for c in all_cards if c not in known_cards and c not in played_cards]
         return unknown_cards
     
     def get_deck_candidates(self) -> List[Card]:
         """
-        山札の候補カード（除外10枚を含む未出現カード）を取得
+        山札の候補カード（分かっていない除外カードを含む未出現カード）を取得
         get_unknown_cards()と同じだが、意味的に明確にするためのエイリアス
         
         Returns:
@@ -118,10 +185,34 @@ class ObservableGameState:
         obs.played_cards = self.played_cards.copy()
         obs.total_points = self.total_points
         obs.turn_count = self.turn_count
-        obs.remaining_deck_size = self.remaining_deck_size
         obs.excluded_cards_count = self.excluded_cards_count
+        obs._known_excluded_cards = self._known_excluded_cards
         return obs
     
+    def to_bytes(self) -> bytes:
+        """
+        コンパクトなバイト列に変換（StateCodec形式）
+        
+        Returns:
+            バイト列
+        """
+        from .state_codec import StateCodec
+        return StateCodec.encode_observable(self)
+    
+    @staticmethod
+    def from_bytes(data: bytes) -> 'ObservableGameState':
+        """
+        to_bytes() で作成したバイト列から復元
+        
+        Args:
+            data: バイト列
+        
+        Returns:
+            ObservableGameState
+        """
+        from .state_codec import StateCodec
+        return StateCodec.decode_observable(data)
+    
     def __repr__(self) -> str:
         return (
             f"ObservableGameState("
@@ -129,5 +220,6 @@ class ObservableGameState:
             f"hand={len(self.hand.get_cards())}, "
             f"played={len(self.played_cards)}, "
             f"deck_remaining={self.remaining_deck_size}, "
+            f"known_excluded={len(self._known_excluded_cards)}, "
             f"points={self.total_points})"
         )
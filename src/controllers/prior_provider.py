@@ -0,0 +1,40 @@
+"""
+事前確率プロバイダ (Prior Provider)
+PUCT選択で使用する各手の事前確率を与える
+"""
+
+from typing import Dict, List, Tuple
+from ..models.card import Card
+from ..models.hand import Hand
+
+
+class PriorProvider:
+    """
+    事前確率プロバイダの基底クラス
+    
+    既定の実装は全ての手に等しい確率を与える（一様分布）。
+    独自の事前確率を使う場合はこのクラスを継承し、
+    get_priors() をオーバーライドする。
+    """
+    
+    def get_priors(
+        self,
+        moves: List[Tuple[Card, int]],
+        hand: Hand,
+        unknown_cards: List[Card]
+    ) -> Dict[Tuple[Card, int], float]:
+        """
+        各手の事前確率を取得
+        
+        Args:
+            moves: 候補の手のリスト
+            hand: 現在の手札
+            unknown_cards: 未知のカード
+        
+        Returns:
+            手 -> 事前確率 のマップ（合計1.0）
+        """
+        if not moves:
+            return {}
+        prior = 1.0 / len(moves)
+        return {move: prior for move in moves}
@@ -0,0 +1,156 @@
+"""
+PUCT選択器
+事前確率付きのUCT（AlphaZero方式）で子ノードを選択する
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.card import Card
+from ..models.hand import Hand
+from .prior_provider import PriorProvider
+from .heuristic_prior_provider import HeuristicPriorProvider
+
+
+class PUCTSelector:
+    """
+    PUCT（Predictor + UCT）による子ノード選択
+    
+    PUCT = Q + c * P * sqrt(N_parent) / (1 + N_child)
+    
+    - Q: 子ノードの平均報酬を、兄弟ノード間の最小値〜最大値で 0〜1 に正規化した値
+    - P: 事前確率（PriorProviderが与える）
+    - 未訪問の手（未試行の手）は Q = fpu_value として扱う
+    
+    UCB1と違い、全ての手を一度ずつ試す必要がなく、
+    事前確率の高い手から優先的に探索される。
+    
+    事前確率はノードの priors 属性にキャッシュされる。
+    IS-MCTSのノードは情報セット単位なので、情報セットごとに1回だけ計算される。
+    """
+    
+    def __init__(
+        self,
+        puct_constant: float = 1.25,
+        prior_provider: Optional[PriorProvider] = None,
+        fpu_value: float = 0.0
+    ):
+        """
+        PUCT選択器の初期化
+        
+        Args:
+            puct_constant: 探索項の係数c
+            prior_provider: 事前確率プロバイダ（Noneの場合はHeuristicPriorProvider）
+            fpu_value: 未訪問の手の正規化済み報酬（First Play Urgency）
+        """
+        self.puct_constant = puct_constant
+        self.prior_provider = prior_provider if prior_provider is not None else HeuristicPriorProvider()
+        self.fpu_value = fpu_value
+    
+    def ensure_priors(
+        self,
+        node,
+        moves: List[Tuple[Card, int]],
+        hand: Hand,
+        unknown_cards: List[Card]
+    ) -> Dict[Tuple[Card, int], float]:
+        """
+        ノードの事前確率を取得（未計算なら計算してキャッシュ）
+        
+        Args:
+            node: MCTSNode または ISMCTSNode
+            moves: ノードの全ての手（子ノードの手 + 未試行の手）
+            hand: 手札
+            unknown_cards: 未知のカード
+        
+        Returns:
+            手 -> 事前確率 のマップ
+        """
+        if node.priors is None:
+            node.priors = self.prior_provider.get_priors(moves, hand, unknown_cards)
+        return node.priors
+    
+    def select(
+        self,
+        parent_visits: int,
+        children: Iterable[Tuple[Tuple[Card, int], object]],
+        untried_moves: List[Tuple[Card, int]],
+        priors: Dict[Tuple[Card, int], float]
+    ) -> Tuple[Optional[Tuple[Card, int]], Optional[object]]:
+        """
+        PUCTスコアが最大の子ノード、または未試行の手を選択
+        
+        Args:
+            parent_visits: 親ノードの訪問回数
+            children: (手, 子ノード) のペア（子ノードは visits, total_reward 属性を持つ）
+            untried_moves: 展開候補の未試行の手
+            priors: 手 -> 事前確率 のマップ
+        
+        Returns:
+            (選択した手, 子ノード)。未試行の手を展開すべき場合は子ノードがNone
+        """
+        children = list(children)
+        sqrt_parent = math.sqrt(max(parent_visits, 1))
+        
+        # 訪問済みの子ノードの平均報酬を正規化するための範囲
+        visited_means = [c.total_reward / c.visits for _, c in children if c.visits > 0]
+        q_min = min(visited_means) if visited_means else 0.0
+        q_max = max(visited_means) if visited_means else 0.0
+        
+        best_move = None
+        best_child = None
+        best_score = -math.inf
+        for move, child in children:
+            if child.visits > 0:
+                q_value = self._normalize(child.total_reward / child.visits, q_min, q_max)
+            else:
+                q_value = self.fpu_value
+            exploration = self.puct_constant * priors.get(move, 0.0) * sqrt_parent / (1 + child.visits)
+            score = q_value + exploration
+            if score > best_score:
+                best_score = score
+                best_move = move
+                best_child = child
+        
+        untried_move = self.best_untried_move(untried_moves, priors)
+        if untried_move is not None:
+            untried_score = self.fpu_value + self.puct_constant * priors.get(untried_move, 0.0) * sqrt_parent
+            if best_child is None or untried_score > best_score:
+                return untried_move, None
+        
+        return best_move, best_child
+    
+    @staticmethod
+    def best_untried_move(
+        untried_moves: List[Tuple[Card, int]],
+        priors: Dict[Tuple[Card, int], float]
+    ) -> Optional[Tuple[Card, int]]:
+        """
+        事前確率が最も高い未試行の手を取得
+        
+        Args:
+            untried_moves: 未試行の手のリスト
+            priors: 手 -> 事前確率 のマップ
+        
+        Returns:
+            最良の未試行の手、無ければNone
+        """
+        if not untried_moves:
+            return None
+        return max(untried_moves, key=lambda move: priors.get(move, 0.0))
+    
+    @staticmethod
+    def _normalize(value: float, q_min: float, q_max: float) -> float:
+        """
+        平均報酬を0〜1に正規化
+        
+        Args:
+            value: 平均報酬
+            q_min: 兄弟ノードの平均報酬の最小値
+            q_max: 兄弟ノードの平均報酬の最大値
+        
+        Returns:
+            正規化した値（範囲が0の場合は0.5）
+        """
+        if q_max <= q_min:
+            return 0.5
+        return (value - q_min) / (q_max - q_min)
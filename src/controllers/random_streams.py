@@ -0,0 +1,95 @@
+"""
+乱数ストリーム (Random Streams)
+1つのシードから、ワーカー・イテレーション・セッションごとの独立した乱数列を派生する
+"""
+
+import random
+from typing import Optional, Tuple
+import numpy as np
+
+
+class RandomStreams:
+    """
+    シード分割による乱数ストリームの生成器（numpy.random.SeedSequence）
+    
+    キー（整数の列）ごとに、互いに独立で決定的な乱数列を派生する。
+    同じシード・同じキーからは常に同じ乱数列が得られ、
+    生成する順序や他のキーの使い方には依存しないため、
+    並列探索でもワーカーへの割り当て順に関係なく結果を再現できる。
+    
+    グローバル乱数（random.seed）を使わないので、同じプロセス内の
+    複数の探索（Streamlitの複数セッションなど）が互いの乱数列を乱すこともない。
+    
+    Usage:
+        streams = RandomStreams(42)
+        # ワーカー3の、10手目の探索用
+        rng = streams.child(3, 10).python_random()
+        engine = ISMCTSEngine(rng=rng)
+        # NumPyの乱数生成器
+        generator = streams.child(3, 10).numpy_generator()
+    """
+    
+    def __init__(self, seed: Optional[int] = None, key: Tuple[int, ...] = ()):
+        """
+        乱数ストリームの初期化
+        
+        Args:
+            seed: 基準のシード（Noneの場合はOSのエントロピーから生成）
+            key: このストリームのキー（child() で派生した位置）
+        """
+        self._sequence = np.random.SeedSequence(seed, spawn_key=key)
+    
+    @property
+    def seed(self) -> int:
+        """基準のシード（Noneで生成した場合は生成されたエントロピー）"""
+        return self._sequence.entropy
+    
+    @property
+    def key(self) -> Tuple[int, ...]:
+        """このストリームのキー"""
+        return tuple(self._sequence.spawn_key)
+    
+    def child(self, *key: int) -> 'RandomStreams':
+        """
+        キーを付け足した子ストリームを派生
+        
+        Args:
+            *key: 付け足すキー（ワーカー番号・イテレーション番号など、0以上の整数）
+        
+        Returns:
+            子ストリーム（同じキーなら何度呼んでも同じ乱数列）
+        """
+        for value in key:
+            if value < 0:
+                raise ValueError(f"キーは0以上の整数である必要があります: {key}")
+        return RandomStreams(self.seed, self.key + tuple(key))
+    
+    def seed_int(self) -> int:
+        """
+        このストリームを表す64ビットの整数シード
+        
+        Returns:
+            random.Random などに渡せる整数（プロセス間で受け渡すジョブ用）
+        """
+        return int(self._sequence.generate_state(1, np.uint64)[0])
+    
+    def python_random(self) -> random.Random:
+        """
+        このストリームの random.Random
+        
+        Returns:
+            新しい乱数生成器（Deck・エンジン・ロールアウト方策の rng に渡す）
+        """
+        return random.Random(self.seed_int())
+    
+    def numpy_generator(self) -> np.random.Generator:
+        """
+        このストリームの numpy.random.Generator
+        
+        Returns:
+            新しい乱数生成器（一括サンプリング用）
+        """
+        return np.random.default_rng(self._sequence)
+    
+    def __repr__(self) -> str:
+        return f"RandomStreams(seed={self.seed}, key={self.key})"
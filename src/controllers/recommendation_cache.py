@@ -0,0 +1,242 @@
+"""
+推奨手キャッシュ
+同じ局面・同じ探索設定の推奨手（手・説明・統計情報）を再利用する
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+from ..models.played_card_log import PlayedCardLog
+from .game_state import GameState
+from .observable_game_state import ObservableGameState
+
+
+class RecommendationCache:
+    """
+    (観測可能な局面, 戦略名, 探索予算, シード) をキーとするLRUキャッシュ
+    
+    WebUIはウィジェットを操作するたびにスクリプトを再実行するため、
+    戦略の切り替え・探索回数スライダーの往復・同じ局面での再分析のたびに
+    同じ探索をやり直していた。推奨手をこのキャッシュに保存しておけば、
+    2回目以降は探索せずに返せる。
+    
+    局面はプレイヤーから観測できる部分（手札・場・出したカード・ポイント・
+    山札の残り枚数・除外枚数）で正規化する。
+    GameState を渡した場合は、完全情報の探索（MCTS）の結果が山札と除外カードに依存するため、
+    山札の順序と除外カードもキーに含める（別のゲームの推奨手を返さないように）。
+    観測可能な状態だけを見る戦略（ヒューリスティック・IS-MCTS）は ObservableGameState を渡す。
+    
+    複数のセッション（スレッド）から共有できるよう、操作はロックで保護する。
+    
+    Usage:
+        cache = RecommendationCache(capacity=1000)
+        recommendation = cache.get_or_compute(
+            obs_state, 'heuristic', lambda: {'move': ..., 'explanation': ..., 'statistics': None}
+        )
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        """
+        推奨手キャッシュの初期化
+        
+        Args:
+            capacity: 保持する推奨手の数の上限
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacityは正の値である必要があります: {capacity}")
+        
+        self.capacity = capacity
+        # キー -> 推奨手（'move', 'explanation', 'statistics'）
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def state_key(state: Union[GameState, ObservableGameState]) -> Tuple:
+        """
+        観測可能な部分だけを使った正規化済みの局面キー
+        
+        手札と出したカード（ビットマスク）は順不同、場のスロットは積んだ順に扱う。
+        GameState と、それから構築した ObservableGameState は同じキーになる
+        （分かっている除外カードを指定した ObservableGameState は別のキー。
+        GameState の除外カードは観測可能な部分として扱わない）。
+        
+        Args:
+            state: ゲーム状態または観測可能なゲーム状態
+        
+        Returns:
+            局面キー
+        """
+        field = state.get_field()
+        if isinstance(state, ObservableGameState):
+            remaining_deck_size = state.remaining_deck_size
+            excluded_cards_count = state.excluded_cards_count
+            known_excluded_mask = PlayedCardLog.mask_of(state.known_excluded_cards)
+        else:
+            deck = state.get_deck()
+            remaining_deck_size = deck.remaining_count()
+            excluded_cards_count = len(deck.get_excluded_cards())
+            known_excluded_mask = 0
+        return (
+            frozenset(state.get_hand().get_cards()),
+            tuple(field.get_all_cards(1)),
+            tuple(field.get_all_cards(2)),
+            state.played_cards.mask,
+            state.total_points,
+            remaining_deck_size,
+            excluded_cards_count,
+            known_excluded_mask
+        )
+    
+    @staticmethod
+    def hidden_key(state: Union[GameState, ObservableGameState]) -> Optional[Tuple]:
+        """
+        観測できない部分（山札の順序・除外カード）のキー
+        
+        Args:
+            state: ゲーム状態または観測可能なゲーム状態
+        
+        Returns:
+            GameState の場合は (山札の順序, 除外カードのビットマスク)、
+            ObservableGameState の場合はNone
+        """
+        if isinstance(state, ObservableGameState):
+            return None
+        deck = state.get_deck()
+        return tuple(deck.get_remaining_cards()), PlayedCardLog.mask_of(deck.get_excluded_cards())
+    
+    @classmethod
+    def make_key(
+        cls,
+        state: Union[GameState, ObservableGameState],
+        strategy: str,
+        budget: Optional[Hashable] = None,
+        seed: Optional[int] = None
+    ) -> Tuple:
+        """
+        キャッシュのキーを作成
+        
+        GameState のキーには観測できない部分（hidden_key）も含めるので、
+        同じ観測の GameState と ObservableGameState は別のキーになる。
+        
+        Args:
+            state: 局面
+            strategy: 戦略名
+            budget: 探索予算（探索回数・制限時間など、Noneの場合は予算なし）
+            seed: 乱数シード（Noneの場合はシード指定なし）
+        
+        Returns:
+            キャッシュのキー
+        """
+        return cls.state_key(state), cls.hidden_key(state), strategy, budget, seed
+    
+    def get(
+        self,
+        state: Union[GameState, ObservableGameState],
+        strategy: str,
+        budget: Optional[Hashable] = None,
+        seed: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        推奨手を取得
+        
+        Args:
+            state: 局面
+            strategy: 戦略名
+            budget: 探索予算
+            seed: 乱数シード
+        
+        Returns:
+            推奨手（'move', 'explanation', 'statistics'）。無ければNone
+        """
+        key = self.make_key(state, strategy, budget, seed)
+        with self._lock:
+            recommendation = self._entries.get(key)
+            if recommendation is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return recommendation
+    
+    def put(
+        self,
+        state: Union[GameState, ObservableGameState],
+        strategy: str,
+        recommendation: Dict[str, Any],
+        budget: Optional[Hashable] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        推奨手を記録（容量を超えた場合は最も長く使われていないものから破棄）
+        
+        Args:
+            state: 局面
+            strategy: 戦略名
+            recommendation: 推奨手（'move', 'explanation', 'statistics'）
+            budget: 探索予算
+            seed: 乱数シード
+        """
+        key = self.make_key(state, strategy, budget, seed)
+        with self._lock:
+            self._entries[key] = recommendation
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+    
+    def get_or_compute(
+        self,
+        state: Union[GameState, ObservableGameState],
+        strategy: str,
+        compute: Callable[[], Dict[str, Any]],
+        budget: Optional[Hashable] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        推奨手を取得し、無ければ計算して記録
+        
+        計算中はロックを保持しないので、同じ局面を同時に計算することはありうる
+        （結果は後から記録した方で上書きされる）。
+        
+        Args:
+            state: 局面
+            strategy: 戦略名
+            compute: 推奨手を計算する関数
+            budget: 探索予算
+            seed: 乱数シード
+        
+        Returns:
+            推奨手（'move', 'explanation', 'statistics'）
+        """
+        recommendation = self.get(state, strategy, budget, seed)
+        if recommendation is None:
+            recommendation = compute()
+            self.put(state, strategy, recommendation, budget, seed)
+        return recommendation
+    
+    def clear(self):
+        """キャッシュを空にする"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def hit_ratio(self) -> float:
+        """
+        キャッシュヒット率
+        
+        Returns:
+            ヒット数 / 参照数（参照が無い場合は0.0）
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        return (
+            f"RecommendationCache(size={len(self)}/{self.capacity}, "
+            f"hit_ratio={self.hit_ratio():.2f})"
+        )
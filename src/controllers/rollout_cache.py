@@ -0,0 +1,178 @@
+"""
+ロールアウトキャッシュ
+完全情報MCTSで、同じ状態からのロールアウト結果を再利用する
+"""
+
+import random
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+from .game_state import GameState
+
+
+class RolloutCache:
+    """
+    (状態, ロールアウト方策, ロールアウト乱数ストリーム) をキーとするLRUキャッシュ
+    
+    完全情報MCTSでは山札の順序が固定されているため、
+    手札・場の一番上・残り山札が同じ状態（手順が違うだけの合流局面）からの
+    ロールアウトは同じ報酬分布に従う。ただしロールアウト方策は合法手のリストから
+    乱数で選ぶので、同じ乱数列でも手札の順序が違えば別の手を選ぶ。そのため手札は
+    順序付きでキーに含め、手札の順序まで一致する合流局面だけで報酬を再利用する。
+    
+    ロールアウトの乱数は num_streams 本のストリームに分ける。ストリームの乱数は
+    (seed, ストリーム番号) だけで決まるので、同じ状態・同じ方策・同じストリームの
+    ロールアウトは常に同じ報酬になり、キャッシュした報酬は再計算した報酬と一致する。
+    エンジンはロールアウトのたびにストリームを方策の乱数で選ぶので、
+    1つの状態の報酬分布は num_streams 個の標本で近似される（再利用の精度と引き換え）。
+    容量を超えた場合は最も長く使われていないキーから破棄する。
+    
+    Usage:
+        cache = RolloutCache(capacity=10000, num_streams=8)
+        engine = MCTSEngine(rollout_cache=cache)
+    """
+    
+    def __init__(self, capacity: int = 10000, num_streams: int = 8, seed: int = 0):
+        """
+        ロールアウトキャッシュの初期化
+        
+        Args:
+            capacity: 保持するキー（状態・方策・ストリームの組）の数の上限
+            num_streams: 1つの状態につき使うロールアウト乱数ストリームの数
+            seed: ロールアウト乱数ストリームのシード
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacityは正の値である必要があります: {capacity}")
+        if num_streams <= 0:
+            raise ValueError(f"num_streamsは正の値である必要があります: {num_streams}")
+        
+        self.capacity = capacity
+        self.num_streams = num_streams
+        self.seed = seed
+        # キー -> 報酬
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def state_key(state: GameState) -> Tuple:
+        """
+        ロールアウト結果を決める部分だけを使った状態キー
+        
+        手札・各スロットの一番上・残り山札が同じなら、以降のゲーム展開と
+        最終的な評価値の分布は同じになる。合法手の順序は手札の順序で決まり、
+        ロールアウトは同じ乱数列でも合法手の順序が違えば別の手を選ぶので、
+        同じストリームで同じ報酬になるよう手札も順序付きでキーにする。
+        ハッシュ値ではなくタプルそのものをキーにするので、衝突で別の状態の報酬を返すことはない。
+        
+        Args:
+            state: ゲーム状態
+        
+        Returns:
+            状態キー
+        """
+        field = state.get_field()
+        return (
+            tuple(state.get_hand().get_cards()),
+            field.get_top_card(1),
+            field.get_top_card(2),
+            tuple(state.get_deck().get_remaining_cards())
+        )
+    
+    def make_key(self, state: GameState, policy: Hashable, stream: int) -> Tuple:
+        """
+        キャッシュのキーを作成
+        
+        Args:
+            state: ロールアウト開始時の状態
+            policy: ロールアウト方策の識別子（方策のクラスなど）
+            stream: ロールアウト乱数ストリームの番号（0 〜 num_streams-1）
+        
+        Returns:
+            (状態キー, 方策, シード, ストリーム番号)
+        """
+        return self.state_key(state), policy, self.seed, stream
+    
+    def stream_rng(self, stream: int) -> random.Random:
+        """
+        ロールアウト乱数ストリームの乱数生成器（同じストリームなら常に同じ乱数列）
+        
+        Args:
+            stream: ロールアウト乱数ストリームの番号（0 〜 num_streams-1）
+        
+        Returns:
+            乱数生成器
+        """
+        if not 0 <= stream < self.num_streams:
+            raise ValueError(f"streamは0以上{self.num_streams}未満である必要があります: {stream}")
+        return random.Random(self.seed * self.num_streams + stream)
+    
+    def get(self, key: Tuple) -> Optional[float]:
+        """
+        記録した報酬を取得
+        
+        Args:
+            key: キャッシュのキー（make_key）
+        
+        Returns:
+            キャッシュされた報酬。無ければNone（ロールアウトが必要）
+        """
+        reward = self._entries.get(key)
+        if reward is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return reward
+    
+    def put(self, key: Tuple, reward: float):
+        """
+        ロールアウト結果を記録
+        
+        Args:
+            key: キャッシュのキー（make_key）
+            reward: ロールアウトの報酬
+        """
+        self._entries[key] = reward
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+    
+    def hit_ratio(self) -> float:
+        """
+        キャッシュヒット率
+        
+        Returns:
+            ヒット数 / 参照数（参照が無い場合は0.0）
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+    
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        キャッシュの統計情報を取得
+        
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            'rollout_cache_hits': self.hits,
+            'rollout_cache_misses': self.misses,
+            'rollout_cache_hit_ratio': self.hit_ratio(),
+            'rollout_cache_size': len(self._entries)
+        }
+    
+    def clear(self):
+        """キャッシュと統計をクリア"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __repr__(self) -> str:
+        return (
+            f"RolloutCache(capacity={self.capacity}, "
+            f"num_streams={self.num_streams}, seed={self.seed}, size={len(self._entries)})"
+        )
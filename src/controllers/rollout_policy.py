@@ -0,0 +1,122 @@
+"""
+ロールアウト方策 (Rollout Policy)
+シミュレーションフェーズで手を選ぶ方策の基底クラス
+"""
+
+import random
+from typing import List, Optional, Tuple
+from ..models.card import Card
+from .game_state import GameState
+from .move_validator import MoveValidator
+from .evaluator import Evaluator
+
+
+class RolloutPolicy:
+    """
+    ロールアウト方策の基底クラス（一様ランダム）
+    
+    ゲーム終了までプレイして報酬を返す rollout() を提供する。
+    独自の方策を作る場合はこのクラスを継承し、以下をオーバーライドする:
+    - begin(): ロールアウト開始時の準備
+    - select_move(): 合法手から1手を選ぶ
+    - on_card_drawn(): 山札からカードを引いた時の差分更新
+    
+    既定の実装は合法手から一様ランダムに選ぶ（従来の random.choice と同じ）。
+    """
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        ロールアウト方策の初期化
+        
+        Args:
+            rng: 乱数生成器（省略時はrandomモジュールのグローバル乱数）
+        """
+        self.rng = rng if rng is not None else random
+    
+    def __getstate__(self) -> dict:
+        """pickle用: グローバル乱数（randomモジュール）は参照として保存しない"""
+        state = self.__dict__.copy()
+        if state['rng'] is random:
+            state['rng'] = None
+        return state
+    
+    def __setstate__(self, state: dict):
+        """pickleからの復元: グローバル乱数を使っていた場合は再び参照する"""
+        self.__dict__.update(state)
+        if self.rng is None:
+            self.rng = random
+    
+    def rollout(self, state: GameState) -> float:
+        """
+        ゲーム終了までプレイして報酬を返す
+        
+        Args:
+            state: シミュレーション開始時の状態（破壊的に変更される）
+        
+        Returns:
+            報酬値（評価スコア）
+        """
+        self.begin(state)
+        
+        while True:
+            valid_moves = MoveValidator.get_valid_moves(
+                state.get_hand(),
+                state.get_field()
+            )
+            
+            if len(valid_moves) == 0:
+                break
+            
+            card, slot = self.select_move(state, valid_moves)
+            
+            hand_size = state.get_hand().count()
+            state.play_card(card, slot)
+            
+            # 手札の枚数が減っていなければ山札から1枚引いている
+            if state.get_hand().count() == hand_size:
+                self.on_card_drawn(state.get_hand().get_cards()[-1])
+        
+        result = {
+            'cards_played': state.get_cards_played_count(),
+            'total_points': state.get_total_points()
+        }
+        
+        return Evaluator.evaluate(result)
+    
+    def begin(self, state: GameState):
+        """
+        ロールアウト開始時の準備
+        
+        Args:
+            state: シミュレーション開始時の状態
+        """
+        pass
+    
+    def select_move(
+        self,
+        state: GameState,
+        valid_moves: List[Tuple[Card, int]]
+    ) -> Tuple[Card, int]:
+        """
+        合法手から1手を選択
+        
+        Args:
+            state: 現在の状態
+            valid_moves: 合法手のリスト（空でない）
+        
+        Returns:
+            選択した手
+        """
+        return self.rng.choice(valid_moves)
+    
+    def on_card_drawn(self, card: Card):
+        """
+        山札からカードを引いた時に呼ばれる
+        
+        Args:
+            card: 引いたカード
+        """
+        pass
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
@@ -0,0 +1,95 @@
+"""
+探索計測 (Search Instrumentation)
+MCTS / IS-MCTS の各フェーズの所要時間や木の形状を集計する
+"""
+
+import time
+from typing import Dict, Any
+
+
+class SearchInstrumentation:
+    """
+    探索1回分の計測値を集計するクラス
+    
+    エンジンに instrument=True を指定した場合のみ使われる。
+    無効時はエンジンがこのクラスを一切呼ばないため、計測のコストはかからない。
+    
+    集計する値:
+    - フェーズごとの累積時間（ns）: select, expand, simulate, backprop, determinize
+    - 平均ロールアウト長（ロールアウト1回で出したカード枚数）
+    - 選択・展開されたノードの深さのヒストグラム
+    - 新しく作成したノード数
+    - 1秒あたりのイテレーション数
+    """
+    
+    PHASES = ('select', 'expand', 'simulate', 'backprop', 'determinize')
+    
+    def __init__(self):
+        """計測値の初期化"""
+        self.reset()
+    
+    def reset(self):
+        """計測値をクリアして計測を開始"""
+        self.phase_ns: Dict[str, int] = {phase: 0 for phase in self.PHASES}
+        self.iterations = 0
+        self.rollouts = 0
+        self.rollout_steps = 0
+        self.depth_histogram: Dict[int, int] = {}
+        self.nodes_allocated = 0
+        self._start_ns = time.perf_counter_ns()
+        self._end_ns = self._start_ns
+    
+    def add_phase(self, phase: str, elapsed_ns: int):
+        """
+        フェーズの所要時間を加算
+        
+        Args:
+            phase: フェーズ名（PHASESのいずれか）
+            elapsed_ns: 所要時間（ns）
+        """
+        self.phase_ns[phase] += elapsed_ns
+    
+    def record_iteration(self, depth: int):
+        """
+        イテレーション1回の完了を記録
+        
+        Args:
+            depth: 選択・展開されたノードの深さ（ルート = 0）
+        """
+        self.iterations += 1
+        self.depth_histogram[depth] = self.depth_histogram.get(depth, 0) + 1
+    
+    def record_rollout(self, steps: int):
+        """
+        ロールアウト1回を記録
+        
+        Args:
+            steps: ロールアウト中に出したカードの枚数
+        """
+        self.rollouts += 1
+        self.rollout_steps += steps
+    
+    def stop(self):
+        """計測を終了（経過時間を確定）"""
+        self._end_ns = time.perf_counter_ns()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        統計情報の辞書に変換
+        
+        Returns:
+            計測値の辞書
+        """
+        elapsed_ns = self._end_ns - self._start_ns
+        return {
+            'iterations': self.iterations,
+            'elapsed_ns': elapsed_ns,
+            'iterations_per_sec': self.iterations / (elapsed_ns / 1e9) if elapsed_ns > 0 else 0.0,
+            'phase_ns': dict(self.phase_ns),
+            'avg_rollout_length': self.rollout_steps / self.rollouts if self.rollouts > 0 else 0.0,
+            'depth_histogram': dict(sorted(self.depth_histogram.items())),
+            'nodes_allocated': self.nodes_allocated
+        }
+    
+    def __repr__(self) -> str:
+        return f"SearchInstrumentation(iterations={self.iterations})"
@@ -0,0 +1,278 @@
+"""
+探索ジョブのスケジューラ (Search Job Scheduler)
+複数のセッションからの探索ジョブを、1つのワーカープールに公平に割り当てる
+"""
+
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future, TimeoutError
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+from ..models.card import Card
+from .game_state import GameState
+from .observable_game_state import ObservableGameState
+from .search_worker_pool import SearchWorkerPool
+
+
+class SearchJobScheduler:
+    """
+    セッションごとの待ち行列を持つ探索ジョブのスケジューラ
+    
+    - 公平性: 待ち行列のあるセッションをラウンドロビンで回し、1ジョブずつプールに投入する
+      （1つのセッションが大量に投入しても、他のセッションのジョブが後回しにならない）
+    - 流量制御: プールに投入済みで未完了のジョブは max_in_flight 個まで
+    - 取り消し: cancel(session_id) でそのセッションの待機中・実行中・未回収のジョブを破棄する
+    - 結果: result(session_id, job_id) で投入したセッションだけが受け取れる
+    
+    スレッドセーフ（Streamlitのセッションごとのスクリプトスレッドから同時に呼ばれる想定）。
+    
+    Usage:
+        scheduler = SearchJobScheduler(SearchWorkerPool({'mcts': MCTSStrategy()}))
+        job_id = scheduler.submit(session_id, 'mcts', state, num_iterations=500)
+        best_move, statistics = scheduler.result(session_id, job_id)
+    """
+    
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    
+    def __init__(self, pool: SearchWorkerPool, max_in_flight: Optional[int] = None):
+        """
+        スケジューラの初期化
+        
+        Args:
+            pool: 探索を実行するワーカープール
+            max_in_flight: 同時にプールへ投入するジョブ数の上限（Noneの場合はワーカー数）
+        """
+        self.pool = pool
+        self.max_in_flight = max_in_flight if max_in_flight is not None else pool.workers
+        if self.max_in_flight <= 0:
+            raise ValueError(f"同時実行数は1以上である必要があります: {self.max_in_flight}")
+        
+        # 完了コールバックはプールの管理スレッドからも、投入直後の同じスレッドからも呼ばれうる
+        self._condition = threading.Condition(threading.RLock())
+        self._job_ids = itertools.count(1)
+        # ジョブID -> ジョブの記録（セッションID・状態・引数・結果・例外）
+        self._jobs: Dict[int, Dict[str, Any]] = {}
+        # セッションID -> 待機中のジョブIDの列
+        self._queues: Dict[str, Deque[int]] = {}
+        # 待機中のジョブがあるセッションの巡回順
+        self._ready: Deque[str] = deque()
+        self._in_flight = 0
+        self._closed = False
+    
+    def submit(
+        self,
+        session_id: str,
+        strategy_name: str,
+        state: Union[GameState, ObservableGameState],
+        seed: Optional[int] = None,
+        num_iterations: Optional[int] = None
+    ) -> int:
+        """
+        探索ジョブを待ち行列に追加
+        
+        Args:
+            session_id: 投入するセッションのID
+            strategy_name: プールに登録した戦略名
+            state: 探索の入力状態（投入時にバイト列に変換するので、後で変更してもよい）
+            seed: ワーカーで探索前に設定する乱数シード
+            num_iterations: このジョブだけの探索回数
+        
+        Returns:
+            ジョブID
+        """
+        if strategy_name not in self.pool.strategy_names:
+            raise ValueError(f"未登録の戦略です: {strategy_name}")
+        job = SearchWorkerPool.encode_job(strategy_name, state, seed, num_iterations)
+        
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("スケジューラは終了しています")
+            job_id = next(self._job_ids)
+            self._jobs[job_id] = {
+                'session_id': session_id,
+                'status': self.QUEUED,
+                'job': job,
+                'future': None,
+                'result': None,
+                'error': None
+            }
+            if session_id not in self._queues:
+                self._queues[session_id] = deque()
+                self._ready.append(session_id)
+            self._queues[session_id].append(job_id)
+            self._dispatch()
+        return job_id
+    
+    def result(
+        self,
+        session_id: str,
+        job_id: int,
+        timeout: Optional[float] = None
+    ) -> Tuple[Optional[Tuple[Card, int]], Optional[Dict[str, Any]]]:
+        """
+        ジョブの完了を待って結果を受け取る（受け取ったジョブは破棄される）
+        
+        Args:
+            session_id: 投入したセッションのID
+            job_id: submit() が返したジョブID
+            timeout: 最大待ち時間（秒、Noneの場合は無制限）
+        
+        Returns:
+            (最良の手, 戦略の統計情報)
+        
+        Raises:
+            KeyError: 他のセッションのジョブ、または未知・回収済み・取り消し済みのジョブ
+            CancelledError: 待っている間にジョブが取り消された
+            TimeoutError: 待ち時間を超えた
+        """
+        with self._condition:
+            self._get_job(session_id, job_id)
+            
+            def finished():
+                job = self._jobs.get(job_id)
+                return job is None or job['status'] == self.DONE
+            
+            if not self._condition.wait_for(finished, timeout):
+                raise TimeoutError(f"ジョブ {job_id} が時間内に完了しませんでした")
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                raise CancelledError(f"ジョブ {job_id} は取り消されました")
+            if job['error'] is not None:
+                raise job['error']
+            return job['result']
+    
+    def poll(self, session_id: str) -> List[int]:
+        """
+        セッションの完了済み（未回収）のジョブIDを取得
+        
+        Args:
+            session_id: セッションのID
+        
+        Returns:
+            完了済みのジョブIDのリスト（投入順）
+        """
+        with self._condition:
+            return [
+                job_id for job_id, job in self._jobs.items()
+                if job['session_id'] == session_id and job['status'] == self.DONE
+            ]
+    
+    def cancel(self, session_id: str) -> int:
+        """
+        セッションの待機中・実行中・未回収のジョブをすべて破棄
+        
+        実行中のジョブはワーカーでは最後まで実行されるが、結果は捨てられる。
+        
+        Args:
+            session_id: セッションのID
+        
+        Returns:
+            破棄した待機中・実行中のジョブ数
+        """
+        with self._condition:
+            cancelled = 0
+            for job_id in [
+                job_id for job_id, job in self._jobs.items()
+                if job['session_id'] == session_id
+            ]:
+                job = self._jobs.pop(job_id)
+                if job['status'] == self.RUNNING:
+                    job['future'].cancel()
+                if job['status'] != self.DONE:
+                    cancelled += 1
+            
+            if session_id in self._queues:
+                del self._queues[session_id]
+                self._ready.remove(session_id)
+            self._condition.notify_all()
+            return cancelled
+    
+    def pending_count(self, session_id: Optional[str] = None) -> int:
+        """
+        待機中・実行中のジョブ数
+        
+        Args:
+            session_id: セッションのID（Noneの場合は全セッション）
+        
+        Returns:
+            ジョブ数
+        """
+        with self._condition:
+            return sum(
+                1 for job in self._jobs.values()
+                if job['status'] != self.DONE
+                and (session_id is None or job['session_id'] == session_id)
+            )
+    
+    def close(self):
+        """すべてのジョブを破棄し、ワーカープールを終了"""
+        with self._condition:
+            self._closed = True
+            self._jobs.clear()
+            self._queues.clear()
+            self._ready.clear()
+            self._condition.notify_all()
+        self.pool.close()
+    
+    def _get_job(self, session_id: str, job_id: int) -> Dict[str, Any]:
+        """セッションのジョブの記録を取得（他のセッションのジョブはKeyError）"""
+        job = self._jobs.get(job_id)
+        if job is None or job['session_id'] != session_id:
+            raise KeyError(f"セッションのジョブではありません: {job_id}")
+        return job
+    
+    def _dispatch(self):
+        """同時実行数に空きがある限り、セッションを巡回して1ジョブずつプールに投入"""
+        while self._in_flight < self.max_in_flight and self._ready:
+            session_id = self._ready.popleft()
+            queue = self._queues[session_id]
+            job_id = queue.popleft()
+            if queue:
+                self._ready.append(session_id)
+            else:
+                del self._queues[session_id]
+            
+            job = self._jobs[job_id]
+            job['status'] = self.RUNNING
+            self._in_flight += 1
+            try:
+                future = self.pool.submit_job(job['job'])
+            except Exception as error:
+                self._in_flight -= 1
+                self._finish(job, None, error)
+                continue
+            job['future'] = future
+            future.add_done_callback(
+                lambda future, job_id=job_id: self._on_done(job_id, future)
+            )
+    
+    def _on_done(self, job_id: int, future: Future):
+        """プールのジョブ完了時のコールバック"""
+        with self._condition:
+            self._in_flight -= 1
+            job = self._jobs.get(job_id)
+            if job is not None:
+                if future.cancelled():
+                    self._finish(job, None, CancelledError(f"ジョブ {job_id} は取り消されました"))
+                elif future.exception() is not None:
+                    self._finish(job, None, future.exception())
+                else:
+                    self._finish(job, future.result(), None)
+            if not self._closed:
+                self._dispatch()
+    
+    def _finish(self, job: Dict[str, Any], result: Any, error: Optional[BaseException]):
+        """ジョブを完了にして待っているスレッドに通知"""
+        job['status'] = self.DONE
+        job['result'] = result
+        job['error'] = error
+        job['job'] = None
+        self._condition.notify_all()
+    
+    def __repr__(self) -> str:
+        return (
+            f"SearchJobScheduler(max_in_flight={self.max_in_flight}, "
+            f"pending={self.pending_count()})"
+        )
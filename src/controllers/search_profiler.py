@@ -0,0 +1,150 @@
+"""
+探索プロファイラ (Search Profiler)
+1回分の探索をプロファイルし、入力状態のスナップショットと一緒に保存する
+"""
+
+import cProfile
+import os
+import pickle
+import random
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+class SearchProfiler:
+    """
+    1手分の探索（get_best_move）をプロファイルするクラス
+    
+    プロファイル結果と一緒に、入力状態・戦略（設定とキャッシュを含む）・
+    グローバル乱数の状態をスナップショットとして保存する。
+    スナップショットを replay() に渡すと、同じ探索をオフラインで再実行できる。
+    
+    出力ファイル（<prefix> = <output_dir>/<label>_<日時>_<PID>_<連番>）:
+    - <prefix>.prof: cProfileの結果（pstats / snakeviz などで閲覧）
+    - <prefix>.pyinstrument.html: pyinstrumentの結果（use_pyinstrument=True の場合、.profの代わり）
+    - <prefix>.snapshot.pkl: 再実行用のスナップショット
+    """
+    
+    SNAPSHOT_VERSION = 1
+    
+    def __init__(self, output_dir: str = 'profiles', use_pyinstrument: bool = False):
+        """
+        プロファイラの初期化
+        
+        Args:
+            output_dir: 出力先ディレクトリ（存在しない場合は作成）
+            use_pyinstrument: cProfileの代わりにpyinstrumentを使うか（要インストール）
+        """
+        self.output_dir = output_dir
+        self.use_pyinstrument = use_pyinstrument
+        self._count = 0
+    
+    def profile(
+        self,
+        label: str,
+        strategy: Any,
+        state: Any,
+        search: Callable[[], Any]
+    ) -> Tuple[Any, str]:
+        """
+        探索をプロファイルして結果を保存
+        
+        スナップショットは探索の前に作成するため、探索中に変化する
+        戦略のキャッシュや乱数の状態も探索開始時点のものが保存される。
+        
+        Args:
+            label: 出力ファイル名の先頭（例: 'mcts'）
+            strategy: 探索を行う戦略（スナップショットに保存）
+            state: 探索の入力状態（GameState または ObservableGameState）
+            search: 探索を実行する関数（引数なし）
+        
+        Returns:
+            (searchの戻り値, 出力ファイルの共通プレフィックス)
+        """
+        snapshot = pickle.dumps({
+            'version': self.SNAPSHOT_VERSION,
+            'label': label,
+            'strategy': strategy,
+            'state': state,
+            'random_state': random.getstate()
+        })
+        
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{label}_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}")
+        # 同じ秒に保存した別のプロファイルを上書きしないよう連番を進める
+        while True:
+            self._count += 1
+            prefix = f"{base}_{self._count}"
+            if not os.path.exists(prefix + '.snapshot.pkl'):
+                break
+        
+        if self.use_pyinstrument:
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise ImportError(
+                    "pyinstrumentがインストールされていません（pip install pyinstrument）"
+                )
+            profiler = Profiler()
+            profiler.start()
+            try:
+                result = search()
+            finally:
+                profiler.stop()
+            with open(prefix + '.pyinstrument.html', 'w', encoding='utf-8') as f:
+                f.write(profiler.output_html())
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                result = search()
+            finally:
+                profiler.disable()
+            profiler.dump_stats(prefix + '.prof')
+        
+        with open(prefix + '.snapshot.pkl', 'wb') as f:
+            f.write(snapshot)
+        
+        return result, prefix
+    
+    @classmethod
+    def load_snapshot(cls, path: str) -> Dict[str, Any]:
+        """
+        スナップショットを読み込む
+        
+        Args:
+            path: スナップショットのパス（*.snapshot.pkl）
+        
+        Returns:
+            'label', 'strategy', 'state', 'random_state' を含む辞書
+        """
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+        if snapshot.get('version') != cls.SNAPSHOT_VERSION:
+            raise ValueError(
+                f"スナップショットのバージョンが一致しません: {snapshot.get('version')}"
+            )
+        return snapshot
+    
+    def replay(self, path: str) -> Tuple[Any, str]:
+        """
+        スナップショットから探索を再実行してプロファイル
+        
+        乱数の状態を保存時点に戻すため、保存時と同じ探索が再現される。
+        
+        Args:
+            path: スナップショットのパス（*.snapshot.pkl）
+        
+        Returns:
+            (最良の手, 出力ファイルの共通プレフィックス)
+        """
+        snapshot = self.load_snapshot(path)
+        strategy = snapshot['strategy']
+        state = snapshot['state']
+        random.setstate(snapshot['random_state'])
+        return self.profile(
+            snapshot['label'],
+            strategy,
+            state,
+            lambda: strategy.get_best_move(state)
+        )
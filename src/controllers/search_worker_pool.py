@@ -0,0 +1,274 @@
+"""
+探索ワーカープール (Search Worker Pool)
+戦略を親プロセスで1回だけ構築し、ワーカーには状態のバイト列だけを送る
+"""
+
+import copy
+import itertools
+import multiprocessing
+import os
+import pickle
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from ..models.card import Card
+from .game_state import GameState
+from .observable_game_state import ObservableGameState
+from .state_codec import StateCodec
+
+
+# プールID -> 戦略の辞書（fork時はワーカーがこの辞書を親からそのまま引き継ぐ）
+_BOOTSTRAP: Dict[int, Dict[str, Any]] = {}
+
+# ワーカープロセス内の戦略（_initialize_worker で設定）
+_worker_strategies: Dict[str, Any] = {}
+
+_pool_ids = itertools.count(1)
+
+
+def _initialize_worker(pool_id: int, payload: Optional[bytes]):
+    """
+    ワーカープロセスの初期化（プロセスごとに1回）
+    
+    Args:
+        pool_id: プールID（fork時に引き継いだ戦略の検索に使う）
+        payload: pickleした戦略の辞書（fork以外の起動方式の場合のみ）
+    """
+    global _worker_strategies
+    if payload is None:
+        _worker_strategies = _BOOTSTRAP[pool_id]
+    else:
+        _worker_strategies = pickle.loads(payload)
+
+
+def _run_job(
+    job: Tuple[str, bytes, Optional[int], Optional[int]]
+) -> Tuple[Optional[Tuple[Card, int]], Optional[Dict[str, Any]]]:
+    """
+    ワーカープロセスで1手分の探索を実行
+    
+    Args:
+        job: (戦略名, 状態のバイト列, 乱数シード, 探索回数)
+    
+    Returns:
+        (最良の手, 戦略の統計情報 last_statistics)
+    """
+    strategy_name, state_bytes, seed, num_iterations = job
+    strategy = _worker_strategies[strategy_name]
+    if num_iterations is not None:
+        # 共有している戦略は書き換えず、探索回数だけ変えた浅いコピーで探索
+        strategy = copy.copy(strategy)
+        strategy.num_iterations = num_iterations
+    state = StateCodec.decode(state_bytes)
+    if seed is None:
+        best_move = strategy.get_best_move(state)
+        return best_move, getattr(strategy, 'last_statistics', None)
+    
+    set_rng = getattr(strategy, 'set_rng', None)
+    if set_rng is not None:
+        # このジョブ専用の乱数列（グローバル乱数は使わない）。
+        # エンジンは共有しているので、ジョブの後で元の乱数に戻す
+        # （シード無しの後続のジョブがこのジョブの乱数列を使い続けないように）
+        previous_rng = strategy.engine.rng
+        set_rng(random.Random(seed))
+        try:
+            best_move = strategy.get_best_move(state)
+        finally:
+            set_rng(previous_rng)
+    else:
+        previous_state = random.getstate()
+        random.seed(seed)
+        try:
+            best_move = strategy.get_best_move(state)
+        finally:
+            random.setstate(previous_state)
+    return best_move, getattr(strategy, 'last_statistics', None)
+
+
+def _ping(delay: float) -> int:
+    """
+    ワーカーの起動確認用の空ジョブ
+    
+    Args:
+        delay: 待ち時間（秒）。全ワーカーに1つずつ行き渡るよう少し待つ
+    
+    Returns:
+        ワーカーのプロセスID
+    """
+    time.sleep(delay)
+    return os.getpid()
+
+
+class SearchWorkerPool:
+    """
+    探索用のプロセスプール
+    
+    戦略（事前確率・ロールアウト方策・ロールアウトキャッシュなどの読み取り専用の表を含む）は
+    親プロセスで1回だけ構築し、ワーカーの起動時に1回だけ共有する:
+    - fork: ワーカーが親のメモリをそのまま引き継ぐ（コピーオンライト、転送なし）
+    - spawn / forkserver: 初期化関数に1回だけpickleして渡す
+    
+    ジョブは StateCodec のバイト列（約100バイト）と戦略名・シード・探索回数だけなので、
+    GameStateのオブジェクトグラフをジョブごとにpickleするより軽い。
+    
+    Usage:
+        with SearchWorkerPool({'ismcts': ISMCTSStrategy(num_iterations=500)}, workers=4) as pool:
+            moves = pool.map('ismcts', observable_states)
+    """
+    
+    def __init__(
+        self,
+        strategies: Dict[str, Any],
+        workers: Optional[int] = None,
+        start_method: Optional[str] = None
+    ):
+        """
+        ワーカープールの初期化
+        
+        Args:
+            strategies: 戦略名 -> get_best_move(state) を持つ戦略
+            workers: ワーカープロセス数（Noneの場合はCPU数）
+            start_method: 起動方式（'fork', 'spawn', 'forkserver'、Noneの場合はOSの既定）
+        """
+        if not strategies:
+            raise ValueError("戦略を1つ以上指定する必要があります")
+        
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers <= 0:
+            raise ValueError(f"ワーカー数は1以上である必要があります: {self.workers}")
+        
+        context = multiprocessing.get_context(start_method)
+        self.start_method = context.get_start_method()
+        self.strategy_names = list(strategies)
+        self._pool_id = next(_pool_ids)
+        
+        if self.start_method == 'fork':
+            # ワーカーは起動時に親のメモリを引き継ぐので、転送するものはない
+            _BOOTSTRAP[self._pool_id] = strategies
+            payload = None
+        else:
+            payload = pickle.dumps(strategies)
+        
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(self._pool_id, payload)
+        )
+    
+    @staticmethod
+    def encode_job(
+        strategy_name: str,
+        state: Union[GameState, ObservableGameState],
+        seed: Optional[int] = None,
+        num_iterations: Optional[int] = None
+    ) -> Tuple[str, bytes, Optional[int], Optional[int]]:
+        """
+        ジョブを作成（状態はStateCodecのバイト列に変換）
+        
+        Args:
+            strategy_name: 戦略名
+            state: 探索の入力状態
+            seed: ワーカーで探索前に設定する乱数シード（戦略の set_rng() に random.Random(seed) を渡す。
+                  Noneの場合は設定しない）
+            num_iterations: このジョブだけの探索回数（Noneの場合は戦略の設定どおり）
+        
+        Returns:
+            (戦略名, 状態のバイト列, 乱数シード, 探索回数)
+        """
+        return strategy_name, state.to_bytes(), seed, num_iterations
+    
+    def submit(
+        self,
+        strategy_name: str,
+        state: Union[GameState, ObservableGameState],
+        seed: Optional[int] = None,
+        num_iterations: Optional[int] = None
+    ) -> Future:
+        """
+        1手分の探索をワーカーに投入
+        
+        Args:
+            strategy_name: 戦略名
+            state: 探索の入力状態
+            seed: ワーカーで探索前に設定する乱数シード
+            num_iterations: このジョブだけの探索回数（Noneの場合は戦略の設定どおり）
+        
+        Returns:
+            (最良の手, 戦略の統計情報) を返すFuture
+        """
+        if strategy_name not in self.strategy_names:
+            raise ValueError(f"未登録の戦略です: {strategy_name}")
+        return self.submit_job(self.encode_job(strategy_name, state, seed, num_iterations))
+    
+    def submit_job(self, job: Tuple[str, bytes, Optional[int], Optional[int]]) -> Future:
+        """
+        encode_job() で作成済みのジョブをワーカーに投入
+        
+        Args:
+            job: (戦略名, 状態のバイト列, 乱数シード, 探索回数)
+        
+        Returns:
+            (最良の手, 戦略の統計情報) を返すFuture
+        """
+        return self._executor.submit(_run_job, job)
+    
+    def map(
+        self,
+        strategy_name: str,
+        states: Sequence[Union[GameState, ObservableGameState]],
+        seeds: Optional[Sequence[Optional[int]]] = None
+    ) -> List[Optional[Tuple[Card, int]]]:
+        """
+        複数の状態を並列に探索
+        
+        Args:
+            strategy_name: 戦略名
+            states: 探索の入力状態のリスト
+            seeds: 状態ごとの乱数シード（Noneの場合は設定しない）
+        
+        Returns:
+            状態と同じ順序の最良の手のリスト
+        """
+        if seeds is None:
+            seeds = [None] * len(states)
+        futures = [
+            self.submit(strategy_name, state, seed)
+            for state, seed in zip(states, seeds)
+        ]
+        return [future.result()[0] for future in futures]
+    
+    def warm_up(self, delay: float = 0.05) -> float:
+        """
+        全ワーカーを起動して初期化を済ませる
+        
+        Args:
+            delay: 空ジョブ1つあたりの待ち時間（秒）
+        
+        Returns:
+            所要時間（秒、待ち時間を含む）
+        """
+        start = time.perf_counter()
+        futures = [self._executor.submit(_ping, delay) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - start
+    
+    def close(self):
+        """ワーカーを終了"""
+        self._executor.shutdown(wait=True)
+        _BOOTSTRAP.pop(self._pool_id, None)
+    
+    def __enter__(self) -> 'SearchWorkerPool':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __repr__(self) -> str:
+        return (
+            f"SearchWorkerPool(workers={self.workers}, "
+            f"start_method={self.start_method}, "
+            f"strategies={self.strategy_names})"
+        )
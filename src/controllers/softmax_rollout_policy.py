@@ -0,0 +1,92 @@
+"""
+柔軟性ソフトマックスロールアウト方策
+"""
+
+import math
+import random
+from typing import List, Optional, Tuple
+from ..models.card import Card
+from .game_state import GameState
+from .rollout_policy import RolloutPolicy
+from .unknown_card_counter import UnknownCardCounter
+
+
+class SoftmaxRolloutPolicy(RolloutPolicy):
+    """
+    柔軟性のソフトマックスによるロールアウト
+    
+    P(カード) ∝ exp(-カードの柔軟性 / temperature)
+    
+    柔軟性が低いカードほど出されやすいが、ε-greedyより滑らかに
+    ヒューリスティックから外れた手も試される。
+    出すスロットはヒューリスティック戦略と同じく先に列挙されたスロットを選ぶ。
+    """
+    
+    def __init__(self, temperature: float = 1.0, rng: Optional[random.Random] = None):
+        """
+        ソフトマックスロールアウト方策の初期化
+        
+        Args:
+            temperature: ソフトマックスの温度（小さいほど貪欲）
+            rng: 乱数生成器（省略時はrandomモジュールのグローバル乱数）
+        """
+        if temperature <= 0:
+            raise ValueError(f"temperatureは正の値である必要があります: {temperature}")
+        super().__init__(rng)
+        self.temperature = temperature
+        self.counter = UnknownCardCounter()
+    
+    def begin(self, state: GameState):
+        """未知カードのカウンタを初期化"""
+        self.counter = UnknownCardCounter(state.get_unknown_cards())
+    
+    def select_move(
+        self,
+        state: GameState,
+        valid_moves: List[Tuple[Card, int]]
+    ) -> Tuple[Card, int]:
+        """
+        柔軟性のソフトマックスで1手を選択
+        
+        Args:
+            state: 現在の状態
+            valid_moves: 合法手のリスト（空でない）
+        
+        Returns:
+            選択した手
+        """
+        # カードごとに最初に列挙された手を候補とする
+        # （get_valid_moves は同じカードの手を連続して列挙する）
+        suit_counts = self.counter.suit_counts
+        value_counts = self.counter.value_counts
+        moves = []
+        flexibilities = []
+        previous_card = None
+        for move in valid_moves:
+            card = move[0]
+            if card is previous_card:
+                continue
+            previous_card = card
+            moves.append(move)
+            flexibilities.append(suit_counts[card.suit] + value_counts[card.value])
+        
+        min_flexibility = min(flexibilities)
+        weights = [
+            math.exp((min_flexibility - flexibility) / self.temperature)
+            for flexibility in flexibilities
+        ]
+        
+        threshold = self.rng.random() * sum(weights)
+        cumulative = 0.0
+        for move, weight in zip(moves, weights):
+            cumulative += weight
+            if threshold < cumulative:
+                return move
+        return moves[-1]
+    
+    def on_card_drawn(self, card: Card):
+        """引いたカードを未知カードから取り除く"""
+        self.counter.remove(card)
+    
+    def __repr__(self) -> str:
+        return f"SoftmaxRolloutPolicy(temperature={self.temperature})"
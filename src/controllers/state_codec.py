@@ -0,0 +1,326 @@
+"""
+状態のバイナリコーデック (State Codec)
+GameState / ObservableGameState を約100バイトのバイト列に変換する
+"""
+
+import struct
+from typing import List, Optional, Tuple, Union
+from ..models.card import Card
+from ..models.deck import Deck
+from ..models.field import Field
+from ..models.hand import Hand
+from ..models.suit import Suit
+from .game_state import GameState
+from .observable_game_state import ObservableGameState
+
+
+class StateCodec:
+    """
+    ゲーム状態をコンパクトなバイト列に変換するクラス
+    
+    カードは 0〜79 の1バイト（スート番号 × 10 + 数値 - 1）で表す。
+    プロセス間の受け渡し・キャッシュのキー・セッションの保存など、
+    deepcopy や pickle（オブジェクトグラフ）より軽く状態を運ぶために使う。
+    
+    フォーマット（バージョン2。バージョン1に、ObservableGameStateの分かっている除外カードを追加）:
+    - ヘッダ: バージョン（1バイト）、種別（1バイト、0=GameState / 1=ObservableGameState）
+    - カード列: 枚数（1バイト）+ カード（1枚1バイト）
+      - GameState: 山札（順序付き）、除外カード、手札、スロット1、スロット2
+      - ObservableGameState: 手札、スロット1、スロット2
+    - 出したカードの履歴: モード（1バイト）+ 枚数（1バイト）+ 本体
+      - モード0: 場のスロットから復元できる場合、各手のスロット番号を1ビットずつ
+      - モード1: それ以外の場合、カード列そのもの
+    - 数値: ポイント・ターン数（各2バイト）
+      - ObservableGameStateはさらに山札の残り枚数・除外枚数（各1バイト）
+        と、分かっている除外カード（カード列、番号順。空の場合は省略）
+        山札の残り枚数は手札・出したカードから導出できるので、復元時には使わない
+    """
+    
+    VERSION = 2
+    
+    KIND_GAME_STATE = 0
+    KIND_OBSERVABLE = 1
+    
+    _PLAYED_SLOT_BITS = 0
+    _PLAYED_CARDS = 1
+    
+    _SUITS = list(Suit)
+    _CARDS = [Card(suit, value) for suit in _SUITS for value in range(1, 11)]
+    _CARD_INDEX = {card: index for index, card in enumerate(_CARDS)}
+    
+    @classmethod
+    def encode_game_state(cls, state: GameState) -> bytes:
+        """
+        GameStateをバイト列に変換
+        
+        Args:
+            state: ゲーム状態
+        
+        Returns:
+            バイト列
+        """
+        field = state.get_field()
+        slot1 = field.get_all_cards(1)
+        slot2 = field.get_all_cards(2)
+        data = bytearray((cls.VERSION, cls.KIND_GAME_STATE))
+        cls._write_cards(data, state.deck._cards)
+        cls._write_cards(data, state.deck._excluded_cards)
+        cls._write_cards(data, state.hand._cards)
+        cls._write_cards(data, slot1)
+        cls._write_cards(data, slot2)
+        cls._write_played(data, state.played_cards, slot1, slot2)
+        data += struct.pack('<HH', state.total_points, state.turn_count)
+        return bytes(data)
+    
+    @classmethod
+    def decode_game_state(cls, data: bytes) -> GameState:
+        """
+        バイト列からGameStateを復元
+        
+        Args:
+            data: encode_game_state() で作成したバイト列
+        
+        Returns:
+            ゲーム状態
+        """
+        offset = cls._read_header(data, cls.KIND_GAME_STATE)
+        try:
+            deck_cards, offset = cls._read_cards(data, offset)
+            excluded_cards, offset = cls._read_cards(data, offset)
+            hand_cards, offset = cls._read_cards(data, offset)
+            slot1, offset = cls._read_cards(data, offset)
+            slot2, offset = cls._read_cards(data, offset)
+            played_cards, offset = cls._read_played(data, offset, slot1, slot2)
+            total_points, turn_count = struct.unpack_from('<HH', data, offset)
+        except (IndexError, struct.error):
+            raise ValueError("状態のバイト列が途中で途切れています")
+        
+        state = GameState.__new__(GameState)
+        # 山札のシャッフルで乱数を消費しないよう、順序を指定して構築
+        state.deck = Deck.from_order(deck_cards, excluded_cards)
+        state.hand = cls._build_hand(hand_cards)
+        state.field = cls._build_field(slot1, slot2)
+        state.total_points = total_points
+        state.turn_count = turn_count
+        state.played_cards = played_cards
+        return state
+    
+    @classmethod
+    def encode_observable(cls, obs_state: ObservableGameState) -> bytes:
+        """
+        ObservableGameStateをバイト列に変換
+        
+        Args:
+            obs_state: 観測可能なゲーム状態
+        
+        Returns:
+            バイト列
+        """
+        field = obs_state.get_field()
+        slot1 = field.get_all_cards(1)
+        slot2 = field.get_all_cards(2)
+        data = bytearray((cls.VERSION, cls.KIND_OBSERVABLE))
+        cls._write_cards(data, obs_state.hand._cards)
+        cls._write_cards(data, slot1)
+        cls._write_cards(data, slot2)
+        cls._write_played(data, obs_state.played_cards, slot1, slot2)
+        data += struct.pack(
+            '<HHBB',
+            obs_state.total_points,
+            obs_state.turn_count,
+            obs_state.remaining_deck_size,
+            obs_state.excluded_cards_count
+        )
+        if obs_state.known_excluded_cards:
+            # 同じ状態が同じバイト列になるよう、カード番号順に並べる
+            card_index = cls._CARD_INDEX
+            cls._write_cards(data, sorted(obs_state.known_excluded_cards, key=card_index.__getitem__))
+        return bytes(data)
+    
+    @classmethod
+    def decode_observable(cls, data: bytes) -> ObservableGameState:
+        """
+        バイト列からObservableGameStateを復元
+        
+        Args:
+            data: encode_observable() で作成したバイト列
+        
+        Returns:
+            観測可能なゲーム状態
+        """
+        offset = cls._read_header(data, cls.KIND_OBSERVABLE)
+        try:
+            hand_cards, offset = cls._read_cards(data, offset)
+            slot1, offset = cls._read_cards(data, offset)
+            slot2, offset = cls._read_cards(data, offset)
+            played_cards, offset = cls._read_played(data, offset, slot1, slot2)
+            total_points, turn_count, _, excluded_cards_count = (
+                struct.unpack_from('<HHBB', data, offset)
+            )
+            offset += struct.calcsize('<HHBB')
+            known_excluded_cards: List[Card] = []
+            if offset < len(data):
+                known_excluded_cards, offset = cls._read_cards(data, offset)
+        except (IndexError, struct.error):
+            raise ValueError("状態のバイト列が途中で途切れています")
+        
+        obs = ObservableGameState()
+        obs.hand = cls._build_hand(hand_cards)
+        obs.field = cls._build_field(slot1, slot2)
+        obs.played_cards = played_cards
+        obs.total_points = total_points
+        obs.turn_count = turn_count
+        obs.excluded_cards_count = excluded_cards_count
+        obs.known_excluded_cards = known_excluded_cards
+        return obs
+    
+    @classmethod
+    def decode(cls, data: bytes) -> Union[GameState, ObservableGameState]:
+        """
+        ヘッダの種別を見て GameState / ObservableGameState を復元
+        
+        Args:
+            data: encode_game_state() / encode_observable() で作成したバイト列
+        
+        Returns:
+            ゲーム状態または観測可能なゲーム状態
+        """
+        if len(data) >= 2 and data[1] == cls.KIND_OBSERVABLE:
+            return cls.decode_observable(data)
+        return cls.decode_game_state(data)
+    
+    @classmethod
+    def _read_header(cls, data: bytes, kind: int) -> int:
+        """
+        ヘッダを検証
+        
+        Args:
+            data: バイト列
+            kind: 期待する種別
+        
+        Returns:
+            本体の開始位置
+        """
+        if len(data) < 2:
+            raise ValueError("状態のバイト列が短すぎます")
+        if data[0] != cls.VERSION:
+            raise ValueError(f"未対応のバージョンです: {data[0]}")
+        if data[1] != kind:
+            raise ValueError(f"状態の種別が一致しません: {data[1]}（期待値: {kind}）")
+        return 2
+    
+    @classmethod
+    def _write_cards(cls, data: bytearray, cards: List[Card]):
+        """カード列を書き込む（枚数 + 1枚1バイト）"""
+        card_index = cls._CARD_INDEX
+        data.append(len(cards))
+        data += bytes(card_index[card] for card in cards)
+    
+    @classmethod
+    def _read_cards(cls, data: bytes, offset: int) -> Tuple[List[Card], int]:
+        """カード列を読み込む"""
+        count = data[offset]
+        end = offset + 1 + count
+        if end > len(data):
+            raise IndexError(end)
+        all_cards = cls._CARDS
+        try:
+            return [all_cards[index] for index in data[offset + 1:end]], end
+        except IndexError:
+            raise ValueError("無効なカード番号が含まれています")
+    
+    @classmethod
+    def _write_played(
+        cls,
+        data: bytearray,
+        played_cards: List[Card],
+        slot1: List[Card],
+        slot2: List[Card]
+    ):
+        """
+        出したカードの履歴を書き込む
+        
+        履歴が2つのスロットを出した順に並べたものと一致すれば、
+        各手のスロット番号（1ビット）だけを書き込む。
+        """
+        slot_bits = cls._played_slot_bits(played_cards, slot1, slot2)
+        if slot_bits is None:
+            data.append(cls._PLAYED_CARDS)
+            cls._write_cards(data, played_cards)
+            return
+        data.append(cls._PLAYED_SLOT_BITS)
+        data.append(len(played_cards))
+        data += slot_bits.to_bytes((len(played_cards) + 7) // 8, 'little')
+    
+    @classmethod
+    def _read_played(
+        cls,
+        data: bytes,
+        offset: int,
+        slot1: List[Card],
+        slot2: List[Card]
+    ) -> Tuple[List[Card], int]:
+        """出したカードの履歴を読み込む"""
+        mode = data[offset]
+        if mode == cls._PLAYED_CARDS:
+            return cls._read_cards(data, offset + 1)
+        if mode != cls._PLAYED_SLOT_BITS:
+            raise ValueError(f"未対応の履歴モードです: {mode}")
+        
+        count = data[offset + 1]
+        end = offset + 2 + (count + 7) // 8
+        if end > len(data):
+            raise IndexError(end)
+        slot_bits = int.from_bytes(data[offset + 2:end], 'little')
+        
+        played_cards = []
+        index1 = index2 = 0
+        for i in range(count):
+            if slot_bits >> i & 1:
+                played_cards.append(slot2[index2])
+                index2 += 1
+            else:
+                played_cards.append(slot1[index1])
+                index1 += 1
+        return played_cards, end
+    
+    @staticmethod
+    def _played_slot_bits(
+        played_cards: List[Card],
+        slot1: List[Card],
+        slot2: List[Card]
+    ) -> Optional[int]:
+        """
+        履歴を各手のスロット番号（スロット2なら1のビット）で表す
+        
+        Returns:
+            ビット列（履歴がスロットから復元できない場合はNone）
+        """
+        if len(played_cards) != len(slot1) + len(slot2):
+            return None
+        slot_bits = 0
+        index1 = index2 = 0
+        for i, card in enumerate(played_cards):
+            if index1 < len(slot1) and slot1[index1] == card:
+                index1 += 1
+            elif index2 < len(slot2) and slot2[index2] == card:
+                slot_bits |= 1 << i
+                index2 += 1
+            else:
+                return None
+        return slot_bits
+    
+    @staticmethod
+    def _build_hand(cards: List[Card]) -> Hand:
+        """カード列から手札を構築"""
+        hand = Hand()
+        hand._cards = cards
+        return hand
+    
+    @staticmethod
+    def _build_field(slot1: List[Card], slot2: List[Card]) -> Field:
+        """カード列から場を構築"""
+        field = Field()
+        field.get_slot(1)._cards = slot1.copy()
+        field.get_slot(2)._cards = slot2.copy()
+        return field
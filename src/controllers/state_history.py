@@ -0,0 +1,178 @@
+"""
+状態履歴 (State History)
+ゲーム状態のコンパクトなスナップショットを保持し、定数時間の元に戻す/やり直しを提供する
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+from .game_state import GameState
+
+
+class RecordsView(Sequence):
+    """
+    StateHistory の記録のリストの読み取り専用ビュー
+    
+    内部のリストを参照するだけなので、作成は定数時間で、履歴の操作は常に反映される。
+    要素の追加・削除・置き換えはできない（スライスは新しいリストを返す）。
+    """
+    
+    def __init__(self, records: List[Dict[str, Any]]):
+        """
+        読み取り専用ビューの初期化
+        
+        Args:
+            records: 参照する記録のリスト
+        """
+        self._records = records
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        return self._records[index]
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __repr__(self) -> str:
+        return f"RecordsView({self._records!r})"
+
+
+class StateHistory:
+    """
+    GameStateのスナップショット履歴（元に戻す/やり直し）
+    
+    各スナップショットは StateCodec のバイト列（約100バイト、不変）と、
+    その状態に至った操作の記録（手を出した場合は {'turn', 'card', 'suit', 'slot'}、
+    手札の追加などはNone）の組。
+    
+    - push: 現在の状態を元に戻す側に積み、やり直し側を捨てる
+    - undo / redo: 現在の状態と、元に戻す側・やり直し側の先頭を入れ替える
+    
+    いずれも定数時間（push でやり直し側を捨てる分を除く）。
+    手を出した記録のリスト（records）も操作ごとに差分で更新するので、呼び出しは定数時間。
+    スナップショットは max_snapshots 個まで保持し、超えた分は古いものから捨てるため、
+    セッションあたりのメモリは上限付き（1ゲームは最大でも約130操作なので、
+    既定の256個ならゲーム全体を保持できる）。
+    
+    Usage:
+        history = StateHistory(state)
+        state.play_card(card, slot)
+        history.push(state, {'turn': 1, 'card': str(card), 'suit': card.suit, 'slot': slot})
+        state = history.undo()
+    """
+    
+    def __init__(self, state: GameState, max_snapshots: int = 256):
+        """
+        状態履歴の初期化
+        
+        Args:
+            state: 最初の状態
+            max_snapshots: 保持するスナップショット数の上限（現在の状態を含む）
+        """
+        if max_snapshots < 2:
+            raise ValueError(f"max_snapshotsは2以上である必要があります: {max_snapshots}")
+        
+        self.max_snapshots = max_snapshots
+        self._current: Tuple[bytes, Optional[Dict[str, Any]]] = (state.to_bytes(), None)
+        # 古い順（右端が直前のスナップショット）。上限を超えると左端から捨てられる
+        self._undo: Deque[Tuple[bytes, Optional[Dict[str, Any]]]] = deque(maxlen=max_snapshots - 1)
+        # 右端が次にやり直すスナップショット
+        self._redo: List[Tuple[bytes, Optional[Dict[str, Any]]]] = []
+        # 元に戻す側と現在のスナップショットの記録（Noneを除く、古い順）
+        self._records: List[Dict[str, Any]] = []
+        self._records_view = RecordsView(self._records)
+    
+    def push(self, state: GameState, record: Optional[Dict[str, Any]] = None):
+        """
+        操作後の状態を記録
+        
+        Args:
+            state: 操作後のゲーム状態
+            record: 操作の記録（手を出した場合の履歴レコード、それ以外はNone）
+        """
+        self._push_undo(self._current)
+        self._current = (state.to_bytes(), record)
+        self._redo.clear()
+        if record is not None:
+            self._records.append(record)
+    
+    def can_undo(self) -> bool:
+        """元に戻せるか"""
+        return len(self._undo) > 0
+    
+    def can_redo(self) -> bool:
+        """やり直せるか"""
+        return len(self._redo) > 0
+    
+    def undo(self) -> Optional[GameState]:
+        """
+        1つ前の状態に戻す
+        
+        Returns:
+            1つ前のゲーム状態（新しいオブジェクト）。戻せない場合はNone
+        """
+        if not self._undo:
+            return None
+        if self._current[1] is not None:
+            self._records.pop()
+        self._redo.append(self._current)
+        self._current = self._undo.pop()
+        return self.current()
+    
+    def redo(self) -> Optional[GameState]:
+        """
+        元に戻した操作をやり直す
+        
+        Returns:
+            やり直した後のゲーム状態（新しいオブジェクト）。やり直せない場合はNone
+        """
+        if not self._redo:
+            return None
+        self._push_undo(self._current)
+        self._current = self._redo.pop()
+        if self._current[1] is not None:
+            self._records.append(self._current[1])
+        return self.current()
+    
+    def _push_undo(self, snapshot: Tuple[bytes, Optional[Dict[str, Any]]]):
+        """
+        元に戻す側にスナップショットを積む（上限を超えて捨てる分の記録も除く）
+        
+        Args:
+            snapshot: スナップショット
+        """
+        if len(self._undo) == self._undo.maxlen and self._undo[0][1] is not None:
+            # 記録の先頭は捨てるスナップショットの記録（上限付きなので pop(0) の長さも上限付き）
+            self._records.pop(0)
+        self._undo.append(snapshot)
+    
+    def current(self) -> GameState:
+        """
+        現在のスナップショットを復元
+        
+        Returns:
+            ゲーム状態（呼ぶたびに新しいオブジェクト）
+        """
+        return GameState.from_bytes(self._current[0])
+    
+    def current_record(self) -> Optional[Dict[str, Any]]:
+        """現在の状態に至った操作の記録を取得"""
+        return self._current[1]
+    
+    def records(self) -> RecordsView:
+        """
+        現在の状態までに出した手の記録（古い順）
+        
+        Returns:
+            履歴レコードの読み取り専用ビュー（保持しているスナップショットの範囲のみ）。
+            内部のリストを参照するので、以降の操作も反映される
+        """
+        return self._records_view
+    
+    def __len__(self) -> int:
+        """保持しているスナップショット数（現在の状態・やり直し側を含む）"""
+        return len(self._undo) + 1 + len(self._redo)
+    
+    def __repr__(self) -> str:
+        return (
+            f"StateHistory(undo={len(self._undo)}, redo={len(self._redo)}, "
+            f"max_snapshots={self.max_snapshots})"
+        )
@@ -0,0 +1,76 @@
+"""
+未知カードカウンタ
+未知カードのスート別・数値別の枚数を保持し、柔軟性を O(1) で計算する
+"""
+
+from typing import Dict, Iterable
+from ..models.card import Card
+from ..models.suit import Suit
+
+
+class UnknownCardCounter:
+    """
+    未知カードのスート別・数値別カウンタ
+    
+    FlexibilityCalculator.calculate_all_flexibility_scores() と同じ
+    「同じスートの枚数 + 同じ数値の枚数」を、カードが引かれるたびに
+    差分更新することで、ロールアウト中も O(1) で柔軟性を求められる。
+    """
+    
+    def __init__(self, unknown_cards: Iterable[Card] = ()):
+        """
+        カウンタの初期化
+        
+        Args:
+            unknown_cards: 未知のカード
+        """
+        self.suit_counts: Dict[Suit, int] = {suit: 0 for suit in Suit}
+        self.value_counts: Dict[int, int] = {value: 0 for value in range(1, 11)}
+        self.total = 0
+        for card in unknown_cards:
+            self.add(card)
+    
+    def add(self, card: Card):
+        """
+        未知カードを追加
+        
+        Args:
+            card: 追加するカード
+        """
+        self.suit_counts[card.suit] += 1
+        self.value_counts[card.value] += 1
+        self.total += 1
+    
+    def remove(self, card: Card):
+        """
+        未知カードを取り除く（カードが引かれて既知になった時に呼ぶ）
+        
+        Args:
+            card: 取り除くカード
+        """
+        self.suit_counts[card.suit] -= 1
+        self.value_counts[card.value] -= 1
+        self.total -= 1
+    
+    def flexibility(self, card: Card) -> int:
+        """
+        カードの柔軟性スコア（接続可能な未知カードの枚数）
+        
+        Args:
+            card: 対象カード（未知カードに含まれないこと）
+        
+        Returns:
+            同じスートの未知カード数 + 同じ数値の未知カード数
+        """
+        return self.suit_counts[card.suit] + self.value_counts[card.value]
+    
+    def copy(self) -> 'UnknownCardCounter':
+        """カウンタのコピーを作成"""
+        counter = UnknownCardCounter()
+        counter.suit_counts = self.suit_counts.copy()
+        counter.value_counts = self.value_counts.copy()
+        counter.total = self.total
+        return counter
+    
+    def __repr__(self) -> str:
+        return f"UnknownCardCounter(total={self.total})"
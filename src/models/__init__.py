@@ -10,6 +10,9 @@ from .hand import Hand
 from .field_slot import FieldSlot
 from .field import Field
 from .point_calculator import PointCalculator
+from .played_card_log import PlayedCardLog
+from .lazy_deck import LazyDeck
+from .indexed_deck import IndexedDeck
 
 __all__ = [
     'Suit',
@@ -19,4 +22,7 @@ __all__ = [
     'FieldSlot',
     'Field',
     'PointCalculator',
+    'PlayedCardLog',
+    'LazyDeck',
+    'IndexedDeck',
 ]
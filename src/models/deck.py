@@ -16,27 +16,35 @@ class Deck:
     または、任意の10枚のカードを除外することもできる
     """
     
-    def __init__(self, seed: Optional[int] = None, excluded_cards: Optional[List[Card]] = None):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        excluded_cards: Optional[List[Card]] = None,
+        rng: Optional[random.Random] = None
+    ):
         """
         デッキの初期化
         
         Args:
-            seed: 乱数シード（テスト用、省略可）
+            seed: 乱数シード（テスト用、省略可。グローバル乱数は初期化しない）
             excluded_cards: 除外するカードのリスト（10枚）。Noneの場合はランダムに10枚除外
+            rng: シャッフルに使う乱数生成器（省略時はseedから生成、
+                 seedも省略した場合はrandomモジュールのグローバル乱数）
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
         
         self._cards: List[Card] = []
         self._excluded_cards: List[Card] = []  # 除外されたカード
-        self._initialize_deck(excluded_cards)
+        self._initialize_deck(excluded_cards, rng)
     
-    def _initialize_deck(self, excluded_cards: Optional[List[Card]] = None):
+    def _initialize_deck(self, excluded_cards: Optional[List[Card]], rng: random.Random):
         """
         全80枚のカードを生成し、10枚を除外して70枚にする
         
         Args:
             excluded_cards: 除外するカードのリスト（10枚）。Noneの場合はランダムに10枚除外
+            rng: 乱数生成器
         """
         # 全80枚のカードを生成
         all_cards = []
@@ -60,12 +68,32 @@ class Deck:
             self._cards = [card for card in all_cards if card not in excluded_cards]
         else:
             # ランダムに10枚を除外
-            random.shuffle(all_cards)
+            rng.shuffle(all_cards)
             self._excluded_cards = all_cards[:10]
             self._cards = all_cards[10:]
         
         # シャッフル
-        random.shuffle(self._cards)
+        rng.shuffle(self._cards)
+    
+    @classmethod
+    def from_order(cls, deck_cards: List[Card], excluded_cards: List[Card]) -> 'Deck':
+        """
+        山札の順序と除外カードを指定してデッキを構築（高速パス）
+        
+        全80枚の生成・除外カードの検証・シャッフルを行わず、乱数も消費しない。
+        呼び出し側がカードの整合性（重複が無いこと、除外カードと山札が重ならないこと）を保証する。
+        
+        Args:
+            deck_cards: 山札のカード（末尾から引かれる順序のまま使う）
+            excluded_cards: 除外カード
+        
+        Returns:
+            デッキ（引数のリストはコピーして保持する）
+        """
+        deck = cls.__new__(cls)
+        deck._cards = list(deck_cards)
+        deck._excluded_cards = list(excluded_cards)
+        return deck
     
     def draw(self) -> Optional[Card]:
         """
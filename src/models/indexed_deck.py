@@ -0,0 +1,108 @@
+"""
+カード番号の配列を山札として使うデッキ
+一括生成した決定化の1行を、Cardのリストに変換せずにそのまま引く
+"""
+
+from typing import List, Optional, Sequence
+from .card import Card
+from .deck import Deck
+
+
+class IndexedDeck(Deck):
+    """
+    カード番号の配列（先頭から引く順）を山札とするデッキ（IS-MCTSの探索用）
+    
+    Determinizer.create_batch() が作る K×N の行列の1行を共有し、
+    次に引く位置だけを持つ。生成・コピーは山札の枚数によらず O(1)。
+    配列は読み取り専用として扱い、書き換えない。
+    
+    山札をCardのリストとして持たないため、Deck._cards を前提とする処理
+    （StateCodecでの保存、RolloutCacheのキーなど）には使えない。
+    """
+    
+    def __init__(
+        self,
+        order: Sequence[int],
+        cards: Sequence[Card],
+        excluded_order: Sequence[int] = (),
+        known_excluded_cards: Sequence[Card] = ()
+    ):
+        """
+        デッキの初期化
+        
+        Args:
+            order: 山札のカード番号（先頭から引く順、NumPyの1次元配列も可）
+            cards: カード番号 -> カード の対応表
+            excluded_order: 除外カードのカード番号（NumPyの1次元配列も可）
+            known_excluded_cards: カードとして持つ除外カード（excluded_order に加える）
+        """
+        # Deck.__init__ は呼ばない（全80枚の生成とシャッフルをしない）
+        self._order = order
+        self._card_table = cards
+        self._excluded_order = excluded_order
+        self._known_excluded_cards = known_excluded_cards
+        self._position = 0
+    
+    def draw(self) -> Optional[Card]:
+        """
+        山札から1枚引く
+        
+        Returns:
+            引いたカード。山札が空の場合はNone
+        """
+        position = self._position
+        if position >= len(self._order):
+            return None
+        self._position = position + 1
+        return self._card_table[self._order[position]]
+    
+    def remaining_count(self) -> int:
+        """
+        山札の残り枚数を返す
+        
+        Returns:
+            残り枚数
+        """
+        return len(self._order) - self._position
+    
+    def is_empty(self) -> bool:
+        """
+        山札が空かどうかを判定
+        
+        Returns:
+            空の場合True
+        """
+        return self._position >= len(self._order)
+    
+    def get_remaining_cards(self) -> List[Card]:
+        """
+        山札に残っているカードを取得（次に引くカードが先頭）
+        
+        Returns:
+            カードのリスト
+        """
+        card_table = self._card_table
+        return [card_table[index] for index in self._order[self._position:]]
+    
+    def get_excluded_cards(self) -> List[Card]:
+        """
+        除外カードを取得
+        
+        Returns:
+            除外カードのリスト（known_excluded_cards + excluded_order のカード）
+        """
+        card_table = self._card_table
+        return list(self._known_excluded_cards) + [card_table[index] for index in self._excluded_order]
+    
+    def __deepcopy__(self, memo) -> 'IndexedDeck':
+        # 配列・対応表・除外カードは共有し、引く位置だけをコピー
+        deck = IndexedDeck.__new__(IndexedDeck)
+        deck._order = self._order
+        deck._card_table = self._card_table
+        deck._excluded_order = self._excluded_order
+        deck._known_excluded_cards = self._known_excluded_cards
+        deck._position = self._position
+        return deck
+    
+    def __repr__(self) -> str:
+        return f"IndexedDeck(remaining={self.remaining_count()})"
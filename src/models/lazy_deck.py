@@ -0,0 +1,138 @@
+"""
+遅延決定化の山札
+引くたびに未知のカードから1枚ずつサンプリングする
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence
+from .card import Card
+from .deck import Deck
+
+
+class LazyDeck(Deck):
+    """
+    遅延決定化の山札（IS-MCTSの探索用）
+    
+    山札の順序と除外カードを最初に全て決める代わりに、
+    draw() のたびに未知のカード（山札 + 除外カードの候補）から1枚を一様にサンプリングする
+    （疎な Fisher–Yates シャッフルを1ステップずつ進める）。
+    最後まで引かれなかったカードが暗黙の除外カードになる。
+    
+    未知のカードの列は複数の決定化で共有し（不変）、
+    決定化ごとには入れ替えた位置だけを辞書で持つので、
+    生成・コピー・1枚引く処理はいずれも引いた枚数に比例するコストで済む。
+    
+    山札の順序が決まっていないため、順序を前提とする処理
+    （StateCodecでの保存、RolloutCacheのキーなど）には使えない。
+    """
+    
+    def __init__(
+        self,
+        unknown_cards: Sequence[Card],
+        deck_size: int,
+        rng: Optional[random.Random] = None,
+        excluded_cards: Sequence[Card] = ()
+    ):
+        """
+        遅延決定化の山札の初期化
+        
+        Args:
+            unknown_cards: 未知のカード（山札 + 除外カードの候補、複数の山札で共有する不変の列）
+            deck_size: 山札の枚数（未知のカードのうち、最大でこの枚数だけ引ける）
+            rng: サンプリングに使う乱数生成器（省略時はrandomモジュールのグローバル乱数、
+                 コピーした山札とも共有する）
+            excluded_cards: 分かっている除外カード（未知のカードには含めない）
+        """
+        if not 0 <= deck_size <= len(unknown_cards):
+            raise ValueError(
+                f"山札の枚数は0以上、未知のカードの枚数以下である必要があります: "
+                f"{deck_size}（未知のカード: {len(unknown_cards)}枚）"
+            )
+        # Deck.__init__ は呼ばない（全80枚の生成とシャッフルをしない）
+        self._unknown_cards = unknown_cards
+        self._deck_size = deck_size
+        self._rng = rng if rng is not None else random
+        self._known_excluded_cards = excluded_cards
+        # 位置 -> 入れ替え後のカード（入れ替えていない位置は unknown_cards のまま）
+        self._swaps: Dict[int, Card] = {}
+        self._drawn = 0
+    
+    def draw(self) -> Optional[Card]:
+        """
+        未知のカードから1枚をサンプリングして引く
+        
+        Returns:
+            引いたカード。山札が空の場合はNone
+        """
+        drawn = self._drawn
+        if drawn >= self._deck_size:
+            return None
+        
+        unknown_cards = self._unknown_cards
+        swaps = self._swaps
+        index = self._rng.randrange(drawn, len(unknown_cards))
+        card = swaps.get(index, unknown_cards[index])
+        # 位置 drawn のカードを選ばれた位置に移す（位置 drawn は以降参照しない）
+        current = swaps.pop(drawn, unknown_cards[drawn])
+        if index != drawn:
+            swaps[index] = current
+        self._drawn = drawn + 1
+        return card
+    
+    def remaining_count(self) -> int:
+        """
+        山札の残り枚数を返す
+        
+        Returns:
+            残り枚数
+        """
+        return self._deck_size - self._drawn
+    
+    def is_empty(self) -> bool:
+        """
+        山札が空かどうかを判定
+        
+        Returns:
+            空の場合True
+        """
+        return self._drawn >= self._deck_size
+    
+    def get_remaining_cards(self) -> List[Card]:
+        """
+        まだ引いていない未知のカードを取得（暗黙の除外カードを含む、順序に意味はない）
+        
+        Returns:
+            カードのリスト
+        """
+        unknown_cards = self._unknown_cards
+        swaps = self._swaps
+        return [
+            swaps.get(index, unknown_cards[index])
+            for index in range(self._drawn, len(unknown_cards))
+        ]
+    
+    def get_excluded_cards(self) -> List[Card]:
+        """
+        分かっている除外カードを取得（それ以外の除外カードは決まっていないので含まない）
+        
+        Returns:
+            カードのリスト
+        """
+        return list(self._known_excluded_cards)
+    
+    def __deepcopy__(self, memo) -> 'LazyDeck':
+        # 未知のカードの列は不変なので共有し、入れ替えた位置だけをコピー
+        deck = LazyDeck.__new__(LazyDeck)
+        deck._unknown_cards = self._unknown_cards
+        deck._deck_size = self._deck_size
+        deck._rng = self._rng
+        deck._known_excluded_cards = self._known_excluded_cards
+        deck._swaps = self._swaps.copy()
+        deck._drawn = self._drawn
+        return deck
+    
+    def __repr__(self) -> str:
+        return (
+            f"LazyDeck(remaining={self.remaining_count()}, "
+            f"unknown={len(self._unknown_cards) - self._drawn})"
+        )
@@ -0,0 +1,150 @@
+"""
+場に出したカードの記録
+出した順のログとビットマスクを同時に管理する
+"""
+
+from typing import Iterable, Iterator, List, Optional
+from .card import Card
+from .suit import Suit
+
+
+# カード -> ビット位置（スート番号 × 10 + 数値 - 1）
+_CARD_INDEX = {
+    Card(suit, value): suit_index * 10 + value - 1
+    for suit_index, suit in enumerate(Suit)
+    for value in range(1, 11)
+}
+
+
+class PlayedCardLog:
+    """
+    場に出したカードの記録（追記のみ）
+    
+    - 出した順のログ（履歴の表示・StateCodecの保存用）
+    - 80ビットのビットマスク（「出したかどうか」の判定・未知カードの計算用）
+    
+    の2つを1回の append で同時に更新するので、両者がずれることはない。
+    
+    view() は O(1) のスナップショットを返す。ログのリストは共有し、
+    長さだけを固定する（追記のみなので、共有した範囲は変わらない）。
+    共有中に追記した場合は、その時点で自分の範囲だけをコピーする（コピーオンライト）。
+    """
+    
+    __slots__ = ('_cards', '_length', 'mask')
+    
+    def __init__(self, cards: Optional[Iterable[Card]] = None):
+        """
+        記録の初期化
+        
+        Args:
+            cards: 出した順のカード（省略時は空）
+        """
+        self._cards: List[Card] = []
+        self._length = 0
+        self.mask = 0
+        if cards is not None:
+            for card in cards:
+                self.append(card)
+    
+    @staticmethod
+    def card_bit(card: Card) -> int:
+        """
+        カードに対応するビットを取得
+        
+        Args:
+            card: カード
+        
+        Returns:
+            ビットマスク上のビット
+        """
+        return 1 << _CARD_INDEX[card]
+    
+    @classmethod
+    def mask_of(cls, cards: Iterable[Card]) -> int:
+        """
+        カードの集合のビットマスクを計算
+        
+        Args:
+            cards: カード
+        
+        Returns:
+            ビットマスク
+        """
+        mask = 0
+        for card in cards:
+            mask |= 1 << _CARD_INDEX[card]
+        return mask
+    
+    def append(self, card: Card):
+        """
+        出したカードを記録
+        
+        Args:
+            card: 出したカード
+        """
+        if self._length != len(self._cards):
+            # 共有しているログに他の記録が追記済みなので、自分の範囲だけをコピー
+            self._cards = self._cards[:self._length]
+        self._cards.append(card)
+        self._length += 1
+        self.mask |= 1 << _CARD_INDEX[card]
+    
+    def view(self) -> 'PlayedCardLog':
+        """
+        現在の記録のスナップショット（O(1)、以降の追記は互いに影響しない）
+        
+        Returns:
+            記録
+        """
+        log = PlayedCardLog.__new__(PlayedCardLog)
+        log._cards = self._cards
+        log._length = self._length
+        log.mask = self.mask
+        return log
+    
+    def copy(self) -> 'PlayedCardLog':
+        """view() と同じ"""
+        return self.view()
+    
+    def to_list(self) -> List[Card]:
+        """
+        出した順のカードのリストを取得
+        
+        Returns:
+            カードのリスト（コピー）
+        """
+        return self._cards[:self._length]
+    
+    def __contains__(self, card: object) -> bool:
+        index = _CARD_INDEX.get(card)
+        return index is not None and bool(self.mask >> index & 1)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[Card]:
+        cards = self._cards
+        for i in range(self._length):
+            yield cards[i]
+    
+    def __getitem__(self, index):
+        return self.to_list()[index]
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PlayedCardLog):
+            return self.mask == other.mask and self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __deepcopy__(self, memo) -> 'PlayedCardLog':
+        # カードは不変なので、スナップショットで十分
+        return self.view()
+    
+    def __reduce__(self):
+        return PlayedCardLog, (self.to_list(),)
+    
+    def __repr__(self) -> str:
+        return f"PlayedCardLog({self.to_list()!r})"
@@ -8,7 +8,8 @@ from .components import (
     display_hand,
     display_field,
     display_deck_status,
-    display_card_selection_table
+    display_card_selection_table,
+    display_search_statistics
 )
 from .dialogs import (
     show_exclude_card_dialog,
@@ -18,7 +19,16 @@ from .dialogs import (
 from .utils import (
     get_suit_emoji,
     initialize_session_state,
-    reset_game
+    reset_game,
+    record_state,
+    undo_state,
+    redo_state,
+    get_search_scheduler,
+    get_session_id,
+    get_recommendation_cache,
+    get_heuristic_strategy,
+    run_heuristic_search,
+    run_mcts_search
 )
 
 __all__ = [
@@ -28,6 +38,7 @@ __all__ = [
     'display_field',
     'display_deck_status',
     'display_card_selection_table',
+    'display_search_statistics',
     # Dialogs
     'show_exclude_card_dialog',
     'show_hand_selection_dialog',
@@ -35,5 +46,14 @@ __all__ = [
     # Utils
     'get_suit_emoji',
     'initialize_session_state',
-    'reset_game'
+    'reset_game',
+    'record_state',
+    'undo_state',
+    'redo_state',
+    'get_search_scheduler',
+    'get_session_id',
+    'get_recommendation_cache',
+    'get_heuristic_strategy',
+    'run_heuristic_search',
+    'run_mcts_search'
 ]
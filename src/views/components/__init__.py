@@ -7,11 +7,13 @@ from .hand_display import display_hand
 from .field_display import display_field
 from .deck_status_display import display_deck_status
 from .card_selection_table import display_card_selection_table
+from .search_statistics_display import display_search_statistics
 
 __all__ = [
     'display_game_state',
     'display_hand',
     'display_field',
     'display_deck_status',
-    'display_card_selection_table'
+    'display_card_selection_table',
+    'display_search_statistics'
 ]
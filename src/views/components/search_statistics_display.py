@@ -0,0 +1,50 @@
+"""
+探索計測表示コンポーネント
+"""
+
+import streamlit as st
+from typing import Dict, Any, Optional
+
+
+def display_search_statistics(stats: Optional[Dict[str, Any]]):
+    """
+    探索の計測結果を折りたたみパネルで表示
+    
+    Args:
+        stats: 戦略の last_statistics（'instrumentation' キーを含む場合のみ表示）
+    """
+    if not stats or 'instrumentation' not in stats:
+        return
+    
+    instrumentation = stats['instrumentation']
+    
+    with st.expander("🔬 探索の計測", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("イテレーション/秒", f"{instrumentation['iterations_per_sec']:,.0f}")
+        col2.metric("平均ロールアウト長", f"{instrumentation['avg_rollout_length']:.2f}枚")
+        col3.metric("作成ノード数", f"{instrumentation['nodes_allocated']:,}")
+        
+        # フェーズごとの所要時間（ms）と割合
+        phase_ns = instrumentation['phase_ns']
+        total_ns = sum(phase_ns.values())
+        rows = []
+        for phase, elapsed_ns in phase_ns.items():
+            share = elapsed_ns / total_ns * 100 if total_ns > 0 else 0.0
+            rows.append({
+                'フェーズ': phase,
+                '時間 (ms)': round(elapsed_ns / 1e6, 2),
+                '割合 (%)': round(share, 1)
+            })
+        st.markdown("**フェーズ別の所要時間**")
+        st.table(rows)
+        
+        # 選択・展開されたノードの深さ
+        histogram = instrumentation['depth_histogram']
+        if histogram:
+            st.markdown("**到達した深さの分布**")
+            st.bar_chart({'回数': {str(depth): count for depth, count in histogram.items()}})
+        
+        st.caption(
+            f"{instrumentation['iterations']}回 / "
+            f"{instrumentation['elapsed_ns'] / 1e6:.1f} ms"
+        )
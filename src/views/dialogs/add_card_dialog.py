@@ -6,6 +6,7 @@
 import streamlit as st
 
 from src.views.components import display_card_selection_table
+from src.views.utils import record_state
 
 
 def show_add_card_dialog():
@@ -56,6 +57,8 @@ def show_add_card_dialog():
                 success = state.add_card_to_hand(selected_card)
                 
                 if success:
+                    # 状態履歴に記録
+                    record_state()
                     # ダイアログを閉じる
                     st.session_state.show_add_card_dialog = False
                     # 選択状態をクリア
@@ -5,11 +5,31 @@
 from .ui_helpers import get_suit_emoji
 from .session_manager import (
     initialize_session_state,
-    reset_game
+    reset_game,
+    record_state,
+    undo_state,
+    redo_state
+)
+from .search_service import (
+    get_search_scheduler,
+    get_session_id,
+    get_recommendation_cache,
+    get_heuristic_strategy,
+    run_heuristic_search,
+    run_mcts_search
 )
 
 __all__ = [
     'get_suit_emoji',
     'initialize_session_state',
-    'reset_game'
+    'reset_game',
+    'record_state',
+    'undo_state',
+    'redo_state',
+    'get_search_scheduler',
+    'get_session_id',
+    'get_recommendation_cache',
+    'get_heuristic_strategy',
+    'run_heuristic_search',
+    'run_mcts_search'
 ]
@@ -0,0 +1,139 @@
+"""
+探索サービスモジュール
+Streamlitサーバーのプロセス全体で共有する探索ワーカープールを管理
+"""
+
+import multiprocessing
+import uuid
+import streamlit as st
+from typing import Any, Dict, Optional, Tuple
+
+from src.models import Card
+from src.controllers import (
+    GameState,
+    HeuristicStrategy,
+    MCTSStrategy,
+    ObservableGameState,
+    RecommendationCache,
+    SearchJobScheduler,
+    SearchWorkerPool
+)
+
+
+# ワーカープールに登録する戦略名
+MCTS_STRATEGY = 'mcts'
+MCTS_INSTRUMENTED_STRATEGY = 'mcts-instrumented'
+HEURISTIC_STRATEGY = 'heuristic'
+
+# Streamlitサーバーはマルチスレッドなので、forkではなくforkserver（なければspawn）で起動
+START_METHOD = (
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+
+@st.cache_resource
+def get_search_scheduler() -> SearchJobScheduler:
+    """
+    プロセス全体で共有する探索スケジューラを取得（初回のみワーカープールを起動）
+    
+    Returns:
+        全セッション共通の探索スケジューラ
+    """
+    pool = SearchWorkerPool({
+        MCTS_STRATEGY: MCTSStrategy(verbose=False),
+        MCTS_INSTRUMENTED_STRATEGY: MCTSStrategy(verbose=False, instrument=True)
+    }, start_method=START_METHOD)
+    return SearchJobScheduler(pool)
+
+
+@st.cache_resource
+def get_recommendation_cache() -> RecommendationCache:
+    """
+    プロセス全体で共有する推奨手キャッシュを取得
+    
+    Returns:
+        全セッション共通の推奨手キャッシュ
+    """
+    return RecommendationCache(capacity=1000)
+
+
+def get_session_id() -> str:
+    """このブラウザセッションのIDを取得（初回のみ生成）"""
+    if 'search_session_id' not in st.session_state:
+        st.session_state.search_session_id = uuid.uuid4().hex
+    return st.session_state.search_session_id
+
+
+def get_heuristic_strategy() -> HeuristicStrategy:
+    """
+    このセッションのヒューリスティック戦略を取得（初回のみ生成）
+    
+    explain() は直前の判断を説明するため、セッション間では共有しない。
+    """
+    if 'heuristic_strategy' not in st.session_state:
+        st.session_state.heuristic_strategy = HeuristicStrategy(verbose=False)
+    return st.session_state.heuristic_strategy
+
+
+def run_heuristic_search(obs_state: ObservableGameState) -> Tuple[Optional[Tuple[Card, int]], str]:
+    """
+    ヒューリスティック戦略で推奨手を取得（同じ局面は推奨手キャッシュから返す）
+    
+    Args:
+        obs_state: 観測可能なゲーム状態
+    
+    Returns:
+        (最良の手, 説明文)
+    """
+    def compute() -> Dict[str, Any]:
+        strategy = get_heuristic_strategy()
+        best_move = strategy.get_best_move(obs_state)
+        return {'move': best_move, 'explanation': strategy.explain(), 'statistics': None}
+    
+    recommendation = get_recommendation_cache().get_or_compute(obs_state, HEURISTIC_STRATEGY, compute)
+    return recommendation['move'], recommendation['explanation']
+
+
+def run_mcts_search(
+    state: GameState,
+    num_iterations: int,
+    instrument: bool = False
+) -> Tuple[Optional[Tuple[Card, int]], Optional[Dict[str, Any]]]:
+    """
+    共有ワーカープールでMCTS探索を実行し、結果を待つ
+    
+    同じ局面・同じ探索回数の推奨手は、探索せずに推奨手キャッシュから返す。
+    このセッションの以前のジョブは取り消してから投入する。
+    待っている間にスクリプトが中断された場合（再実行・停止）もジョブを取り消す。
+    
+    Args:
+        state: ゲーム状態
+        num_iterations: 探索回数
+        instrument: 探索の計測を有効にするか
+    
+    Returns:
+        (最良の手, 探索の統計情報)
+    """
+    cache = get_recommendation_cache()
+    strategy_name = MCTS_INSTRUMENTED_STRATEGY if instrument else MCTS_STRATEGY
+    recommendation = cache.get(state, strategy_name, num_iterations)
+    if recommendation is not None:
+        return recommendation['move'], recommendation['statistics']
+    
+    scheduler = get_search_scheduler()
+    session_id = get_session_id()
+    scheduler.cancel(session_id)
+    job_id = scheduler.submit(session_id, strategy_name, state, num_iterations=num_iterations)
+    try:
+        best_move, statistics = scheduler.result(session_id, job_id)
+    except BaseException:
+        scheduler.cancel(session_id)
+        raise
+    
+    cache.put(
+        state,
+        strategy_name,
+        {'move': best_move, 'explanation': None, 'statistics': statistics},
+        num_iterations
+    )
+    return best_move, statistics
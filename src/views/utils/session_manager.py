@@ -4,10 +4,10 @@ Streamlitセッション状態管理モジュール
 
 import streamlit as st
 import random
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 from src.models import Card
-from src.controllers import GameState
+from src.controllers import GameState, StateHistory
 
 
 def initialize_session_state():
@@ -15,6 +15,7 @@ def initialize_session_state():
     if 'game_state' not in st.session_state:
         seed = random.randint(0, 100000)
         st.session_state.game_state = GameState(seed=seed)
+        st.session_state.state_history = StateHistory(st.session_state.game_state)
         st.session_state.history = []
         st.session_state.turn = 0
         st.session_state.seed = seed
@@ -37,6 +38,7 @@ def reset_game(excluded_cards: Optional[List[Card]] = None, initial_hand: Option
     """
     seed = random.randint(0, 100000)
     st.session_state.game_state = GameState(seed=seed, excluded_cards=excluded_cards, initial_hand=initial_hand)
+    st.session_state.state_history = StateHistory(st.session_state.game_state)
     st.session_state.history = []
     st.session_state.turn = 0
     st.session_state.seed = seed
@@ -47,3 +49,61 @@ def reset_game(excluded_cards: Optional[List[Card]] = None, initial_hand: Option
     st.session_state.initial_hand = []  # 初期手札選択をクリア
     st.session_state.show_hand_dialog = False  # ダイアログを閉じる
     st.session_state.show_add_card_dialog = False  # 手札追加ダイアログを閉じる
+
+
+def record_state(record: Optional[Dict[str, Any]] = None):
+    """
+    現在のゲーム状態を状態履歴に記録（操作の後に呼ぶ）
+    
+    Args:
+        record: 手を出した場合の履歴レコード（{'turn', 'card', 'suit', 'slot'}）、それ以外はNone
+    """
+    st.session_state.state_history.push(st.session_state.game_state, record)
+    _sync_history()
+
+
+def undo_state() -> bool:
+    """
+    1つ前の操作を元に戻す
+    
+    Returns:
+        元に戻せた場合True
+    """
+    state = st.session_state.state_history.undo()
+    if state is None:
+        return False
+    _restore_state(state)
+    return True
+
+
+def redo_state() -> bool:
+    """
+    元に戻した操作をやり直す
+    
+    Returns:
+        やり直せた場合True
+    """
+    state = st.session_state.state_history.redo()
+    if state is None:
+        return False
+    _restore_state(state)
+    return True
+
+
+def _restore_state(state: GameState):
+    """状態履歴から復元したゲーム状態をセッションに反映"""
+    st.session_state.game_state = state
+    st.session_state.recommended_move = None
+    st.session_state.strategy_explanation = None
+    # 手を出した直後（まだ手札を補充していない）状態なら、手札追加ダイアログを開く
+    st.session_state.show_add_card_dialog = (
+        st.session_state.state_history.current_record() is not None
+        and state.deck.remaining_count() > 0
+    )
+    _sync_history()
+
+
+def _sync_history():
+    """表示用の履歴とターン数を状態履歴から導出（履歴は状態履歴の読み取り専用ビューで、作り直さない）"""
+    st.session_state.history = st.session_state.state_history.records()
+    st.session_state.turn = len(st.session_state.history)
@@ -0,0 +1,167 @@
+"""
+benchmark.pyのテスト
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+import benchmark
+
+
+class TestBuildJobs(unittest.TestCase):
+    """build_jobs関数のテスト"""
+    
+    def test_budgeted_strategy(self):
+        """探索予算を使う戦略は予算 × シードの組み合わせ"""
+        jobs = benchmark.build_jobs(['mcts'], [1, 2], [10, 20], [5.0])
+        
+        self.assertEqual(len(jobs), 6)
+        budgets = {(job['num_iterations'], job['time_limit_ms']) for job in jobs}
+        self.assertEqual(
+            budgets,
+            {(10, None), (20, None), (benchmark.TIME_BUDGET_MAX_ITERATIONS, 5.0)}
+        )
+    
+    def test_unbudgeted_strategy(self):
+        """探索予算を使わない戦略はシードごとに1ジョブ"""
+        jobs = benchmark.build_jobs(['random', 'heuristic'], [1, 2, 3], [10, 20], [5.0])
+        
+        self.assertEqual(len(jobs), 6)
+        self.assertTrue(all(job['num_iterations'] is None for job in jobs))
+    
+    def test_unknown_strategy(self):
+        """未知の戦略はエラー"""
+        with self.assertRaises(ValueError):
+            benchmark.build_jobs(['unknown'], [1], [10], [])
+
+
+class TestPlayGame(unittest.TestCase):
+    """play_game / run_jobs関数のテスト"""
+    
+    def test_records_decision_times(self):
+        """1手ごとの思考時間を記録する"""
+        record = benchmark.play_game(
+            {'strategy': 'heuristic', 'seed': 42, 'num_iterations': None, 'time_limit_ms': None}
+        )
+        
+        self.assertEqual(record['strategy'], 'heuristic')
+        self.assertEqual(len(record['decision_ns']), record['turns'])
+        self.assertTrue(all(ns >= 0 for ns in record['decision_ns']))
+        self.assertGreater(record['cards_played'], 0)
+    
+    def test_same_seed_is_reproducible(self):
+        """同じシードなら同じ結果"""
+        job = {'strategy': 'mcts', 'seed': 7, 'num_iterations': 5, 'time_limit_ms': None}
+        
+        record1 = benchmark.play_game(job)
+        record2 = benchmark.play_game(job)
+        
+        self.assertEqual(record1['cards_played'], record2['cards_played'])
+        self.assertEqual(record1['total_points'], record2['total_points'])
+    
+    def test_parallel_matches_serial(self):
+        """プロセスプールでも直列実行と同じ結果が同じ順序で返る"""
+        jobs = benchmark.build_jobs(['random', 'mcts'], [1, 2], [5], [])
+        
+        serial = benchmark.run_jobs(jobs, workers=1)
+        parallel = benchmark.run_jobs(jobs, workers=2)
+        
+        self.assertEqual(
+            [(r['strategy'], r['seed'], r['cards_played']) for r in serial],
+            [(r['strategy'], r['seed'], r['cards_played']) for r in parallel]
+        )
+
+
+class TestStatistics(unittest.TestCase):
+    """集計関数のテスト"""
+    
+    def test_percentile(self):
+        """最近傍順位法のパーセンタイル"""
+        values = list(range(1, 21))
+        
+        self.assertEqual(benchmark.percentile(values, 95), 19)
+        self.assertEqual(benchmark.percentile(values, 50), 10)
+        self.assertEqual(benchmark.percentile([3], 95), 3)
+    
+    def test_describe(self):
+        """平均・中央値・信頼区間"""
+        stats = benchmark.describe([1, 2, 3, 4])
+        
+        self.assertEqual(stats['n'], 4)
+        self.assertAlmostEqual(stats['mean'], 2.5)
+        self.assertAlmostEqual(stats['median'], 2.5)
+        self.assertEqual(stats['p95'], 4)
+        self.assertGreater(stats['ci95'], 0.0)
+    
+    def test_describe_empty(self):
+        """空のリストは全て0"""
+        self.assertEqual(benchmark.describe([])['n'], 0)
+    
+    def test_summarize_groups_by_budget(self):
+        """(戦略, 探索回数, 時間予算) ごとに集計する"""
+        records = [
+            {'strategy': 'mcts', 'num_iterations': 10, 'time_limit_ms': None,
+             'cards_played': 10, 'total_points': 0, 'decision_ns': [1000000]},
+            {'strategy': 'mcts', 'num_iterations': 10, 'time_limit_ms': None,
+             'cards_played': 20, 'total_points': 0, 'decision_ns': [3000000]},
+            {'strategy': 'mcts', 'num_iterations': 20, 'time_limit_ms': None,
+             'cards_played': 30, 'total_points': 0, 'decision_ns': [2000000]},
+        ]
+        
+        summaries = benchmark.summarize(records)
+        
+        self.assertEqual(summaries[('mcts', 10, None)]['games'], 2)
+        self.assertAlmostEqual(summaries[('mcts', 10, None)]['cards']['mean'], 15.0)
+        self.assertAlmostEqual(summaries[('mcts', 10, None)]['decision_ms']['mean'], 2.0)
+        self.assertEqual(summaries[('mcts', 20, None)]['games'], 1)
+
+
+class TestWriteResults(unittest.TestCase):
+    """write_results関数のテスト"""
+    
+    def setUp(self):
+        self.records = [
+            benchmark.play_game(
+                {'strategy': 'random', 'seed': 1, 'num_iterations': None, 'time_limit_ms': None}
+            )
+        ]
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_jsonl(self):
+        """JSONLは1行1ゲーム"""
+        path = os.path.join(self.temp_dir.name, 'results.jsonl')
+        
+        benchmark.write_results(self.records, path)
+        
+        with open(path, encoding='utf-8') as f:
+            loaded = [json.loads(line) for line in f]
+        self.assertEqual(loaded, self.records)
+    
+    def test_csv(self):
+        """CSVは拡張子から判定し、思考時間を空白区切りで出力"""
+        path = os.path.join(self.temp_dir.name, 'results.csv')
+        
+        benchmark.write_results(self.records, path)
+        
+        with open(path, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(
+            [int(ns) for ns in rows[0]['decision_ns'].split()],
+            self.records[0]['decision_ns']
+        )
+    
+    def test_invalid_format(self):
+        """未知の出力形式はエラー"""
+        path = os.path.join(self.temp_dir.name, 'results.txt')
+        with self.assertRaises(ValueError):
+            benchmark.write_results(self.records, path, 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
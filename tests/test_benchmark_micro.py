@@ -0,0 +1,88 @@
+"""
+benchmark_micro.pyのテスト
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import benchmark_micro
+
+
+class TestBenchmarkMicro(unittest.TestCase):
+    """マイクロベンチマークのテスト"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.samples = benchmark_micro.collect_samples(seeds=[0, 1])
+    
+    def test_collect_samples(self):
+        """実際のゲームから局面を集める"""
+        self.assertGreater(len(self.samples['states']), 0)
+        for key in ('moves', 'observables', 'info_sets', 'hands'):
+            self.assertEqual(len(self.samples[key]), len(self.samples['states']))
+    
+    def test_run_suite(self):
+        """全ての計測が正の実行時間を返し、基準ループを必ず含む"""
+        results = benchmark_micro.run_suite(
+            self.samples,
+            names=['get_valid_moves', 'information_set_hash'],
+            repeat=1,
+            scale=0.01
+        )
+        
+        self.assertEqual(
+            set(results),
+            {'get_valid_moves', 'information_set_hash', benchmark_micro.CALIBRATION}
+        )
+        self.assertTrue(all(ns > 0 for ns in results.values()))
+    
+    def test_relative_ratio_normalizes_by_calibration(self):
+        """マシン全体が2倍遅くなっただけなら比は1.0"""
+        baseline = {'op': 100.0, benchmark_micro.CALIBRATION: 10.0}
+        results = {'op': 200.0, benchmark_micro.CALIBRATION: 20.0}
+        
+        self.assertAlmostEqual(benchmark_micro.relative_ratio('op', results, baseline), 1.0)
+        self.assertIsNone(benchmark_micro.relative_ratio('missing', {'missing': 1.0}, baseline))
+    
+    def test_compare_detects_regression(self):
+        """閾値を超えて遅くなった計測を検出"""
+        baseline = {'fast': 100.0, 'slow': 100.0, benchmark_micro.CALIBRATION: 10.0}
+        results = {'fast': 110.0, 'slow': 200.0, benchmark_micro.CALIBRATION: 10.0}
+        
+        regressions = benchmark_micro.compare_with_baseline(results, baseline, threshold=0.3)
+        
+        self.assertEqual([r['name'] for r in regressions], ['slow'])
+        self.assertAlmostEqual(regressions[0]['ratio'], 2.0)
+    
+    def test_baseline_round_trip(self):
+        """保存したベースラインを読み込める"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'baseline.json')
+            benchmark_micro.save_baseline({'op': 123.0}, path)
+            
+            self.assertEqual(benchmark_micro.load_baseline(path), {'op': 123.0})
+            self.assertIsNone(benchmark_micro.load_baseline(os.path.join(temp_dir, 'none.json')))
+    
+    def test_main_fails_on_regression(self):
+        """退行があれば終了コード1"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'baseline.json')
+            benchmark_micro.save_baseline(
+                {'information_set_hash': 1.0, benchmark_micro.CALIBRATION: 1000.0},
+                path
+            )
+            
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = benchmark_micro.main([
+                    '--only', 'information_set_hash',
+                    '--repeat', '1',
+                    '--baseline', path
+                ])
+        
+        self.assertEqual(exit_code, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
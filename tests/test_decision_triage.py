@@ -0,0 +1,142 @@
+"""
+decision_triage.py のテスト
+"""
+
+import unittest
+from src.controllers.decision_triage import DecisionTriage
+from src.controllers.game_state import GameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers.ismcts_strategy import ISMCTSStrategy
+from src.models.card import Card
+from src.models.suit import Suit
+from src.models.hand import Hand
+from src.models.field import Field
+
+
+class TestDecisionTriage(unittest.TestCase):
+    """DecisionTriageクラスのテスト"""
+    
+    def _hand(self, *cards: Card) -> Hand:
+        """カードから手札を作る"""
+        hand = Hand()
+        for card in cards:
+            hand.add_card(card)
+        return hand
+    
+    def _field(self, top1: Card, top2: Card) -> Field:
+        """トップカードを指定して場を作る"""
+        field = Field()
+        field.place_card(1, top1)
+        field.place_card(2, top2)
+        return field
+    
+    def _dead_top_position(self):
+        """スロット1のトップ（A1）が死んでいて、A2を両方のスロットに出せる局面"""
+        hand = self._hand(Card(Suit.SUIT_A, 2), Card(Suit.SUIT_C, 5), Card(Suit.SUIT_D, 6))
+        field = self._field(Card(Suit.SUIT_A, 1), Card(Suit.SUIT_B, 2))
+        # スートAの残りと数値1のカードは全て出し終えている
+        known_cards = [Card(Suit.SUIT_A, 1), Card(Suit.SUIT_B, 2)]
+        known_cards += [Card(Suit.SUIT_A, value) for value in range(3, 11)]
+        known_cards += [Card(suit, 1) for suit in Suit if suit != Suit.SUIT_A]
+        return hand, field, known_cards
+    
+    def test_no_move(self):
+        """合法手が無ければNoneで決まる"""
+        triage = DecisionTriage()
+        hand = self._hand(Card(Suit.SUIT_C, 5))
+        field = self._field(Card(Suit.SUIT_A, 1), Card(Suit.SUIT_B, 2))
+        
+        self.assertEqual(triage.resolve(hand, field, []), (True, None))
+        self.assertEqual(triage.last_rule, 'no_move')
+    
+    def test_single_move(self):
+        """合法手が1つならその手で決まる"""
+        triage = DecisionTriage()
+        hand = self._hand(Card(Suit.SUIT_A, 5), Card(Suit.SUIT_C, 7))
+        field = self._field(Card(Suit.SUIT_A, 1), Card(Suit.SUIT_B, 2))
+        
+        self.assertEqual(triage.resolve(hand, field, []), (True, (Card(Suit.SUIT_A, 5), 1)))
+        self.assertEqual(triage.last_rule, 'single_move')
+    
+    def test_symmetric(self):
+        """スロットの入れ替えで同値な手しか無ければ、代表手で決まる"""
+        triage = DecisionTriage()
+        hand = self._hand(Card(Suit.SUIT_A, 5))
+        
+        self.assertEqual(triage.resolve(hand, Field(), []), (True, (Card(Suit.SUIT_A, 5), 1)))
+        self.assertEqual(triage.last_rule, 'symmetric')
+    
+    def test_dominated(self):
+        """死んでいるトップを覆う手が残り、生きているトップを覆う手は除かれる"""
+        triage = DecisionTriage()
+        hand, field, known_cards = self._dead_top_position()
+        
+        self.assertEqual(triage.resolve(hand, field, known_cards), (True, (Card(Suit.SUIT_A, 2), 1)))
+        self.assertEqual(triage.last_rule, 'dominated')
+    
+    def test_live_tops_are_searched(self):
+        """どちらのトップも生きていれば探索に回す"""
+        triage = DecisionTriage()
+        hand, field, known_cards = self._dead_top_position()
+        # 数値1のカードが1枚でも未知なら、A1の上にはまだ出せる
+        known_cards.remove(Card(Suit.SUIT_H, 1))
+        
+        self.assertEqual(triage.resolve(hand, field, known_cards), (False, None))
+        self.assertIsNone(triage.last_rule)
+        self.assertEqual(
+            DecisionTriage.remove_dominated_moves(
+                MoveValidator.get_valid_moves(hand, field), hand, field, known_cards
+            ),
+            [(Card(Suit.SUIT_A, 2), 1), (Card(Suit.SUIT_A, 2), 2)]
+        )
+    
+    def test_remaining_hand_keeps_top_live(self):
+        """未知のカードが尽きていても、残りの手札に出せるカードがあればトップは生きている"""
+        hand, field, known_cards = self._dead_top_position()
+        hand.add_card(Card(Suit.SUIT_A, 3))
+        known_cards.remove(Card(Suit.SUIT_A, 3))
+        
+        moves = MoveValidator.get_canonical_moves(hand, field)
+        self.assertEqual(DecisionTriage.remove_dominated_moves(moves, hand, field, known_cards), moves)
+    
+    def test_statistics(self):
+        """規則ごとの回数と、探索せずに決まった割合を数える"""
+        triage = DecisionTriage()
+        triage.resolve(self._hand(Card(Suit.SUIT_A, 5)), Field(), [])
+        triage.resolve(self._hand(Card(Suit.SUIT_A, 5), Card(Suit.SUIT_B, 6)), Field(), [])
+        
+        stats = triage.get_statistics()
+        self.assertEqual(stats['symmetric'], 1)
+        self.assertEqual(stats['searched'], 1)
+        self.assertEqual(stats['total'], 2)
+        self.assertAlmostEqual(stats['resolved_rate'], 0.5)
+        
+        triage.reset()
+        self.assertEqual(triage.get_statistics()['total'], 0)
+        self.assertEqual(triage.get_statistics()['resolved_rate'], 0.0)
+    
+    def test_strategies_skip_search(self):
+        """両戦略とも、決まった局面では探索せずに手を返す"""
+        # シード0の局面で先頭の代表手を3手指すと、合法手が1つだけになる
+        game_state = GameState(seed=0)
+        for _ in range(3):
+            game_state.play_card(*MoveValidator.get_canonical_moves(game_state.get_hand(), game_state.get_field())[0])
+        valid_moves = MoveValidator.get_valid_moves(game_state.get_hand(), game_state.get_field())
+        self.assertEqual(len(valid_moves), 1)
+        
+        triage = DecisionTriage()
+        strategy = MCTSStrategy(num_iterations=100, triage=triage)
+        self.assertEqual(strategy.get_best_move(game_state), valid_moves[0])
+        self.assertEqual(strategy.last_statistics, {'best_move': valid_moves[0], 'triage': 'single_move'})
+        
+        ismcts_strategy = ISMCTSStrategy(num_iterations=100, triage=triage)
+        obs_state = ObservableGameState.from_game_state(game_state)
+        self.assertEqual(ismcts_strategy.get_best_move(obs_state), valid_moves[0])
+        self.assertEqual(ismcts_strategy.last_statistics['triage'], 'single_move')
+        self.assertEqual(triage.counters['single_move'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 deck.pyのテスト
 """
 
+import random
 import unittest
 from src.models.deck import Deck
 from src.models.card import Card
@@ -139,6 +140,21 @@ class TestDeck(unittest.TestCase):
         # （100%保証はできないが、統計的にほぼ確実）
         self.assertIsNotNone(card1)
         self.assertIsNotNone(card2)
+    
+    def test_from_order(self):
+        """順序を指定して構築すると、その順序のまま引かれ乱数も消費しない"""
+        deck_cards = [Card(Suit.SUIT_A, 1), Card(Suit.SUIT_B, 2), Card(Suit.SUIT_C, 3)]
+        excluded_cards = [Card(Suit.SUIT_D, 4)]
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        deck = Deck.from_order(deck_cards, excluded_cards)
+        
+        self.assertEqual(random.random(), expected)
+        deck_cards.clear()
+        self.assertEqual(deck.remaining_count(), 3)
+        self.assertEqual(deck.draw(), Card(Suit.SUIT_C, 3))
+        self.assertEqual(deck.get_excluded_cards(), excluded_cards)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,202 @@
+"""
+determinization_batch.py と一括決定化のテスト
+"""
+
+import copy
+import random
+import unittest
+import numpy as np
+from src.models.indexed_deck import IndexedDeck
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.determinizer import Determinizer
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.move_validator import MoveValidator
+from src.controllers.random_streams import RandomStreams
+
+
+class TestDeterminizationBatch(unittest.TestCase):
+    """Determinizer.create_batch() のテスト"""
+    
+    def setUp(self):
+        random.seed(0)
+        self.game_state = GameState(seed=4)
+        for _ in range(3):
+            valid_moves = MoveValidator.get_valid_moves(self.game_state.get_hand(), self.game_state.get_field())
+            self.game_state.play_card(*valid_moves[0])
+        self.obs_state = ObservableGameState.from_game_state(self.game_state)
+        self.pool = set(self.obs_state.get_unknown_cards())
+    
+    def test_shape_and_dtype(self):
+        """K×N の int8 行列で、読み取り専用"""
+        batch = Determinizer.create_batch(self.obs_state, 16, np.random.default_rng(0))
+        
+        self.assertEqual(len(batch), 16)
+        self.assertEqual(batch.orders.shape, (16, self.obs_state.remaining_deck_size))
+        self.assertEqual(batch.orders.dtype, np.int8)
+        self.assertEqual(batch.excluded.shape, (16, len(self.pool) - self.obs_state.remaining_deck_size))
+        self.assertFalse(batch.orders.flags.writeable)
+    
+    def test_rows_partition_unknown_cards(self):
+        """各行の山札と除外カードを合わせると未知のカードに一致する"""
+        batch = Determinizer.create_batch(self.obs_state, 8, np.random.default_rng(1))
+        
+        for index in range(len(batch)):
+            deck_cards = batch.deck_cards(index)
+            excluded_cards = batch.excluded_cards(index)
+            self.assertEqual(len(set(deck_cards)), len(deck_cards))
+            self.assertEqual(set(deck_cards) | set(excluded_cards), self.pool)
+            self.assertFalse(set(deck_cards) & set(excluded_cards))
+        # 行ごとに異なる並び
+        self.assertFalse(np.array_equal(batch.orders[0], batch.orders[1]))
+    
+    def test_reproducible_with_same_generator_seed(self):
+        """同じシードの乱数生成器なら同じ行列"""
+        first = Determinizer.create_batch(self.obs_state, 4, np.random.default_rng(7))
+        second = Determinizer.create_batch(self.obs_state, 4, np.random.default_rng(7))
+        
+        np.testing.assert_array_equal(first.orders, second.orders)
+        np.testing.assert_array_equal(first.excluded, second.excluded)
+    
+    def test_respects_known_excluded_cards(self):
+        """分かっている除外カードは山札に入らず、全ての行の除外カードに含まれる"""
+        known = self.game_state.get_deck().get_excluded_cards()[:4]
+        obs_state = ObservableGameState.from_game_state(self.game_state, known_excluded_cards=known)
+        batch = Determinizer.create_batch(obs_state, 8, np.random.default_rng(2))
+        
+        for index in range(len(batch)):
+            self.assertFalse(set(known) & set(batch.deck_cards(index)))
+            self.assertTrue(set(known) <= set(batch.excluded_cards(index)))
+            self.assertEqual(len(batch.excluded_cards(index)), obs_state.excluded_cards_count)
+    
+    def test_invalid_count(self):
+        """生成数が1未満ならエラー"""
+        with self.assertRaises(ValueError):
+            Determinizer.create_batch(self.obs_state, 0)
+    
+    def test_create_state(self):
+        """行をそのまま山札とするGameStateを構築でき、観測可能状態は変わらない"""
+        batch = Determinizer.create_batch(self.obs_state, 4, np.random.default_rng(3))
+        state = batch.create_state(2)
+        
+        self.assertIsInstance(state.get_deck(), IndexedDeck)
+        self.assertEqual(state.get_hand().get_cards(), self.obs_state.hand.get_cards())
+        self.assertEqual(state.get_deck().get_remaining_cards(), batch.deck_cards(2))
+        self.assertEqual(set(state.get_unknown_cards()), self.pool)
+        
+        hand = self.obs_state.hand.get_cards()
+        valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+        state.play_card(*valid_moves[0])
+        self.assertIn(batch.deck_cards(2)[0], state.get_hand().get_cards())
+        self.assertEqual(self.obs_state.hand.get_cards(), hand)
+    
+    def test_deepcopy_is_independent(self):
+        """コピーは行を共有し、以降の引きは互いに影響しない"""
+        batch = Determinizer.create_batch(self.obs_state, 1, np.random.default_rng(4))
+        deck = batch.create_state(0).get_deck()
+        deck.draw()
+        copied = copy.deepcopy(deck)
+        copied.draw()
+        
+        self.assertIs(copied._order, deck._order)
+        self.assertEqual(copied.remaining_count(), deck.remaining_count() - 1)
+    
+    def test_engine_search(self):
+        """一括決定化でもIS-MCTS探索が合法手を返し、同じ乱数なら同じ結果"""
+        results = []
+        for _ in range(2):
+            engine = ISMCTSEngine(determinization_batch_size=32, rng=random.Random(5))
+            best_move, stats = engine.search(self.obs_state, num_iterations=100)
+            results.append((best_move, stats['total_visits']))
+        
+        valid_moves = MoveValidator.get_valid_moves(self.obs_state.hand, self.obs_state.field)
+        self.assertIn(results[0][0], valid_moves)
+        self.assertEqual(results[0][1], 100)
+        self.assertEqual(results[0], results[1])
+    
+    def _related_counts(self, batch):
+        """各行の、除外カードのうち手札または場のトップカードとスートか数値が一致するカードの枚数"""
+        field = self.obs_state.field
+        cards = self.obs_state.hand.get_cards() + [field.get_top_card(1), field.get_top_card(2)]
+        suits = {card.suit for card in cards if card is not None}
+        values = {card.value for card in cards if card is not None}
+        related = lambda card: card.suit in suits or card.value in values
+        return [sum(related(card) for card in batch.excluded_cards(index)) for index in range(len(batch))]
+    
+    def test_stratified_rows_are_valid(self):
+        """層別サンプリングでも各行は未知のカードの分割になる"""
+        batch = Determinizer.create_batch(self.obs_state, 50, np.random.default_rng(5), sampling='stratified')
+        
+        for index in range(len(batch)):
+            deck_cards = batch.deck_cards(index)
+            self.assertEqual(len(set(deck_cards)), self.obs_state.remaining_deck_size)
+            self.assertEqual(set(deck_cards) | set(batch.excluded_cards(index)), self.pool)
+    
+    def test_stratified_reduces_feature_variance(self):
+        """層別サンプリングでは、特徴量の平均がバッチごとにほとんどばらつかない"""
+        means = {}
+        for sampling in ('iid', 'stratified'):
+            means[sampling] = []
+            for seed in range(20):
+                batch = Determinizer.create_batch(
+                    self.obs_state, 100, np.random.default_rng(seed), sampling=sampling
+                )
+                means[sampling].append(np.mean(self._related_counts(batch)))
+        
+        self.assertAlmostEqual(np.mean(means['stratified']), np.mean(means['iid']), delta=0.1)
+        self.assertLess(np.var(means['stratified']) * 10, np.var(means['iid']))
+    
+    def test_antithetic_pairs_are_reversed(self):
+        """対称サンプリングでは2行ずつ互いに逆順の順列になる"""
+        batch = Determinizer.create_batch(self.obs_state, 5, np.random.default_rng(6), sampling='antithetic')
+        
+        for index in (0, 2):
+            first = batch.excluded[index].tolist() + batch.orders[index].tolist()
+            second = batch.excluded[index + 1].tolist() + batch.orders[index + 1].tolist()
+            self.assertEqual(first, second[::-1])
+        self.assertEqual(len(batch), 5)
+    
+    def test_invalid_sampling(self):
+        """未知のサンプリング方式はエラー"""
+        with self.assertRaises(ValueError):
+            Determinizer.create_batch(self.obs_state, 4, sampling='sobol')
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(determinization_sampling='sobol')
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(lazy_determinization=True, determinization_sampling='stratified')
+    
+    def test_engine_search_with_sampling(self):
+        """層別・対称サンプリングでもIS-MCTS探索が合法手を返す"""
+        valid_moves = MoveValidator.get_valid_moves(self.obs_state.hand, self.obs_state.field)
+        for sampling in ('stratified', 'antithetic'):
+            engine = ISMCTSEngine(determinization_sampling=sampling, rng=random.Random(8))
+            best_move, stats = engine.search(self.obs_state, num_iterations=60)
+            
+            self.assertIn(best_move, valid_moves)
+            self.assertEqual(stats['total_visits'], 60)
+    
+    def test_engine_search_stops_at_unplayable_child(self):
+        """別の決定化で引いたカードの手に当たっても、選択が循環せず探索が終わる"""
+        game_state = GameState(seed=0)
+        game_state.play_card(*MoveValidator.get_valid_moves(game_state.get_hand(), game_state.get_field())[0])
+        obs_state = ObservableGameState.from_game_state(game_state)
+        # 修正前は、このシードで祖先と同じ情報セットが子に登録され、選択が無限ループしていた
+        engine = ISMCTSEngine(
+            rng=RandomStreams(2026).child(0, 0).python_random(),
+            determinization_sampling='antithetic',
+            determinization_batch_size=100
+        )
+        _, stats = engine.search(obs_state, num_iterations=100)
+        
+        self.assertEqual(stats['total_visits'], 100)
+    
+    def test_engine_rejects_lazy_and_batch(self):
+        """遅延決定化と一括決定化は併用できない"""
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(lazy_determinization=True, determinization_batch_size=32)
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(determinization_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
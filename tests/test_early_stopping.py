@@ -0,0 +1,152 @@
+"""
+early_stopping.py のテスト
+"""
+
+import random
+import unittest
+from src.controllers.early_stopping import EarlyStopping
+from src.controllers.game_state import GameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.ismcts_engine import ISMCTSEngine
+
+
+class TestEarlyStopping(unittest.TestCase):
+    """EarlyStoppingクラスのテスト"""
+    
+    def _record(self, early_stopping: EarlyStopping, rewards):
+        """報酬を順に記録する"""
+        for reward in rewards:
+            early_stopping.record(reward)
+    
+    def test_invalid_arguments(self):
+        """不正な設定はエラー"""
+        with self.assertRaises(ValueError):
+            EarlyStopping(min_iterations=0)
+        with self.assertRaises(ValueError):
+            EarlyStopping(check_interval=0)
+        with self.assertRaises(ValueError):
+            EarlyStopping(confidence_z=0.0)
+    
+    def test_should_check(self):
+        """1回目と、min_iterations 回以降の check_interval 回ごとに判定する"""
+        early_stopping = EarlyStopping(min_iterations=20, check_interval=10)
+        early_stopping.reset(100)
+        checked = []
+        for iteration in range(1, 41):
+            early_stopping.record(0.0)
+            if early_stopping.should_check():
+                checked.append(iteration)
+        self.assertEqual(checked, [1, 20, 30, 40])
+    
+    def test_single_move(self):
+        """手が1つなら1回目で打ち切る"""
+        early_stopping = EarlyStopping()
+        early_stopping.reset(1000)
+        early_stopping.record(5.0)
+        
+        self.assertTrue(early_stopping.should_stop([(1, 5.0)], num_moves=1))
+        self.assertEqual(early_stopping.stop_reason, 'single_move')
+        self.assertEqual(early_stopping.iterations_saved, 999)
+    
+    def test_visit_bound(self):
+        """訪問回数の差が残りの探索回数より大きければ打ち切る"""
+        early_stopping = EarlyStopping(min_iterations=10, confidence_z=100.0)
+        early_stopping.reset(100)
+        self._record(early_stopping, [1.0, 2.0] * 40)
+        
+        # 残り20回: 差20では追いつける可能性がある
+        self.assertFalse(early_stopping.should_stop([(50, 75.0), (30, 45.0)], num_moves=2))
+        # 差21なら追いつけない
+        self.assertTrue(early_stopping.should_stop([(50, 75.0), (29, 43.5), (1, 1.5)], num_moves=3))
+        self.assertEqual(early_stopping.stop_reason, 'visit_bound')
+        self.assertEqual(early_stopping.to_dict(), {
+            'iterations': 80,
+            'iterations_saved': 20,
+            'stop_reason': 'visit_bound'
+        })
+    
+    def test_confidence(self):
+        """最良の手の信頼区間の下限が他の手の上限より大きければ打ち切る"""
+        early_stopping = EarlyStopping(min_iterations=10)
+        early_stopping.reset(1000)
+        rng = random.Random(0)
+        self._record(early_stopping, [rng.gauss(10.0, 1.0) for _ in range(100)])
+        
+        # 平均報酬の差が標準誤差に比べて十分大きい
+        self.assertTrue(early_stopping.should_stop([(60, 60 * 12.0), (40, 40 * 8.0)], num_moves=2))
+        self.assertEqual(early_stopping.stop_reason, 'confidence')
+    
+    def test_no_stop_when_close_or_untried(self):
+        """平均報酬が近い場合や、未試行の手がある場合は信頼区間では打ち切らない"""
+        early_stopping = EarlyStopping(min_iterations=10)
+        early_stopping.reset(1000)
+        rng = random.Random(0)
+        self._record(early_stopping, [rng.gauss(10.0, 3.0) for _ in range(100)])
+        
+        self.assertFalse(early_stopping.should_stop([(55, 55 * 10.2), (45, 45 * 10.0)], num_moves=2))
+        self.assertFalse(early_stopping.should_stop([(60, 60 * 12.0), (40, 40 * 8.0)], num_moves=3))
+        self.assertIsNone(early_stopping.stop_reason)
+        self.assertEqual(early_stopping.iterations_saved, 0)
+    
+    def test_reset(self):
+        """reset() で前回の探索の状態をクリアする"""
+        early_stopping = EarlyStopping()
+        early_stopping.reset(10)
+        early_stopping.record(1.0)
+        early_stopping.should_stop([(1, 1.0)], num_moves=1)
+        
+        early_stopping.reset(20)
+        self.assertEqual(early_stopping.to_dict(), {
+            'iterations': 0,
+            'iterations_saved': 0,
+            'stop_reason': None
+        })
+    
+    def test_engines_report_iterations_saved(self):
+        """両エンジンとも打ち切った探索回数を統計情報に出す"""
+        game_state = GameState(seed=3)
+        obs_state = ObservableGameState.from_game_state(game_state)
+        
+        engine = MCTSEngine(rng=random.Random(1), early_stopping=EarlyStopping())
+        best_move, root = engine.search(game_state, num_iterations=1000)
+        stats = engine.get_statistics(root)['early_stopping']
+        self.assertIsNotNone(best_move)
+        self.assertEqual(stats['iterations'], root.visits)
+        self.assertEqual(stats['iterations'] + stats['iterations_saved'], 1000)
+        self.assertIn(stats['stop_reason'], EarlyStopping.STOP_REASONS)
+        
+        ismcts_engine = ISMCTSEngine(rng=random.Random(1), early_stopping=EarlyStopping())
+        best_move, ismcts_stats = ismcts_engine.search(obs_state, num_iterations=1000)
+        stats = ismcts_stats['early_stopping']
+        self.assertIsNotNone(best_move)
+        self.assertEqual(stats['iterations'], ismcts_stats['total_visits'])
+        self.assertEqual(stats['iterations'] + stats['iterations_saved'], 1000)
+        self.assertIn(stats['stop_reason'], EarlyStopping.STOP_REASONS)
+    
+    def test_engine_single_move(self):
+        """手が1つの局面では1回探索しただけで打ち切る"""
+        # シード0の局面で先頭の代表手を3手指すと、代表手が1つだけになる
+        game_state = GameState(seed=0)
+        for _ in range(3):
+            game_state.play_card(*MoveValidator.get_canonical_moves(game_state.get_hand(), game_state.get_field())[0])
+        valid_moves = MoveValidator.get_canonical_moves(game_state.get_hand(), game_state.get_field())
+        self.assertEqual(len(valid_moves), 1)
+        
+        engine = MCTSEngine(rng=random.Random(1), early_stopping=EarlyStopping())
+        best_move, root = engine.search(game_state, num_iterations=500)
+        self.assertEqual(best_move, valid_moves[0])
+        self.assertEqual(root.visits, 1)
+        self.assertEqual(engine.get_statistics(root)['early_stopping']['stop_reason'], 'single_move')
+    
+    def test_requires_ucb_root(self):
+        """逐次半減のルート選択とは併用できない"""
+        with self.assertRaises(ValueError):
+            MCTSEngine(root_selection='sequential_halving', early_stopping=EarlyStopping())
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(root_selection='hybrid', early_stopping=EarlyStopping())
+
+
+if __name__ == '__main__':
+    unittest.main()
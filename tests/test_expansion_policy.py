@@ -0,0 +1,85 @@
+"""
+expansion_policy.pyのテスト
+"""
+
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.models.hand import Hand
+from src.controllers.expansion_policy import ExpansionPolicy
+from src.controllers.mcts_node import MCTSNode
+from src.controllers.game_state import GameState
+
+
+class TestExpansionPolicy(unittest.TestCase):
+    """ExpansionPolicyクラスのテスト"""
+    
+    def test_invalid_parameters(self):
+        """不正なパラメータはエラー"""
+        with self.assertRaises(ValueError):
+            ExpansionPolicy(widening_constant=0)
+        with self.assertRaises(ValueError):
+            ExpansionPolicy(widening_exponent=1.5)
+    
+    def test_max_children(self):
+        """子ノード数の上限は訪問回数に応じて増える"""
+        policy = ExpansionPolicy(widening_constant=1.0, widening_exponent=0.5)
+        
+        self.assertEqual(policy.max_children(0), 1)
+        self.assertEqual(policy.max_children(1), 1)
+        self.assertEqual(policy.max_children(4), 2)
+        self.assertEqual(policy.max_children(10), 4)
+    
+    def test_can_expand(self):
+        """上限未満なら展開できる"""
+        policy = ExpansionPolicy()
+        
+        self.assertTrue(policy.can_expand(0, 0))
+        self.assertFalse(policy.can_expand(1, 1))
+        self.assertTrue(policy.can_expand(1, 4))
+    
+    def test_order_moves_most_promising_last(self):
+        """最も有望な手（柔軟性が低いカードを出す手）が末尾に来る"""
+        low_flex = Card(Suit.SUIT_A, 1)
+        high_flex = Card(Suit.SUIT_B, 2)
+        hand = Hand()
+        hand.add_card(low_flex)
+        hand.add_card(high_flex)
+        unknown_cards = [Card(Suit.SUIT_B, 3), Card(Suit.SUIT_C, 2), Card(Suit.SUIT_D, 4)]
+        
+        moves = [(low_flex, 1), (high_flex, 1)]
+        ordered = ExpansionPolicy().order_moves(moves, hand, unknown_cards)
+        
+        self.assertEqual(ordered[-1], (low_flex, 1))
+        self.assertEqual(len(ordered), 2)
+    
+    def test_order_moves_keeps_original_order_on_tie(self):
+        """同点の場合は元の順序で先にある手から展開される"""
+        card = Card(Suit.SUIT_A, 1)
+        hand = Hand()
+        hand.add_card(card)
+        
+        moves = [(card, 1), (card, 2)]
+        ordered = ExpansionPolicy().order_moves(moves, hand, [])
+        
+        self.assertEqual(ordered.pop(), (card, 1))
+    
+    def test_node_progressive_widening(self):
+        """訪問回数が少ないうちは子ノードが1つに制限される"""
+        state = GameState(seed=42)
+        node = MCTSNode(state, expansion_policy=ExpansionPolicy())
+        
+        self.assertFalse(node.is_fully_expanded())
+        node.expand()
+        node.visits = 1
+        
+        # 未試行の手は残っているが、上限に達しているので展開済みとみなす
+        self.assertGreater(len(node.untried_moves), 0)
+        self.assertTrue(node.is_fully_expanded())
+        
+        node.visits = 4
+        self.assertFalse(node.is_fully_expanded())
+
+
+if __name__ == '__main__':
+    unittest.main()
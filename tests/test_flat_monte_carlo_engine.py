@@ -0,0 +1,106 @@
+"""
+flat_monte_carlo_engine.py のテスト
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.rollout_policy import RolloutPolicy
+from src.controllers.determinizer import Determinizer
+from src.controllers.flat_monte_carlo_engine import FlatMonteCarloEngine
+
+
+class TestFlatMonteCarloEngine(unittest.TestCase):
+    """FlatMonteCarloEngineクラスのテスト"""
+    
+    def setUp(self):
+        random.seed(0)
+        game_state = GameState(seed=4)
+        for _ in range(3):
+            valid_moves = MoveValidator.get_valid_moves(game_state.get_hand(), game_state.get_field())
+            game_state.play_card(*valid_moves[0])
+        self.obs_state = ObservableGameState.from_game_state(game_state)
+        self.canonical_moves = MoveValidator.get_canonical_moves(self.obs_state.hand, self.obs_state.field)
+    
+    def test_search_returns_valid_move(self):
+        """ロールアウトの予算を手の数で割った数の世界で、全ての代表手を評価する"""
+        engine = FlatMonteCarloEngine(rng=random.Random(1))
+        best_move, stats = engine.search(self.obs_state, num_iterations=200)
+        
+        num_moves = len(self.canonical_moves)
+        self.assertIn(best_move, self.canonical_moves)
+        self.assertEqual(stats['num_worlds'], 200 // num_moves)
+        self.assertEqual(stats['total_rollouts'], stats['num_worlds'] * num_moves)
+        self.assertEqual({move_stats['move'] for move_stats in stats['moves']}, set(self.canonical_moves))
+    
+    def test_paired_statistics(self):
+        """手の統計は平均報酬の降順で、最良の手との差は0以下"""
+        engine = FlatMonteCarloEngine(rng=random.Random(2))
+        stats = engine.evaluate(self.obs_state, num_worlds=30)
+        moves = stats['moves']
+        
+        self.assertEqual(moves[0]['move'], stats['best_move'])
+        self.assertEqual(moves[0]['diff_to_best'], 0.0)
+        self.assertEqual(moves[0]['diff_std_error'], 0.0)
+        self.assertAlmostEqual(moves[0]['mean_reward'], stats['best_move_reward'])
+        for previous, current in zip(moves, moves[1:]):
+            self.assertGreaterEqual(previous['mean_reward'], current['mean_reward'])
+            self.assertLessEqual(current['diff_to_best'], 0.0)
+            self.assertAlmostEqual(
+                current['diff_to_best'], current['mean_reward'] - stats['best_move_reward']
+            )
+    
+    def test_common_random_numbers(self):
+        """同じ手を2回評価すると、同じ世界・同じ乱数なので報酬の差はちょうど0"""
+        move = self.canonical_moves[0]
+        engine = FlatMonteCarloEngine(rng=random.Random(3))
+        engine._get_moves = lambda observable_state: [move, move]
+        stats = engine.evaluate(self.obs_state, num_worlds=20)
+        
+        self.assertEqual(stats['moves'][1]['diff_to_best'], 0.0)
+        self.assertEqual(stats['moves'][1]['diff_std_error'], 0.0)
+    
+    def test_reproducible_and_restores_policy_rng(self):
+        """同じ乱数なら同じ結果になり、ロールアウト方策の乱数は元に戻る"""
+        policy_rng = random.Random(9)
+        results = []
+        for _ in range(2):
+            policy = RolloutPolicy(policy_rng)
+            engine = FlatMonteCarloEngine(rollout_policy=policy, rng=random.Random(4))
+            results.append(engine.evaluate(self.obs_state, num_worlds=10)['moves'])
+            self.assertIs(policy.rng, policy_rng)
+        
+        self.assertEqual(results[0], results[1])
+    
+    def test_time_limit_uses_completed_worlds(self):
+        """時間制限では、全ての手を評価し終えた世界だけを使う"""
+        engine = FlatMonteCarloEngine(rng=random.Random(5))
+        stats = engine.evaluate(self.obs_state, num_worlds=100000, time_limit=0.01)
+        
+        self.assertGreaterEqual(stats['num_worlds'], 1)
+        self.assertLess(stats['num_worlds'], 100000)
+        self.assertEqual(stats['total_rollouts'], stats['num_worlds'] * len(self.canonical_moves))
+    
+    def test_time_limit_caps_world_batch(self):
+        """時間制限がある場合、世界は予算の数ではなく上限の数ずつ生成する"""
+        engine = FlatMonteCarloEngine(rng=random.Random(5))
+        
+        with patch.object(Determinizer, 'create_batch', wraps=Determinizer.create_batch) as create_batch:
+            stats = engine.search(self.obs_state, num_iterations=1_000_000, time_limit=0.0)[1]
+        
+        self.assertEqual(create_batch.call_args.args[1], FlatMonteCarloEngine.TIME_LIMIT_BATCH_SIZE)
+        self.assertEqual(stats['num_worlds'], 1)
+    
+    def test_invalid_arguments(self):
+        """世界の数・サンプリング方式が不正ならエラー"""
+        with self.assertRaises(ValueError):
+            FlatMonteCarloEngine(determinization_sampling='sobol')
+        with self.assertRaises(ValueError):
+            FlatMonteCarloEngine().evaluate(self.obs_state, num_worlds=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -136,6 +136,31 @@ class TestFlexibilityCalculator(unittest.TestCase):
         # 残りの手札 (SUIT_B:3, SUIT_C:7) の柔軟性は 1 + 1 = 2
         self.assertEqual(remaining_flex, 2)
     
+    def test_evaluate_moves_flexibility_matches_single(self):
+        """まとめて評価した結果が1手ずつの評価と一致する"""
+        hand = Hand()
+        hand.add_card(Card(Suit.SUIT_A, 5))
+        hand.add_card(Card(Suit.SUIT_B, 3))
+        hand.add_card(Card(Suit.SUIT_C, 5))
+        
+        unknown_cards = [
+            Card(Suit.SUIT_A, 1),
+            Card(Suit.SUIT_B, 5),
+            Card(Suit.SUIT_D, 3),
+            Card(Suit.SUIT_E, 9),
+        ]
+        moves = [(card, 1) for card in hand.get_cards()] + [(Card(Suit.SUIT_A, 5), 2)]
+        
+        evaluations = FlexibilityCalculator.evaluate_moves_flexibility(
+            moves, hand, unknown_cards
+        )
+        
+        for card, slot in moves:
+            expected = FlexibilityCalculator.evaluate_move_flexibility(
+                card, slot, hand, unknown_cards
+            )
+            self.assertEqual(evaluations[(card, slot)], expected)
+    
     def test_get_card_compatibility_details(self):
         """互換性詳細情報の取得"""
         card = Card(Suit.SUIT_A, 5)
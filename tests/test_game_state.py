@@ -147,6 +147,17 @@ class TestGameState(unittest.TestCase):
         self.assertIn("Hand", state_str)
         self.assertIn("Field", state_str)
     
+    def test_get_unknown_cards(self):
+        """未知のカードは全80枚から手札と場に出したカードを除いたもの"""
+        game_state = GameState(seed=42)
+        game_state.play_card(game_state.get_hand().get_cards()[0], 1)
+        
+        unknown_cards = game_state.get_unknown_cards()
+        known_cards = set(game_state.get_hand().get_cards()) | set(game_state.get_played_cards())
+        
+        self.assertEqual(len(unknown_cards), 80 - len(known_cards))
+        self.assertTrue(known_cards.isdisjoint(unknown_cards))
+    
     def test_initialization_with_initial_hand(self):
         """指定した初期手札でゲーム状態を初期化するテスト"""
         # 除外カードと初期手札を指定
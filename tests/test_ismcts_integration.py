@@ -3,13 +3,17 @@ IS-MCTS統合テスト
 実際のゲーム状況でIS-MCTSが正しく動作するかを確認
 """
 
+import random
 import unittest
+from unittest.mock import patch
 from src.models.card import Card
 from src.models.suit import Suit
 from src.controllers.game_state import GameState
 from src.controllers.observable_game_state import ObservableGameState
 from src.controllers.determinizer import Determinizer
 from src.controllers.information_set import InformationSet
+from src.controllers.ismcts_node import ISMCTSNode
+from src.controllers.move_validator import MoveValidator
 from src.controllers.ismcts_engine import ISMCTSEngine
 from src.controllers.ismcts_strategy import ISMCTSStrategy
 
@@ -54,6 +58,31 @@ class TestISMCTSIntegration(unittest.TestCase):
         expected_count = 80 - len(obs_state.hand.get_cards()) - len(obs_state.played_cards)
         self.assertEqual(unplayed_count, expected_count)
     
+    def test_determinization_respects_known_excluded_cards(self):
+        """分かっている除外カードは常に除外され、観測と矛盾する決定化は生成されない"""
+        game_state = GameState(seed=42)
+        excluded_cards = game_state.get_deck().get_excluded_cards()
+        
+        for known_count in (3, 10):
+            known = excluded_cards[:known_count]
+            obs_state = ObservableGameState.from_game_state(game_state, known_excluded_cards=known)
+            for det_state in (
+                Determinizer.create_determinization(obs_state, seed=known_count),
+                Determinizer.create_lazy_determinization(obs_state)
+            ):
+                deck = det_state.get_deck()
+                self.assertEqual(deck.remaining_count(), obs_state.remaining_deck_size)
+                self.assertTrue(set(known) <= set(deck.get_excluded_cards()))
+                drawn = [deck.draw() for _ in range(deck.remaining_count())]
+                self.assertFalse(set(known) & set(drawn))
+            
+            # 全て分かっている場合、山札の候補は実際の山札と一致する
+            if known_count == 10:
+                self.assertEqual(
+                    set(Determinizer.create_determinization(obs_state).get_deck().get_remaining_cards()),
+                    set(game_state.get_deck().get_remaining_cards())
+                )
+    
     def test_information_set_from_game_state(self):
         """ゲーム状態から情報セットを正しく生成できる"""
         game_state = GameState(seed=42)
@@ -119,6 +148,87 @@ class TestISMCTSIntegration(unittest.TestCase):
         print(f"    キャッシュサイズ: {stats['info_set_cache_size']}")
         print(f"    最良の手: {stats['best_move']}")
     
+    def test_unplayable_move_does_not_advance(self):
+        """この決定化では指せない手の子ノードへは進まず、未試行の手は後に回す（木の循環・無限ループの回帰テスト）"""
+        obs_state = ObservableGameState.from_game_state(GameState(seed=42))
+        state = Determinizer.create_determinization(obs_state, rng=random.Random(0))
+        engine = ISMCTSEngine(rng=random.Random(0))
+        root = engine._get_or_create_node(engine._get_information_set_from_observable(obs_state))
+        # 山札のカードは手札に無いので、この決定化では指せない（別の決定化で引いたカードの手）
+        unplayable_move = (state.get_deck().get_remaining_cards()[0], 1)
+        
+        root.initialize_untried_moves([unplayable_move])
+        node, expanded_state = engine._expand(root, state)
+        self.assertIs(node, root)
+        self.assertIs(expanded_state, state)
+        self.assertEqual(root.untried_moves, [unplayable_move])
+        self.assertEqual(root.children, {})
+        
+        # 展開済みの子ノードが指せない手だけの場合、選択はその手前で止まる
+        child = ISMCTSNode(root.info_set, parent=root, move=unplayable_move)
+        root.untried_moves = []
+        root.children[unplayable_move] = child
+        root.visits = child.visits = 1
+        node, selected_state = engine._select(root, state)
+        self.assertIs(node, root)
+        self.assertEqual(selected_state.get_hand().get_cards(), state.get_hand().get_cards())
+    
+    def test_ismcts_engine_time_limit(self):
+        """時間予算を超えたら探索回数の途中でも終了する"""
+        game_state = GameState(seed=42)
+        obs_state = ObservableGameState.from_game_state(
+            game_state,
+            game_state.get_played_cards()
+        )
+        
+        engine = ISMCTSEngine(verbose=False)
+        best_move, stats = engine.search(obs_state, num_iterations=100000, time_limit=0.0)
+        
+        self.assertIsNotNone(best_move)
+        self.assertEqual(stats['total_visits'], 1)
+    
+    def test_time_limit_caps_determinization_batch(self):
+        """時間制限がある場合、一括決定化は探索回数ではなく上限の数ずつ生成する"""
+        obs_state = ObservableGameState.from_game_state(GameState(seed=42))
+        engine = ISMCTSEngine(rng=random.Random(0), determinization_sampling='stratified')
+        
+        with patch.object(Determinizer, 'create_batch', wraps=Determinizer.create_batch) as create_batch:
+            engine.search(obs_state, num_iterations=1_000_000, time_limit=0.0)
+        
+        self.assertEqual(create_batch.call_args.args[1], ISMCTSEngine.TIME_LIMIT_BATCH_SIZE)
+    
+    def test_ismcts_engine_root_selection(self):
+        """逐次半減とハイブリッドでも、全ての代表手を試して有効な手を返す"""
+        game_state = GameState(seed=42)
+        obs_state = ObservableGameState.from_game_state(
+            game_state,
+            game_state.get_played_cards()
+        )
+        root_moves = MoveValidator.get_canonical_moves(obs_state.hand, obs_state.field)
+        
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(root_selection='unknown')
+        
+        for root_selection in ('sequential_halving', 'hybrid'):
+            with self.subTest(root_selection=root_selection):
+                engine = ISMCTSEngine(rng=random.Random(7), root_selection=root_selection)
+                best_move, stats = engine.search(obs_state, num_iterations=150)
+                
+                self.assertIn(best_move, root_moves)
+                self.assertEqual(stats['best_move'], best_move)
+                self.assertEqual(stats['total_visits'], 150)
+                self.assertEqual(stats['num_children'], len(root_moves))
+                
+                root_info_set = engine._get_information_set_from_observable(obs_state)
+                root = engine.info_set_tree[root_info_set]
+                grandchildren = sum(len(child.children) for child in root.children.values())
+                if root_selection == 'sequential_halving':
+                    # 木は伸ばさない（ノードはルートと子だけ）
+                    self.assertEqual(grandchildren, 0)
+                    self.assertEqual(stats['info_set_cache_size'], len(root_moves) + 1)
+                else:
+                    self.assertGreater(grandchildren, 0)
+    
     def test_ismcts_strategy_interface(self):
         """ISMCTSStrategyインターフェースが正しく動作する"""
         # ゲーム状態を作成
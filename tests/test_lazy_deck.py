@@ -0,0 +1,114 @@
+"""
+lazy_deck.py と遅延決定化のテスト
+"""
+
+import copy
+import random
+import unittest
+from collections import Counter
+from src.models.card import Card
+from src.models.suit import Suit
+from src.models.lazy_deck import LazyDeck
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.determinizer import Determinizer
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.move_validator import MoveValidator
+
+
+class TestLazyDeck(unittest.TestCase):
+    """LazyDeckクラスのテスト"""
+    
+    def setUp(self):
+        random.seed(0)
+        self.pool = tuple(Card(suit, value) for suit in Suit for value in range(1, 4))
+    
+    def test_invalid_deck_size(self):
+        """山札の枚数が未知のカードより多ければエラー"""
+        with self.assertRaises(ValueError):
+            LazyDeck(self.pool, len(self.pool) + 1)
+    
+    def test_draws_distinct_cards_from_pool(self):
+        """山札の枚数だけ、未知のカードから重複なく引ける"""
+        deck = LazyDeck(self.pool, 20)
+        drawn = [deck.draw() for _ in range(20)]
+        
+        self.assertEqual(len(set(drawn)), 20)
+        self.assertTrue(set(drawn) <= set(self.pool))
+        self.assertTrue(deck.is_empty())
+        self.assertIsNone(deck.draw())
+        # 引かれなかった4枚が暗黙の除外カード
+        self.assertEqual(set(deck.get_remaining_cards()), set(self.pool) - set(drawn))
+        self.assertEqual(deck.get_excluded_cards(), [])
+    
+    def test_deepcopy_is_independent(self):
+        """コピーは未知のカードの列を共有し、以降の引きは互いに影響しない"""
+        deck = LazyDeck(self.pool, 20)
+        deck.draw()
+        copied = copy.deepcopy(deck)
+        copied_drawn = {copied.draw() for _ in range(10)}
+        
+        self.assertIs(copied._unknown_cards, deck._unknown_cards)
+        self.assertEqual(deck.remaining_count(), 19)
+        self.assertEqual(copied.remaining_count(), 9)
+        self.assertEqual(len(copied_drawn), 10)
+        self.assertEqual(len(deck.get_remaining_cards()), len(self.pool) - 1)
+    
+    def test_draws_are_uniform(self):
+        """2枚目に引くカードも未知のカードから一様に選ばれる"""
+        counts = Counter()
+        trials = 24000
+        for _ in range(trials):
+            deck = LazyDeck(self.pool, 20)
+            deck.draw()
+            counts[deck.draw()] += 1
+        
+        expected = trials / len(self.pool)
+        for card in self.pool:
+            self.assertAlmostEqual(counts[card] / expected, 1.0, delta=0.15)
+
+
+class TestLazyDeterminization(unittest.TestCase):
+    """遅延決定化のテスト"""
+    
+    def setUp(self):
+        random.seed(0)
+        game_state = GameState(seed=4)
+        for _ in range(3):
+            valid_moves = MoveValidator.get_valid_moves(game_state.get_hand(), game_state.get_field())
+            game_state.play_card(*valid_moves[0])
+        self.obs_state = ObservableGameState.from_game_state(game_state)
+    
+    def test_matches_eager_determinization(self):
+        """山札の枚数・未知のカードは通常の決定化と同じ"""
+        lazy_state = Determinizer.create_lazy_determinization(self.obs_state)
+        eager_state = Determinizer.create_determinization(self.obs_state)
+        
+        self.assertEqual(lazy_state.get_deck().remaining_count(), eager_state.get_deck().remaining_count())
+        self.assertEqual(set(lazy_state.get_unknown_cards()), set(eager_state.get_unknown_cards()))
+        self.assertEqual(lazy_state.get_hand().get_cards(), self.obs_state.hand.get_cards())
+        self.assertEqual(lazy_state.get_played_cards(), self.obs_state.get_played_cards())
+    
+    def test_does_not_modify_observable_state(self):
+        """決定化でプレイしても観測可能状態は変わらない"""
+        lazy_state = Determinizer.create_lazy_determinization(self.obs_state)
+        hand = self.obs_state.hand.get_cards()
+        played = self.obs_state.get_played_cards()
+        valid_moves = MoveValidator.get_valid_moves(lazy_state.get_hand(), lazy_state.get_field())
+        lazy_state.play_card(*valid_moves[0])
+        
+        self.assertEqual(self.obs_state.hand.get_cards(), hand)
+        self.assertEqual(self.obs_state.get_played_cards(), played)
+    
+    def test_engine_search(self):
+        """遅延決定化でもIS-MCTS探索が合法手を返す"""
+        engine = ISMCTSEngine(lazy_determinization=True)
+        best_move, stats = engine.search(self.obs_state, num_iterations=100)
+        
+        valid_moves = MoveValidator.get_valid_moves(self.obs_state.hand, self.obs_state.field)
+        self.assertIn(best_move, valid_moves)
+        self.assertEqual(stats['total_visits'], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -134,6 +134,50 @@ class TestMCTSEngine(unittest.TestCase):
         # 何かしらの手が返される
         self.assertIsNotNone(best_move1)
         self.assertIsNotNone(best_move2)
+    
+    def test_search_time_limit(self):
+        """時間予算を超えたら探索回数の途中でも終了する"""
+        engine = MCTSEngine(simulation_seed=42)
+        
+        best_move, root = engine.search(GameState(seed=42), num_iterations=100000, time_limit=0.0)
+        
+        # 最低1回は探索してから終了する
+        self.assertIsNotNone(best_move)
+        self.assertEqual(root.visits, 1)
+    
+    def test_invalid_root_selection(self):
+        """未知のroot_selectionはエラー"""
+        with self.assertRaises(ValueError):
+            MCTSEngine(root_selection='unknown')
+    
+    def test_sequential_halving_root(self):
+        """逐次半減: ルートの手を全て展開し、子から直接ロールアウトする"""
+        state = GameState(seed=42)
+        engine = MCTSEngine(simulation_seed=42, root_selection='sequential_halving')
+        
+        best_move, root = engine.search(state, num_iterations=100)
+        
+        self.assertEqual(root.visits, 100)
+        self.assertEqual(len(root.untried_moves), 0)
+        self.assertIn(best_move, [child.move for child in root.children])
+        # 木は伸ばさない
+        self.assertTrue(all(len(child.children) == 0 for child in root.children))
+        # 全ての手を少なくとも1回は試す
+        self.assertTrue(all(child.visits > 0 for child in root.children))
+        # 統計の最良の手も逐次半減で決めた手
+        self.assertEqual(engine.get_statistics(root)['best_move'], best_move)
+    
+    def test_hybrid_root(self):
+        """ハイブリッド: ルートは逐次半減、その下はUCB1で木を伸ばす"""
+        state = GameState(seed=42)
+        engine = MCTSEngine(simulation_seed=42, root_selection='hybrid')
+        
+        best_move, root = engine.search(state, num_iterations=200)
+        
+        self.assertEqual(root.visits, 200)
+        self.assertIn(best_move, [child.move for child in root.children])
+        self.assertTrue(any(len(child.children) > 0 for child in root.children))
+        self.assertEqual(engine.get_statistics(root)['best_move'], best_move)
 
 
 if __name__ == '__main__':
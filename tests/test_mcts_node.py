@@ -167,6 +167,24 @@ class TestMCTSNode(unittest.TestCase):
         self.assertIn("MCTSNode", node_str)
         self.assertIn("visits=5", node_str)
         self.assertIn("10.5", node_str)
+    
+    def test_deduplicate_moves_on_empty_field(self):
+        """空の場では同値な手がまとめられ、分岐数が半分になる"""
+        state = GameState(seed=42)
+        
+        node = MCTSNode(state)
+        raw_node = MCTSNode(state, deduplicate_moves=False)
+        
+        self.assertEqual(len(node.untried_moves) * 2, len(raw_node.untried_moves))
+    
+    def test_expand_propagates_deduplicate_setting(self):
+        """子ノードにも重複除去の設定が引き継がれる"""
+        state = GameState(seed=42)
+        node = MCTSNode(state, deduplicate_moves=False)
+        
+        child = node.expand()
+        
+        self.assertFalse(child.deduplicate_moves)
 
 
 if __name__ == '__main__':
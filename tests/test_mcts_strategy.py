@@ -2,6 +2,7 @@
 MCTSStrategy クラスのユニットテスト
 """
 
+import random
 import unittest
 from src.controllers.mcts_strategy import MCTSStrategy
 from src.controllers.game_state import GameState
@@ -142,14 +143,12 @@ class TestMCTSStrategy(unittest.TestCase):
     
     def test_reproducibility(self):
         """同じシードで再現性があることを確認"""
-        strategy = MCTSStrategy(num_iterations=100, verbose=False)
-        
-        # 同じシードで2回プレイ
-        state1 = GameState(seed=999)
-        result1 = strategy.play_game(state1)
+        # 同じシード（山札・探索の乱数）で2回プレイ（GameStateのシードはグローバル乱数を初期化しない）
+        strategy1 = MCTSStrategy(num_iterations=100, verbose=False, rng=random.Random(999))
+        result1 = strategy1.play_game(GameState(seed=999))
         
-        state2 = GameState(seed=999)
-        result2 = strategy.play_game(state2)
+        strategy2 = MCTSStrategy(num_iterations=100, verbose=False, rng=random.Random(999))
+        result2 = strategy2.play_game(GameState(seed=999))
         
         # 同じ結果が得られるはず
         self.assertEqual(result1['cards_played'], result2['cards_played'])
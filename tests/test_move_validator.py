@@ -148,6 +148,63 @@ class TestMoveValidator(unittest.TestCase):
         self.assertIn((Card(Suit.SUIT_A, 5), 1), valid_moves)
         self.assertIn((Card(Suit.SUIT_A, 5), 2), valid_moves)
 
+    
+    def test_get_canonical_moves_empty_field(self):
+        """両スロットが空の場合、スロット違いの手は1つにまとめられる"""
+        hand = Hand()
+        hand.add_card(Card(Suit.SUIT_A, 1))
+        hand.add_card(Card(Suit.SUIT_B, 2))
+        hand.add_card(Card(Suit.SUIT_C, 3))
+        
+        field = Field()
+        
+        canonical_moves = MoveValidator.get_canonical_moves(hand, field)
+        
+        # 3枚のカード × 1スロット = 3通りの代表手
+        self.assertEqual(len(canonical_moves), 3)
+        self.assertEqual({slot for _, slot in canonical_moves}, {1})
+    
+    def test_get_canonical_moves_keeps_distinct_moves(self):
+        """結果のトップカードの組が異なる手はまとめない"""
+        hand = Hand()
+        hand.add_card(Card(Suit.SUIT_A, 5))
+        
+        field = Field()
+        field.place_card(1, Card(Suit.SUIT_A, 1))
+        field.place_card(2, Card(Suit.SUIT_B, 5))
+        
+        canonical_moves = MoveValidator.get_canonical_moves(hand, field)
+        
+        # (A5, B5) と (A1, A5) は異なる組なので両方残る
+        self.assertEqual(len(canonical_moves), 2)
+    
+    def test_get_canonical_moves_one_slot_occupied(self):
+        """片方のスロットだけ空の場合はまとめない"""
+        hand = Hand()
+        hand.add_card(Card(Suit.SUIT_A, 2))
+        
+        field = Field()
+        field.place_card(1, Card(Suit.SUIT_A, 5))
+        
+        canonical_moves = MoveValidator.get_canonical_moves(hand, field)
+        
+        self.assertEqual(len(canonical_moves), 2)
+    
+    def test_get_canonical_moves_both_slots_occupied(self):
+        """両スロットにカードがある局面では何もまとめない（まとまるのは最初の1手だけ）"""
+        hand = Hand()
+        hand.add_card(Card(Suit.SUIT_A, 5))
+        hand.add_card(Card(Suit.SUIT_B, 1))
+        
+        field = Field()
+        field.place_card(1, Card(Suit.SUIT_A, 1))
+        field.place_card(2, Card(Suit.SUIT_B, 5))
+        
+        self.assertEqual(
+            MoveValidator.get_canonical_moves(hand, field),
+            MoveValidator.get_valid_moves(hand, field)
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
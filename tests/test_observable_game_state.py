@@ -18,8 +18,11 @@ class TestObservableGameState(unittest.TestCase):
         self.assertEqual(len(obs_state.get_played_cards()), 0)
         self.assertEqual(obs_state.get_total_points(), 0)
         self.assertEqual(obs_state.turn_count, 0)
-        self.assertEqual(obs_state.remaining_deck_size, 65)  # 70 - 5
+        # 山札の残り枚数は導出される（手札0枚なので 80 - 10）
+        self.assertEqual(obs_state.remaining_deck_size, 70)
         self.assertEqual(obs_state.excluded_cards_count, 10)
+        self.assertEqual(obs_state.known_excluded_cards, frozenset())
+        self.assertEqual(ObservableGameState.from_game_state(GameState(seed=1)).remaining_deck_size, 65)
     
     def test_from_game_state(self):
         """GameStateからの変換テスト"""
@@ -106,6 +109,29 @@ class TestObservableGameState(unittest.TestCase):
         self.assertEqual(len(obs_state.get_hand().get_cards()), 2)
         self.assertEqual(len(copied.get_hand().get_cards()), 1)  # コピーは変わらない
 
+    def test_known_excluded_cards(self):
+        """分かっている除外カードは未知のカードに含まれない"""
+        game_state = GameState(seed=3)
+        excluded_cards = game_state.get_deck().get_excluded_cards()
+        obs_state = ObservableGameState.from_game_state(game_state, known_excluded_cards=excluded_cards[:4])
+        
+        unknown_cards = obs_state.get_unknown_cards()
+        self.assertEqual(len(unknown_cards), 75 - 4)
+        for card in excluded_cards[:4]:
+            self.assertNotIn(card, unknown_cards)
+        self.assertEqual(obs_state.remaining_deck_size, 65)
+        self.assertEqual(obs_state.copy().known_excluded_cards, frozenset(excluded_cards[:4]))
+    
+    def test_invalid_known_excluded_cards(self):
+        """手札と重なる・除外枚数を超える除外カードはエラー"""
+        game_state = GameState(seed=3)
+        obs_state = ObservableGameState.from_game_state(game_state)
+        
+        with self.assertRaises(ValueError):
+            obs_state.known_excluded_cards = game_state.get_hand().get_cards()[:1]
+        with self.assertRaises(ValueError):
+            obs_state.known_excluded_cards = game_state.get_deck().get_remaining_cards()[:11]
+    
     def test_repr(self):
         """文字列表現のテスト"""
         obs_state = ObservableGameState()
@@ -0,0 +1,105 @@
+"""
+played_card_log.pyのテスト
+"""
+
+import copy
+import pickle
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.models.played_card_log import PlayedCardLog
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.move_validator import MoveValidator
+
+
+class TestPlayedCardLog(unittest.TestCase):
+    """PlayedCardLogクラスのテスト"""
+    
+    def setUp(self):
+        self.cards = [Card(Suit.SUIT_A, 1), Card(Suit.SUIT_B, 5), Card(Suit.SUIT_H, 10)]
+    
+    def test_log_and_mask_stay_in_sync(self):
+        """ログとビットマスクが同時に更新される"""
+        log = PlayedCardLog(self.cards)
+        
+        self.assertEqual(log.to_list(), self.cards)
+        self.assertEqual(len(log), 3)
+        self.assertEqual(log.mask, PlayedCardLog.mask_of(self.cards))
+        self.assertIn(Card(Suit.SUIT_B, 5), log)
+        self.assertNotIn(Card(Suit.SUIT_B, 6), log)
+        self.assertEqual(PlayedCardLog.card_bit(Card(Suit.SUIT_A, 1)), 1)
+        self.assertEqual(PlayedCardLog.card_bit(Card(Suit.SUIT_H, 10)), 1 << 79)
+    
+    def test_view_is_independent(self):
+        """スナップショットと元の記録は、以降の追記で互いに影響しない"""
+        log = PlayedCardLog(self.cards[:1])
+        view = log.view()
+        other_view = log.view()
+        log.append(self.cards[1])
+        view.append(self.cards[2])
+        other_view.append(self.cards[1])
+        
+        self.assertEqual(log.to_list(), self.cards[:2])
+        self.assertEqual(view.to_list(), [self.cards[0], self.cards[2]])
+        self.assertEqual(other_view.to_list(), self.cards[:2])
+        self.assertNotIn(self.cards[2], log)
+    
+    def test_equality(self):
+        """記録同士・リストと比較できる"""
+        log = PlayedCardLog(self.cards)
+        
+        self.assertEqual(log, PlayedCardLog(self.cards))
+        self.assertEqual(log, self.cards)
+        self.assertNotEqual(log, PlayedCardLog(reversed(self.cards)))
+        self.assertEqual(log[0], self.cards[0])
+    
+    def test_copy_and_pickle(self):
+        """deepcopy・pickleで同じ記録を復元できる"""
+        log = PlayedCardLog(self.cards)
+        
+        for restored in (copy.deepcopy(log), pickle.loads(pickle.dumps(log))):
+            self.assertEqual(restored, log)
+            self.assertEqual(restored.mask, log.mask)
+
+
+class TestPlayedCardLogInStates(unittest.TestCase):
+    """GameState / ObservableGameStateでの記録のテスト"""
+    
+    def setUp(self):
+        self.state = GameState(seed=4)
+        for _ in range(3):
+            valid_moves = MoveValidator.get_valid_moves(self.state.get_hand(), self.state.get_field())
+            self.state.play_card(*valid_moves[0])
+    
+    def test_play_card_updates_log(self):
+        """カードを出すとログとビットマスクが更新される"""
+        played = self.state.get_played_cards()
+        
+        self.assertEqual(len(played), 3)
+        self.assertEqual(self.state.played_cards.mask, PlayedCardLog.mask_of(played))
+    
+    def test_observable_state_shares_log(self):
+        """観測可能状態はGameStateの記録を共有し、以降の手の影響を受けない"""
+        obs_state = ObservableGameState.from_game_state(self.state)
+        played = self.state.get_played_cards()
+        valid_moves = MoveValidator.get_valid_moves(self.state.get_hand(), self.state.get_field())
+        self.state.play_card(*valid_moves[0])
+        
+        self.assertEqual(obs_state.get_played_cards(), played)
+        self.assertEqual(len(self.state.played_cards), 4)
+        for card in obs_state.get_unknown_cards():
+            self.assertNotIn(card, played)
+    
+    def test_list_assignment(self):
+        """リストを代入すると記録に変換される"""
+        obs_state = ObservableGameState()
+        obs_state.played_cards = [Card(Suit.SUIT_C, 3)]
+        
+        self.assertIsInstance(obs_state.played_cards, PlayedCardLog)
+        self.assertIn(Card(Suit.SUIT_C, 3), obs_state.played_cards)
+        self.assertEqual(len(obs_state.get_unknown_cards()), 79)
+
+
+if __name__ == '__main__':
+    unittest.main()
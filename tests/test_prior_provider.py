@@ -0,0 +1,67 @@
+"""
+prior_provider.py / heuristic_prior_provider.pyのテスト
+"""
+
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.models.hand import Hand
+from src.controllers.prior_provider import PriorProvider
+from src.controllers.heuristic_prior_provider import HeuristicPriorProvider
+
+
+class TestPriorProvider(unittest.TestCase):
+    """PriorProviderクラスのテスト"""
+    
+    def test_uniform_priors(self):
+        """既定の実装は一様分布"""
+        moves = [(Card(Suit.SUIT_A, 1), 1), (Card(Suit.SUIT_B, 2), 1)]
+        
+        priors = PriorProvider().get_priors(moves, Hand(), [])
+        
+        self.assertEqual(priors, {moves[0]: 0.5, moves[1]: 0.5})
+    
+    def test_empty_moves(self):
+        """手が無い場合は空のマップ"""
+        self.assertEqual(PriorProvider().get_priors([], Hand(), []), {})
+
+
+class TestHeuristicPriorProvider(unittest.TestCase):
+    """HeuristicPriorProviderクラスのテスト"""
+    
+    def setUp(self):
+        self.low_flex = Card(Suit.SUIT_A, 1)
+        self.high_flex = Card(Suit.SUIT_B, 2)
+        self.hand = Hand()
+        self.hand.add_card(self.low_flex)
+        self.hand.add_card(self.high_flex)
+        self.unknown_cards = [Card(Suit.SUIT_B, 3), Card(Suit.SUIT_C, 2), Card(Suit.SUIT_D, 4)]
+        self.moves = [(self.low_flex, 1), (self.high_flex, 1)]
+    
+    def test_priors_sum_to_one(self):
+        """事前確率の合計は1"""
+        priors = HeuristicPriorProvider().get_priors(self.moves, self.hand, self.unknown_cards)
+        
+        self.assertAlmostEqual(sum(priors.values()), 1.0)
+    
+    def test_low_flexibility_card_preferred(self):
+        """柔軟性が低いカードを出す手ほど事前確率が高い"""
+        priors = HeuristicPriorProvider().get_priors(self.moves, self.hand, self.unknown_cards)
+        
+        self.assertGreater(priors[(self.low_flex, 1)], priors[(self.high_flex, 1)])
+    
+    def test_temperature_sharpens_distribution(self):
+        """温度が低いほど最良手に集中する"""
+        sharp = HeuristicPriorProvider(temperature=0.5).get_priors(self.moves, self.hand, self.unknown_cards)
+        flat = HeuristicPriorProvider(temperature=10.0).get_priors(self.moves, self.hand, self.unknown_cards)
+        
+        self.assertGreater(sharp[(self.low_flex, 1)], flat[(self.low_flex, 1)])
+    
+    def test_invalid_temperature(self):
+        """温度は正の値のみ"""
+        with self.assertRaises(ValueError):
+            HeuristicPriorProvider(temperature=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
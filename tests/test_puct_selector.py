@@ -0,0 +1,116 @@
+"""
+puct_selector.pyのテスト
+"""
+
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.controllers.puct_selector import PUCTSelector
+from src.controllers.prior_provider import PriorProvider
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+
+
+class _Child:
+    """テスト用の子ノード"""
+    
+    def __init__(self, visits: int, total_reward: float):
+        self.visits = visits
+        self.total_reward = total_reward
+
+
+class TestPUCTSelector(unittest.TestCase):
+    """PUCTSelectorクラスのテスト"""
+    
+    def setUp(self):
+        self.move_a = (Card(Suit.SUIT_A, 1), 1)
+        self.move_b = (Card(Suit.SUIT_B, 2), 1)
+        self.move_c = (Card(Suit.SUIT_C, 3), 1)
+    
+    def test_untried_move_with_highest_prior_selected_first(self):
+        """子ノードが無い場合は事前確率が最も高い未試行の手を選ぶ"""
+        selector = PUCTSelector()
+        priors = {self.move_a: 0.2, self.move_b: 0.8}
+        
+        move, child = selector.select(0, [], [self.move_a, self.move_b], priors)
+        
+        self.assertEqual(move, self.move_b)
+        self.assertIsNone(child)
+    
+    def test_prefers_better_child(self):
+        """事前確率が同じなら平均報酬が高い子を選ぶ"""
+        selector = PUCTSelector()
+        good = _Child(visits=10, total_reward=1000.0)
+        bad = _Child(visits=10, total_reward=500.0)
+        priors = {self.move_a: 0.5, self.move_b: 0.5}
+        
+        move, child = selector.select(20, [(self.move_a, bad), (self.move_b, good)], [], priors)
+        
+        self.assertEqual(move, self.move_b)
+        self.assertIs(child, good)
+    
+    def test_high_prior_untried_move_beats_poor_child(self):
+        """事前確率の高い未試行の手は、十分訪問された子より優先されうる"""
+        selector = PUCTSelector(puct_constant=2.0)
+        child = _Child(visits=50, total_reward=5000.0)
+        priors = {self.move_a: 0.1, self.move_b: 0.9}
+        
+        move, selected = selector.select(50, [(self.move_a, child)], [self.move_b], priors)
+        
+        self.assertEqual(move, self.move_b)
+        self.assertIsNone(selected)
+    
+    def test_ensure_priors_caches_on_node(self):
+        """事前確率はノードにキャッシュされ、再計算されない"""
+        class CountingProvider(PriorProvider):
+            calls = 0
+            
+            def get_priors(self, moves, hand, unknown_cards):
+                CountingProvider.calls += 1
+                return super().get_priors(moves, hand, unknown_cards)
+        
+        class Node:
+            priors = None
+        
+        selector = PUCTSelector(prior_provider=CountingProvider())
+        node = Node()
+        selector.ensure_priors(node, [self.move_a, self.move_c], None, [])
+        selector.ensure_priors(node, [self.move_a, self.move_c], None, [])
+        
+        self.assertEqual(CountingProvider.calls, 1)
+        self.assertEqual(node.priors[self.move_a], 0.5)
+    
+    def test_mcts_engine_puct_search(self):
+        """MCTSEngineでPUCT選択が動作する"""
+        state = GameState(seed=42)
+        engine = MCTSEngine(simulation_seed=42, selection='puct')
+        
+        best_move, root = engine.search(state, num_iterations=50)
+        
+        self.assertIsNotNone(best_move)
+        self.assertEqual(root.visits, 50)
+        self.assertIsNotNone(root.priors)
+    
+    def test_ismcts_engine_puct_search(self):
+        """ISMCTSEngineでPUCT選択が動作する"""
+        state = GameState(seed=42)
+        obs_state = ObservableGameState.from_game_state(state, [])
+        engine = ISMCTSEngine(selection='puct')
+        
+        best_move, stats = engine.search(obs_state, num_iterations=50)
+        
+        self.assertIsNotNone(best_move)
+        self.assertEqual(stats['total_visits'], 50)
+    
+    def test_invalid_selection(self):
+        """不明な選択方式はエラー"""
+        with self.assertRaises(ValueError):
+            MCTSEngine(selection='unknown')
+        with self.assertRaises(ValueError):
+            ISMCTSEngine(selection='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+random_streams.py と乱数生成器の注入のテスト
+"""
+
+import random
+import unittest
+from src.controllers.game import Game
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.determinizer import Determinizer
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.random_streams import RandomStreams
+from src.models.deck import Deck
+
+
+class TestRandomStreams(unittest.TestCase):
+    """RandomStreamsクラスのテスト"""
+    
+    def test_same_key_is_reproducible(self):
+        """同じシード・同じキーからは、派生の順序によらず同じ乱数列"""
+        streams = RandomStreams(42)
+        first = streams.child(3, 10).python_random().random()
+        streams.child(0).python_random()
+        again = RandomStreams(42).child(3).child(10).python_random().random()
+        
+        self.assertEqual(first, again)
+        self.assertEqual(streams.child(3, 10).key, (3, 10))
+    
+    def test_different_keys_are_independent(self):
+        """キーやシードが違えば別の乱数列"""
+        streams = RandomStreams(42)
+        seeds = {streams.child(worker).seed_int() for worker in range(100)}
+        seeds.add(RandomStreams(43).child(0).seed_int())
+        
+        self.assertEqual(len(seeds), 101)
+        self.assertNotEqual(streams.seed_int(), streams.child(0).seed_int())
+    
+    def test_numpy_generator(self):
+        """NumPyの乱数生成器も同じキーなら同じ乱数列"""
+        values1 = RandomStreams(7).child(1).numpy_generator().integers(0, 1000, size=5)
+        values2 = RandomStreams(7).child(1).numpy_generator().integers(0, 1000, size=5)
+        
+        self.assertEqual(values1.tolist(), values2.tolist())
+    
+    def test_negative_key(self):
+        """負のキーはエラー"""
+        with self.assertRaises(ValueError):
+            RandomStreams(1).child(-1)
+
+
+class TestInjectedRandom(unittest.TestCase):
+    """乱数生成器を注入したゲーム・探索のテスト"""
+    
+    def test_seed_does_not_touch_global_random(self):
+        """シード指定の山札・ゲーム・エンジンはグローバル乱数を初期化しない"""
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        Deck(seed=1)
+        Game(seed=1).simulate_random_game()
+        MCTSEngine(simulation_seed=1)
+        
+        self.assertEqual(random.random(), expected)
+    
+    def test_game_is_reproducible(self):
+        """同じシードのゲームは同じ山札・同じ結果"""
+        self.assertEqual(Game(seed=5).simulate_random_game(), Game(seed=5).simulate_random_game())
+        self.assertEqual(
+            Game(seed=5).state.get_hand().get_cards(),
+            GameState(seed=5).get_hand().get_cards()
+        )
+    
+    def test_engines_are_reproducible_with_interleaving(self):
+        """同じ乱数列のエンジンは、他の探索と交互に実行しても同じ結果"""
+        state = GameState(seed=3)
+        obs_state = ObservableGameState.from_game_state(state)
+        
+        results = []
+        for _ in range(2):
+            stream = RandomStreams(11).child(0)
+            mcts = MCTSEngine(rng=stream.python_random())
+            ismcts = ISMCTSEngine(rng=stream.child(1).python_random())
+            # 間に他の探索（グローバル乱数）が入っても影響しない
+            MCTSEngine().search(state, num_iterations=10)
+            _, root = mcts.search(state, num_iterations=30)
+            _, stats = ismcts.search(obs_state, num_iterations=30)
+            results.append((
+                [(child.move, child.visits) for child in root.children],
+                stats
+            ))
+        
+        self.assertEqual(results[0], results[1])
+    
+    def test_determinizer_rng(self):
+        """同じ乱数列の決定化は同じ山札"""
+        obs_state = ObservableGameState.from_game_state(GameState(seed=2))
+        deck1 = Determinizer.create_determinization(obs_state, rng=random.Random(4)).get_deck()
+        deck2 = Determinizer.create_determinization(obs_state, rng=random.Random(4)).get_deck()
+        
+        self.assertEqual(deck1.get_remaining_cards(), deck2.get_remaining_cards())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+recommendation_cache.pyのテスト
+"""
+
+import time
+import unittest
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.heuristic_strategy import HeuristicStrategy
+from src.controllers.move_validator import MoveValidator
+from src.controllers.recommendation_cache import RecommendationCache
+
+
+def play_first_moves(state: GameState, turns: int) -> GameState:
+    """先頭の合法手で指定手数だけ進める"""
+    for _ in range(turns):
+        valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+        if not valid_moves:
+            break
+        state.play_card(*valid_moves[0])
+    return state
+
+
+class TestRecommendationCache(unittest.TestCase):
+    """RecommendationCacheクラスのテスト"""
+    
+    def setUp(self):
+        self.cache = RecommendationCache(capacity=3)
+        self.state = play_first_moves(GameState(seed=1), 5)
+        self.recommendation = {'move': None, 'explanation': 'test', 'statistics': None}
+    
+    def test_invalid_capacity(self):
+        """容量が0以下ならエラー"""
+        with self.assertRaises(ValueError):
+            RecommendationCache(capacity=0)
+    
+    def test_observable_state_shares_key(self):
+        """GameStateとそこから構築した観測可能状態は同じキー"""
+        obs_state = ObservableGameState.from_game_state(self.state, self.state.get_played_cards())
+        
+        self.assertEqual(
+            RecommendationCache.state_key(self.state),
+            RecommendationCache.state_key(obs_state)
+        )
+    
+    def test_hidden_deck_order_is_ignored(self):
+        """山札の順序（観測できない情報）が違っても観測可能な局面キーは同じ"""
+        other = GameState.from_bytes(self.state.to_bytes())
+        other.deck._cards.reverse()
+        
+        self.assertEqual(
+            RecommendationCache.state_key(self.state),
+            RecommendationCache.state_key(other)
+        )
+    
+    def test_game_state_key_includes_hidden_deck(self):
+        """GameStateの推奨手は、山札の順序か除外カードが違うゲームには返さない"""
+        self.cache.put(self.state, 'mcts', self.recommendation, budget=500)
+        reordered = GameState.from_bytes(self.state.to_bytes())
+        reordered.deck._cards.reverse()
+        swapped = GameState.from_bytes(self.state.to_bytes())
+        swapped.deck._cards[0], swapped.deck._excluded_cards[0] = (
+            swapped.deck._excluded_cards[0], swapped.deck._cards[0]
+        )
+        obs_state = ObservableGameState.from_game_state(self.state, self.state.get_played_cards())
+        
+        self.assertIs(self.cache.get(GameState.from_bytes(self.state.to_bytes()), 'mcts', budget=500), self.recommendation)
+        self.assertIsNone(self.cache.get(reordered, 'mcts', budget=500))
+        self.assertIsNone(self.cache.get(swapped, 'mcts', budget=500))
+        self.assertIsNone(self.cache.get(obs_state, 'mcts', budget=500))
+    
+    def test_key_includes_strategy_budget_and_seed(self):
+        """戦略名・探索予算・シードが違えば別の推奨手"""
+        self.cache.put(self.state, 'mcts', self.recommendation, budget=500, seed=1)
+        
+        self.assertIs(self.cache.get(self.state, 'mcts', budget=500, seed=1), self.recommendation)
+        self.assertIsNone(self.cache.get(self.state, 'mcts', budget=1000, seed=1))
+        self.assertIsNone(self.cache.get(self.state, 'mcts', budget=500, seed=2))
+        self.assertIsNone(self.cache.get(self.state, 'heuristic', budget=500, seed=1))
+        self.assertIsNone(self.cache.get(GameState(seed=2), 'mcts', budget=500, seed=1))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+    
+    def test_lru_eviction(self):
+        """容量を超えると最も長く使われていないものから破棄"""
+        for budget in (1, 2, 3):
+            self.cache.put(self.state, 'mcts', self.recommendation, budget=budget)
+        self.cache.get(self.state, 'mcts', budget=1)
+        self.cache.put(self.state, 'mcts', self.recommendation, budget=4)
+        
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNotNone(self.cache.get(self.state, 'mcts', budget=1))
+        self.assertIsNone(self.cache.get(self.state, 'mcts', budget=2))
+    
+    def test_get_or_compute(self):
+        """2回目以降は計算しない"""
+        calls = []
+        strategy = HeuristicStrategy()
+        
+        def compute():
+            calls.append(1)
+            move = strategy.get_best_move(self.state)
+            return {'move': move, 'explanation': strategy.explain(), 'statistics': None}
+        
+        first = self.cache.get_or_compute(self.state, 'heuristic', compute)
+        second = self.cache.get_or_compute(self.state, 'heuristic', compute)
+        
+        self.assertEqual(len(calls), 1)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hit_ratio(), 0.5)
+    
+    def test_hit_is_sub_millisecond(self):
+        """同じ局面の再分析は1ミリ秒未満で返る"""
+        obs_state = ObservableGameState.from_game_state(self.state, self.state.get_played_cards())
+        self.cache.put(obs_state, 'heuristic', self.recommendation)
+        
+        samples = []
+        for _ in range(100):
+            start = time.perf_counter()
+            self.cache.get(obs_state, 'heuristic')
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+        
+        self.assertLess(samples[len(samples) // 2], 0.001)
+
+
+if __name__ == '__main__':
+    unittest.main()
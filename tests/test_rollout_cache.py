@@ -0,0 +1,198 @@
+"""
+rollout_cache.pyのテスト
+"""
+
+import copy
+import random
+import unittest
+from src.controllers.game_state import GameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.rollout_cache import RolloutCache
+from src.controllers.rollout_policy import RolloutPolicy
+from src.controllers.epsilon_greedy_rollout_policy import EpsilonGreedyRolloutPolicy
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.mcts_strategy import MCTSStrategy
+
+
+class TestRolloutCache(unittest.TestCase):
+    """RolloutCacheクラスのテスト"""
+    
+    def test_invalid_arguments(self):
+        """容量・ストリーム数が0以下ならエラー"""
+        with self.assertRaises(ValueError):
+            RolloutCache(capacity=0)
+        with self.assertRaises(ValueError):
+            RolloutCache(num_streams=0)
+    
+    def test_miss_until_recorded(self):
+        """記録するまではミス、記録した後は同じ報酬を返す"""
+        cache = RolloutCache(num_streams=2)
+        key = cache.make_key(GameState(seed=42), RolloutPolicy, 0)
+        
+        self.assertIsNone(cache.get(key))
+        cache.put(key, 10.0)
+        
+        self.assertEqual(cache.get(key), 10.0)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+    
+    def test_key_includes_policy_seed_and_stream(self):
+        """方策・シード・ストリームが違えば別のキー"""
+        state = GameState(seed=42)
+        cache = RolloutCache(num_streams=2)
+        cache.put(cache.make_key(state, RolloutPolicy, 0), 10.0)
+        
+        self.assertIsNone(cache.get(cache.make_key(state, RolloutPolicy, 1)))
+        self.assertIsNone(cache.get(cache.make_key(state, EpsilonGreedyRolloutPolicy, 0)))
+        self.assertNotEqual(
+            cache.make_key(state, RolloutPolicy, 0),
+            RolloutCache(num_streams=2, seed=1).make_key(state, RolloutPolicy, 0)
+        )
+    
+    def test_stream_rng_is_reproducible(self):
+        """同じストリームの乱数列は常に同じで、ストリームの範囲外はエラー"""
+        cache = RolloutCache(num_streams=2)
+        
+        self.assertEqual(cache.stream_rng(1).random(), cache.stream_rng(1).random())
+        self.assertNotEqual(cache.stream_rng(0).random(), cache.stream_rng(1).random())
+        with self.assertRaises(ValueError):
+            cache.stream_rng(2)
+    
+    def test_lru_eviction(self):
+        """容量を超えると最も長く使われていないキーを破棄"""
+        cache = RolloutCache(capacity=2, num_streams=1)
+        cache.put(1, 1.0)
+        cache.put(2, 2.0)
+        cache.get(1)
+        cache.put(3, 3.0)
+        
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(1), 1.0)
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), 3.0)
+    
+    def test_hit_ratio(self):
+        """ヒット率 = ヒット数 / 参照数"""
+        cache = RolloutCache(num_streams=1)
+        self.assertEqual(cache.hit_ratio(), 0.0)
+        
+        cache.get(1)
+        cache.put(1, 5.0)
+        cache.get(1)
+        
+        self.assertEqual(cache.hit_ratio(), 0.5)
+        self.assertEqual(cache.get_statistics()['rollout_cache_hit_ratio'], 0.5)
+    
+    def test_clear(self):
+        """クリアでエントリと統計がリセットされる"""
+        cache = RolloutCache(num_streams=1)
+        cache.put(1, 5.0)
+        cache.get(1)
+        
+        cache.clear()
+        
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+
+class TestRolloutCacheStateKey(unittest.TestCase):
+    """RolloutCache.state_keyのテスト"""
+    
+    def test_copy_has_same_key(self):
+        """コピーした状態は同じキー"""
+        state = GameState(seed=42)
+        
+        self.assertEqual(
+            RolloutCache.state_key(state),
+            RolloutCache.state_key(copy.deepcopy(state))
+        )
+    
+    def test_different_state_has_different_key(self):
+        """手を進めた状態は別のキー"""
+        state = GameState(seed=42)
+        next_state = copy.deepcopy(state)
+        card, slot = MoveValidator.get_valid_moves(next_state.get_hand(), next_state.get_field())[0]
+        next_state.play_card(card, slot)
+        
+        self.assertNotEqual(RolloutCache.state_key(state), RolloutCache.state_key(next_state))
+    
+    def test_hand_order_is_part_of_key(self):
+        """同じカードでも手札の順序が違えば別のキー（同じストリームでも選ぶ手が変わるため）"""
+        state = GameState(seed=42)
+        reordered = copy.deepcopy(state)
+        hand = reordered.get_hand()
+        cards = hand.get_cards()
+        for card in cards:
+            hand.remove_card(card)
+        for card in reversed(cards):
+            hand.add_card(card)
+        
+        self.assertEqual(set(hand.get_cards()), set(state.get_hand().get_cards()))
+        self.assertNotEqual(RolloutCache.state_key(state), RolloutCache.state_key(reordered))
+        
+        # 同じストリームの乱数でも、手札の順序でロールアウトの報酬が変わりうる
+        cache = RolloutCache(num_streams=8)
+        engine = MCTSEngine()
+        self.assertTrue(any(
+            engine._rollout(state, rng=cache.stream_rng(stream))
+            != engine._rollout(reordered, rng=cache.stream_rng(stream))
+            for stream in range(cache.num_streams)
+        ))
+    
+    def test_key_is_not_a_bare_hash(self):
+        """キーは状態そのもの（ハッシュ値の衝突で別の状態と一致しない）"""
+        state = GameState(seed=42)
+        key = RolloutCache.state_key(state)
+        
+        self.assertIsInstance(key, tuple)
+        self.assertEqual(key[3], tuple(state.get_deck().get_remaining_cards()))
+
+
+class TestEngineRolloutCache(unittest.TestCase):
+    """エンジンへのロールアウトキャッシュの組み込みテスト"""
+    
+    def test_statistics_without_cache(self):
+        """キャッシュ無しでは統計にキャッシュ情報を含まない"""
+        engine = MCTSEngine()
+        _, root = engine.search(GameState(seed=42), num_iterations=20)
+        
+        self.assertNotIn('rollout_cache_hit_ratio', engine.get_statistics(root))
+    
+    def test_statistics_with_cache(self):
+        """キャッシュ有りでは統計にヒット率を含む"""
+        cache = RolloutCache(num_streams=2)
+        engine = MCTSEngine(rollout_cache=cache)
+        
+        best_move, root = engine.search(GameState(seed=42), num_iterations=200)
+        stats = engine.get_statistics(root)
+        
+        self.assertIsNotNone(best_move)
+        self.assertEqual(stats['total_visits'], 200)
+        self.assertEqual(stats['rollout_cache_hits'] + stats['rollout_cache_misses'], 200)
+        self.assertGreater(stats['rollout_cache_hit_ratio'], 0.0)
+    
+    def test_cached_reward_matches_recomputed_rollout(self):
+        """キャッシュした報酬は、同じストリームでロールアウトし直した報酬と一致する"""
+        state = GameState(seed=42)
+        cache = RolloutCache(num_streams=4)
+        engine = MCTSEngine(rng=random.Random(0), rollout_cache=cache)
+        stream = random.Random(0).randrange(cache.num_streams)
+        
+        reward = engine._simulate(state)
+        
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(reward, MCTSEngine()._rollout(state, rng=cache.stream_rng(stream)))
+        self.assertEqual(cache.get(cache.make_key(state, RolloutPolicy, stream)), reward)
+    
+    def test_strategy_plays_game_with_cache(self):
+        """キャッシュ付きの戦略でゲームを最後までプレイできる"""
+        strategy = MCTSStrategy(num_iterations=30, rollout_cache=RolloutCache())
+        
+        result = strategy.play_game(GameState(seed=42))
+        
+        self.assertGreater(result['cards_played'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+rollout_policy.py / epsilon_greedy_rollout_policy.py / softmax_rollout_policy.pyのテスト
+"""
+
+import random
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.controllers.game_state import GameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.rollout_policy import RolloutPolicy
+from src.controllers.epsilon_greedy_rollout_policy import EpsilonGreedyRolloutPolicy
+from src.controllers.softmax_rollout_policy import SoftmaxRolloutPolicy
+from src.controllers.unknown_card_counter import UnknownCardCounter
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.observable_game_state import ObservableGameState
+
+
+class TestRolloutPolicy(unittest.TestCase):
+    """RolloutPolicyクラス（一様ランダム）のテスト"""
+    
+    def test_rollout_plays_until_terminal(self):
+        """ロールアウトは合法手が無くなるまでプレイする"""
+        state = GameState(seed=42)
+        
+        reward = RolloutPolicy(rng=random.Random(0)).rollout(state)
+        
+        self.assertGreaterEqual(reward, 0)
+        self.assertFalse(MoveValidator.has_valid_move(state.get_hand(), state.get_field()))
+    
+    def test_same_rng_seed_is_reproducible(self):
+        """同じシードの乱数生成器なら同じ報酬"""
+        reward1 = RolloutPolicy(rng=random.Random(3)).rollout(GameState(seed=42))
+        reward2 = RolloutPolicy(rng=random.Random(3)).rollout(GameState(seed=42))
+        
+        self.assertEqual(reward1, reward2)
+
+
+class TestEpsilonGreedyRolloutPolicy(unittest.TestCase):
+    """EpsilonGreedyRolloutPolicyクラスのテスト"""
+    
+    def test_invalid_epsilon(self):
+        """epsilonが範囲外ならエラー"""
+        with self.assertRaises(ValueError):
+            EpsilonGreedyRolloutPolicy(epsilon=1.5)
+    
+    def test_greedy_selects_lowest_flexibility(self):
+        """epsilon=0なら柔軟性が最も低いカードを出す"""
+        policy = EpsilonGreedyRolloutPolicy(epsilon=0.0)
+        policy.counter = UnknownCardCounter([Card(Suit.SUIT_B, 3), Card(Suit.SUIT_C, 2)])
+        low_flex = Card(Suit.SUIT_A, 1)
+        high_flex = Card(Suit.SUIT_B, 2)
+        valid_moves = [(high_flex, 1), (low_flex, 1), (low_flex, 2)]
+        
+        move = policy.select_move(GameState(seed=42), valid_moves)
+        
+        self.assertEqual(move, (low_flex, 1))
+    
+    def test_rollout_keeps_counter_consistent(self):
+        """ロールアウト終了時のカウンタは最終状態の未知カードと一致する"""
+        state = GameState(seed=42)
+        policy = EpsilonGreedyRolloutPolicy(epsilon=0.0)
+        
+        policy.rollout(state)
+        
+        unknown_cards = state.get_unknown_cards()
+        expected = UnknownCardCounter(unknown_cards)
+        self.assertEqual(policy.counter.total, len(unknown_cards))
+        self.assertEqual(policy.counter.suit_counts, expected.suit_counts)
+        self.assertEqual(policy.counter.value_counts, expected.value_counts)
+
+
+class TestSoftmaxRolloutPolicy(unittest.TestCase):
+    """SoftmaxRolloutPolicyクラスのテスト"""
+    
+    def test_invalid_temperature(self):
+        """temperatureが0以下ならエラー"""
+        with self.assertRaises(ValueError):
+            SoftmaxRolloutPolicy(temperature=0)
+    
+    def test_prefers_low_flexibility(self):
+        """柔軟性が低いカードほど選ばれやすい"""
+        policy = SoftmaxRolloutPolicy(temperature=0.5, rng=random.Random(0))
+        policy.counter = UnknownCardCounter([Card(Suit.SUIT_B, 3), Card(Suit.SUIT_C, 2)])
+        low_flex = Card(Suit.SUIT_A, 1)
+        high_flex = Card(Suit.SUIT_B, 2)
+        valid_moves = [(high_flex, 1), (low_flex, 1), (low_flex, 2)]
+        state = GameState(seed=42)
+        
+        moves = [policy.select_move(state, valid_moves) for _ in range(200)]
+        
+        self.assertGreater(moves.count((low_flex, 1)), moves.count((high_flex, 1)))
+        # 同じカードは先に列挙されたスロットに出す
+        self.assertNotIn((low_flex, 2), moves)
+    
+    def test_rollout(self):
+        """ロールアウトが報酬を返す"""
+        reward = SoftmaxRolloutPolicy(rng=random.Random(0)).rollout(GameState(seed=42))
+        
+        self.assertGreaterEqual(reward, 0)
+
+
+class TestEngineRolloutPolicy(unittest.TestCase):
+    """エンジンへのロールアウト方策の組み込みテスト"""
+    
+    def test_mcts_engine_uses_policy(self):
+        """MCTSEngineが指定した方策で探索できる"""
+        engine = MCTSEngine(rollout_policy=EpsilonGreedyRolloutPolicy(rng=random.Random(0)))
+        
+        best_move, root = engine.search(GameState(seed=42), num_iterations=50)
+        
+        self.assertIsNotNone(best_move)
+        self.assertEqual(root.visits, 50)
+    
+    def test_ismcts_engine_uses_policy(self):
+        """ISMCTSEngineが指定した方策で探索できる"""
+        state = GameState(seed=42)
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        engine = ISMCTSEngine(rollout_policy=SoftmaxRolloutPolicy(rng=random.Random(0)))
+        
+        best_move, stats = engine.search(obs_state, num_iterations=50)
+        
+        self.assertIsNotNone(best_move)
+        self.assertEqual(stats['total_visits'], 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
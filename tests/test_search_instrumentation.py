@@ -0,0 +1,119 @@
+"""
+search_instrumentation.pyのテスト
+"""
+
+import unittest
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.search_instrumentation import SearchInstrumentation
+from src.controllers.mcts_engine import MCTSEngine
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers.ismcts_engine import ISMCTSEngine
+from src.controllers.ismcts_strategy import ISMCTSStrategy
+
+
+class TestSearchInstrumentation(unittest.TestCase):
+    """SearchInstrumentationクラスのテスト"""
+    
+    def test_empty_statistics(self):
+        """計測前はすべて0"""
+        stats = SearchInstrumentation().to_dict()
+        
+        self.assertEqual(stats['iterations'], 0)
+        self.assertEqual(stats['avg_rollout_length'], 0.0)
+        self.assertEqual(stats['nodes_allocated'], 0)
+        self.assertEqual(stats['depth_histogram'], {})
+        self.assertEqual(set(stats['phase_ns']), set(SearchInstrumentation.PHASES))
+    
+    def test_records_are_aggregated(self):
+        """フェーズ時間・深さ・ロールアウト長が集計される"""
+        instrumentation = SearchInstrumentation()
+        instrumentation.add_phase('select', 100)
+        instrumentation.add_phase('select', 50)
+        instrumentation.record_rollout(4)
+        instrumentation.record_rollout(6)
+        instrumentation.record_iteration(2)
+        instrumentation.record_iteration(1)
+        instrumentation.record_iteration(2)
+        instrumentation.stop()
+        
+        stats = instrumentation.to_dict()
+        self.assertEqual(stats['phase_ns']['select'], 150)
+        self.assertEqual(stats['avg_rollout_length'], 5.0)
+        self.assertEqual(stats['iterations'], 3)
+        self.assertEqual(list(stats['depth_histogram'].items()), [(1, 1), (2, 2)])
+        self.assertGreater(stats['iterations_per_sec'], 0.0)
+    
+    def test_reset_clears_records(self):
+        """resetで計測値がクリアされる"""
+        instrumentation = SearchInstrumentation()
+        instrumentation.record_iteration(0)
+        instrumentation.nodes_allocated = 5
+        instrumentation.reset()
+        
+        self.assertEqual(instrumentation.iterations, 0)
+        self.assertEqual(instrumentation.nodes_allocated, 0)
+
+
+class TestEngineInstrumentation(unittest.TestCase):
+    """エンジン・戦略の計測のテスト"""
+    
+    def test_mcts_disabled_by_default(self):
+        """既定では計測せず、統計情報にも含めない"""
+        engine = MCTSEngine()
+        _, root = engine.search(GameState(seed=42), num_iterations=10)
+        
+        self.assertIsNone(engine.instrumentation)
+        self.assertNotIn('instrumentation', engine.get_statistics(root))
+    
+    def test_mcts_statistics(self):
+        """MCTSの統計情報に計測値が含まれる"""
+        engine = MCTSEngine(instrument=True)
+        _, root = engine.search(GameState(seed=42), num_iterations=30)
+        
+        stats = engine.get_statistics(root)['instrumentation']
+        self.assertEqual(stats['iterations'], 30)
+        self.assertEqual(sum(stats['depth_histogram'].values()), 30)
+        self.assertGreater(stats['nodes_allocated'], 0)
+        self.assertGreater(stats['avg_rollout_length'], 0.0)
+        self.assertGreater(stats['phase_ns']['simulate'], 0)
+        self.assertEqual(stats['phase_ns']['determinize'], 0)
+    
+    def test_mcts_search_resets_instrumentation(self):
+        """探索ごとに計測値がリセットされる"""
+        engine = MCTSEngine(instrument=True)
+        engine.search(GameState(seed=42), num_iterations=10)
+        _, root = engine.search(GameState(seed=42), num_iterations=5)
+        
+        self.assertEqual(engine.get_statistics(root)['instrumentation']['iterations'], 5)
+    
+    def test_ismcts_statistics(self):
+        """IS-MCTSの統計情報に決定化を含む計測値が含まれる"""
+        state = GameState(seed=42)
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        engine = ISMCTSEngine(instrument=True)
+        _, stats = engine.search(obs_state, num_iterations=30)
+        
+        instrumentation = stats['instrumentation']
+        self.assertEqual(instrumentation['iterations'], 30)
+        self.assertGreater(instrumentation['nodes_allocated'], 0)
+        self.assertLessEqual(instrumentation['nodes_allocated'], stats['info_set_cache_size'])
+        self.assertGreater(instrumentation['phase_ns']['determinize'], 0)
+    
+    def test_strategies_expose_last_statistics(self):
+        """戦略は直近の探索の統計情報を保持する"""
+        state = GameState(seed=42)
+        mcts = MCTSStrategy(num_iterations=10, instrument=True)
+        self.assertIsNone(mcts.last_statistics)
+        mcts.get_best_move(state)
+        self.assertEqual(mcts.last_statistics['instrumentation']['iterations'], 10)
+        
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        ismcts = ISMCTSStrategy(num_iterations=10)
+        ismcts.get_best_move(obs_state)
+        self.assertEqual(ismcts.last_statistics['total_visits'], 10)
+        self.assertNotIn('instrumentation', ismcts.last_statistics)
+
+
+if __name__ == '__main__':
+    unittest.main()
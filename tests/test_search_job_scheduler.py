@@ -0,0 +1,113 @@
+"""
+search_job_scheduler.pyのテスト
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import CancelledError, TimeoutError
+from src.controllers.game_state import GameState
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers.search_job_scheduler import SearchJobScheduler
+from src.controllers.search_worker_pool import SearchWorkerPool
+
+
+class SleepStrategy:
+    """テスト用の戦略（少し待ってから完了時刻を返す）"""
+    
+    def get_best_move(self, state):
+        time.sleep(0.05)
+        return time.time()
+
+
+class TestSearchJobScheduler(unittest.TestCase):
+    """SearchJobSchedulerクラスのテスト"""
+    
+    def setUp(self):
+        pool = SearchWorkerPool(
+            {'sleep': SleepStrategy(), 'mcts': MCTSStrategy(num_iterations=20)},
+            workers=1,
+            start_method='fork'
+        )
+        self.scheduler = SearchJobScheduler(pool)
+        self.state = GameState(seed=1)
+    
+    def tearDown(self):
+        self.scheduler.close()
+    
+    def test_result_returns_move_and_statistics(self):
+        """結果は投入したセッションに返る"""
+        job_id = self.scheduler.submit('a', 'mcts', self.state, num_iterations=10)
+        best_move, statistics = self.scheduler.result('a', job_id)
+        
+        self.assertIn(best_move, [
+            (card, slot) for card in self.state.get_hand().get_cards() for slot in (1, 2)
+        ])
+        self.assertEqual(statistics['total_visits'], 10)
+        # 回収済みのジョブは破棄される
+        with self.assertRaises(KeyError):
+            self.scheduler.result('a', job_id)
+    
+    def test_round_robin_between_sessions(self):
+        """先に大量に投入したセッションがあっても、他のセッションのジョブが割り込める"""
+        a_jobs = [self.scheduler.submit('a', 'sleep', self.state) for _ in range(3)]
+        b_job = self.scheduler.submit('b', 'sleep', self.state)
+        
+        a_times = [self.scheduler.result('a', job_id)[0] for job_id in a_jobs]
+        b_time = self.scheduler.result('b', b_job)[0]
+        
+        self.assertLess(a_times[1], b_time)
+        self.assertLess(b_time, a_times[2])
+    
+    def test_other_session_cannot_collect(self):
+        """他のセッションのジョブは受け取れない"""
+        job_id = self.scheduler.submit('a', 'sleep', self.state)
+        with self.assertRaises(KeyError):
+            self.scheduler.result('b', job_id)
+        self.scheduler.result('a', job_id)
+    
+    def test_cancel_session(self):
+        """取り消したセッションのジョブは破棄され、他のセッションには影響しない"""
+        a_jobs = [self.scheduler.submit('a', 'sleep', self.state) for _ in range(3)]
+        b_job = self.scheduler.submit('b', 'sleep', self.state)
+        
+        self.assertEqual(self.scheduler.cancel('a'), 3)
+        self.assertEqual(self.scheduler.pending_count('a'), 0)
+        for job_id in a_jobs:
+            with self.assertRaises(KeyError):
+                self.scheduler.result('a', job_id)
+        self.assertIsInstance(self.scheduler.result('b', b_job)[0], float)
+    
+    def test_cancel_while_waiting(self):
+        """待っている間に取り消されるとCancelledError"""
+        self.scheduler.submit('a', 'sleep', self.state)
+        job_id = self.scheduler.submit('a', 'sleep', self.state)
+        timer = threading.Timer(0.01, self.scheduler.cancel, args=('a',))
+        timer.start()
+        
+        with self.assertRaises(CancelledError):
+            self.scheduler.result('a', job_id)
+        timer.join()
+    
+    def test_poll_and_timeout(self):
+        """完了済みのジョブの確認と、待ち時間の上限"""
+        job_id = self.scheduler.submit('a', 'sleep', self.state)
+        with self.assertRaises(TimeoutError):
+            self.scheduler.result('a', job_id, timeout=0.001)
+        
+        deadline = time.time() + 5.0
+        while not self.scheduler.poll('a') and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.scheduler.poll('a'), [job_id])
+        self.assertEqual(self.scheduler.pending_count(), 0)
+    
+    def test_invalid_arguments(self):
+        """未登録の戦略・同時実行数0はエラー"""
+        with self.assertRaises(ValueError):
+            self.scheduler.submit('a', 'ismcts', self.state)
+        with self.assertRaises(ValueError):
+            SearchJobScheduler(self.scheduler.pool, max_in_flight=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
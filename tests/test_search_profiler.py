@@ -0,0 +1,107 @@
+"""
+search_profiler.py と profile_search.py のテスト
+"""
+
+import contextlib
+import io
+import os
+import pickle
+import random
+import tempfile
+import unittest
+import profile_search
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers.ismcts_strategy import ISMCTSStrategy
+from src.controllers.search_profiler import SearchProfiler
+from src.controllers.epsilon_greedy_rollout_policy import EpsilonGreedyRolloutPolicy
+
+
+class TestSearchProfiler(unittest.TestCase):
+    """SearchProfilerクラスのテスト"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.profiler = SearchProfiler(self.tmpdir.name)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_mcts_profile_writes_files(self):
+        """profile=Trueでプロファイルとスナップショットを保存"""
+        strategy = MCTSStrategy(num_iterations=20, profiler=self.profiler)
+        move = strategy.get_best_move(GameState(seed=42), profile=True)
+        
+        self.assertIsNotNone(move)
+        prefix = strategy.last_profile_path
+        self.assertTrue(os.path.exists(prefix + '.prof'))
+        self.assertTrue(os.path.exists(prefix + '.snapshot.pkl'))
+        self.assertEqual(strategy.last_statistics['total_visits'], 20)
+    
+    def test_profile_disabled_by_default(self):
+        """既定ではプロファイルしない"""
+        strategy = MCTSStrategy(num_iterations=5, profiler=self.profiler)
+        strategy.get_best_move(GameState(seed=42))
+        
+        self.assertIsNone(strategy.last_profile_path)
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+    
+    def test_ismcts_replay_reproduces_search(self):
+        """スナップショットから同じ探索を再現できる"""
+        state = GameState(seed=7)
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        strategy = ISMCTSStrategy(num_iterations=30, profiler=self.profiler)
+        random.seed(123)
+        move = strategy.get_best_move(obs_state, profile=True)
+        
+        random.seed(999)
+        replayed_move, prefix = self.profiler.replay(strategy.last_profile_path + '.snapshot.pkl')
+        
+        self.assertEqual(replayed_move, move)
+        snapshot = SearchProfiler.load_snapshot(prefix + '.snapshot.pkl')
+        self.assertEqual(snapshot['label'], 'ismcts')
+        self.assertIsInstance(snapshot['state'], ObservableGameState)
+        # スナップショットは探索前の戦略を保存している
+        self.assertIsNone(snapshot['strategy'].last_statistics)
+    
+    def test_snapshot_keeps_global_rng_reference(self):
+        """グローバル乱数を使うロールアウト方策はpickle後もrandomモジュールを参照"""
+        strategy = MCTSStrategy(rollout_policy=EpsilonGreedyRolloutPolicy())
+        restored = pickle.loads(pickle.dumps(strategy))
+        
+        self.assertIs(restored.engine.rollout_policy.rng, random)
+    
+    def test_version_mismatch(self):
+        """バージョンが異なるスナップショットはエラー"""
+        path = os.path.join(self.tmpdir.name, 'old.snapshot.pkl')
+        with open(path, 'wb') as f:
+            pickle.dump({'version': 0}, f)
+        
+        with self.assertRaises(ValueError):
+            SearchProfiler.load_snapshot(path)
+
+
+class TestProfileSearchCLI(unittest.TestCase):
+    """profile_search.pyのテスト"""
+    
+    def test_capture_and_replay(self):
+        """captureで保存したスナップショットをreplayできる"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with contextlib.redirect_stdout(io.StringIO()):
+                prefix = profile_search.main([
+                    'capture', '--strategy', 'mcts', '--turns', '2',
+                    '--iterations', '10', '--output-dir', tmpdir, '--top', '3'
+                ])
+                replayed = profile_search.main([
+                    'replay', prefix + '.snapshot.pkl', '--output-dir', tmpdir, '--top', '3'
+                ])
+            
+            snapshot = SearchProfiler.load_snapshot(prefix + '.snapshot.pkl')
+            self.assertEqual(snapshot['state'].turn_count, 2)
+            self.assertNotEqual(prefix, replayed)
+            self.assertTrue(os.path.exists(replayed + '.prof'))
+
+
+if __name__ == '__main__':
+    unittest.main()
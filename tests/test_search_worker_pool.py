@@ -0,0 +1,105 @@
+"""
+search_worker_pool.py と benchmark_worker_pool.py のテスト
+"""
+
+import contextlib
+import io
+import pickle
+import random
+import unittest
+from unittest.mock import patch
+import benchmark_worker_pool
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.heuristic_strategy import HeuristicStrategy
+from src.controllers.mcts_strategy import MCTSStrategy
+from src.controllers import search_worker_pool
+from src.controllers.search_worker_pool import SearchWorkerPool
+
+
+class TestSearchWorkerPool(unittest.TestCase):
+    """SearchWorkerPoolクラスのテスト"""
+    
+    def test_invalid_arguments(self):
+        """戦略が空、ワーカー数が0以下ならエラー"""
+        with self.assertRaises(ValueError):
+            SearchWorkerPool({}, workers=1)
+        with self.assertRaises(ValueError):
+            SearchWorkerPool({'heuristic': HeuristicStrategy()}, workers=0)
+    
+    def test_encode_job_is_compact(self):
+        """ジョブはGameStateのpickleよりはるかに小さい"""
+        state = GameState(seed=1)
+        job = SearchWorkerPool.encode_job('mcts', state, seed=3)
+        
+        self.assertEqual(job[0], 'mcts')
+        self.assertEqual(job[2], 3)
+        self.assertLess(len(pickle.dumps(job)) * 5, len(pickle.dumps(state)))
+    
+    def test_seeded_job_restores_rng(self):
+        """シード付きのジョブの後は、共有している戦略の乱数を元に戻す"""
+        rng = random.Random(0)
+        strategy = MCTSStrategy(num_iterations=5, rng=rng)
+        
+        with patch.dict(search_worker_pool._worker_strategies, {'mcts': strategy}):
+            search_worker_pool._run_job(SearchWorkerPool.encode_job('mcts', GameState(seed=1), seed=3))
+        
+        self.assertIs(strategy.engine.rng, rng)
+        self.assertIs(strategy.engine.rollout_policy.rng, rng)
+    
+    def test_fork_pool_matches_local_search(self):
+        """forkしたワーカーの結果は、同じシードの親プロセスでの探索と一致"""
+        states = [GameState(seed=seed) for seed in range(3)]
+        strategies = {'mcts': MCTSStrategy(num_iterations=20)}
+        
+        with SearchWorkerPool(strategies, workers=2, start_method='fork') as pool:
+            moves = pool.map('mcts', states, seeds=[10, 11, 12])
+        
+        expected = []
+        for state, seed in zip(states, [10, 11, 12]):
+            strategy = MCTSStrategy(num_iterations=20, rng=random.Random(seed))
+            expected.append(strategy.get_best_move(state))
+        self.assertEqual(moves, expected)
+    
+    def test_spawn_pool_with_observable_state(self):
+        """spawnでも戦略を共有でき、ObservableGameStateのジョブを実行できる"""
+        state = GameState(seed=5)
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        
+        with SearchWorkerPool({'heuristic': HeuristicStrategy()}, workers=1, start_method='spawn') as pool:
+            self.assertEqual(pool.start_method, 'spawn')
+            move, statistics = pool.submit('heuristic', obs_state).result()
+        
+        self.assertEqual(move, HeuristicStrategy().get_best_move(obs_state))
+        self.assertIsNone(statistics)
+    
+    def test_num_iterations_override(self):
+        """ジョブごとに探索回数を変えられ、統計情報も返る"""
+        with SearchWorkerPool({'mcts': MCTSStrategy(num_iterations=50)}, workers=1, start_method='fork') as pool:
+            _, statistics = pool.submit('mcts', GameState(seed=2), num_iterations=7).result()
+            _, default_statistics = pool.submit('mcts', GameState(seed=2)).result()
+        
+        self.assertEqual(statistics['total_visits'], 7)
+        self.assertEqual(default_statistics['total_visits'], 50)
+    
+    def test_unknown_strategy(self):
+        """未登録の戦略名はエラー"""
+        with SearchWorkerPool({'heuristic': HeuristicStrategy()}, workers=1, start_method='fork') as pool:
+            with self.assertRaises(ValueError):
+                pool.submit('mcts', GameState(seed=1))
+
+
+class TestBenchmarkWorkerPool(unittest.TestCase):
+    """benchmark_worker_pool.pyのテスト"""
+    
+    def test_main(self):
+        """起動時間と1ジョブあたりの時間を計測"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = benchmark_worker_pool.main(['--jobs', '3', '--start-methods', 'fork'])
+        
+        self.assertGreater(results['fork']['startup_ms'], 0.0)
+        self.assertEqual(set(results['fork']['latency_us']), {'pickle', 'bytes'})
+
+
+if __name__ == '__main__':
+    unittest.main()
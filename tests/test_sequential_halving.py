@@ -0,0 +1,91 @@
+"""
+sequential_halving.py のテスト
+"""
+
+import unittest
+from src.controllers.sequential_halving import SequentialHalving
+
+
+class TestSequentialHalving(unittest.TestCase):
+    """SequentialHalvingクラスのテスト"""
+    
+    def setUp(self):
+        # スケジュールは手をキーとして扱うだけなので、テストでは文字列を手の代わりに使う
+        self.moves = ['a', 'b', 'c', 'd']
+        self.rewards = {'a': 1.0, 'b': 2.0, 'c': 3.0, 'd': 4.0}
+    
+    def _run(self, halving: SequentialHalving, count: int) -> list:
+        """count回、手を選んで固定の報酬を記録する"""
+        chosen = []
+        for _ in range(count):
+            move = halving.next_move()
+            halving.record(move, self.rewards[move])
+            chosen.append(move)
+        return chosen
+    
+    def test_invalid_arguments(self):
+        """手が無い場合や予算が1未満の場合はエラー"""
+        with self.assertRaises(ValueError):
+            SequentialHalving([], 10)
+        with self.assertRaises(ValueError):
+            SequentialHalving(self.moves, 0)
+    
+    def test_rounds_are_round_robin(self):
+        """ラウンドの中では残っている手を順番に、同じ回数ずつ選ぶ"""
+        halving = SequentialHalving(self.moves, budget=16)
+        self.assertEqual(halving.num_rounds, 2)
+        
+        # 1ラウンド目: 16 / (4手 × 2ラウンド) = 2回ずつ
+        first_round = self._run(halving, 8)
+        self.assertEqual(first_round, self.moves * 2)
+        self.assertEqual(halving.survivors, tuple(self.moves))
+    
+    def test_halving_keeps_top_half(self):
+        """ラウンドの終わりに平均報酬の上位半分だけが残る"""
+        halving = SequentialHalving(self.moves, budget=16)
+        self._run(halving, 8)
+        
+        # 2ラウンド目: 16 / (2手 × 2ラウンド) = 4回ずつ
+        second_round = self._run(halving, 8)
+        self.assertEqual(set(halving.survivors), {'c', 'd'})
+        self.assertEqual(second_round.count('c'), 4)
+        self.assertEqual(second_round.count('d'), 4)
+        self.assertEqual(halving.get_visits('a'), 2)
+        self.assertEqual(halving.get_visits('d'), 6)
+        self.assertEqual(halving.best_move(), 'd')
+    
+    def test_remaining_budget_goes_to_last_move(self):
+        """最後の1手になった後は、その手だけを選び続ける"""
+        halving = SequentialHalving(self.moves, budget=16)
+        self._run(halving, 16)
+        
+        self.assertEqual(self._run(halving, 5), ['d'] * 5)
+        self.assertEqual(halving.survivors, ('d',))
+    
+    def test_small_budget(self):
+        """予算が手の数より少なくても、各ラウンドで1回ずつは選ぶ"""
+        halving = SequentialHalving(self.moves, budget=2)
+        self.assertEqual(self._run(halving, 4), self.moves)
+        self.assertEqual(halving.best_move(), 'd')
+    
+    def test_single_move(self):
+        """手が1つならその手だけを選ぶ"""
+        halving = SequentialHalving(['a'], budget=10)
+        self.assertEqual(halving.num_rounds, 1)
+        self.assertEqual(halving.best_move(), 'a')
+        self.assertEqual(self._run(halving, 3), ['a'] * 3)
+        self.assertAlmostEqual(halving.get_mean_reward('a'), 1.0)
+    
+    def test_best_move_uses_mean_reward(self):
+        """最良の手は試行回数ではなく平均報酬で決める（未試行の手は除く）"""
+        halving = SequentialHalving(self.moves, budget=100)
+        halving.record('a', 1.0)
+        halving.record('a', 1.0)
+        halving.record('b', 5.0)
+        
+        self.assertEqual(halving.best_move(), 'b')
+        self.assertEqual(halving.get_mean_reward('c'), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
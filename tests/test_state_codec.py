@@ -0,0 +1,152 @@
+"""
+state_codec.pyのテスト
+"""
+
+import random
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.controllers.game_state import GameState
+from src.controllers.observable_game_state import ObservableGameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.state_codec import StateCodec
+
+
+def play_random_turns(state: GameState, turns: int, seed: int = 0) -> GameState:
+    """合法手からランダムに指定手数だけ進める"""
+    rng = random.Random(seed)
+    for _ in range(turns):
+        valid_moves = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())
+        if not valid_moves:
+            break
+        state.play_card(*rng.choice(valid_moves))
+    return state
+
+
+class TestGameStateCodec(unittest.TestCase):
+    """GameStateの変換のテスト"""
+    
+    def assert_same_state(self, restored: GameState, state: GameState):
+        self.assertEqual(restored.deck.get_remaining_cards(), state.deck.get_remaining_cards())
+        self.assertEqual(restored.deck.get_excluded_cards(), state.deck.get_excluded_cards())
+        self.assertEqual(restored.hand.get_cards(), state.hand.get_cards())
+        for slot in (1, 2):
+            self.assertEqual(restored.field.get_all_cards(slot), state.field.get_all_cards(slot))
+        self.assertEqual(restored.played_cards, state.played_cards)
+        self.assertEqual(restored.total_points, state.total_points)
+        self.assertEqual(restored.turn_count, state.turn_count)
+    
+    def test_round_trip_initial_state(self):
+        """初期状態を復元できる"""
+        state = GameState(seed=42)
+        restored = GameState.from_bytes(state.to_bytes())
+        
+        self.assert_same_state(restored, state)
+    
+    def test_round_trip_mid_game(self):
+        """途中の状態を復元でき、同じように進められる"""
+        for seed in range(5):
+            state = play_random_turns(GameState(seed=seed), 10 + seed, seed)
+            restored = GameState.from_bytes(state.to_bytes())
+            self.assert_same_state(restored, state)
+            
+            # 復元した状態も山札の順序どおりに進む
+            play_random_turns(state, 5, seed)
+            play_random_turns(restored, 5, seed)
+            self.assert_same_state(restored, state)
+    
+    def test_size_is_compact(self):
+        """1状態あたり約100バイト"""
+        for turns in (0, 10, 30):
+            state = play_random_turns(GameState(seed=1), turns)
+            self.assertLessEqual(len(state.to_bytes()), 100)
+    
+    def test_played_history_not_matching_field(self):
+        """場と一致しない履歴もそのまま復元できる"""
+        state = GameState(seed=3)
+        card = state.deck.get_remaining_cards()[0]
+        state.played_cards.append(card)
+        restored = GameState.from_bytes(state.to_bytes())
+        
+        self.assertEqual(restored.played_cards, [card])
+    
+    def test_decode_does_not_consume_global_random(self):
+        """復元時にグローバル乱数を消費しない"""
+        data = GameState(seed=5).to_bytes()
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        GameState.from_bytes(data)
+        
+        self.assertEqual(random.random(), expected)
+
+
+class TestObservableGameStateCodec(unittest.TestCase):
+    """ObservableGameStateの変換のテスト"""
+    
+    def test_round_trip(self):
+        """観測可能状態を復元できる"""
+        state = play_random_turns(GameState(seed=11), 12)
+        obs_state = ObservableGameState.from_game_state(state, state.get_played_cards())
+        restored = ObservableGameState.from_bytes(obs_state.to_bytes())
+        
+        self.assertEqual(restored.hand.get_cards(), obs_state.hand.get_cards())
+        for slot in (1, 2):
+            self.assertEqual(restored.field.get_all_cards(slot), obs_state.field.get_all_cards(slot))
+        self.assertEqual(restored.played_cards, obs_state.played_cards)
+        self.assertEqual(restored.total_points, obs_state.total_points)
+        self.assertEqual(restored.turn_count, obs_state.turn_count)
+        self.assertEqual(restored.remaining_deck_size, obs_state.remaining_deck_size)
+        self.assertEqual(restored.get_unknown_cards(), obs_state.get_unknown_cards())
+    
+    def test_round_trip_known_excluded_cards(self):
+        """分かっている除外カードも復元でき、同じ状態は同じバイト列になる"""
+        state = GameState(seed=11)
+        excluded_cards = state.get_deck().get_excluded_cards()
+        obs_state = ObservableGameState.from_game_state(state, known_excluded_cards=excluded_cards)
+        reordered = ObservableGameState.from_game_state(state, known_excluded_cards=excluded_cards[::-1])
+        restored = ObservableGameState.from_bytes(obs_state.to_bytes())
+        
+        self.assertEqual(restored.known_excluded_cards, frozenset(excluded_cards))
+        self.assertEqual(obs_state.to_bytes(), reordered.to_bytes())
+        self.assertEqual(restored.get_unknown_cards(), obs_state.get_unknown_cards())
+    
+    def test_round_trip_played_cards_only_in_history(self):
+        """WebUIのように履歴だけにあるカードも復元できる"""
+        obs_state = ObservableGameState()
+        obs_state.played_cards = [Card(Suit.SUIT_A, 1), Card(Suit.SUIT_H, 10)]
+        restored = ObservableGameState.from_bytes(obs_state.to_bytes())
+        
+        self.assertEqual(restored.played_cards, obs_state.played_cards)
+
+
+class TestStateCodecErrors(unittest.TestCase):
+    """不正なバイト列のテスト"""
+    
+    def test_wrong_kind(self):
+        """種別が異なるとエラー"""
+        with self.assertRaises(ValueError):
+            ObservableGameState.from_bytes(GameState(seed=1).to_bytes())
+    
+    def test_wrong_version(self):
+        """未対応のバージョンはエラー"""
+        data = bytearray(GameState(seed=1).to_bytes())
+        data[0] = StateCodec.VERSION + 1
+        with self.assertRaises(ValueError):
+            GameState.from_bytes(bytes(data))
+        
+        # 分かっている除外カードを持たないバージョン1のバイト列も読まない
+        data[0] = 1
+        with self.assertRaises(ValueError):
+            GameState.from_bytes(bytes(data))
+    
+    def test_truncated(self):
+        """途中で途切れたバイト列はエラー"""
+        data = GameState(seed=1).to_bytes()
+        for length in (0, 1, 10, len(data) - 1):
+            with self.assertRaises(ValueError):
+                GameState.from_bytes(data[:length])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+state_history.py とセッションの元に戻す/やり直しのテスト
+"""
+
+import unittest
+from unittest.mock import patch
+from src.controllers.game_state import GameState
+from src.controllers.move_validator import MoveValidator
+from src.controllers.state_history import StateHistory
+from src.views.utils.session_manager import (
+    initialize_session_state,
+    record_state,
+    undo_state,
+    redo_state
+)
+
+
+def play_first_move(state: GameState) -> dict:
+    """先頭の合法手を出し、履歴レコードを返す"""
+    card, slot = MoveValidator.get_valid_moves(state.get_hand(), state.get_field())[0]
+    state.play_card(card, slot)
+    return {'turn': state.turn_count, 'card': str(card), 'suit': card.suit, 'slot': slot}
+
+
+class MockSessionState(dict):
+    """属性アクセスとキーアクセスの両方をサポートするセッション状態"""
+    
+    def __setattr__(self, name, value):
+        self[name] = value
+    
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class TestStateHistory(unittest.TestCase):
+    """StateHistoryクラスのテスト"""
+    
+    def setUp(self):
+        self.state = GameState(seed=1)
+        self.history = StateHistory(self.state)
+    
+    def test_invalid_max_snapshots(self):
+        """上限が2未満ならエラー"""
+        with self.assertRaises(ValueError):
+            StateHistory(self.state, max_snapshots=1)
+    
+    def test_undo_redo(self):
+        """元に戻す/やり直しで各時点の状態を復元できる"""
+        snapshots = [self.state.to_bytes()]
+        for _ in range(3):
+            self.history.push(self.state, play_first_move(self.state))
+            snapshots.append(self.state.to_bytes())
+        
+        self.assertFalse(self.history.can_redo())
+        for expected in reversed(snapshots[:-1]):
+            self.assertEqual(self.history.undo().to_bytes(), expected)
+        self.assertFalse(self.history.can_undo())
+        self.assertIsNone(self.history.undo())
+        
+        for expected in snapshots[1:]:
+            self.assertEqual(self.history.redo().to_bytes(), expected)
+        self.assertIsNone(self.history.redo())
+    
+    def test_push_discards_redo(self):
+        """元に戻した後に新しい操作をすると、やり直しはできない"""
+        self.history.push(self.state, play_first_move(self.state))
+        state = self.history.undo()
+        self.history.push(state)
+        
+        self.assertFalse(self.history.can_redo())
+        self.assertEqual(len(self.history), 2)
+    
+    def test_records(self):
+        """手を出した記録だけが古い順に並ぶ（元に戻した分は含まない）"""
+        first = play_first_move(self.state)
+        self.history.push(self.state, first)
+        self.history.push(self.state)
+        second = play_first_move(self.state)
+        self.history.push(self.state, second)
+        
+        self.assertEqual(list(self.history.records()), [first, second])
+        self.history.undo()
+        self.assertIsNone(self.history.current_record())
+        self.assertEqual(list(self.history.records()), [first])
+    
+    def test_records_are_incremental(self):
+        """記録のリストは作り直さずに更新され、上限で捨てたスナップショットの記録は含まない"""
+        history = StateHistory(self.state, max_snapshots=3)
+        records = history.records()
+        pushed = []
+        for _ in range(4):
+            pushed.append(play_first_move(self.state))
+            history.push(self.state, pushed[-1])
+        
+        self.assertIs(history.records(), records)
+        self.assertEqual(list(records), pushed[-3:])
+        history.undo()
+        history.undo()
+        self.assertEqual(list(records), pushed[-3:-2])
+        history.redo()
+        self.assertEqual(list(records), pushed[-3:-1])
+    
+    def test_records_are_read_only(self):
+        """記録は読み取り専用のビューで、呼び出し側から内部のリストを変更できない"""
+        record = play_first_move(self.state)
+        self.history.push(self.state, record)
+        records = self.history.records()
+        
+        with self.assertRaises(TypeError):
+            records[0] = {}
+        with self.assertRaises(AttributeError):
+            records.append(record)
+        records[:].clear()
+        
+        self.assertEqual(list(self.history.records()), [record])
+        self.assertEqual(list(reversed(records[-10:])), [record])
+    
+    def test_bounded(self):
+        """スナップショット数は上限を超えない"""
+        history = StateHistory(self.state, max_snapshots=4)
+        for _ in range(10):
+            history.push(self.state)
+        while history.can_undo():
+            history.undo()
+        
+        self.assertEqual(len(history), 4)
+
+
+class TestSessionUndoRedo(unittest.TestCase):
+    """セッション状態の元に戻す/やり直しのテスト"""
+    
+    def setUp(self):
+        self.session_state = MockSessionState()
+        self.patcher = patch('streamlit.session_state', self.session_state)
+        self.patcher.start()
+        initialize_session_state()
+    
+    def tearDown(self):
+        self.patcher.stop()
+    
+    def test_history_is_derived(self):
+        """表示用の履歴とターン数は状態履歴から導出される"""
+        state = self.session_state.game_state
+        record_state(play_first_move(state))
+        record_state(play_first_move(state))
+        
+        self.assertEqual(len(self.session_state.history), 2)
+        self.assertEqual(self.session_state.turn, 2)
+        
+        self.assertTrue(undo_state())
+        self.assertEqual(len(self.session_state.history), 1)
+        self.assertEqual(self.session_state.turn, 1)
+        self.assertEqual(self.session_state.game_state.get_cards_played_count(), 1)
+        # 手を出した直後の状態に戻ったので、手札追加ダイアログを開く
+        self.assertTrue(self.session_state.show_add_card_dialog)
+        
+        self.assertTrue(redo_state())
+        self.assertEqual(self.session_state.turn, 2)
+        self.assertEqual(self.session_state.game_state.to_bytes(), state.to_bytes())
+    
+    def test_nothing_to_undo(self):
+        """操作が無ければ元に戻せない"""
+        self.assertFalse(undo_state())
+        self.assertFalse(redo_state())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+unknown_card_counter.pyのテスト
+"""
+
+import unittest
+from src.models.card import Card
+from src.models.suit import Suit
+from src.models.deck import Deck
+from src.controllers.unknown_card_counter import UnknownCardCounter
+from src.controllers.flexibility_calculator import FlexibilityCalculator
+
+
+class TestUnknownCardCounter(unittest.TestCase):
+    """UnknownCardCounterクラスのテスト"""
+    
+    def test_counts(self):
+        """スート別・数値別の枚数を数える"""
+        counter = UnknownCardCounter([
+            Card(Suit.SUIT_A, 1),
+            Card(Suit.SUIT_A, 2),
+            Card(Suit.SUIT_B, 1)
+        ])
+        
+        self.assertEqual(counter.total, 3)
+        self.assertEqual(counter.suit_counts[Suit.SUIT_A], 2)
+        self.assertEqual(counter.value_counts[1], 2)
+        self.assertEqual(counter.flexibility(Card(Suit.SUIT_A, 5)), 2)
+        self.assertEqual(counter.flexibility(Card(Suit.SUIT_C, 1)), 2)
+        self.assertEqual(counter.flexibility(Card(Suit.SUIT_C, 9)), 0)
+    
+    def test_remove(self):
+        """取り除いたカードは柔軟性に数えない"""
+        card = Card(Suit.SUIT_A, 1)
+        counter = UnknownCardCounter([card, Card(Suit.SUIT_A, 2)])
+        
+        counter.remove(card)
+        
+        self.assertEqual(counter.total, 1)
+        self.assertEqual(counter.flexibility(Card(Suit.SUIT_A, 1)), 1)
+    
+    def test_matches_flexibility_calculator(self):
+        """FlexibilityCalculatorと同じ柔軟性を返す"""
+        deck = Deck(seed=7)
+        hand_cards = [deck.draw() for _ in range(5)]
+        unknown_cards = deck.get_remaining_cards()
+        counter = UnknownCardCounter(unknown_cards)
+        
+        for card in hand_cards:
+            self.assertEqual(
+                counter.flexibility(card),
+                FlexibilityCalculator.calculate_flexibility_score(card, unknown_cards)
+            )
+    
+    def test_copy_is_independent(self):
+        """コピーへの変更は元のカウンタに影響しない"""
+        card = Card(Suit.SUIT_A, 1)
+        counter = UnknownCardCounter([card])
+        
+        copied = counter.copy()
+        copied.remove(card)
+        
+        self.assertEqual(counter.total, 1)
+        self.assertEqual(counter.suit_counts[Suit.SUIT_A], 1)
+        self.assertEqual(copied.total, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()